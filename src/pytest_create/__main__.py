@@ -1,12 +1,44 @@
 """Command-line interface."""
+from pathlib import Path
+from typing import Any
 from typing import List
+from typing import Optional
 
 import click
 import pytest
 from loguru import logger
 
+from pytest_create.discovery import find_package_name
+from pytest_create.import_graph import ImportGraph
+from pytest_create.rules import KINDS
+from pytest_create.symbol_index import DEFAULT_INDEX_PATH
+from pytest_create.symbol_index import Symbol
+from pytest_create.symbol_index import SymbolIndex
 
-@click.command(name="pytest-create")
+
+class DefaultGroup(click.Group):
+    """A group that runs its default command when no command is named."""
+
+    def __init__(self, *args: Any, default: str, **kwargs: Any) -> None:
+        """Creates a group that falls back to the default command."""
+        super().__init__(*args, **kwargs)
+        self.default: str = default
+
+    def parse_args(self, ctx: click.Context, args: List[str]) -> List[str]:
+        """Names the default command unless a command or help is requested."""
+        if not args or (
+            args[0] not in self.commands and args[0] not in ctx.help_option_names
+        ):
+            args = [self.default, *args]
+        return super().parse_args(ctx, args)
+
+
+@click.group(name="pytest-create", cls=DefaultGroup, default="create")
+def main() -> None:
+    """Create new unit tests, query the symbol index and list import hubs."""
+
+
+@main.command(name="create")
 @click.argument(
     "src", type=click.Path(file_okay=True, dir_okay=True), default="", required=False
 )
@@ -16,7 +48,7 @@ from loguru import logger
     default="",
     required=False,
 )
-def main(src: click.Path, dst: click.Path) -> None:
+def create(src: click.Path, dst: click.Path) -> None:
     """Create new unit tests for the specified source file or directory."""
     logger.debug("Running main from CLI")
     logger.debug(f"src - {src}\ndst - {dst}")
@@ -27,5 +59,63 @@ def main(src: click.Path, dst: click.Path) -> None:
     )
 
 
+@main.group(name="index")
+def index() -> None:
+    """Query the symbol index updated by pytest --create-index."""
+
+
+@index.command(name="query")
+@click.option(
+    "--db",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=DEFAULT_INDEX_PATH,
+    show_default=True,
+    help="The symbol index to query.",
+)
+@click.option("--package", default=None, help="Only symbols in this package.")
+@click.option("--kind", type=click.Choice(KINDS), default=None)
+@click.option(
+    "--tested/--untested",
+    default=None,
+    help="Only symbols that have, or do not have, a test.",
+)
+@click.option("--name", default=None, help="A glob matched against qualnames.")
+def query(
+    db: Path,
+    package: Optional[str],
+    kind: Optional[str],
+    tested: Optional[bool],
+    name: Optional[str],
+) -> None:
+    """List the indexed symbols without importing any source module."""
+    if not db.is_file():
+        raise click.ClickException(f"No symbol index found at {db}")
+    with SymbolIndex(db) as symbol_index:
+        symbols: List[Symbol] = symbol_index.query(
+            package=package, kind=kind, tested=tested, name=name
+        )
+    for symbol in symbols:
+        location: str = f"{symbol.file}:{symbol.line}" if symbol.line else ""
+        click.echo(f"{symbol.name} {symbol.kind} {location}".rstrip())
+
+
+@main.command(name="graph")
+@click.argument(
+    "src",
+    type=click.Path(exists=True, file_okay=False, path_type=Path),
+    default=".",
+    required=False,
+)
+@click.option("--limit", type=int, default=None, help="Only list this many modules.")
+def graph(src: Path, limit: Optional[int]) -> None:
+    """List the modules under SRC by fan-in without importing any of them."""
+    package: str = find_package_name(src.resolve())
+    import_graph: ImportGraph = ImportGraph.from_path(
+        src, prefix=f"{package}." if package else ""
+    )
+    for name, fan_in, fan_out in import_graph.find_hubs(limit):
+        click.echo(f"{name} {fan_in} {fan_out}")
+
+
 if __name__ == "__main__":
     main(prog_name="pytest-create")  # pragma: no cover
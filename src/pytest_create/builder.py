@@ -0,0 +1,589 @@
+"""A module used for building the test and benchmark modules of source modules.
+
+The modules are built as definitions, which are rendered and written to the
+test files that do not exist yet.
+"""
+import inspect
+import os
+from pathlib import Path
+from types import MethodType
+from types import ModuleType
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Mapping
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+import inflection
+from loguru import logger
+
+from pytest_create.constants import FIXTURE_SCOPES
+from pytest_create.definitions.benchmark_def import BenchmarkDef
+from pytest_create.definitions.class_def import ClassDef
+from pytest_create.definitions.function_def import SELF_PARAMETER
+from pytest_create.definitions.function_def import FunctionDef
+from pytest_create.definitions.import_def import ImportBlockDef
+from pytest_create.definitions.import_def import ImportDef
+from pytest_create.definitions.module_def import ModuleDef
+from pytest_create.definitions.object_def import ObjectDef
+from pytest_create.formatting import FormatCache
+from pytest_create.formatting import format_sources
+from pytest_create.mro_index import MroIndex
+from pytest_create.signatures import SourceExpression
+from pytest_create.signatures import get_signature
+from pytest_create.signatures import with_first_parameter
+from pytest_create.source_module import SourceModule
+from pytest_create.source_module import SourceModules
+
+
+PYTEST_IMPORT: ImportBlockDef = ImportBlockDef(module="", names=("pytest",))
+PARAMETRIZE_DECORATOR: str = "@pytest.mark.parametrize("
+BENCHMARK_IMPORTS: Tuple[ImportBlockDef, ...] = (
+    ImportBlockDef(module="", names=("json", "timeit")),
+    ImportBlockDef(module="pathlib", names=("Path",)),
+    ImportBlockDef(module="typing", names=("Callable", "Dict", "List")),
+    PYTEST_IMPORT,
+)
+
+
+def build_test_modules(
+    sources: Iterable[SourceModule],
+    dst: Path,
+    fixture_scope: Optional[str] = None,
+    parametrize: bool = False,
+    xdist_group_seconds: Optional[float] = None,
+    slow_seconds: Optional[float] = None,
+    subclasses: bool = False,
+) -> Dict[Path, ModuleDef]:
+    """Build the test modules for the objects defined by the source modules.
+
+    A test module is built for each source module, unless its test file already
+    exists. Fixtures requested by the test files of more than one module are
+    hoisted into the conftest.py of the closest directory the test files have in
+    common.
+
+    The tests of a module that is expensive to import are put in an xdist_group
+    named after the module, so that pytest-xdist runs them on a single worker
+    with --dist loadgroup and the module is only imported once.
+
+    When subclasses is set, each method is tested once, in the test of the class
+    that defines it, for that class and each of the discovered subclasses that
+    inherit the method.
+    """
+    if fixture_scope is not None and fixture_scope not in FIXTURE_SCOPES:
+        raise ValueError(f"Fixture scope must be one of {FIXTURE_SCOPES}")
+    source_modules: SourceModules = get_new_module_paths(sources, dst)
+    builder: TestModuleBuilder = TestModuleBuilder(
+        source_modules=source_modules,
+        fixture_scope=fixture_scope,
+        parametrize=parametrize,
+        xdist_group_seconds=xdist_group_seconds,
+        slow_seconds=slow_seconds,
+        subclasses=subclasses,
+    )
+    test_modules: Dict[Path, ModuleDef] = {
+        path: builder.build(path, source) for path, source in source_modules.items()
+    }
+    builder.add_fixtures(test_modules)
+    return test_modules
+
+
+def build_benchmark_modules(
+    sources: Iterable[SourceModule], dst: Path
+) -> Dict[Path, ModuleDef]:
+    """Build benchmark modules for the functions and methods of the source modules.
+
+    The benchmark modules mirror the test modules under their own destination
+    directory, and existing benchmark modules are left untouched. Benchmarks
+    call their target without arguments, so only functions, and methods of
+    classes, that can be called without arguments are benchmarked.
+    """
+    benchmark_modules: Dict[Path, ModuleDef] = {}
+    for path, source in get_new_module_paths(sources, dst).items():
+        imports: List[Union[ImportDef, ImportBlockDef]] = [*BENCHMARK_IMPORTS]
+        definitions: List[ObjectDef] = []
+        for obj in source.objects:
+            benchmarks: List[BenchmarkDef] = _build_benchmarks(source, obj)
+            if benchmarks:
+                imports.append(_import_object(source.module, obj))
+                definitions.extend(benchmarks)
+        if definitions:
+            benchmark_modules[path] = ModuleDef(
+                name=path.stem, imports=imports, definitions=definitions
+            )
+    return benchmark_modules
+
+
+def _build_benchmarks(source: SourceModule, obj: Any) -> List[BenchmarkDef]:
+    """Build the benchmarks of a function, or of the methods of a class."""
+    if not _takes_no_arguments(obj):
+        return []
+    if not inspect.isclass(obj):
+        return [
+            BenchmarkDef(
+                name=f"test_{obj.__name__}_benchmark",
+                docstring=f"Benchmarks the {obj.__name__} function.",
+                target=obj.__name__,
+            )
+        ]
+    return [
+        BenchmarkDef(
+            name=f"test_{get_fixture_name(obj)}_{name}_benchmark",
+            docstring=f"Benchmarks the {obj.__name__}.{name} method.",
+            target=f"{obj.__name__}().{name}",
+            key=f"{obj.__name__}.{name}",
+        )
+        for name in source.methods[obj]
+        if _takes_no_arguments(getattr(obj, name), bound=_is_instance_method(obj, name))
+    ]
+
+
+def _is_instance_method(cls: type, name: str) -> bool:
+    """Returns whether a method is bound to the instance it is called on."""
+    return not isinstance(getattr(cls, name), MethodType) and not isinstance(
+        inspect.getattr_static(cls, name), staticmethod
+    )
+
+
+def _takes_no_arguments(obj: Any, bound: bool = False) -> bool:
+    """Returns whether a callable can be called without arguments.
+
+    The first parameter is left out when bound is set, such as the self of a
+    method that is called on an instance.
+    """
+    parameters: List[inspect.Parameter] = list(get_signature(obj).parameters.values())
+    return all(
+        parameter.default is not inspect.Parameter.empty
+        or parameter.kind
+        in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD)
+        for parameter in (parameters[1:] if bound else parameters)
+    )
+
+
+def get_test_module_path(module_name: str, dst: Path, package: str = "") -> Path:
+    """Returns the path of the test file for a module.
+
+    The test file mirrors the package structure of the module, with the module
+    name prefixed by test_. The given package, which the source root is in, is
+    left out of the path.
+    """
+    if package and module_name.startswith(f"{package}."):
+        module_name = module_name[len(package) + 1 :]
+    *packages, name = module_name.split(".")
+    return dst.joinpath(*packages, f"test_{name}.py")
+
+
+def get_fixture_name(cls: type) -> str:
+    """Returns the name of the fixture that creates instances of a class."""
+    return str(inflection.underscore(cls.__name__))
+
+
+def write_modules(
+    modules: Mapping[Path, ModuleDef], format_cache: Optional[FormatCache] = None
+) -> None:
+    """Write rendered module definitions to their paths.
+
+    Modules are streamed to disk as they are rendered. When a format cache is
+    given, they are rendered first and then formatted together in batches.
+    """
+    if format_cache is None:
+        for path, module_def in modules.items():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with path.open("w", encoding="utf-8") as fp:
+                module_def.render_to(fp)
+        return
+    paths: List[Path] = list(modules)
+    sources: List[str] = format_sources(
+        [modules[path].render() for path in paths], cache=format_cache, paths=paths
+    )
+    for path, source in zip(paths, sources):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(source, encoding="utf-8")
+
+
+class TestModuleBuilder:
+    """Builds test modules and tracks the fixtures each of them requests."""
+
+    def __init__(
+        self,
+        source_modules: SourceModules,
+        fixture_scope: Optional[str],
+        parametrize: bool = False,
+        xdist_group_seconds: Optional[float] = None,
+        slow_seconds: Optional[float] = None,
+        subclasses: bool = False,
+    ) -> None:
+        """Finds the classes whose instances are created by fixtures.
+
+        The subclass relations between the classes are indexed when inherited
+        methods are tested for subclasses.
+        """
+        self.fixture_scope: Optional[str] = fixture_scope
+        self.parametrize: bool = parametrize
+        self.xdist_group_seconds: Optional[float] = xdist_group_seconds
+        self.slow_seconds: Optional[float] = slow_seconds
+        self.modules: Dict[type, ModuleType] = {}
+        self.fixtures: Dict[type, str] = {}
+        self.requests: Dict[type, List[Path]] = {}
+        for source in source_modules.values():
+            self.modules.update(
+                (obj, source.module) for obj in source.objects if inspect.isclass(obj)
+            )
+        self.mro_index: Optional[MroIndex] = (
+            MroIndex.from_classes(self.modules) if subclasses else None
+        )
+        if fixture_scope is None:
+            return
+        names: List[str] = [get_fixture_name(cls) for cls in self.modules]
+        for cls, name in zip(self.modules, names):
+            if names.count(name) > 1:
+                module_name: str = self.modules[cls].__name__.replace(".", "_")
+                name = f"{module_name}_{name}"
+            self.fixtures[cls] = name
+
+    def build(self, path: Path, source: SourceModule) -> ModuleDef:
+        """Build the test module for the objects defined in a module.
+
+        When parametrizing, the functions and classes that need the same check
+        are tested by a single parametrized test instead of one test each.
+        """
+        imports: List[Union[ImportDef, ImportBlockDef]] = []
+        definitions: List[ObjectDef] = []
+        functions: Dict[Any, FunctionDef] = {}
+        classes: List[type] = []
+        for obj in source.objects:
+            imports.append(_import_object(source.module, obj))
+            if not inspect.isclass(obj):
+                function_def: FunctionDef = self._build_function_test(
+                    path, obj, imports
+                )
+                if self.parametrize and not function_def.signature.parameters:
+                    functions[obj] = function_def
+                else:
+                    definitions.append(function_def)
+            elif (
+                self.parametrize
+                and obj not in self.fixtures
+                and not self._find_inheritors(obj, source.methods[obj])
+            ):
+                classes.append(obj)
+            else:
+                definitions.append(
+                    self._build_class_test(path, obj, source.methods[obj], imports)
+                )
+        if len(functions) > 1:
+            definitions.append(self._build_parametrized_function_test(functions))
+        else:
+            definitions.extend(functions.values())
+        if len(classes) > 1:
+            definitions.extend(
+                self._build_parametrized_class_tests(
+                    {cls: source.methods[cls] for cls in classes}
+                )
+            )
+        else:
+            definitions.extend(
+                self._build_class_test(path, cls, source.methods[cls], imports)
+                for cls in classes
+            )
+        marks: List[str] = self._get_marks(source)
+        if marks or any(
+            PARAMETRIZE_DECORATOR in decorator
+            for definition in _walk_definitions(definitions)
+            for decorator in definition.decorators or ()
+        ):
+            imports.append(PYTEST_IMPORT)
+        return ModuleDef(
+            name=path.stem,
+            imports=imports,
+            statements=[f"pytestmark = [{', '.join(marks)}]"] if marks else [],
+            definitions=definitions,
+        )
+
+    def add_fixtures(self, test_modules: Dict[Path, ModuleDef]) -> None:
+        """Add the requested fixtures to the test modules or a shared conftest.py.
+
+        A fixture is hoisted into a conftest.py only if that conftest.py does not
+        exist yet, otherwise it is added to each test module that requests it.
+        """
+        fixture_paths: Dict[Path, List[type]] = {}
+        for cls, paths in self.requests.items():
+            for path in _get_fixture_paths(paths):
+                fixture_paths.setdefault(path, []).append(cls)
+        for path, classes in fixture_paths.items():
+            module_def: ModuleDef = test_modules.setdefault(
+                path, ModuleDef(name=path.stem)
+            )
+            module_def.imports = [
+                *module_def.imports,
+                PYTEST_IMPORT,
+                *(_import_object(self.modules[cls], cls) for cls in classes),
+            ]
+            module_def.definitions = [
+                *(self._build_fixture(cls) for cls in classes),
+                *module_def.definitions,
+            ]
+
+    def _get_marks(self, source: SourceModule) -> List[str]:
+        marks: List[str] = []
+        seconds: float = source.import_seconds
+        if self.xdist_group_seconds is not None and seconds >= self.xdist_group_seconds:
+            marks.append(f'pytest.mark.xdist_group(name="{source.module.__name__}")')
+        if self.slow_seconds is not None and seconds >= self.slow_seconds:
+            marks.append("pytest.mark.slow")
+        return marks
+
+    def _build_fixture(self, cls: type) -> FunctionDef:
+        return FunctionDef(
+            name=self.fixtures[cls],
+            docstring=f"Returns an instance of {cls.__name__}.",
+            signature=inspect.Signature(
+                return_annotation=SourceExpression(cls.__name__)
+            ),
+            code=f"return {cls.__name__}()",
+            decorators=[f'@pytest.fixture(scope="{self.fixture_scope}")'],
+        )
+
+    def _build_class_test(
+        self,
+        path: Path,
+        cls: type,
+        names: List[str],
+        imports: List[Union[ImportDef, ImportBlockDef]],
+    ) -> ClassDef:
+        inherited: Dict[str, List[type]] = self._find_inheritors(cls, names)
+        names = [name for name in names if name not in inherited]
+        instance: str = f"{cls.__name__}()"
+        parameters: List[inspect.Parameter] = []
+        if cls in self.fixtures:
+            instance = self._request_fixture(path, cls, imports, parameters)
+        signature: inspect.Signature = inspect.Signature(
+            parameters, return_annotation=None
+        )
+        definitions: List[Union[ObjectDef, inspect.Parameter]] = [
+            FunctionDef.as_method(
+                name="test_instance",
+                docstring=f"Tests creating an instance of {cls.__name__}.",
+                signature=signature,
+                code=f"assert isinstance({instance}, {cls.__name__})",
+            )
+        ]
+        if self.parametrize and len(names) > 1:
+            definitions.append(
+                FunctionDef.as_parametrized(
+                    argnames=["name"],
+                    argvalues=[f'"{name}"' for name in names],
+                    name="test_methods",
+                    docstring=f"Tests the methods of {cls.__name__}.",
+                    signature=with_first_parameter(signature, SELF_PARAMETER),
+                    code=f"assert callable(getattr({instance}, name))",
+                )
+            )
+            names = []
+        for name in names:
+            definitions.append(
+                FunctionDef.as_method(
+                    name=f"test_{name}",
+                    docstring=f"Tests the {name} method.",
+                    signature=signature,
+                    code=f"assert callable({instance}.{name})",
+                )
+            )
+        for name, subclasses in inherited.items():
+            imports.extend(
+                _import_object(self.modules[subclass], subclass)
+                for subclass in subclasses
+            )
+            definitions.append(self._build_inherited_method_test(cls, name, subclasses))
+        return ClassDef(
+            name=f"Test{cls.__name__}",
+            docstring=f"Tests the {cls.__name__} class.",
+            definitions=definitions,
+        )
+
+    def _find_inheritors(self, cls: type, names: List[str]) -> Dict[str, List[type]]:
+        """Returns the discovered subclasses that inherit each method of a class.
+
+        Subclasses whose name is already taken by the class or another subclass
+        are left out, so that the names imported by the test stay unique.
+        """
+        if self.mro_index is None:
+            return {}
+        inherited: Dict[str, List[type]] = {}
+        for name in names:
+            subclasses: List[type] = []
+            for subclass in self.mro_index.get_inheritors(cls, name):
+                if subclass.__name__ not in (
+                    cls.__name__,
+                    *(other.__name__ for other in subclasses),
+                ):
+                    subclasses.append(subclass)
+            if subclasses:
+                inherited[name] = subclasses
+        return inherited
+
+    def _build_inherited_method_test(
+        self, cls: type, name: str, subclasses: List[type]
+    ) -> FunctionDef:
+        names: List[str] = [klass.__name__ for klass in (cls, *subclasses)]
+        return FunctionDef.as_parametrized(
+            argnames=["cls"],
+            argvalues=names,
+            ids=names,
+            name=f"test_{name}",
+            docstring=(
+                f"Tests the {name} method of {cls.__name__} and the subclasses "
+                "that inherit it."
+            ),
+            signature=inspect.Signature([SELF_PARAMETER], return_annotation=None),
+            code=f"assert callable(cls().{name})",
+        )
+
+    def _build_parametrized_function_test(
+        self, functions: Dict[Any, FunctionDef]
+    ) -> FunctionDef:
+        names: List[str] = [func.__name__ for func in functions]
+        return FunctionDef.as_parametrized(
+            argnames=["function"],
+            argvalues=names,
+            ids=names,
+            name="test_functions",
+            docstring="Tests the functions of the module.",
+            signature=inspect.Signature(return_annotation=None),
+            code="assert callable(function)",
+        )
+
+    def _build_parametrized_class_tests(
+        self, classes: Dict[type, List[str]]
+    ) -> List[ObjectDef]:
+        names: List[str] = [cls.__name__ for cls in classes]
+        methods: List[Tuple[str, str]] = [
+            (cls.__name__, name)
+            for cls, cls_methods in classes.items()
+            for name in cls_methods
+        ]
+        tests: List[ObjectDef] = [
+            FunctionDef.as_parametrized(
+                argnames=["cls"],
+                argvalues=names,
+                ids=names,
+                name="test_classes",
+                docstring="Tests creating an instance of each class of the module.",
+                signature=inspect.Signature(return_annotation=None),
+                code="assert isinstance(cls(), cls)",
+            )
+        ]
+        if methods:
+            tests.append(
+                FunctionDef.as_parametrized(
+                    argnames=["cls", "name"],
+                    argvalues=[f'({cls_name}, "{name}")' for cls_name, name in methods],
+                    ids=[f"{cls_name}.{name}" for cls_name, name in methods],
+                    name="test_methods",
+                    docstring="Tests the methods of each class of the module.",
+                    signature=inspect.Signature(return_annotation=None),
+                    code="assert callable(getattr(cls(), name))",
+                )
+            )
+        return tests
+
+    def _build_function_test(
+        self,
+        path: Path,
+        func: Any,
+        imports: List[Union[ImportDef, ImportBlockDef]],
+    ) -> FunctionDef:
+        parameters: List[inspect.Parameter] = []
+        for parameter in get_signature(func).parameters.values():
+            cls: Optional[type] = self._find_fixture_class(parameter.annotation)
+            if cls is not None and cls.__name__ not in (
+                _parameter.annotation for _parameter in parameters
+            ):
+                self._request_fixture(path, cls, imports, parameters)
+        return FunctionDef(
+            name=f"test_{func.__name__}",
+            docstring=f"Tests the {func.__name__} function.",
+            signature=inspect.Signature(parameters, return_annotation=None),
+            code=f"assert callable({func.__name__})",
+        )
+
+    def _request_fixture(
+        self,
+        path: Path,
+        cls: type,
+        imports: List[Union[ImportDef, ImportBlockDef]],
+        parameters: List[inspect.Parameter],
+    ) -> str:
+        requests: List[Path] = self.requests.setdefault(cls, [])
+        if path not in requests:
+            requests.append(path)
+        imports.append(_import_object(self.modules[cls], cls))
+        parameters.append(
+            inspect.Parameter(
+                self.fixtures[cls],
+                inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                annotation=SourceExpression(cls.__name__),
+            )
+        )
+        return self.fixtures[cls]
+
+    def _find_fixture_class(self, annotation: Any) -> Optional[type]:
+        if isinstance(annotation, type):
+            return annotation if annotation in self.fixtures else None
+        if not isinstance(annotation, str):
+            return None
+        name: str = annotation.strip("'\"").rsplit(".", 1)[-1]
+        matches: List[type] = [cls for cls in self.fixtures if cls.__name__ == name]
+        return matches[0] if len(matches) == 1 else None
+
+
+def _walk_definitions(
+    definitions: Iterable[Union[ObjectDef, inspect.Parameter]]
+) -> Iterable[FunctionDef]:
+    """Yields the function definitions, including those nested in classes."""
+    for definition in definitions:
+        if isinstance(definition, FunctionDef):
+            yield definition
+        elif isinstance(definition, ClassDef):
+            yield from _walk_definitions(definition.definitions)
+
+
+def _import_object(module: ModuleType, obj: Any) -> ImportDef:
+    """Returns the import of a source object by the name its module was found under."""
+    return ImportDef(module=module, obj=obj, module_name=module.__name__)
+
+
+def _get_fixture_paths(paths: List[Path]) -> List[Path]:
+    """Returns where to define a fixture requested by the given test files."""
+    if len(paths) == 1:
+        return paths
+    conftest_path: Path = (
+        Path(os.path.commonpath([path.parent for path in paths])) / "conftest.py"
+    )
+    if conftest_path.exists():
+        logger.debug(f"Not hoisting fixture into existing {conftest_path}")
+        return paths
+    return [conftest_path]
+
+
+def get_new_module_paths(sources: Iterable[SourceModule], dst: Path) -> SourceModules:
+    """Maps the paths of test modules that do not exist yet to their sources.
+
+    Raises ValueError when two different source modules map to the same path,
+    such as modules of the same name in two source roots.
+    """
+    source_modules: SourceModules = {}
+    for source in sources:
+        path: Path = get_test_module_path(source.module.__name__, dst, source.package)
+        if path.exists():
+            continue
+        other: SourceModule = source_modules.setdefault(path, source)
+        if other.module is not source.module:
+            raise ValueError(
+                f"{other.module.__name__} and {source.module.__name__} of different "
+                f"source roots would both be tested in {path}"
+            )
+    return source_modules
@@ -0,0 +1,239 @@
+"""A module used for discovering source objects from cached bytecode.
+
+Bytecode files are memory mapped and unmarshalled, and the code objects they
+hold are walked without being executed, so modules that are only shipped as
+.pyc files are discovered without their import side effects. Default values
+and annotations only exist once a module is executed, so the signatures of the
+discovered functions only have the names and kinds of their parameters.
+"""
+import inspect
+import marshal
+import mmap
+import sys
+from importlib.util import MAGIC_NUMBER
+from importlib.util import cache_from_source
+from pathlib import Path
+from types import CodeType
+from typing import Any
+from typing import Dict
+from typing import Generator
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from loguru import logger
+
+from pytest_create.signatures import signature_from_code
+from pytest_create.stand_ins import StandInModule
+from pytest_create.stand_ins import make_class
+from pytest_create.stand_ins import make_function
+from pytest_create.util import ModuleFilter
+
+
+BYTECODE_SUFFIX: str = ".pyc"
+CACHE_DIRECTORY: str = "__pycache__"
+CACHE_TAG: Optional[str] = sys.implementation.cache_tag
+HEADER_SIZE: int = 16
+INIT_MODULE: str = "__init__"
+
+
+class BytecodeModule(StandInModule):
+    """A module built from a .pyc file without executing it.
+
+    The module's __file__ is where its source would be found. The bytecode that
+    was actually read is kept in bytecode_file.
+    """
+
+    discovery_path = "bytecode"
+
+    def __init__(
+        self,
+        name: str,
+        file: Path,
+        bytecode_file: Path,
+        objects: List[Any],
+        path: Optional[List[str]] = None,
+    ) -> None:
+        """Creates a module holding the public objects defined in bytecode."""
+        super().__init__(name, file=file, objects=objects, path=path)
+        self.bytecode_file: Path = bytecode_file
+
+
+def find_bytecode_modules(
+    path: Path, prefix: str = "", module_filter: Optional[ModuleFilter] = None
+) -> Generator[BytecodeModule, None, None]:
+    """Recursively yields the packages and modules under a path from their bytecode.
+
+    Both __pycache__/<name>.<cache tag>.pyc files written for this interpreter
+    and sourceless <name>.pyc files are read. Bytecode written by another
+    Python version is skipped, and so are the modules whose name is rejected by
+    the module filter, along with the modules in them.
+    """
+    logger.debug(f"Finding bytecode modules in {path}")
+    for name, bytecode_file, is_package in _find_bytecode_files(path):
+        if module_filter is not None and not module_filter(f"{prefix}{name}"):
+            continue
+        module: Optional[BytecodeModule] = load_bytecode_module(
+            f"{prefix}{name}",
+            bytecode_file,
+            file=path / name / f"{INIT_MODULE}.py"
+            if is_package
+            else path / f"{name}.py",
+            path=[str(path / name)] if is_package else None,
+        )
+        if module is None:
+            continue
+        yield module
+        if is_package:
+            yield from find_bytecode_modules(
+                path / name, prefix=f"{prefix}{name}.", module_filter=module_filter
+            )
+
+
+def load_bytecode_module(
+    name: str,
+    bytecode_file: Path,
+    file: Optional[Path] = None,
+    path: Optional[List[str]] = None,
+) -> Optional[BytecodeModule]:
+    """Returns the module described by a .pyc file, or None if it cannot be read.
+
+    The file is where the module's source would be found, which defaults to the
+    directory the bytecode is cached for.
+    """
+    code: Optional[CodeType] = read_bytecode(bytecode_file)
+    if code is None:
+        return None
+    return BytecodeModule(
+        name,
+        file=file if file is not None else get_source_path(bytecode_file),
+        bytecode_file=bytecode_file,
+        objects=_build_objects(name, code),
+        path=path,
+    )
+
+
+def read_bytecode(bytecode_file: Path) -> Optional[CodeType]:
+    """Returns the module code object stored in a .pyc file.
+
+    The file is memory mapped rather than read, and None is returned when it
+    was written by another Python version or cannot be unmarshalled.
+    """
+    try:
+        with bytecode_file.open("rb") as file, mmap.mmap(
+            file.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mapped, memoryview(mapped) as view:
+            if view[: len(MAGIC_NUMBER)] != MAGIC_NUMBER:
+                logger.debug(f"Skipping bytecode of another Python - {bytecode_file}")
+                return None
+            with view[HEADER_SIZE:] as body:
+                code: Any = marshal.loads(body)
+    except (OSError, ValueError, EOFError, TypeError) as e:
+        logger.warning(f"Failed to read bytecode {bytecode_file} - {e}")
+        return None
+    return code if isinstance(code, CodeType) else None
+
+
+def get_bytecode_path(path: Path) -> Path:
+    """Returns the cached bytecode path of a source file, or a .pyc file itself."""
+    if path.suffix == BYTECODE_SUFFIX:
+        return path
+    return Path(cache_from_source(str(path)))
+
+
+def get_source_path(bytecode_file: Path) -> Path:
+    """Returns where the source of a cached or sourceless .pyc file would be.
+
+    Paths that are not .pyc files are returned as they are.
+    """
+    if bytecode_file.suffix != BYTECODE_SUFFIX:
+        return bytecode_file
+    if bytecode_file.parent.name == CACHE_DIRECTORY:
+        return bytecode_file.parent.parent / f"{bytecode_file.name.split('.', 1)[0]}.py"
+    return bytecode_file.with_suffix(".py")
+
+
+def find_init_bytecode(directory: Path) -> Optional[Path]:
+    """Returns the bytecode of a package's __init__ module, if it has any."""
+    for bytecode_file in _get_bytecode_paths(directory, INIT_MODULE):
+        if bytecode_file.is_file():
+            return bytecode_file
+    return None
+
+
+def _find_bytecode_files(path: Path) -> List[Tuple[str, Path, bool]]:
+    """Returns the name and bytecode of each module and package in a directory.
+
+    Cached bytecode takes precedence over sourceless bytecode of the same name.
+    """
+    found: Dict[str, Tuple[Path, bool]] = {}
+    cached_suffix: str = f".{CACHE_TAG}{BYTECODE_SUFFIX}"
+    if CACHE_TAG is not None and (path / CACHE_DIRECTORY).is_dir():
+        for bytecode_file in (path / CACHE_DIRECTORY).iterdir():
+            if bytecode_file.name.endswith(cached_suffix):
+                found.setdefault(
+                    bytecode_file.name[: -len(cached_suffix)], (bytecode_file, False)
+                )
+    if not path.is_dir():
+        return []
+    for child in path.iterdir():
+        if child.suffix == BYTECODE_SUFFIX and child.is_file():
+            found.setdefault(child.stem, (child, False))
+        elif child.is_dir() and child.name.isidentifier():
+            init_bytecode: Optional[Path] = find_init_bytecode(child)
+            if init_bytecode is not None:
+                found[child.name] = (init_bytecode, True)
+    return [
+        (name, bytecode_file, is_package)
+        for name, (bytecode_file, is_package) in sorted(found.items())
+        if name.isidentifier() and name != INIT_MODULE
+    ]
+
+
+def _get_bytecode_paths(directory: Path, name: str) -> List[Path]:
+    paths: List[Path] = [directory / f"{name}{BYTECODE_SUFFIX}"]
+    if CACHE_TAG is not None:
+        paths.insert(
+            0, directory / CACHE_DIRECTORY / f"{name}.{CACHE_TAG}{BYTECODE_SUFFIX}"
+        )
+    return paths
+
+
+def _build_objects(module_name: str, code: CodeType) -> List[Any]:
+    """Returns stand-ins of the public functions and classes a module defines.
+
+    Function bodies are optimized code objects while class bodies are not, which
+    tells the two apart without executing the module.
+    """
+    objects: Dict[str, Any] = {}
+    for const in _get_code_constants(code):
+        if const.co_name.startswith("_") or const.co_name in objects:
+            continue
+        if const.co_flags & inspect.CO_OPTIMIZED:
+            objects[const.co_name] = make_function(
+                module_name, const.co_name, signature_from_code(const)
+            )
+        else:
+            objects[const.co_name] = _build_class(module_name, const)
+    return list(objects.values())
+
+
+def _build_class(module_name: str, code: CodeType) -> type:
+    members: Dict[str, Any] = {}
+    for const in _get_code_constants(code):
+        if const.co_flags & inspect.CO_OPTIMIZED and const.co_name not in members:
+            members[const.co_name] = make_function(
+                module_name,
+                f"{code.co_name}.{const.co_name}",
+                signature_from_code(const),
+            )
+    return make_class(module_name, code.co_name, members)
+
+
+def _get_code_constants(code: CodeType) -> List[CodeType]:
+    """Returns the named code objects defined directly in a code object."""
+    return [
+        const
+        for const in code.co_consts
+        if isinstance(const, CodeType) and not const.co_name.startswith("<")
+    ]
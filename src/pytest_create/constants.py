@@ -0,0 +1,12 @@
+"""Constants shared by the plugin options and the modules that create tests.
+
+They are kept apart from those modules so that the plugin can register its
+options without importing them.
+"""
+from typing import Tuple
+
+
+FIXTURE_SCOPES: Tuple[str, ...] = ("module", "session")
+DISCOVERY_MODES: Tuple[str, ...] = ("import", "auto")
+DEFAULT_COVERAGE_THRESHOLD: float = 0.5
+DEFAULT_HUB_LIMIT: int = 10
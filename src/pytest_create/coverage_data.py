@@ -0,0 +1,98 @@
+"""A module used for reading line coverage from a coverage.py data file.
+
+The data file is read directly with sqlite3, so coverage.py does not need to be
+installed to find out which functions and methods are already covered.
+"""
+import dis
+import inspect
+import sqlite3
+from dataclasses import dataclass
+from dataclasses import field
+from pathlib import Path
+from types import CodeType
+from typing import Any
+from typing import Dict
+from typing import Optional
+from typing import Set
+
+from loguru import logger
+
+
+@dataclass
+class CoverageData:
+    """The executed line numbers of each measured source file."""
+
+    lines: Dict[Path, Set[int]] = field(default_factory=dict)
+
+    @classmethod
+    def from_file(cls, path: Path) -> "CoverageData":
+        """Read the executed lines from a .coverage SQLite database.
+
+        Both line and branch (arc) measurements are supported.
+        """
+        if not path.is_file():
+            raise FileNotFoundError(f"No coverage data file found at {path}")
+        logger.debug(f"Reading coverage data from {path}")
+        lines: Dict[Path, Set[int]] = {}
+        connection: sqlite3.Connection = sqlite3.connect(
+            f"file:{path}?mode=ro", uri=True
+        )
+        try:
+            files: Dict[int, Path] = {
+                file_id: Path(file_path).resolve()
+                for file_id, file_path in connection.execute(
+                    "SELECT id, path FROM file"
+                )
+            }
+            for file_id, numbits in connection.execute(
+                "SELECT file_id, numbits FROM line_bits"
+            ):
+                lines.setdefault(files[file_id], set()).update(
+                    numbits_to_lines(numbits)
+                )
+            for file_id, from_line, to_line in connection.execute(
+                "SELECT file_id, fromno, tono FROM arc"
+            ):
+                lines.setdefault(files[file_id], set()).update(
+                    line for line in (from_line, to_line) if line > 0
+                )
+        finally:
+            connection.close()
+        return cls(lines=lines)
+
+    def get_coverage(self, obj: Any) -> Optional[float]:
+        """Returns the fraction of a function's lines that were executed.
+
+        The def line is not counted, since it runs when the module is imported.
+        None is returned for objects without Python code.
+        """
+        code: Optional[CodeType] = getattr(
+            inspect.unwrap(getattr(obj, "__func__", obj)), "__code__", None
+        )
+        if code is None:
+            return None
+        statements: Set[int] = get_code_lines(code) - {code.co_firstlineno}
+        if not statements:
+            return 1.0
+        executed: Set[int] = self.lines.get(Path(code.co_filename).resolve(), set())
+        return len(statements & executed) / len(statements)
+
+
+def numbits_to_lines(numbits: bytes) -> Set[int]:
+    """Returns the line numbers stored in a coverage.py numbits blob."""
+    return {
+        byte_index * 8 + bit_index
+        for byte_index, byte in enumerate(numbits)
+        if byte
+        for bit_index in range(8)
+        if byte & (1 << bit_index)
+    }
+
+
+def get_code_lines(code: CodeType) -> Set[int]:
+    """Returns the line numbers of a code object and the code nested inside it."""
+    lines: Set[int] = {line for _, line in dis.findlinestarts(code) if line}
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            lines.update(get_code_lines(const))
+    return lines
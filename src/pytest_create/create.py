@@ -1,15 +1,839 @@
 """Python module for creating pytests from python objects."""
+import contextlib
+import hashlib
+import inspect
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from importlib.abc import MetaPathFinder
+from importlib.abc import PathEntryFinder
 from pathlib import Path
+from types import ModuleType
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Mapping
+from typing import Optional
+from typing import Sequence
+from typing import Set
+from typing import Tuple
+from typing import Union
 
 from loguru import logger
 
+from pytest_create.builder import build_benchmark_modules
+from pytest_create.builder import build_test_modules
+from pytest_create.builder import get_new_module_paths
+from pytest_create.builder import write_modules
+from pytest_create.bytecode import find_bytecode_modules
+from pytest_create.bytecode import get_bytecode_path
+from pytest_create.bytecode import get_source_path
+from pytest_create.bytecode import load_bytecode_module
+from pytest_create.constants import DEFAULT_COVERAGE_THRESHOLD
+from pytest_create.constants import DISCOVERY_MODES
+from pytest_create.coverage_data import CoverageData
+from pytest_create.definitions.module_def import ModuleDef
+from pytest_create.definitions.templates import set_template_dirs
+from pytest_create.discovery import IMPORT_PATH
+from pytest_create.discovery import DiscoveryReport
+from pytest_create.discovery import ImportManager
+from pytest_create.discovery import SourceRoot
+from pytest_create.discovery import find_package_name
+from pytest_create.fingerprints import FingerprintIndex
+from pytest_create.formatting import FormatCache
+from pytest_create.import_graph import ImportGraph
+from pytest_create.object_index import ObjectIndex
+from pytest_create.rules import CompiledRules
+from pytest_create.rules import Rules
+from pytest_create.rules import compile_rules
+from pytest_create.signatures import get_signature
+from pytest_create.source_module import SourceModule
+from pytest_create.source_module import SourceModules
+from pytest_create.source_module import find_methods
+from pytest_create.source_module import get_source_name
+from pytest_create.stand_ins import StandInModule
+from pytest_create.static import load_decorators
+from pytest_create.static import load_definition_lines
+from pytest_create.static import load_static_module
+from pytest_create.static import static_loader
+from pytest_create.stubs import load_stub_module
+from pytest_create.stubs import stub_loader
+from pytest_create.symbol_index import Symbol
+from pytest_create.symbol_index import SymbolIndex
+from pytest_create.tested_index import TestedIndex
+from pytest_create.update import record_fingerprints
+from pytest_create.update import update_test_modules
+from pytest_create.util import ModuleLoader
+from pytest_create.util import find_module_members
+from pytest_create.util import find_modules
+from pytest_create.util import find_named_modules
+from pytest_create.util import get_source_code_filter
+from pytest_create.util import import_from_name
+from pytest_create.util import load_from_file
+from pytest_create.util import load_from_name
 
-def create_tests(src: Path, dst: Path) -> None:
+
+@dataclass
+class CreateOptions:
+    """The options of a run that creates tests.
+
+    Attributes:
+        template_dirs: Directories whose templates take precedence over the
+            default templates.
+        format_cache: Formats the created files with isort and black and
+            caches the formatted sources.
+        fixture_scope: Creates the instances of classes once per scope, in
+            shared fixtures.
+        parametrize: Puts objects that need the same check into a
+            parametrized test.
+        benchmarks_dst: The directory benchmark stubs are created in, which
+            mirrors the layout of the tests of each root.
+        xdist_group_seconds: Marks the test modules of source modules that took
+            at least this long to import with an xdist_group marker.
+        slow_seconds: Marks the test modules of source modules that took at
+            least this long to import with a slow marker.
+        coverage_data: Only creates tests for the functions and methods whose
+            line coverage is below coverage_threshold.
+        coverage_threshold: The line coverage below which objects are tested.
+        tested_index: Skips the objects that already have a test.
+        stub_paths: Reads modules that have a .pyi stub next to them, or in one
+            of these paths, from the stub instead of importing them.
+        bytecode: Reads modules from their cached .pyc files without executing
+            them.
+        discovery: How modules are discovered, one of DISCOVERY_MODES. In auto
+            discovery, a module is only imported when static analysis finds
+            that its public surface depends on runtime behavior.
+        discovery_report: Records the path each module took.
+        subclasses: Parametrizes the test of a method over the class that
+            defines it and the discovered subclasses that inherit it.
+        rules: Selects the modules and objects tests are created for.
+        fingerprints: Patches existing test files in place with the tests of
+            the objects whose signature or docstring changed since the run that
+            recorded them, and updates the fingerprints. It can not be combined
+            with parametrize.
+        import_graph: Imports the modules in the topological order of their
+            static imports, and records the import graph of each root.
+        max_workers: The number of threads the roots are discovered with.
+        object_index: Records the discovered objects and the names that
+            re-export them.
+    """
+
+    template_dirs: Sequence[Path] = ()
+    format_cache: Optional[FormatCache] = None
+    fixture_scope: Optional[str] = None
+    parametrize: bool = False
+    benchmarks_dst: Optional[Path] = None
+    xdist_group_seconds: Optional[float] = None
+    slow_seconds: Optional[float] = None
+    coverage_data: Optional[CoverageData] = None
+    coverage_threshold: float = DEFAULT_COVERAGE_THRESHOLD
+    tested_index: Optional[TestedIndex] = None
+    stub_paths: Optional[Sequence[Path]] = None
+    bytecode: bool = False
+    discovery: str = "import"
+    discovery_report: Optional[DiscoveryReport] = None
+    subclasses: bool = False
+    rules: Optional[Rules] = None
+    fingerprints: Optional[FingerprintIndex] = None
+    import_graph: Optional[ImportGraph] = None
+    max_workers: Optional[int] = None
+    object_index: Optional[ObjectIndex] = None
+
+
+def create_tests(src: Path, dst: Path, options: Optional[CreateOptions] = None) -> None:
     """Create test files for the specified package module.
 
     The created test files will be located in the specified destination
-    directory.
+    directory, and the options are those of create_tests_for_roots.
     """
     logger.debug("create_tests -")
     logger.debug(f"\tsrc - {src}")
     logger.debug(f"\tdst - {dst}")
+    create_tests_for_roots([SourceRoot(src=src, dst=dst)], options=options)
+
+
+def create_tests_for_roots(
+    roots: Sequence[SourceRoot],
+    options: Optional[CreateOptions] = None,
+    root_sources: Optional[Sequence[List[SourceModule]]] = None,
+) -> None:
+    """Create test files for several source roots in a single run.
+
+    The roots are discovered concurrently and share one import manager, and the
+    tests of each root are created in its own destination directory. When
+    root_sources is given, such as the source modules find_root_source_objects
+    returned for the roots, the roots are not discovered again.
+
+    Benchmarks of every root are created in the benchmarks directory of the
+    options, and ValueError is raised when modules of two roots map to the same
+    benchmark module.
+    """
+    opts: CreateOptions = options if options is not None else CreateOptions()
+    logger.debug("create_tests_for_roots -")
+    logger.debug(f"\troots - {roots}")
+    logger.debug(f"\toptions - {opts}")
+    set_template_dirs(opts.template_dirs)
+    modules: Dict[Path, ModuleDef] = {}
+    benchmark_sources: List[SourceModule] = []
+    created: SourceModules = {}
+    for root, sources in zip(
+        roots,
+        root_sources
+        if root_sources is not None
+        else find_root_source_objects(
+            roots,
+            stub_paths=opts.stub_paths,
+            bytecode=opts.bytecode,
+            discovery=opts.discovery,
+            discovery_report=opts.discovery_report,
+            rules=opts.rules,
+            import_graph=opts.import_graph,
+            max_workers=opts.max_workers,
+            object_index=opts.object_index,
+        ),
+    ):
+        test_sources: List[SourceModule] = (
+            select_untested(sources, opts.tested_index)
+            if opts.tested_index is not None
+            else sources
+        )
+        if opts.coverage_data is not None:
+            test_sources = select_uncovered(
+                test_sources, opts.coverage_data, threshold=opts.coverage_threshold
+            )
+        if opts.fingerprints is not None:
+            update_test_modules(
+                test_sources,
+                dst=root.dst,
+                fingerprints=opts.fingerprints,
+                parametrize=opts.parametrize,
+                subclasses=opts.subclasses,
+                tested_index=opts.tested_index,
+                format_cache=opts.format_cache,
+            )
+            created.update(get_new_module_paths(test_sources, root.dst))
+        modules.update(
+            build_test_modules(
+                test_sources,
+                dst=root.dst,
+                fixture_scope=opts.fixture_scope,
+                parametrize=opts.parametrize,
+                xdist_group_seconds=opts.xdist_group_seconds,
+                slow_seconds=opts.slow_seconds,
+                subclasses=opts.subclasses,
+            )
+        )
+        benchmark_sources.extend(sources)
+    benchmarks: Dict[Path, ModuleDef] = (
+        build_benchmark_modules(benchmark_sources, dst=opts.benchmarks_dst)
+        if opts.benchmarks_dst is not None
+        else {}
+    )
+    write_modules(modules, format_cache=opts.format_cache)
+    for root in roots:
+        _create_packages(modules, dst=root.dst)
+    if opts.fingerprints is not None:
+        for path, source in created.items():
+            if path in modules:
+                record_fingerprints(path, source, opts.fingerprints)
+    if opts.benchmarks_dst is not None:
+        write_modules(benchmarks, format_cache=opts.format_cache)
+        _create_packages(benchmarks, dst=opts.benchmarks_dst)
+
+
+def find_root_source_objects(
+    roots: Sequence[SourceRoot],
+    import_manager: Optional[ImportManager] = None,
+    stub_paths: Optional[Sequence[Path]] = None,
+    bytecode: bool = False,
+    discovery: str = "import",
+    discovery_report: Optional[DiscoveryReport] = None,
+    rules: Optional[Rules] = None,
+    import_graph: Optional[ImportGraph] = None,
+    max_workers: Optional[int] = None,
+    object_index: Optional[ObjectIndex] = None,
+) -> List[List[SourceModule]]:
+    """Returns the source modules of each root, discovering the roots concurrently.
+
+    A single import manager is shared by every root, so a module that is found
+    under more than one root is only imported once. A single object index is
+    shared as well, so the aliases of every object are recorded for the run.
+    """
+    manager: ImportManager = (
+        import_manager if import_manager is not None else ImportManager()
+    )
+    index: ObjectIndex = object_index if object_index is not None else ObjectIndex()
+
+    def find_root(root: SourceRoot) -> List[SourceModule]:
+        return find_source_objects(
+            root.src,
+            import_manager=manager,
+            modules=root.modules,
+            stub_paths=stub_paths,
+            bytecode=bytecode,
+            discovery=discovery,
+            discovery_report=discovery_report,
+            rules=rules,
+            import_graph=import_graph,
+            object_index=index,
+        )
+
+    if len(roots) <= 1:
+        return [find_root(root) for root in roots]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(find_root, roots))
+
+
+def find_source_objects(
+    src: Path,
+    import_manager: Optional[ImportManager] = None,
+    modules: Optional[Sequence[str]] = None,
+    stub_paths: Optional[Sequence[Path]] = None,
+    bytecode: bool = False,
+    discovery: str = "import",
+    discovery_report: Optional[DiscoveryReport] = None,
+    rules: Optional[Rules] = None,
+    import_graph: Optional[ImportGraph] = None,
+    object_index: Optional[ObjectIndex] = None,
+) -> List[SourceModule]:
+    """Returns the source modules under src with the objects they define.
+
+    Only the public functions and classes defined by each module are kept, and
+    modules that define none of them are left out. The time each module took to
+    import is recorded along with it. Objects are recorded in the object index,
+    and an object bound by several modules is only kept in the module that
+    defines it.
+
+    Modules are loaded through the import manager when one is given. When
+    module names are given, only those modules are loaded from src instead of
+    walking it.
+
+    Modules that have a .pyi stub in stub_paths are read from the stub, and
+    modules are read from their .pyc files when bytecode is set. In auto
+    discovery, modules are read from their source unless they have dynamic
+    features. The path each module took is recorded in the discovery report
+    when one is given.
+
+    When rules are given, modules they exclude are not loaded, and only the
+    objects and methods they select are kept. Otherwise, only the public
+    functions, classes and methods are kept.
+
+    When an import graph is given and src is walked, the modules are imported
+    into sys.modules in the topological order of their static imports, so each
+    module is only imported once and its import time does not include that of
+    the modules it imports. The import graph of src is added to import_graph.
+    """
+    if discovery not in DISCOVERY_MODES:
+        raise ValueError(f"Discovery mode must be one of {DISCOVERY_MODES}")
+    index: ObjectIndex = object_index if object_index is not None else ObjectIndex()
+    rule_filter: CompiledRules = compile_rules(rules or Rules())
+    package: str = (
+        find_package_name(src if src.is_dir() else src.parent)
+        if modules is None
+        else ""
+    )
+    sources: List[SourceModule] = []
+    for module, import_seconds in _find_source_modules(
+        src,
+        import_manager,
+        modules,
+        stub_paths,
+        bytecode,
+        discovery=discovery,
+        discovery_report=discovery_report,
+        rule_filter=rule_filter,
+        import_graph=import_graph,
+        prefix=f"{package}." if package else "",
+    ):
+        decorators: Dict[str, List[str]] = (
+            _find_decorators(module) if rule_filter.needs_decorators else {}
+        )
+        objects: List[Any] = (
+            [
+                obj
+                for obj in module.objects
+                if index.add(module.__name__, obj.__name__, obj)
+                and _includes_object(rule_filter, obj, decorators)
+            ]
+            if isinstance(module, StandInModule)
+            else _find_defined_objects(module, src, index, rule_filter, decorators)
+        )
+        if objects:
+            sources.append(
+                SourceModule(
+                    module,
+                    objects,
+                    import_seconds,
+                    methods={
+                        obj: find_methods(obj, rule_filter, decorators)
+                        for obj in objects
+                        if inspect.isclass(obj)
+                    },
+                    package=package,
+                )
+            )
+    return sources
+
+
+def select_uncovered(
+    sources: Iterable[SourceModule],
+    coverage_data: CoverageData,
+    threshold: float = DEFAULT_COVERAGE_THRESHOLD,
+) -> List[SourceModule]:
+    """Returns the sources trimmed to the objects whose coverage is below threshold.
+
+    A class is kept when any of its methods is, with only those methods listed,
+    and modules that are left without objects are dropped.
+    """
+    selected: List[SourceModule] = []
+    for source in sources:
+        objects: List[Any] = []
+        methods: Dict[type, List[str]] = {}
+        for obj in source.objects:
+            if inspect.isclass(obj):
+                methods[obj] = [
+                    name
+                    for name in source.methods[obj]
+                    if _is_uncovered(vars(obj)[name], coverage_data, threshold)
+                ]
+                if methods[obj]:
+                    objects.append(obj)
+            elif _is_uncovered(obj, coverage_data, threshold):
+                objects.append(obj)
+        logger.debug(
+            f"{source.module.__name__} - {len(objects)} of {len(source.objects)} "
+            "objects are below the coverage threshold"
+        )
+        if objects:
+            selected.append(
+                SourceModule(
+                    source.module,
+                    objects,
+                    source.import_seconds,
+                    methods=methods,
+                    package=source.package,
+                )
+            )
+    return selected
+
+
+def select_untested(
+    sources: Iterable[SourceModule], tested_index: TestedIndex
+) -> List[SourceModule]:
+    """Returns the sources trimmed to the objects that have no test in the index.
+
+    A class is kept when it or any of its methods is untested, with only the
+    untested methods listed, and modules left without objects are dropped.
+    """
+    selected: List[SourceModule] = []
+    for source in sources:
+        untested: Set[str] = set(tested_index.find_untested(get_source_names(source)))
+        objects: List[Any] = []
+        methods: Dict[type, List[str]] = {}
+        for obj in source.objects:
+            name: str = get_source_name(source, obj)
+            if inspect.isclass(obj):
+                methods[obj] = [
+                    method
+                    for method in source.methods[obj]
+                    if f"{name}.{method}" in untested
+                ]
+                if name in untested or methods[obj]:
+                    objects.append(obj)
+            elif name in untested:
+                objects.append(obj)
+        logger.debug(
+            f"{source.module.__name__} - {len(objects)} of {len(source.objects)} "
+            "objects have no tests"
+        )
+        if objects:
+            selected.append(
+                SourceModule(
+                    source.module,
+                    objects,
+                    source.import_seconds,
+                    methods=methods,
+                    package=source.package,
+                )
+            )
+    return selected
+
+
+def find_untested(
+    sources: Iterable[SourceModule], tested_index: TestedIndex
+) -> List[str]:
+    """Returns the qualified names of the source objects that have no test."""
+    return [
+        name
+        for source in sources
+        for name in tested_index.find_untested(get_source_names(source))
+    ]
+
+
+def get_source_names(source: SourceModule) -> List[str]:
+    """Returns the qualified names of a source module's objects and methods."""
+    names: List[str] = []
+    for obj in source.objects:
+        name: str = get_source_name(source, obj)
+        names.append(name)
+        if inspect.isclass(obj):
+            names.extend(f"{name}.{method}" for method in source.methods[obj])
+    return names
+
+
+def get_source_symbols(
+    source: SourceModule, tested_index: Optional[TestedIndex] = None
+) -> List[Symbol]:
+    """Returns the symbols of a source module's objects and methods.
+
+    Definition lines are read from the source or stub the module was read from,
+    and symbols are marked as tested when they have a test in the tested index.
+    """
+    file: Optional[str] = _get_source_file(source.module)
+    lines: Dict[str, int] = load_definition_lines(Path(file)) if file else {}
+    symbols: List[Symbol] = []
+    for obj in source.objects:
+        members: List[Tuple[str, str, Any]] = [
+            (
+                obj.__qualname__,
+                "class" if inspect.isclass(obj) else "function",
+                obj,
+            )
+        ]
+        if inspect.isclass(obj):
+            members.extend(
+                (f"{obj.__qualname__}.{name}", "method", vars(obj)[name])
+                for name in source.methods[obj]
+            )
+        for qualname, kind, member in members:
+            name: str = f"{source.module.__name__}.{qualname}"
+            symbols.append(
+                Symbol(
+                    module=source.module.__name__,
+                    qualname=qualname,
+                    kind=kind,
+                    file=file,
+                    line=lines.get(qualname),
+                    signature_hash=_hash_signature(member),
+                    tested=tested_index is not None and name in tested_index,
+                )
+            )
+    return symbols
+
+
+def index_symbols(
+    sources: Iterable[SourceModule],
+    symbol_index: SymbolIndex,
+    tested_index: Optional[TestedIndex] = None,
+) -> List[str]:
+    """Updates the symbols of the source modules in the symbol index.
+
+    Modules whose source file no longer exists are removed from the index.
+    Returns the names of the modules whose symbols changed.
+    """
+    updated: List[str] = [
+        source.module.__name__
+        for source in sources
+        if symbol_index.update(
+            source.module.__name__, get_source_symbols(source, tested_index)
+        )
+    ]
+    removed: List[str] = symbol_index.prune()
+    logger.debug(
+        f"Updated {len(updated)} and removed {len(removed)} modules of the "
+        f"symbol index {symbol_index.path}"
+    )
+    return updated
+
+
+def _get_source_file(module: ModuleType) -> Optional[str]:
+    """Returns the stub a module was read from, or its source file."""
+    file: Optional[str] = getattr(module, "stub_file", None) or getattr(
+        module, "__file__", None
+    )
+    return str(file) if file is not None else None
+
+
+def _hash_signature(obj: Any) -> str:
+    """Returns a short hash of the signature of a function, method or class."""
+    signature: inspect.Signature = get_signature(getattr(obj, "__func__", obj))
+    return hashlib.sha256(str(signature).encode()).hexdigest()[:16]
+
+
+def _is_uncovered(obj: Any, coverage_data: CoverageData, threshold: float) -> bool:
+    """Returns whether the line coverage of a function is below the threshold."""
+    coverage: Optional[float] = coverage_data.get_coverage(obj)
+    return coverage is not None and coverage < threshold
+
+
+def _find_source_modules(
+    src: Path,
+    import_manager: Optional[ImportManager] = None,
+    names: Optional[Sequence[str]] = None,
+    stub_paths: Optional[Sequence[Path]] = None,
+    bytecode: bool = False,
+    discovery: str = "import",
+    discovery_report: Optional[DiscoveryReport] = None,
+    rule_filter: Optional[CompiledRules] = None,
+    import_graph: Optional[ImportGraph] = None,
+    prefix: str = "",
+) -> Iterator[Tuple[ModuleType, float]]:
+    """Yields the source modules under src that are not test modules.
+
+    Each module is yielded with the number of seconds it took to import, or to
+    read from its source, stub or bytecode. Only the loader call is timed, so
+    walking src and loading the packages a module is in are not counted.
+
+    Modules the rules exclude are skipped before they are loaded, and so are the
+    packages that cannot contain an included module. The modules are walked in
+    import graph order when an import graph is given. The names of the modules
+    found under src start with prefix, which is the package src is in.
+    """
+    rules: CompiledRules = rule_filter or compile_rules(Rules())
+    if src.is_file():
+        start_file: float = time.perf_counter()
+        module: Optional[ModuleType] = _load_source_file(
+            src,
+            import_manager,
+            stub_paths,
+            bytecode,
+            discovery,
+            discovery_report,
+            rule_filter=rules,
+            prefix=prefix,
+        )
+        if module is not None:
+            if discovery_report is not None:
+                discovery_report.record(module.__name__, _get_discovery_path(module))
+            yield module, time.perf_counter() - start_file
+        return
+    ordered: bool = import_graph is not None and names is None and not bytecode
+    load_seconds: Dict[str, float] = {}
+    load: ModuleLoader = _timed_loader(
+        _get_module_loader(
+            import_manager, stub_paths, discovery, discovery_report, ordered
+        )
+        or load_from_name,
+        load_seconds,
+    )
+    if ordered:
+        names = _find_import_order(src, import_graph, rules, prefix)
+    modules: Iterator[ModuleType] = iter(
+        _find_bytecode_modules(src, names, stub_paths, rules.may_contain, prefix)
+        if bytecode
+        else find_named_modules(
+            names, src, load=load, module_filter=rules.may_contain, prefix=prefix
+        )
+        if names is not None
+        else find_modules(
+            src, prefix=prefix, load=load, module_filter=rules.may_contain
+        )
+    )
+    while True:
+        start: float = time.perf_counter()
+        next_module: Optional[ModuleType] = next(modules, None)
+        next_seconds: float = time.perf_counter() - start
+        if next_module is None:
+            return
+        if _is_source_module(next_module.__name__, rules):
+            if discovery_report is not None:
+                discovery_report.record(
+                    next_module.__name__, _get_discovery_path(next_module)
+                )
+            yield next_module, load_seconds.get(next_module.__name__, next_seconds)
+
+
+def _find_import_order(
+    src: Path,
+    import_graph: Optional[ImportGraph],
+    rule_filter: CompiledRules,
+    prefix: str = "",
+) -> List[str]:
+    """Returns the modules under src in import order, adding their graph."""
+    graph: ImportGraph = ImportGraph.from_path(src, rule_filter.may_contain, prefix)
+    if import_graph is not None:
+        import_graph.update(graph)
+    return graph.topological_order()
+
+
+def _get_module_loader(
+    import_manager: Optional[ImportManager] = None,
+    stub_paths: Optional[Sequence[Path]] = None,
+    discovery: str = "import",
+    discovery_report: Optional[DiscoveryReport] = None,
+    ordered: bool = False,
+) -> Optional[ModuleLoader]:
+    """Returns the loader of the modules found by walking or naming them.
+
+    Modules are read from their stub or statically from their source when they
+    can be, and are otherwise imported. Modules imported in import graph order
+    are added to sys.modules, so that the modules that import them reuse them.
+    """
+    load: Optional[ModuleLoader] = import_from_name if ordered else None
+    if import_manager is not None:
+        load = (
+            import_manager.import_from_name
+            if ordered
+            else import_manager.load_from_name
+        )
+    if discovery == "auto":
+        load = static_loader(discovery_report, load=load)
+    if stub_paths is not None:
+        load = stub_loader(stub_paths, load=load)
+    return load
+
+
+def _timed_loader(load: ModuleLoader, seconds: Dict[str, float]) -> ModuleLoader:
+    """Returns a loader that records how long each call of load takes by name."""
+
+    def load_timed(
+        name: str, finder: Union[PathEntryFinder, MetaPathFinder]
+    ) -> Optional[ModuleType]:
+        start: float = time.perf_counter()
+        try:
+            return load(name, finder)
+        finally:
+            seconds[name] = time.perf_counter() - start
+
+    return load_timed
+
+
+def _is_source_module(module_name: str, rule_filter: CompiledRules) -> bool:
+    """Returns whether a module is included by the rules and is not a test module."""
+    name: str = module_name.rsplit(".", 1)[-1]
+    return (
+        not name.startswith("test_")
+        and name != "conftest"
+        and rule_filter.includes_module(module_name)
+    )
+
+
+def _load_source_file(
+    src: Path,
+    import_manager: Optional[ImportManager] = None,
+    stub_paths: Optional[Sequence[Path]] = None,
+    bytecode: bool = False,
+    discovery: str = "import",
+    discovery_report: Optional[DiscoveryReport] = None,
+    rule_filter: Optional[CompiledRules] = None,
+    prefix: str = "",
+) -> Optional[ModuleType]:
+    """Returns the module of a source file, or None if it cannot be loaded.
+
+    The module is read from its stub, then from its bytecode or statically from
+    its source, and is only imported when it cannot be read. Nothing is loaded
+    when the rules exclude the module. The module name starts with prefix.
+    """
+    name: str = f"{prefix}{src.name.split('.', 1)[0]}"
+    if rule_filter is not None and not rule_filter.includes_module(name):
+        return None
+    module: Optional[ModuleType] = (
+        load_stub_module(name, origin=get_source_path(src), stub_paths=stub_paths)
+        if stub_paths is not None
+        else None
+    )
+    if module is None and bytecode:
+        module = load_bytecode_module(name, get_bytecode_path(src))
+    elif module is None and discovery == "auto":
+        module = load_static_module(name, origin=src, report=discovery_report)
+    if module is None and not bytecode:
+        with contextlib.suppress(Exception):
+            module = (
+                import_manager.load_from_file(src, name=name)
+                if import_manager is not None
+                else load_from_file(src, name=name)
+            )
+    return module
+
+
+def _find_bytecode_modules(
+    src: Path,
+    names: Optional[Sequence[str]] = None,
+    stub_paths: Optional[Sequence[Path]] = None,
+    module_filter: Optional[Callable[[str], bool]] = None,
+    prefix: str = "",
+) -> Iterator[ModuleType]:
+    """Yields the modules under src read from their bytecode.
+
+    Modules that have a stub are read from the stub instead when stub_paths is
+    given, and only the named modules are yielded when names are given.
+    """
+    for module in find_bytecode_modules(
+        src, prefix=prefix, module_filter=module_filter
+    ):
+        if names is not None and module.__name__ not in names:
+            continue
+        stub_module: Optional[ModuleType] = (
+            load_stub_module(
+                module.__name__,
+                origin=Path(str(module.__file__)),
+                path=getattr(module, "__path__", None),
+                stub_paths=stub_paths,
+            )
+            if stub_paths is not None
+            else None
+        )
+        yield stub_module or module
+
+
+def _get_discovery_path(module: ModuleType) -> str:
+    """Returns whether a module was imported, or how it was read instead."""
+    return module.discovery_path if isinstance(module, StandInModule) else IMPORT_PATH
+
+
+def _find_decorators(module: ModuleType) -> Dict[str, List[str]]:
+    """Returns the decorator names of a module's objects by qualname.
+
+    They are read from the stub a module was read from, or from its source.
+    """
+    file: Optional[str] = _get_source_file(module)
+    return load_decorators(Path(file)) if file is not None else {}
+
+
+def _find_defined_objects(
+    module: ModuleType,
+    src: Path,
+    object_index: ObjectIndex,
+    rule_filter: Optional[CompiledRules] = None,
+    decorators: Optional[Mapping[str, List[str]]] = None,
+) -> List[Any]:
+    """Returns the functions and classes defined in a module that the rules select.
+
+    Objects the module only re-exports are recorded as aliases in the object
+    index and skipped before the rules and the source code filter run on them.
+    """
+    source_filter: Callable[[Any], bool] = get_source_code_filter(src)
+    return [
+        obj
+        for name, obj in find_module_members(module)
+        if object_index.add(module.__name__, name, obj)
+        and _includes_object(rule_filter or compile_rules(Rules()), obj, decorators)
+        and source_filter(obj)
+    ]
+
+
+def _includes_object(
+    rule_filter: CompiledRules,
+    obj: Any,
+    decorators: Optional[Mapping[str, List[str]]] = None,
+) -> bool:
+    """Returns whether the rules select a function or class."""
+    return rule_filter.includes_object(
+        obj.__qualname__,
+        "class" if inspect.isclass(obj) else "function",
+        (decorators or {}).get(obj.__qualname__, ()),
+    )
+
+
+def _create_packages(modules: Iterable[Path], dst: Path) -> None:
+    """Creates an __init__.py in each created test directory that lacks one."""
+    directories: Set[Path] = set()
+    for path in modules:
+        directories.update(
+            parent for parent in path.parents if parent != dst and dst in parent.parents
+        )
+    for directory in directories:
+        (directory / "__init__.py").touch(exist_ok=True)
@@ -0,0 +1,30 @@
+"""A module used for rendering the source code of a benchmark test."""
+from dataclasses import dataclass
+
+from pytest_create.definitions.object_def import ObjectDef
+from pytest_create.definitions.slots import slotted
+from pytest_create.definitions.templates import LazyTemplate
+
+
+@slotted()
+@dataclass
+class BenchmarkDef(ObjectDef):
+    """A class used for rendering the source code of a benchmark test.
+
+    The benchmark calls the target a number of times to warm up, then records
+    the best of several timed repeats and compares it to a baseline file that
+    is written next to the benchmark module on its first run.
+    """
+
+    target: str = ""
+    key: str = ""
+    warmup: int = 3
+    repeat: int = 5
+    number: int = 100
+    tolerance: float = 1.5
+    template = LazyTemplate("benchmark.jinja2")
+
+    def __post_init__(self) -> None:
+        """Post init method for the BenchmarkDef class."""
+        super().__post_init__()
+        self.key: str = self.key if self.key else self.target
@@ -4,14 +4,15 @@ from dataclasses import dataclass
 from dataclasses import field
 from typing import ClassVar
 from typing import List
+from typing import Tuple
 from typing import Union
 
-from jinja2 import Template
-
 from pytest_create.definitions.object_def import ObjectDef
-from pytest_create.definitions.templates import CLASS_TEMPLATE
+from pytest_create.definitions.slots import slotted
+from pytest_create.definitions.templates import LazyTemplate
 
 
+@slotted()
 @dataclass
 class ClassDef(ObjectDef):
     """A class used for rendering the source code of a Python Class."""
@@ -20,4 +21,5 @@ class ClassDef(ObjectDef):
     bases: List[str] = field(default_factory=list)
     decorators: List[str] = field(default_factory=list)
     definitions: List[Union[ObjectDef, inspect.Parameter]] = field(default_factory=list)
-    template: ClassVar[Template] = CLASS_TEMPLATE
+    template = LazyTemplate("class.jinja2")
+    nested_fields: ClassVar[Tuple[str, ...]] = ("definitions",)
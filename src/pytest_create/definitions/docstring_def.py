@@ -3,11 +3,14 @@ import re
 from dataclasses import dataclass
 from typing import Pattern
 
+from pytest_create.definitions.slots import slotted
+
 
 DOCSTRING_QUOTES_RE: Pattern[str] = re.compile(r'["\']+(.*?)["\']+')
 
 
-@dataclass
+@slotted()
+@dataclass(frozen=True)
 class DocstringDef:
     """A class used for rendering the source code of a Python Docstring."""
 
@@ -15,7 +18,7 @@ class DocstringDef:
 
     def __post_init__(self) -> None:
         """Remove the docstring quotes from the value."""
-        self.value: str = self._remove_docstring_quotes(self.value)
+        object.__setattr__(self, "value", self._remove_docstring_quotes(self.value))
 
     def __str__(self) -> str:
         """Return the rendered docstring."""
@@ -32,6 +35,8 @@ class DocstringDef:
     @classmethod
     def from_string(cls, value: str) -> "DocstringDef":
         """Create a DocstringDef from a string."""
+        if not value:
+            return EMPTY_DOCSTRING
         return cls(value=value)
 
     @classmethod
@@ -48,3 +53,6 @@ class DocstringDef:
 
     def _format_as_multi_line(self) -> str:
         return '"""' + self.value + '\n"""'
+
+
+EMPTY_DOCSTRING: DocstringDef = DocstringDef()
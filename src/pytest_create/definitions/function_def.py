@@ -3,14 +3,14 @@ import inspect
 from dataclasses import dataclass
 from dataclasses import field
 from typing import Any
-from typing import ClassVar
 from typing import List
 from typing import Optional
-
-from jinja2 import Template
+from typing import Sequence
 
 from pytest_create.definitions.object_def import ObjectDef
-from pytest_create.definitions.templates import FUNCTION_TEMPLATE
+from pytest_create.definitions.slots import slotted
+from pytest_create.definitions.templates import LazyTemplate
+from pytest_create.signatures import with_first_parameter
 
 
 CLS_PARAMETER: inspect.Parameter = inspect.Parameter(
@@ -21,6 +21,7 @@ SELF_PARAMETER: inspect.Parameter = inspect.Parameter(
 )
 
 
+@slotted()
 @dataclass
 class FunctionDef(ObjectDef):
     """A class used for rendering the source code of a Python Function."""
@@ -28,7 +29,7 @@ class FunctionDef(ObjectDef):
     signature: inspect.Signature = field(default_factory=inspect.Signature)
     code: Optional[str] = field(default="pass")
     decorators: Optional[List[str]] = field(default=None)
-    template: ClassVar[Template] = FUNCTION_TEMPLATE
+    template = LazyTemplate("function.jinja2")
 
     def __post_init__(self) -> None:
         """Post init method for the FunctionDef class."""
@@ -58,10 +59,9 @@ class FunctionDef(ObjectDef):
         )
         if "@classmethod" not in function_def.decorators:
             function_def.decorators.append("@classmethod")
-        if function_def.signature.parameters.get("cls", None) is None:
-            function_def.signature = function_def.signature.replace(
-                parameters=[CLS_PARAMETER, *function_def.signature.parameters.values()]
-            )
+        function_def.signature = with_first_parameter(
+            function_def.signature, CLS_PARAMETER
+        )
         return function_def
 
     @classmethod
@@ -71,8 +71,61 @@ class FunctionDef(ObjectDef):
         function_def.decorators = (
             function_def.decorators if function_def.decorators is not None else []
         )
-        if function_def.signature.parameters.get("self", None) is None:
-            function_def.signature = function_def.signature.replace(
-                parameters=[SELF_PARAMETER, *function_def.signature.parameters.values()]
-            )
+        function_def.signature = with_first_parameter(
+            function_def.signature, SELF_PARAMETER
+        )
+        return function_def
+
+    @classmethod
+    def as_parametrized(
+        cls,
+        argnames: Sequence[str],
+        argvalues: Sequence[str],
+        ids: Optional[Sequence[str]] = None,
+        **kwargs: Any,
+    ) -> "FunctionDef":
+        """Return a FunctionDef that runs once for each row of a parametrize table.
+
+        Each of argvalues is the source code of one row, and the argnames are
+        appended to the signature as parameters.
+        """
+        function_def: FunctionDef = cls(**kwargs)
+        function_def.decorators = (
+            function_def.decorators if function_def.decorators is not None else []
+        )
+        function_def.decorators.append(
+            parametrize_decorator(argnames, argvalues, ids=ids)
+        )
+        parameters: List[inspect.Parameter] = list(
+            function_def.signature.parameters.values()
+        )
+        function_def.signature = function_def.signature.replace(
+            parameters=[
+                *parameters,
+                *(
+                    inspect.Parameter(name, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+                    for name in argnames
+                    if name not in function_def.signature.parameters
+                ),
+            ]
+        )
         return function_def
+
+
+def parametrize_decorator(
+    argnames: Sequence[str],
+    argvalues: Sequence[str],
+    ids: Optional[Sequence[str]] = None,
+) -> str:
+    """Return a pytest.mark.parametrize decorator with one row per line."""
+    lines: List[str] = [
+        "@pytest.mark.parametrize(",
+        f'    "{", ".join(argnames)}",',
+        "    [",
+        *(f"        {argvalue}," for argvalue in argvalues),
+        "    ],",
+    ]
+    if ids is not None:
+        lines.extend(["    ids=[", *(f'        "{id_}",' for id_ in ids), "    ],"])
+    lines.append(")")
+    return "\n".join(lines)
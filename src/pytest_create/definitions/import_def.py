@@ -1,16 +1,36 @@
 """A module used for rendering the source code of a Python Import."""
+import sys
 from dataclasses import dataclass
 from dataclasses import field
 from pathlib import Path
 from types import ModuleType
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import Tuple
+from typing import Union
 
+from pytest_create.definitions.slots import slotted
 
+
+MAX_LINE_LENGTH: int = 88
+
+
+@slotted()
 @dataclass
 class ImportDef:
-    """A class used for rendering the source code of a Python Import."""
+    """A class used for rendering the source code of a Python Import.
+
+    The module is imported by its name when module_name is given, such as the
+    name it was discovered under, and otherwise by the packages found above its
+    file.
+    """
 
     module: ModuleType
     obj: object = None
+    module_name: Optional[str] = None
     module_path: Path = field(init=False)
     relative_module_path: Path = field(init=False)
     module_parent: str = field(init=False)
@@ -18,27 +38,30 @@ class ImportDef:
     def __post_init__(self) -> None:
         """Set the module path, relative module path and module parent."""
         self.module_path: Path = Path(getattr(self.module, "__file__", ""))
-        self.relative_module_path: Path = self._find_package_root()
-        self.module_parent: str = ".".join(
-            self.relative_module_path.with_suffix("").parts[:-1]
+        self.relative_module_path: Path = (
+            self._find_package_root()
+            if self.module_name is None
+            else self._get_named_path(self.module_name)
+        )
+        self.module_parent: str = sys.intern(
+            ".".join(self.relative_module_path.with_suffix("").parts[:-1])
         )
 
     def render(self) -> str:
         """Render the import statement for the object."""
-        if self.obj is None:
-            return self._render_module_import()
-        return self._render_object_import()
+        module, name = self.target()
+        return f"from {module} import {name}"
 
-    def _render_module_import(self) -> str:
-        return f"from {self.module_parent} import {self.relative_module_path.stem}"
-
-    def _render_object_import(self) -> str:
+    def target(self) -> Tuple[str, str]:
+        """Return the module imported from and the name that is imported."""
+        if self.obj is None:
+            return self.module_parent, self.relative_module_path.stem
         object_module: str = ".".join(self.relative_module_path.with_suffix("").parts)
         if isinstance(self.obj, str):
-            return f"from {object_module} import {self.obj}"
+            return object_module, self.obj
         if not hasattr(self.obj, "__name__"):
             raise ValueError(f"Object must have a name to import - {self.obj}")
-        return f"from {object_module} import {getattr(self.obj, '__name__', '')}"
+        return object_module, getattr(self.obj, "__name__", "")
 
     def _find_package_root(self) -> Path:
         current_root: Path = self.module_path
@@ -46,3 +69,47 @@ class ImportDef:
             current_root = current_root.parent
         current_root = current_root.parent
         return self.module_path.relative_to(current_root)
+
+    def _get_named_path(self, name: str) -> Path:
+        parts: List[str] = name.split(".")
+        if self.module_path.stem == "__init__":
+            return Path(*parts, self.module_path.name)
+        return Path(*parts[:-1], self.module_path.name or f"{parts[-1]}.py")
+
+
+@slotted()
+@dataclass(frozen=True)
+class ImportBlockDef:
+    """A class used for rendering the source code of grouped Python imports."""
+
+    module: str
+    names: Tuple[str, ...]
+
+    def render(self) -> str:
+        """Render a single import statement for all of the names."""
+        if not self.module:
+            return "\n".join(f"import {name}" for name in self.names)
+        line: str = f"from {self.module} import {', '.join(self.names)}"
+        if len(self.names) == 1 or len(line) <= MAX_LINE_LENGTH:
+            return line
+        names: str = "".join(f"    {name},\n" for name in self.names)
+        return f"from {self.module} import (\n{names})"
+
+
+def group_imports(
+    imports: Iterable[Union[ImportDef, ImportBlockDef]]
+) -> List[ImportBlockDef]:
+    """Group imports by module into deduplicated, sorted import blocks."""
+    names_by_module: Dict[str, Set[str]] = {}
+    for import_def in imports:
+        if isinstance(import_def, ImportBlockDef):
+            names_by_module.setdefault(import_def.module, set()).update(
+                import_def.names
+            )
+            continue
+        module, name = import_def.target()
+        names_by_module.setdefault(module, set()).add(name)
+    return [
+        ImportBlockDef(module=module, names=tuple(sorted(names)))
+        for module, names in sorted(names_by_module.items())
+    ]
@@ -1,20 +1,35 @@
 """A module used for rendering the source code of a Python Module."""
 from dataclasses import dataclass
 from dataclasses import field
-from typing import ClassVar
+from typing import Any
+from typing import Dict
 from typing import List
+from typing import Union
 
-from jinja2 import Template
-
+from pytest_create.definitions.import_def import ImportBlockDef
 from pytest_create.definitions.import_def import ImportDef
+from pytest_create.definitions.import_def import group_imports
 from pytest_create.definitions.object_def import ObjectDef
-from pytest_create.definitions.templates import MODULE_TEMPLATE
+from pytest_create.definitions.slots import slotted
+from pytest_create.definitions.templates import LazyTemplate
 
 
+@slotted()
 @dataclass
 class ModuleDef(ObjectDef):
     """A class used for rendering the source code of a Python Module."""
 
-    imports: List[ImportDef] = field(default_factory=list)
+    imports: List[Union[ImportDef, ImportBlockDef]] = field(default_factory=list)
+    statements: List[str] = field(default_factory=list)
     definitions: List[ObjectDef] = field(default_factory=list)
-    template: ClassVar[Template] = MODULE_TEMPLATE
+    template = LazyTemplate("module.jinja2")
+
+    def as_dict(self) -> Dict[Any, Any]:
+        """Returns the module's attributes with its imports grouped by module.
+
+        Duplicate imports are removed and the names imported from each module
+        are rendered as a single, deterministically sorted import statement.
+        """
+        non_rendered_dict: Dict[Any, Any] = super().as_dict()
+        non_rendered_dict["imports"] = group_imports(self.imports)
+        return non_rendered_dict
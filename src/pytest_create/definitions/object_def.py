@@ -1,17 +1,21 @@
 """A module used for rendering the source code of a Python object."""
+import sys
 from dataclasses import dataclass
 from typing import TypeVar
 from typing import Union
 
 from loguru import logger
 
+from pytest_create.definitions.docstring_def import EMPTY_DOCSTRING
 from pytest_create.definitions.docstring_def import DocstringDef
 from pytest_create.definitions.render import TemplateRendered
+from pytest_create.definitions.slots import slotted
 
 
 T = TypeVar("T")
 
 
+@slotted()
 @dataclass
 class ObjectDef(TemplateRendered):
     """Abstract base class for object definitions."""
@@ -21,12 +25,13 @@ class ObjectDef(TemplateRendered):
     def __post_init__(self) -> None:
         """Initialize the object definition."""
         logger.debug(f"{self.__class__.__name__} - {self.name}")
+        self.name: str = sys.intern(self.name)
         if isinstance(self.docstring, str):
             self.docstring: DocstringDef = DocstringDef.from_string(self.docstring)
         elif isinstance(self.docstring, DocstringDef):
             self.docstring: DocstringDef = self.docstring
         else:
-            self.docstring: DocstringDef = DocstringDef()
+            self.docstring: DocstringDef = EMPTY_DOCSTRING
 
     def __str__(self) -> str:
         """Return the rendered object definition."""
@@ -6,14 +6,22 @@ from pathlib import Path
 from typing import Any
 from typing import ClassVar
 from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Mapping
 from typing import MutableMapping
 from typing import MutableSequence
+from typing import Optional
+from typing import TextIO
+from typing import Tuple
 from typing import TypeVar
 from typing import Union
 
 from jinja2 import Template
 from loguru import logger
 
+from pytest_create.definitions.slots import slotted
+
 
 if sys.version_info >= (3, 8):
     from typing import Protocol
@@ -40,6 +48,16 @@ class SupportsRender(Protocol):
         pass
 
 
+class RenderedFragment(str):
+    """The source code of a nested definition, already at its final indentation.
+
+    Templates tell it apart from plain strings, which they still have to indent.
+    """
+
+    __slots__ = ()
+
+
+@slotted("_fragment")
 @dataclass
 class TemplateRendered:
     """A class used for rendering Python objects using Jinja2 templates."""
@@ -47,6 +65,7 @@ class TemplateRendered:
     name: str
     indent_width: int = 4
     template: ClassVar[Template]
+    nested_fields: ClassVar[Tuple[str, ...]] = ()
 
     def as_dict(self) -> Dict[Any, Any]:
         """Returns a dictionary of the object's attributes."""
@@ -55,35 +74,111 @@ class TemplateRendered:
             non_rendered_dict[_field.name] = getattr(self, _field.name)
         return non_rendered_dict
 
-    def render(self) -> str:
-        """Renders the Python source code using a Jinja2 template."""
+    def render(self, indent: str = "") -> str:
+        """Renders the Python source code using a Jinja2 template.
+
+        Every line is produced at its final indentation. Definitions listed in
+        ``nested_fields`` are rendered one level deeper than this object, so
+        nested templates never have to re-indent an already rendered subtree.
+
+        The rendered fragment is memoized along with the structural key of the
+        context it was rendered from. Nested definitions that did not change
+        return their memoized fragment, which is the same object as the one in
+        the key, so only the templates of changed definitions and of the
+        definitions that contain them run again.
+        """
+        rendered_dict: Dict[Any, Any] = self._rendered_dict(indent=indent)
+        key: Tuple[str, Any] = (indent, self._structural_key(rendered_dict))
+        cached: Optional[Tuple[Tuple[str, Any], RenderedFragment]] = getattr(
+            self, "_fragment", None
+        )
+        if cached is not None and cached[0] == key:
+            return cached[1]
         logger.debug(f"render - {self.name}")
-        return self.template.render(self._rendered_dict())
+        fragment: RenderedFragment = RenderedFragment(
+            self.template.render(rendered_dict, indent=indent)
+        )
+        self._fragment: Optional[Tuple[Tuple[str, Any], RenderedFragment]] = (
+            key,
+            fragment,
+        )
+        return fragment
+
+    def generate(self, indent: str = "") -> Iterator[str]:
+        """Yields the rendered Python source code as the template produces it.
+
+        Nested definitions are streamed as well instead of being rendered to
+        strings first, so the complete source is never held in memory.
+        """
+        logger.debug(f"generate - {self.name}")
+        yield from self.template.generate(
+            self._rendered_dict(indent=indent, stream=True), indent=indent
+        )
+
+    def render_to(self, fp: TextIO, indent: str = "") -> None:
+        """Writes the rendered Python source code to a file as it is produced."""
+        for chunk in self.generate(indent=indent):
+            fp.write(chunk)
+
+    def _rendered_dict(self, indent: str = "", stream: bool = False) -> Dict[Any, Any]:
+        non_rendered_dict: Dict[Any, Any] = self.as_dict()
+        nested_indent: str = indent + " " * self.indent_width
+        for key, value in non_rendered_dict.items():
+            non_rendered_dict[key] = self._recurse_render(
+                value,
+                indent=nested_indent if key in self.nested_fields else indent,
+                stream=stream,
+            )
+        return non_rendered_dict
 
-    def _rendered_dict(
-        self,
+    @classmethod
+    def _recurse_render(
+        cls, obj: T, indent: str = "", stream: bool = False
     ) -> Union[
         str,
-        Dict[Any, Any],
+        T,
         SupportsRender,
+        RenderedFragment,
+        "StreamedFragment",
         MutableMapping[KT, VT],
-        MutableSequence[Dict[Any, Any]],
+        MutableSequence[T],
     ]:
-        non_rendered_dict: Dict[Any, Any] = self.as_dict()
-        return self._recurse_render(non_rendered_dict)
-
-    @classmethod
-    def _recurse_render(
-        cls, obj: T
-    ) -> Union[str, T, SupportsRender, MutableMapping[KT, VT], MutableSequence[T]]:
+        if isinstance(obj, TemplateRendered):
+            if stream:
+                return StreamedFragment(definition=obj, indent=indent)
+            return obj.render(indent=indent)
         if isinstance(obj, SupportsRender):
             return obj.render()
         if isinstance(obj, MutableMapping):
-            for k, v in obj.items():
-                obj[k] = cls._recurse_render(v)
-            return obj
+            rendered_mapping: Dict[Any, Any] = {
+                k: cls._recurse_render(v, indent=indent, stream=stream)
+                for k, v in obj.items()
+            }
+            return rendered_mapping
         if isinstance(obj, MutableSequence):
-            for i, v in enumerate(obj):
-                obj[i] = cls._recurse_render(v)
-            return obj
+            rendered_sequence: List[Any] = [
+                cls._recurse_render(v, indent=indent, stream=stream) for v in obj
+            ]
+            return rendered_sequence
         return obj
+
+    @classmethod
+    def _structural_key(cls, obj: Any) -> Any:
+        """Returns an immutable snapshot of a rendered context for comparison."""
+        if isinstance(obj, Mapping):
+            return tuple((k, cls._structural_key(v)) for k, v in obj.items())
+        if isinstance(obj, (MutableSequence, tuple)):
+            return tuple(cls._structural_key(v) for v in obj)
+        return obj
+
+
+@dataclass(frozen=True)
+class StreamedFragment:
+    """A nested definition whose source code is generated while it is written."""
+
+    definition: TemplateRendered
+    indent: str = ""
+
+    def __iter__(self) -> Iterator[str]:
+        """Yields the chunks of the nested definition's source code."""
+        return self.definition.generate(indent=self.indent)
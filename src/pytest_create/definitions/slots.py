@@ -0,0 +1,56 @@
+"""A module used for storing dataclass fields in __slots__."""
+from dataclasses import fields
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Set
+from typing import Tuple
+from typing import Type
+from typing import TypeVar
+
+
+T = TypeVar("T")
+
+
+def slotted(*extra_slots: str) -> Callable[[Type[T]], Type[T]]:
+    """Returns a decorator that recreates a dataclass with __slots__.
+
+    Instances of the recreated class store their fields in slots instead of a
+    per-instance __dict__. Only fields that no base class already stores in a
+    slot are added, so slotted dataclasses can inherit from one another.
+    """
+
+    def decorator(cls: Type[T]) -> Type[T]:
+        dataclass_cls: Any = cls
+        inherited: Set[str] = {
+            name for base in cls.__mro__[1:] for name in getattr(base, "__slots__", ())
+        }
+        slots: Tuple[str, ...] = tuple(
+            name
+            for name in (
+                *(_field.name for _field in fields(dataclass_cls)),
+                *extra_slots,
+            )
+            if name not in inherited
+        )
+        cls_dict: Dict[str, Any] = dict(cls.__dict__)
+        for name in (*slots, "__dict__", "__weakref__"):
+            cls_dict.pop(name, None)
+        cls_dict["__slots__"] = slots
+        metaclass: Any = type(cls)
+        slotted_cls: Type[T] = metaclass(cls.__name__, cls.__bases__, cls_dict)
+        _rebind_class_cells(cls_dict, cls, slotted_cls)
+        return slotted_cls
+
+    return decorator
+
+
+def _rebind_class_cells(
+    cls_dict: Dict[str, Any], cls: Type[Any], slotted_cls: Type[Any]
+) -> None:
+    """Points the __class__ cells used by zero-argument super() to the new class."""
+    for value in cls_dict.values():
+        function: Any = getattr(value, "__func__", value)
+        for cell in getattr(function, "__closure__", None) or ():
+            if cell.cell_contents is cls:
+                cell.cell_contents = slotted_cls
@@ -1,16 +1,85 @@
-"""Contains default Jinja2 templates for use as ObjectDef templates."""
+"""Contains default Jinja2 templates for use as ObjectDef templates.
+
+Templates are compiled on first use rather than at import time, and their
+compiled bytecode is cached on disk between runs.
+"""
+import functools
 from pathlib import Path
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import Optional
+from typing import Tuple
 
 from jinja2 import Environment
+from jinja2 import FileSystemBytecodeCache
 from jinja2 import FileSystemLoader
 from jinja2 import Template
 
+from pytest_create.definitions.render import RenderedFragment
+from pytest_create.definitions.render import StreamedFragment
+
 
 TEMPLATES_FOLDER: Path = Path(__file__).parent
-ENV: Environment = Environment(
-    loader=FileSystemLoader(str(TEMPLATES_FOLDER)), autoescape=True
-)
+TEMPLATE_NAMES: Dict[str, str] = {
+    "BENCHMARK_TEMPLATE": "benchmark.jinja2",
+    "CLASS_TEMPLATE": "class.jinja2",
+    "FUNCTION_TEMPLATE": "function.jinja2",
+    "MODULE_TEMPLATE": "module.jinja2",
+}
+
+_template_dirs: Tuple[Path, ...] = ()
+
+
+class LazyTemplate:
+    """A class attribute that loads its Jinja2 template on first access."""
+
+    def __init__(self, name: str) -> None:
+        """Stores the name of the template to load."""
+        self.name: str = name
+
+    def __get__(self, obj: Any, objtype: Optional[type] = None) -> Template:
+        """Returns the template from the current template environment."""
+        return get_template(self.name)
+
+
+def set_template_dirs(template_dirs: Iterable[Path]) -> None:
+    """Sets user template directories that take precedence over the defaults."""
+    global _template_dirs
+    _template_dirs = tuple(
+        Path(template_dir).resolve() for template_dir in template_dirs
+    )
+
+
+def get_environment() -> Environment:
+    """Returns the Jinja2 environment for the current template directories."""
+    return _get_environment(_template_dirs)
+
+
+def get_template(name: str) -> Template:
+    """Returns a compiled template, compiling it on first use."""
+    return get_environment().get_template(name)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_environment(template_dirs: Tuple[Path, ...]) -> Environment:
+    env: Environment = Environment(
+        loader=FileSystemLoader(
+            [str(template_dir) for template_dir in (*template_dirs, TEMPLATES_FOLDER)]
+        ),
+        bytecode_cache=FileSystemBytecodeCache(),
+        auto_reload=False,
+        autoescape=False,
+    )
+    env.tests["streamed"] = lambda value: isinstance(value, StreamedFragment)
+    env.tests["rendered"] = lambda value: isinstance(value, RenderedFragment)
+    return env
+
 
-CLASS_TEMPLATE: Template = ENV.get_template("class.jinja2")
-FUNCTION_TEMPLATE: Template = ENV.get_template("function.jinja2")
-MODULE_TEMPLATE: Template = ENV.get_template("module.jinja2")
+def __getattr__(name: str) -> Any:
+    """Lazily provides ENV and the default templates as module attributes."""
+    if name == "ENV":
+        return get_environment()
+    if name in TEMPLATE_NAMES:
+        return get_template(TEMPLATE_NAMES[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
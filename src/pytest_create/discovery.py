@@ -0,0 +1,268 @@
+"""A module used for discovering several source roots with shared caches."""
+import contextlib
+import glob
+import sys
+import threading
+from dataclasses import dataclass
+from dataclasses import field
+from importlib.abc import MetaPathFinder
+from importlib.abc import PathEntryFinder
+from importlib.machinery import ModuleSpec
+from importlib.machinery import all_suffixes
+from pathlib import Path
+from types import ModuleType
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+from loguru import logger
+
+from pytest_create.bytecode import find_init_bytecode
+from pytest_create.util import import_from_name
+from pytest_create.util import load_from_file
+from pytest_create.util import load_from_name
+
+
+if sys.version_info >= (3, 8):
+    from importlib import metadata
+else:
+    import importlib_metadata as metadata
+
+
+ModuleFactory = Callable[[], Optional[ModuleType]]
+
+MODULE_SUFFIXES: Tuple[str, ...] = (*all_suffixes(), ".pyi")
+IMPORT_PATH: str = "import"
+
+
+@dataclass(frozen=True)
+class SourceRoot:
+    """A source directory or file and the directory its tests are created in.
+
+    When modules are given, only the modules with those names are discovered
+    under src instead of walking it.
+    """
+
+    src: Path
+    dst: Path
+    modules: Optional[Tuple[str, ...]] = None
+
+
+@dataclass
+class DiscoveryReport:
+    """The path each discovered module took, and why modules were imported.
+
+    A module is either imported or read without being imported, statically from
+    its source or from its stub or bytecode. The reasons are the dynamic
+    features that required a module to be imported in auto discovery.
+    """
+
+    paths: Dict[str, str] = field(default_factory=dict)
+    reasons: Dict[str, List[str]] = field(default_factory=dict)
+
+    def record(self, name: str, path: str) -> None:
+        """Records the path a module took."""
+        logger.debug(f"Discovered {name} by {path}")
+        self.paths[name] = path
+
+    def add_reasons(self, name: str, reasons: Iterable[str]) -> None:
+        """Records why a module had to be imported."""
+        self.reasons[name] = list(reasons)
+
+    def get_modules(self, path: str) -> List[str]:
+        """Returns the names of the modules that took a path."""
+        return sorted(name for name, taken in self.paths.items() if taken == path)
+
+    def count_paths(self) -> Dict[str, int]:
+        """Returns the number of modules that took each path."""
+        counts: Dict[str, int] = {}
+        for path in self.paths.values():
+            counts[path] = counts.get(path, 0) + 1
+        return counts
+
+
+class ImportManager:
+    """Loads each source module once, even when several threads discover roots.
+
+    Loaded modules are indexed by the path of their source file, so every root
+    shares the same module objects and the same path index. A module that was
+    already loaded from a file under the same name, such as through a symlink
+    or a relative path in another root, is not loaded again.
+    """
+
+    def __init__(self) -> None:
+        """Creates an empty module cache and path index."""
+        self.modules: Dict[Tuple[str, str], Optional[ModuleType]] = {}
+        self.path_index: Dict[Path, ModuleType] = {}
+        self._lock: threading.Lock = threading.Lock()
+        self._module_locks: Dict[Tuple[str, str], threading.Lock] = {}
+
+    def load_from_name(
+        self, name: str, finder: Union[PathEntryFinder, MetaPathFinder]
+    ) -> Optional[ModuleType]:
+        """Load a module from its name, or return it if it is already loaded."""
+        spec: Optional[ModuleSpec] = None
+        with contextlib.suppress(Exception):
+            spec = finder.find_spec(name, None)
+        origin: str = str(getattr(spec, "origin", None))
+        return self._load((name, origin), lambda: load_from_name(name, finder))
+
+    def import_from_name(
+        self, name: str, finder: Union[PathEntryFinder, MetaPathFinder]
+    ) -> Optional[ModuleType]:
+        """Import a module from its name into sys.modules, or return it if loaded."""
+        spec: Optional[ModuleSpec] = None
+        with contextlib.suppress(Exception):
+            spec = finder.find_spec(name, None)
+        origin: str = str(getattr(spec, "origin", None))
+        return self._load((name, origin), lambda: import_from_name(name, finder))
+
+    def load_from_file(
+        self, path: Path, name: Optional[str] = None
+    ) -> Optional[ModuleType]:
+        """Load the module located at the given path, or return it if loaded."""
+        return self._load(
+            (name or path.stem, str(path)), lambda: load_from_file(path, name=name)
+        )
+
+    def _load(self, key: Tuple[str, str], load: ModuleFactory) -> Optional[ModuleType]:
+        with self._lock:
+            module_lock: threading.Lock = self._module_locks.setdefault(
+                key, threading.Lock()
+            )
+        with module_lock:
+            if key not in self.modules:
+                module: Optional[ModuleType] = self._find_indexed(*key) or load()
+                self.modules[key] = module
+                module_file: Optional[str] = getattr(module, "__file__", None)
+                if module is not None and module_file is not None:
+                    with self._lock:
+                        self.path_index[Path(module_file).resolve()] = module
+            return self.modules[key]
+
+    def _find_indexed(self, name: str, origin: str) -> Optional[ModuleType]:
+        """Returns the module loaded from the origin file under the name, if any."""
+        with self._lock:
+            module: Optional[ModuleType] = self.path_index.get(Path(origin).resolve())
+        return module if getattr(module, "__name__", None) == name else None
+
+
+def find_package_name(directory: Path) -> str:
+    """Returns the dotted name of the package a directory is, or an empty string.
+
+    The name is found by walking up through the directories that have an
+    __init__ module, in source or bytecode, so src/shapes is the package
+    shapes when src has no __init__ module.
+    """
+    parts: List[str] = []
+    while directory.name and (
+        (directory / "__init__.py").is_file()
+        or find_init_bytecode(directory) is not None
+    ):
+        parts.insert(0, directory.name)
+        directory = directory.parent
+    return ".".join(parts)
+
+
+def expand_roots(specs: Iterable[str], dst: Path) -> List[SourceRoot]:
+    """Returns the source roots described by SRC[=DST] specifications.
+
+    SRC may be a glob. The parts of each match that fill a wildcard part of SRC
+    fill the wildcard parts of DST in order, so services/*/src=services/*/tests
+    maps services/api/src to services/api/tests. Without DST, the captured parts
+    are joined onto the default destination directory.
+    """
+    roots: List[SourceRoot] = []
+    for spec in specs:
+        src_pattern, _, dst_pattern = spec.partition("=")
+        matches: List[str] = (
+            sorted(glob.glob(src_pattern, recursive=True))
+            if glob.has_magic(src_pattern)
+            else [src_pattern]
+        )
+        if not matches:
+            logger.warning(f"No source roots match {src_pattern}")
+        for match in matches:
+            captures: List[str] = _get_captures(src_pattern, match)
+            root_dst: Path = (
+                _fill_wildcards(dst_pattern, captures)
+                if dst_pattern
+                else dst.joinpath(*captures)
+            )
+            roots.append(SourceRoot(Path(match).resolve(), root_dst.resolve()))
+    return roots
+
+
+def get_distribution_root(name: str, dst: Path) -> SourceRoot:
+    """Returns the source root of an installed distribution.
+
+    The distribution's modules are listed from the RECORD of its installed
+    files, so the directory it is installed in is never walked. Raises
+    PackageNotFoundError when the distribution is not installed.
+    """
+    distribution: metadata.Distribution = metadata.distribution(name)
+    src: Path = Path(str(distribution.locate_file(""))).resolve()
+    modules: List[str] = get_distribution_modules(distribution)
+    logger.debug(f"Found {len(modules)} modules in the {name} distribution")
+    return SourceRoot(src=src, dst=dst, modules=tuple(modules))
+
+
+def get_distribution_modules(distribution: metadata.Distribution) -> List[str]:
+    """Returns the names of the modules in a distribution's RECORD.
+
+    Python sources, extension modules and stubs are listed, while files
+    installed outside of the distribution's directory, such as scripts, and
+    files that cannot be imported are left out. Packages are
+    listed before the modules they contain.
+    """
+    files: Optional[List[metadata.PackagePath]] = distribution.files
+    if files is None:
+        logger.warning(
+            f"No RECORD of installed files found for {distribution.metadata['Name']}"
+        )
+        return []
+    names: Dict[str, None] = {}
+    for file in files:
+        parts: Tuple[str, ...] = file.parts
+        stem: str = file.name.split(".", 1)[0]
+        if (
+            not file.name.endswith(MODULE_SUFFIXES)
+            or not parts
+            or "__pycache__" in parts
+            or not all(part.isidentifier() for part in parts[:-1])
+            or not stem.isidentifier()
+        ):
+            continue
+        module_parts: Tuple[str, ...] = (
+            parts[:-1] if stem == "__init__" else (*parts[:-1], stem)
+        )
+        if module_parts:
+            names[".".join(module_parts)] = None
+    return sorted(names)
+
+
+def _get_captures(pattern: str, match: str) -> List[str]:
+    """Returns the parts of a match that fill the wildcard parts of a pattern."""
+    pattern_parts: Tuple[str, ...] = Path(pattern).parts
+    match_parts: Tuple[str, ...] = Path(match).parts
+    if len(pattern_parts) != len(match_parts):
+        return []
+    return [
+        match_part
+        for pattern_part, match_part in zip(pattern_parts, match_parts)
+        if glob.has_magic(pattern_part)
+    ]
+
+
+def _fill_wildcards(pattern: str, captures: List[str]) -> Path:
+    """Replaces the wildcard parts of a pattern with the captured parts."""
+    remaining: List[str] = list(captures)
+    parts: List[str] = [
+        remaining.pop(0) if glob.has_magic(part) and remaining else part
+        for part in Path(pattern).parts
+    ]
+    return Path(*parts)
@@ -0,0 +1,207 @@
+"""A module used for regenerating only the tests of source objects that changed.
+
+The fingerprint of an object covers its signature and docstring, and those of
+the methods listed for a class, but not its body, so editing the body of a
+function does not change it. The stub hash of an object is a hash of the syntax
+tree of the test definition created for it, which does not depend on how the
+test file is formatted. A test whose stub hash no longer matches was edited by
+hand and is never replaced.
+"""
+import ast
+import hashlib
+import inspect
+import json
+from dataclasses import asdict
+from dataclasses import dataclass
+from dataclasses import field
+from pathlib import Path
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Mapping
+from typing import Optional
+from typing import Set
+from typing import Tuple
+from typing import Union
+
+from loguru import logger
+
+from pytest_create.signatures import get_signature
+
+
+FINGERPRINTS_DIRECTORY: str = "pytest-create-fingerprints"
+FINGERPRINTS_FILE_NAME: str = "fingerprints.json"
+
+_TestNode = Union[ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef]
+
+
+@dataclass
+class ObjectFingerprint:
+    """The fingerprint of a source object and the test created for it."""
+
+    fingerprint: str
+    test: str
+    stub: Optional[str] = None
+
+
+@dataclass
+class FingerprintIndex:
+    """The fingerprints of the source objects by qualified name."""
+
+    objects: Dict[str, ObjectFingerprint] = field(default_factory=dict)
+
+    @classmethod
+    def from_file(cls, path: Path) -> "FingerprintIndex":
+        """Reads the fingerprints written by a previous run.
+
+        An empty index is returned when the file is missing or cannot be read.
+        """
+        try:
+            data: Dict[str, Dict[str, Any]] = json.loads(
+                path.read_text(encoding="utf-8")
+            )
+            return cls(
+                objects={
+                    name: ObjectFingerprint(**fingerprint)
+                    for name, fingerprint in data.items()
+                }
+            )
+        except (OSError, ValueError, TypeError) as e:
+            logger.debug(f"No fingerprints read from {path} - {e}")
+            return cls()
+
+    def write(self, path: Path) -> None:
+        """Writes the fingerprints for the next run."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(
+            json.dumps(
+                {name: asdict(value) for name, value in sorted(self.objects.items())},
+                indent=1,
+            ),
+            encoding="utf-8",
+        )
+
+    def get(self, name: str) -> Optional[ObjectFingerprint]:
+        """Returns the fingerprint of the object with the qualified name."""
+        return self.objects.get(name)
+
+    def set(self, name: str, fingerprint: ObjectFingerprint) -> None:
+        """Sets the fingerprint of the object with the qualified name."""
+        self.objects[name] = fingerprint
+
+
+def get_fingerprint(obj: Any, methods: Iterable[str] = ()) -> str:
+    """Returns the fingerprint of a function, or of a class and its listed methods."""
+    parts: List[str] = [_describe(obj)]
+    if inspect.isclass(obj):
+        parts.extend(f"{name}{_describe(vars(obj)[name])}" for name in methods)
+    return hashlib.sha256("\0".join(parts).encode()).hexdigest()
+
+
+def hash_definition(node: ast.AST) -> str:
+    """Returns a hash of a definition's syntax tree, ignoring its formatting."""
+    return hashlib.sha256(ast.dump(node).encode()).hexdigest()
+
+
+def find_test_definitions(source: str) -> Dict[str, _TestNode]:
+    """Returns the top-level functions and classes of a test module by name."""
+    return {
+        node.name: node
+        for node in ast.parse(source).body
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef))
+    }
+
+
+def find_imported_names(source: str) -> Set[str]:
+    """Returns the names bound by the top-level imports of a test module."""
+    names: Set[str] = set()
+    for node in ast.parse(source).body:
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            names.update(
+                alias.asname or alias.name.split(".", 1)[0] for alias in node.names
+            )
+    return names
+
+
+def patch_source(
+    source: str, definitions: Mapping[str, str], imports: Iterable[str] = ()
+) -> str:
+    """Returns a test module with its definitions replaced or appended.
+
+    Each rendered definition replaces the top-level definition of the same name,
+    including its decorators, or is appended to the module when there is none.
+    The import statements are added after the existing imports, or after the
+    module docstring when there are none.
+    """
+    lines: List[str] = source.splitlines()
+    tree: ast.Module = ast.parse(source)
+    body: List[ast.stmt] = tree.body
+    names: Dict[str, int] = {
+        node.name: index
+        for index, node in enumerate(body)
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef))
+    }
+    edits: List[Tuple[int, int, List[str]]] = [
+        (
+            _get_start(body[names[name]]),
+            _get_end(body, names[name], lines),
+            rendered.strip("\n").splitlines(),
+        )
+        for name, rendered in definitions.items()
+        if name in names
+    ]
+    position: int = _get_import_position(tree, lines)
+    edits.append((position + 1, position, [line for line in imports if line]))
+    for start, end, replacement in sorted(
+        edits, key=lambda edit: edit[0], reverse=True
+    ):
+        lines[start - 1 : end] = replacement
+    appended: List[str] = [
+        rendered.strip("\n")
+        for name, rendered in definitions.items()
+        if name not in names
+    ]
+    return "\n\n\n".join(["\n".join(lines).rstrip("\n"), *appended]) + "\n"
+
+
+def _get_import_position(tree: ast.Module, lines: List[str]) -> int:
+    """Returns the line after which new import statements are added."""
+    body: List[ast.stmt] = tree.body
+    import_indexes: List[int] = [
+        index
+        for index, node in enumerate(body)
+        if isinstance(node, (ast.Import, ast.ImportFrom))
+    ]
+    if import_indexes:
+        return _get_end(body, import_indexes[-1], lines)
+    if ast.get_docstring(tree, clean=False) is not None:
+        return _get_end(body, 0, lines)
+    return 0
+
+
+def _get_start(node: ast.stmt) -> int:
+    """Returns the first line of a statement, including its decorators."""
+    decorators: List[ast.expr] = getattr(node, "decorator_list", [])
+    return min([node.lineno, *(decorator.lineno for decorator in decorators)])
+
+
+def _get_end(body: List[ast.stmt], index: int, lines: List[str]) -> int:
+    """Returns the last line of a top-level statement.
+
+    The end is found from the start of the next statement, since end_lineno is
+    not available on every supported Python version. Blank lines and the
+    comments above the next statement are left out.
+    """
+    end: int = _get_start(body[index + 1]) - 1 if index + 1 < len(body) else len(lines)
+    while end > body[index].lineno and (
+        not lines[end - 1].strip() or lines[end - 1].startswith("#")
+    ):
+        end -= 1
+    return end
+
+
+def _describe(obj: Any) -> str:
+    """Returns the normalized signature and docstring of an object."""
+    func: Any = getattr(obj, "__func__", obj)
+    return f"{get_signature(func)}\0{inspect.cleandoc(func.__doc__ or '')}"
@@ -0,0 +1,275 @@
+"""A module used for formatting rendered source code with isort and black.
+
+isort and black are only imported when a source is formatted, so that loading
+the plugin does not pay for importing them. Their settings are read from the
+configuration files of the tree the source is written to, so created tests are
+formatted the same way as the rest of the project.
+"""
+import hashlib
+import json
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from dataclasses import field
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+from loguru import logger
+
+
+@dataclass(frozen=True)
+class FormatSettings:
+    """The isort config and black mode used to format the sources of a directory.
+
+    The description holds the settings read from configuration files and is
+    part of the cache key, so changing them formats the sources again.
+    """
+
+    isort_config: Any = None
+    black_mode: Any = None
+    description: str = ""
+
+
+@dataclass
+class FormatCache:
+    """A cache of formatted source code keyed by a hash of the rendered source.
+
+    Formatted sources are kept in memory and, when a directory is given,
+    written to it so that later runs can reuse them.
+    """
+
+    directory: Optional[Path] = None
+    line_length: int = 88
+    formatted: Dict[str, str] = field(default_factory=dict, repr=False)
+
+    def key(self, source: str, settings: Optional[FormatSettings] = None) -> str:
+        """Returns the cache key of a rendered source and the settings it uses."""
+        versions: str = "-".join(
+            [
+                str(get_version("black")),
+                str(get_version("isort")),
+                str(self.line_length),
+            ]
+        )
+        description: str = settings.description if settings is not None else ""
+        return hashlib.sha256(
+            f"{versions}\0{description}\0{source}".encode()
+        ).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Returns the formatted source for a key if it has been cached."""
+        if key in self.formatted:
+            return self.formatted[key]
+        if self.directory is not None:
+            path: Path = self.directory / f"{key}.py"
+            if path.is_file():
+                self.formatted[key] = path.read_text(encoding="utf-8")
+                return self.formatted[key]
+        return None
+
+    def set(self, key: str, formatted: str) -> None:
+        """Caches the formatted source for a key."""
+        self.formatted[key] = formatted
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            (self.directory / f"{key}.py").write_text(formatted, encoding="utf-8")
+
+
+@lru_cache(maxsize=None)
+def get_version(distribution: str) -> Optional[str]:
+    """Returns the installed version of a distribution without importing it."""
+    if sys.version_info >= (3, 8):
+        from importlib import metadata
+    else:  # pragma: no cover
+        import importlib_metadata as metadata
+    try:
+        return metadata.version(distribution)
+    except metadata.PackageNotFoundError:
+        return None
+
+
+@lru_cache(maxsize=None)
+def get_format_settings(
+    directory: Optional[Path] = None, line_length: int = 88
+) -> FormatSettings:
+    """Returns the isort and black settings that apply to a directory.
+
+    Configuration files are looked up from the closest existing directory
+    upwards, as isort and black do. Without one, isort uses the black profile
+    and both use the given line length. Formatters that are not installed have
+    no settings.
+    """
+    start: Optional[Path] = _find_existing_directory(directory)
+    isort_config, isort_settings = _get_isort_settings(start, line_length)
+    black_mode, black_settings = _get_black_settings(start, line_length)
+    return FormatSettings(
+        isort_config=isort_config,
+        black_mode=black_mode,
+        description=json.dumps(
+            {"isort": isort_settings, "black": black_settings},
+            sort_keys=True,
+            default=_to_json,
+        ),
+    )
+
+
+def format_source(
+    source: str, line_length: int = 88, settings: Optional[FormatSettings] = None
+) -> str:
+    """Formats source code in-process with isort and black when installed."""
+    format_settings: FormatSettings = (
+        settings if settings is not None else get_format_settings(None, line_length)
+    )
+    if format_settings.isort_config is not None:
+        import isort
+
+        source = isort.code(source, config=format_settings.isort_config)
+    if format_settings.black_mode is not None:
+        import black
+
+        source = black.format_str(source, mode=format_settings.black_mode)
+    return source
+
+
+def format_sources(
+    sources: Sequence[str],
+    cache: Optional[FormatCache] = None,
+    batch_size: int = 32,
+    max_workers: Optional[int] = None,
+    paths: Optional[Sequence[Path]] = None,
+) -> List[str]:
+    """Formats rendered modules in batches spread across a process pool.
+
+    Each source is formatted with the settings of the directory of its path,
+    when paths are given. Sources whose formatted output is already cached are
+    not formatted again, and identical sources are only formatted once. A
+    source that fails to format is returned as it is and is not cached.
+    """
+    format_cache: FormatCache = cache if cache is not None else FormatCache()
+    settings: List[FormatSettings] = [
+        get_format_settings(
+            path.parent if path is not None else None, format_cache.line_length
+        )
+        for path in (paths if paths is not None else [None] * len(sources))
+    ]
+    keys: List[str] = [
+        format_cache.key(source, source_settings)
+        for source, source_settings in zip(sources, settings)
+    ]
+    pending: Dict[str, Tuple[str, FormatSettings]] = {
+        key: (source, source_settings)
+        for key, source, source_settings in zip(keys, sources, settings)
+        if format_cache.get(key) is None
+    }
+    items: List[Tuple[str, str, FormatSettings]] = [
+        (key, source, source_settings)
+        for key, (source, source_settings) in pending.items()
+    ]
+    batches: List[List[Tuple[str, str, FormatSettings]]] = [
+        items[index : index + batch_size] for index in range(0, len(items), batch_size)
+    ]
+    logger.debug(f"Formatting {len(items)} of {len(sources)} sources")
+    for key, formatted in _format_batches(batches, max_workers=max_workers):
+        if formatted is not None:
+            format_cache.set(key, formatted)
+    return [
+        format_cache.formatted.get(key, source) for key, source in zip(keys, sources)
+    ]
+
+
+def _format_batches(
+    batches: List[List[Tuple[str, str, FormatSettings]]],
+    max_workers: Optional[int],
+) -> Iterable[Tuple[str, Optional[str]]]:
+    if len(batches) <= 1:
+        for batch in batches:
+            yield from _format_batch(batch)
+        return
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        for formatted_batch in executor.map(_format_batch, batches):
+            yield from formatted_batch
+
+
+def _format_batch(
+    batch: List[Tuple[str, str, FormatSettings]]
+) -> List[Tuple[str, Optional[str]]]:
+    formatted_batch: List[Tuple[str, Optional[str]]] = []
+    for key, source, settings in batch:
+        formatted: Optional[str] = None
+        try:
+            formatted = format_source(source, settings=settings)
+        except Exception as e:
+            logger.warning(f"Failed to format rendered source - {e}")
+        formatted_batch.append((key, formatted))
+    return formatted_batch
+
+
+def _find_existing_directory(directory: Optional[Path]) -> Optional[Path]:
+    """Returns the directory or its closest parent that exists."""
+    if directory is None:
+        return None
+    for candidate in (directory, *directory.parents):
+        if candidate.is_dir():
+            return candidate
+    return None
+
+
+def _get_isort_settings(
+    directory: Optional[Path], line_length: int
+) -> Tuple[Any, List[Dict[str, Any]]]:
+    """Returns the isort config of a directory and the settings files gave it."""
+    try:
+        import isort
+    except ImportError:  # pragma: no cover
+        return None, []
+    if directory is not None:
+        config: Any = isort.Config(settings_path=str(directory))
+        found: List[Dict[str, Any]] = [
+            source for source in config.sources if source.get("source") != "defaults"
+        ]
+        if found:
+            return config, found
+    return isort.Config(profile="black", line_length=line_length), []
+
+
+def _get_black_settings(
+    directory: Optional[Path], line_length: int
+) -> Tuple[Any, Dict[str, Any]]:
+    """Returns the black mode of a directory and the settings files gave it."""
+    try:
+        from black.files import find_pyproject_toml
+        from black.files import parse_pyproject_toml
+        from black.mode import Mode
+        from black.mode import TargetVersion
+    except ImportError:  # pragma: no cover
+        return None, {}
+    found: Dict[str, Any] = {}
+    if directory is not None:
+        pyproject: Optional[str] = find_pyproject_toml((str(directory),))
+        if pyproject is not None:
+            found = parse_pyproject_toml(pyproject)
+    mode: Mode = Mode(
+        target_versions={
+            TargetVersion[version.upper()]
+            for version in found.get("target_version", [])
+        },
+        line_length=found.get("line_length", line_length),
+        string_normalization=not found.get("skip_string_normalization", False),
+        magic_trailing_comma=not found.get("skip_magic_trailing_comma", False),
+        preview=found.get("preview", False),
+    )
+    return mode, found
+
+
+def _to_json(value: Any) -> Any:
+    """Returns a value that json can write, with sets in a stable order."""
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=str)
+    return str(value)
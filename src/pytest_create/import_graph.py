@@ -0,0 +1,206 @@
+"""A module used for ordering source modules by their static imports.
+
+The graph is built from the import statements of each source file without
+importing any of them, and only the imports of modules found under the source
+root are kept. Importing the modules in topological order imports each shared
+dependency before the modules that import it, so the time it takes is counted
+once, for the dependency itself.
+"""
+import ast
+import pkgutil
+from collections import Counter
+from dataclasses import dataclass
+from dataclasses import field
+from pathlib import Path
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import Tuple
+from typing import Union
+
+from loguru import logger
+
+from pytest_create.util import ModuleFilter
+
+
+@dataclass
+class ImportGraph:
+    """The modules under a source root and the modules each of them imports."""
+
+    imports: Dict[str, List[str]] = field(default_factory=dict)
+
+    @classmethod
+    def from_path(
+        cls,
+        path: Path,
+        module_filter: Optional[ModuleFilter] = None,
+        prefix: str = "",
+    ) -> "ImportGraph":
+        """Builds the import graph of the modules under path.
+
+        Module names start with the prefix, such as the name of the package
+        path is followed by a dot, so that they match the absolute imports of
+        the sources. Modules whose name is rejected by the module filter are
+        left out, and so are the modules in packages it rejects.
+        """
+        files: Dict[str, Optional[Path]] = dict(
+            _find_module_files(path, module_filter, prefix)
+        )
+        return cls(
+            imports={
+                name: sorted(
+                    imported
+                    for imported in _find_imports(name, file)
+                    if imported in files and imported != name
+                )
+                if file is not None
+                else []
+                for name, file in sorted(files.items())
+            }
+        )
+
+    def update(self, other: "ImportGraph") -> None:
+        """Adds the modules of another graph, such as that of another root."""
+        self.imports.update(other.imports)
+
+    def fan_in(self, name: str) -> int:
+        """Returns the number of modules that import a module."""
+        return sum(name in imported for imported in self.imports.values())
+
+    def count_fan_ins(self) -> "Counter[str]":
+        """Returns the number of modules that import each module."""
+        return Counter(
+            imported for imports in self.imports.values() for imported in imports
+        )
+
+    def fan_out(self, name: str) -> int:
+        """Returns the number of modules a module imports."""
+        return len(self.imports.get(name, []))
+
+    def find_hubs(self, limit: Optional[int] = None) -> List[Tuple[str, int, int]]:
+        """Returns the modules with their fan-in and fan-out, most imported first."""
+        fan_ins: "Counter[str]" = self.count_fan_ins()
+        hubs: List[Tuple[str, int, int]] = sorted(
+            ((name, fan_ins[name], self.fan_out(name)) for name in self.imports),
+            key=lambda hub: (-hub[1], -hub[2], hub[0]),
+        )
+        return hubs[:limit] if limit is not None else hubs
+
+    def topological_order(self) -> List[str]:
+        """Returns the modules ordered so that each comes after its dependencies.
+
+        A module depends on its package and on the modules it imports, except
+        for those in itself, since a package is always imported before its
+        submodules. Modules in an import cycle are ordered by name.
+        """
+        order: List[str] = []
+        visited: Set[str] = set()
+        for name in sorted(self.imports):
+            self._visit(name, visited, order)
+        return order
+
+    def _visit(self, name: str, visited: Set[str], order: List[str]) -> None:
+        """Adds a module to the order after the dependencies it has not visited."""
+        if name in visited:
+            return
+        visited.add(name)
+        stack: List[Tuple[str, Iterator[str]]] = [(name, self._get_dependencies(name))]
+        while stack:
+            current, dependencies = stack[-1]
+            dependency: Optional[str] = next(
+                (
+                    dependency
+                    for dependency in dependencies
+                    if dependency not in visited
+                ),
+                None,
+            )
+            if dependency is None:
+                stack.pop()
+                order.append(current)
+                continue
+            visited.add(dependency)
+            stack.append((dependency, self._get_dependencies(dependency)))
+
+    def _get_dependencies(self, name: str) -> Iterator[str]:
+        """Returns an iterator over the package and imports a module depends on."""
+        package: str = name.rpartition(".")[0]
+        return iter(
+            [
+                *([package] if package in self.imports else []),
+                *(
+                    imported
+                    for imported in self.imports.get(name, [])
+                    if not imported.startswith(f"{name}.")
+                ),
+            ]
+        )
+
+
+def _find_module_files(
+    path: Path, module_filter: Optional[ModuleFilter] = None, prefix: str = ""
+) -> Iterable[Tuple[str, Optional[Path]]]:
+    """Yields the name and source file of each module find_modules walks.
+
+    The file is None for modules that have no Python source, such as extension
+    modules.
+    """
+    for _, name, ispkg in pkgutil.iter_modules([str(path)], prefix=prefix):
+        if module_filter is not None and not module_filter(name):
+            continue
+        stem: str = name.rpartition(".")[2]
+        file: Path = path / stem / "__init__.py" if ispkg else path / f"{stem}.py"
+        yield name, file if file.is_file() else None
+        if ispkg:
+            yield from _find_module_files(path / stem, module_filter, f"{name}.")
+
+
+def _find_imports(name: str, file: Path) -> Set[str]:
+    """Returns the absolute names of the modules a source file may import.
+
+    Both the module of a from import and the names it imports are returned,
+    since those names may be submodules. Imports in function bodies are left
+    out, as they do not run when the module is imported.
+    """
+    try:
+        tree: ast.Module = ast.parse(file.read_text(encoding="utf-8"), str(file))
+    except (OSError, SyntaxError, ValueError) as e:
+        logger.debug(f"Failed to parse {file} - {e}")
+        return set()
+    package: str = name if file.name == "__init__.py" else name.rpartition(".")[0]
+    imports: Set[str] = set()
+    for node in _walk_imports(tree):
+        if isinstance(node, ast.Import):
+            imports.update(alias.name for alias in node.names)
+            continue
+        base: Optional[str] = _resolve_from(node, package)
+        if base is not None:
+            imports.add(base)
+            imports.update(f"{base}.{alias.name}" for alias in node.names)
+    return imports
+
+
+def _walk_imports(node: ast.AST) -> Iterator[Union[ast.Import, ast.ImportFrom]]:
+    """Yields the import statements under a node that are not in a function."""
+    for child in ast.iter_child_nodes(node):
+        if isinstance(child, (ast.Import, ast.ImportFrom)):
+            yield child
+        elif not isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            yield from _walk_imports(child)
+
+
+def _resolve_from(node: ast.ImportFrom, package: str) -> Optional[str]:
+    """Returns the absolute module name of a from import.
+
+    None is returned for a relative import beyond the top-level package.
+    """
+    if not node.level:
+        return node.module or ""
+    parts: List[str] = package.split(".") if package else []
+    if node.level > len(parts):
+        return None
+    base: str = ".".join(parts[: len(parts) - node.level + 1])
+    return f"{base}.{node.module}" if node.module else base
@@ -0,0 +1,67 @@
+"""A module used for indexing the discovered subclasses of discovered classes.
+
+A method belongs to the first class in a class's MRO that defines it, so a
+method inherited by many subclasses is attributed to a single class. Its test
+is created once, in the test of that class, and can be run against each of
+the discovered subclasses that inherit it.
+
+Classes are matched by qualified name, because the base classes of a
+discovered subclass are the copies its module imported rather than the copies
+pytest-create loaded.
+"""
+import inspect
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+
+from pytest_create.util import get_qualified_name
+
+
+@dataclass
+class MroIndex:
+    """The discovered subclasses of each discovered class, in discovery order."""
+
+    subclasses: Dict[type, List[type]] = field(default_factory=dict)
+
+    @classmethod
+    def from_classes(cls, classes: Iterable[type]) -> "MroIndex":
+        """Returns the index of the subclass relations between the classes."""
+        index: MroIndex = cls()
+        discovered: List[type] = list(classes)
+        names: Dict[Optional[str], type] = {
+            get_qualified_name(klass): klass for klass in discovered
+        }
+        names.pop(None, None)
+        for subclass in discovered:
+            for base in inspect.getmro(subclass)[1:]:
+                klass: Optional[type] = names.get(get_qualified_name(base))
+                if klass is not None and klass is not subclass:
+                    index.subclasses.setdefault(klass, []).append(subclass)
+        return index
+
+    def get_subclasses(self, cls: type) -> List[type]:
+        """Returns the discovered subclasses of a class."""
+        return self.subclasses.get(cls, [])
+
+    def get_inheritors(self, cls: type, name: str) -> List[type]:
+        """Returns the discovered subclasses that inherit an attribute from a class.
+
+        Subclasses that override the attribute, or inherit it from a class
+        between them and cls in their MRO, are left out.
+        """
+        return [
+            subclass
+            for subclass in self.get_subclasses(cls)
+            if get_qualified_name(get_owner(subclass, name)) == get_qualified_name(cls)
+        ]
+
+
+def get_owner(cls: type, name: str) -> Optional[type]:
+    """Returns the class in a class's MRO that defines an attribute."""
+    for owner in inspect.getmro(cls):
+        if name in vars(owner):
+            return owner
+    return None
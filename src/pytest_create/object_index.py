@@ -0,0 +1,62 @@
+"""A module used for indexing the source objects of a discovery run.
+
+Objects are indexed by qualified name rather than identity. A module loaded by
+pytest-create and the same module imported by a package that re-exports it,
+such as an __init__ doing from .impl import *, are distinct module objects
+holding distinct copies of the same classes and functions.
+"""
+import threading
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+
+from loguru import logger
+
+from pytest_create.util import get_qualified_name
+
+
+class ObjectIndex:
+    """The source objects found in a discovery run and the names they are bound to.
+
+    Each object is attributed to the module that defines it under its own name,
+    and every other module attribute bound to it, such as a re-export, is
+    recorded as one of its aliases.
+    """
+
+    def __init__(self) -> None:
+        """Creates an empty index that can be shared by several threads."""
+        self.objects: Dict[str, Any] = {}
+        self.aliases: Dict[str, List[str]] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def add(self, module_name: str, name: str, obj: Any) -> bool:
+        """Indexes an object bound to a name in a module.
+
+        Returns whether the binding is the object's definition. Objects without
+        a module and qualname, such as constants and instances, are not indexed.
+        """
+        qualified_name: Optional[str] = get_qualified_name(obj)
+        if qualified_name is None:
+            return False
+        with self._lock:
+            if obj.__module__ == module_name and getattr(obj, "__name__", None) == name:
+                self.objects.setdefault(qualified_name, obj)
+                return True
+            aliases: List[str] = self.aliases.setdefault(qualified_name, [])
+            if f"{module_name}.{name}" not in aliases:
+                logger.debug(f"{module_name}.{name} is an alias of {qualified_name}")
+                aliases.append(f"{module_name}.{name}")
+        return False
+
+    def get_aliases(self, qualified_name: str) -> List[str]:
+        """Returns the other names an object is bound to."""
+        return self.aliases.get(qualified_name, [])
+
+    def __contains__(self, qualified_name: object) -> bool:
+        """Returns whether an object was found under the qualified name."""
+        return qualified_name in self.objects or qualified_name in self.aliases
+
+    def __len__(self) -> int:
+        """Returns the number of objects whose definition was found."""
+        return len(self.objects)
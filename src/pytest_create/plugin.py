@@ -1,5 +1,12 @@
-"""The pytest-create pytest plugin."""
+"""The pytest-create pytest plugin.
+
+Only the options are registered when the plugin is loaded. The modules that
+discover sources and create tests are imported by the hooks that use them, so
+that a pytest run without --create does not pay for importing them.
+"""
+import re
 from pathlib import Path
+from typing import TYPE_CHECKING
 from typing import List
 from typing import Optional
 from typing import Tuple
@@ -8,7 +15,25 @@ from typing import Union
 import pytest
 from loguru import logger
 
-from pytest_create.create import create_tests
+from pytest_create.constants import DEFAULT_COVERAGE_THRESHOLD
+from pytest_create.constants import DEFAULT_HUB_LIMIT
+from pytest_create.constants import DISCOVERY_MODES
+from pytest_create.constants import FIXTURE_SCOPES
+from pytest_create.rules import KINDS
+from pytest_create.rules import Rules
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pytest_create.coverage_data import CoverageData
+    from pytest_create.discovery import DiscoveryReport
+    from pytest_create.discovery import SourceRoot
+    from pytest_create.formatting import FormatCache
+    from pytest_create.import_graph import ImportGraph
+
+
+untested_key: "pytest.StashKey[List[str]]" = pytest.StashKey()
+discovery_key: "pytest.StashKey[DiscoveryReport]" = pytest.StashKey()
+import_graph_key: "pytest.StashKey[ImportGraph]" = pytest.StashKey()
 
 
 def pytest_addoption(parser: pytest.Parser) -> None:
@@ -22,32 +47,564 @@ def pytest_addoption(parser: pytest.Parser) -> None:
         default=False,
         help="Create test files for a given package module.",
     )
+    group.addoption(
+        "--create-root",
+        action="append",
+        default=[],
+        metavar="SRC[=DST]",
+        help="Another source root or glob of roots to create tests for, with its "
+        "own destination. Wildcards in DST are filled by the parts SRC matched.",
+    )
+    group.addoption(
+        "--create-dist",
+        action="append",
+        default=[],
+        metavar="NAME",
+        help="An installed distribution to create tests for. Its modules are read "
+        "from the distribution's RECORD instead of walking site-packages.",
+    )
+    group.addoption(
+        "--create-stubs",
+        action="store_true",
+        default=False,
+        help="Read modules that have a .pyi stub from the stub instead of "
+        "importing them.",
+    )
+    group.addoption(
+        "--create-stub-path",
+        action="append",
+        default=[],
+        metavar="DIR",
+        help="A directory of .pyi stubs to search after the stubs next to each "
+        "module. Implies --create-stubs.",
+    )
+    group.addoption(
+        "--create-bytecode",
+        action="store_true",
+        default=False,
+        help="Read modules from their cached .pyc files without executing them, "
+        "for installs that ship bytecode only.",
+    )
+    group.addoption(
+        "--create-discovery",
+        choices=DISCOVERY_MODES,
+        default="import",
+        help="How source modules are discovered. auto only imports modules whose "
+        "public surface depends on runtime behavior, reads every other module "
+        "from its source and reports the path each module took.",
+    )
+    group.addoption(
+        "--create-import-graph",
+        nargs="?",
+        type=int,
+        const=DEFAULT_HUB_LIMIT,
+        default=None,
+        metavar="LIMIT",
+        help="Import source modules in the order of their static imports, so each "
+        "shared dependency is imported once, and report the LIMIT most imported "
+        f"modules (default {DEFAULT_HUB_LIMIT}) with their fan-in and fan-out.",
+    )
+    group.addoption(
+        "--create-include",
+        action="append",
+        default=[],
+        metavar="GLOB",
+        help="Only create tests for modules whose absolute dotted name, such as "
+        "pkg.module, matches GLOB. Added to the create_include ini option.",
+    )
+    group.addoption(
+        "--create-exclude",
+        action="append",
+        default=[],
+        metavar="GLOB",
+        help="Neither import nor create tests for modules, and the modules in "
+        "packages, whose absolute dotted name matches GLOB. Added to "
+        "create_exclude.",
+    )
+    group.addoption(
+        "--create-include-name",
+        action="append",
+        default=[],
+        metavar="REGEX",
+        help="Only create tests for objects whose qualname, such as Class.method, "
+        "contains a match of REGEX. Added to create_include_names.",
+    )
+    group.addoption(
+        "--create-exclude-name",
+        action="append",
+        default=[],
+        metavar="REGEX",
+        help="Skip objects whose qualname contains a match of REGEX. Added to "
+        "create_exclude_names.",
+    )
+    group.addoption(
+        "--create-exclude-decorator",
+        action="append",
+        default=[],
+        metavar="NAME",
+        help="Skip objects with a decorator named NAME, such as property. Added to "
+        "create_exclude_decorators.",
+    )
+    group.addoption(
+        "--create-kind",
+        action="append",
+        choices=KINDS,
+        default=[],
+        help="Only create tests for objects of this kind. Replaces create_kinds.",
+    )
+    group.addoption(
+        "--create-private",
+        action="store_true",
+        default=False,
+        help="Also create tests for private objects, whose name starts with _.",
+    )
+    group.addoption(
+        "--create-templates",
+        action="append",
+        default=[],
+        help="Directory of Jinja2 templates that override the default templates.",
+    )
+    group.addoption(
+        "--create-format",
+        action="store_true",
+        default=False,
+        help="Format created test files with isort and black.",
+    )
+    group.addoption(
+        "--create-fixtures",
+        choices=FIXTURE_SCOPES,
+        default=None,
+        help="Create class instances with shared fixtures of the given scope.",
+    )
+    group.addoption(
+        "--create-parametrize",
+        action="store_true",
+        default=False,
+        help="Test objects that need the same check with one parametrized test.",
+    )
+    group.addoption(
+        "--create-subclasses",
+        action="store_true",
+        default=False,
+        help="Test each method once for the class that defines it, parametrized "
+        "over the discovered subclasses that inherit it.",
+    )
+    group.addoption(
+        "--create-update",
+        action="store_true",
+        default=False,
+        help="Patch existing test files with the tests of the objects whose "
+        "signature or docstring changed since the last run. Tests edited by hand "
+        "are left alone. Can not be used with --create-parametrize.",
+    )
+    group.addoption(
+        "--create-benchmarks",
+        nargs="?",
+        const=True,
+        default=False,
+        help="Also create benchmark stubs, by default in a benchmarks directory "
+        "next to the created tests, for the functions and methods that can be "
+        "called without arguments.",
+    )
+    group.addoption(
+        "--create-xdist-groups",
+        type=float,
+        default=None,
+        metavar="SECONDS",
+        help="Put the tests of modules that take at least SECONDS to import in an "
+        "xdist_group, so that --dist loadgroup imports them on a single worker.",
+    )
+    group.addoption(
+        "--create-slow",
+        type=float,
+        default=None,
+        metavar="SECONDS",
+        help="Mark the tests of modules that take at least SECONDS to import as slow.",
+    )
+    group.addoption(
+        "--create-uncovered-only",
+        nargs="?",
+        type=float,
+        const=DEFAULT_COVERAGE_THRESHOLD,
+        default=None,
+        metavar="THRESHOLD",
+        help="Only create tests for functions and methods whose line coverage is "
+        f"below THRESHOLD (default {DEFAULT_COVERAGE_THRESHOLD}).",
+    )
+    group.addoption(
+        "--create-coverage-file",
+        default=None,
+        help="The coverage data file used by --create-uncovered-only "
+        "(default .coverage in the rootdir).",
+    )
+    group.addoption(
+        "--create-untested",
+        action="store_true",
+        default=False,
+        help="Report the public functions, classes and methods under the source "
+        "roots that no collected test tests.",
+    )
+    group.addoption(
+        "--create-index",
+        nargs="?",
+        const=True,
+        default=False,
+        metavar="PATH",
+        help="Update the SQLite symbol index queried by pytest-create index query, "
+        "by default in the pytest cache directory.",
+    )
+    parser.addini(
+        "create_include",
+        type="linelist",
+        default=[],
+        help="Globs of the absolute dotted module names to create tests for.",
+    )
+    parser.addini(
+        "create_exclude",
+        type="linelist",
+        default=[],
+        help="Globs of the absolute dotted module and package names to skip without "
+        "importing them.",
+    )
+    parser.addini(
+        "create_include_names",
+        type="linelist",
+        default=[],
+        help="Regexes of the object qualnames to create tests for.",
+    )
+    parser.addini(
+        "create_exclude_names",
+        type="linelist",
+        default=[],
+        help="Regexes of the object qualnames to skip.",
+    )
+    parser.addini(
+        "create_exclude_decorators",
+        type="linelist",
+        default=[],
+        help="Names of the decorators whose objects are skipped.",
+    )
+    parser.addini(
+        "create_kinds",
+        type="linelist",
+        default=list(KINDS),
+        help=f"Kinds of objects to create tests for, out of {', '.join(KINDS)}.",
+    )
+    parser.addini(
+        "create_private",
+        type="bool",
+        default=False,
+        help="Also create tests for private objects.",
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Registers the markers of the tests pytest-create creates."""
+    config.addinivalue_line(
+        "markers", "slow: tests of modules that are slow to import (--create-slow)"
+    )
 
 
 def pytest_collection_modifyitems(
     config: pytest.Config, items: List[pytest.Item]
 ) -> None:
-    """Creates new tests and skips existing tests when pytest-create is used."""
+    """Creates new tests and skips existing tests when pytest-create is used.
+
+    The collected items are indexed first, so that objects that already have a
+    test are neither created again nor reported as untested.
+    """
     logger.debug("pytest_collection_modifyitems")
     create: Union[str, bool, Tuple[str], Tuple[str, str], None] = config.getoption(
         "--create"
     )
     logger.debug(f"--create - {create}")
-    if create not in [None, False]:
+    root_specs: List[str] = config.getoption("--create-root")
+    dist_names: List[str] = config.getoption("--create-dist")
+    creating: bool = create not in [None, False] or bool(root_specs or dist_names)
+    index_path: Optional[Path] = _get_index_path(config)
+    if (
+        not creating
+        and not config.getoption("--create-untested")
+        and index_path is None
+    ):
+        return
+    from pytest_create.create import CreateOptions
+    from pytest_create.create import create_tests_for_roots
+    from pytest_create.create import find_root_source_objects
+    from pytest_create.create import find_untested
+    from pytest_create.create import index_symbols
+    from pytest_create.discovery import DiscoveryReport
+    from pytest_create.discovery import SourceRoot
+    from pytest_create.discovery import expand_roots
+    from pytest_create.fingerprints import FingerprintIndex
+    from pytest_create.import_graph import ImportGraph
+    from pytest_create.source_module import SourceModule
+    from pytest_create.symbol_index import SymbolIndex
+    from pytest_create.tested_index import TestedIndex
+
+    dst_path: Path = (
+        Path(config.args[0]).resolve() if config.args[0] else _get_default_dst(config)
+    )
+    roots: List[SourceRoot] = [
+        *expand_roots(root_specs, dst=dst_path),
+        *_get_distribution_roots(dist_names, dst=dst_path),
+    ]
+    if create not in [None, False] or not (root_specs or dist_names):
         src_path: Path = (
             Path(create).resolve()
             if isinstance(create, str)
             else _get_default_src(config)
         )
-        dst_path: Path = (
-            Path(config.args[0]).resolve()
-            if config.args[0]
-            else _get_default_dst(config)
+        roots.insert(0, SourceRoot(src=src_path, dst=dst_path))
+    tested_index: TestedIndex = TestedIndex.from_items(items)
+    discovery: str = config.getoption("--create-discovery")
+    discovery_report: Optional[DiscoveryReport] = None
+    if discovery == "auto":
+        discovery_report = config.stash[discovery_key] = DiscoveryReport()
+    import_graph: Optional[ImportGraph] = None
+    if config.getoption("--create-import-graph") is not None:
+        import_graph = config.stash[import_graph_key] = ImportGraph()
+    root_sources: List[List[SourceModule]] = find_root_source_objects(
+        roots,
+        stub_paths=_get_stub_paths(config),
+        bytecode=config.getoption("--create-bytecode"),
+        discovery=discovery,
+        discovery_report=discovery_report,
+        rules=_get_rules(config),
+        import_graph=import_graph,
+    )
+    sources: List[SourceModule] = [
+        source for modules in root_sources for source in modules
+    ]
+    if config.getoption("--create-untested"):
+        config.stash[untested_key] = find_untested(sources, tested_index)
+    if index_path is not None:
+        with SymbolIndex(index_path) as symbol_index:
+            index_symbols(sources, symbol_index, tested_index)
+    if creating:
+        template_dirs: List[Path] = [
+            Path(template_dir).resolve()
+            for template_dir in config.getoption("--create-templates")
+        ]
+        coverage_threshold: Optional[float] = config.getoption(
+            "--create-uncovered-only"
+        )
+        fingerprints_path: Optional[Path] = _get_fingerprints_path(config)
+        fingerprints: Optional[FingerprintIndex] = (
+            FingerprintIndex.from_file(fingerprints_path)
+            if fingerprints_path is not None
+            else None
         )
-        create_tests(src=src_path, dst=dst_path)
+        create_tests_for_roots(
+            roots,
+            options=CreateOptions(
+                template_dirs=template_dirs,
+                format_cache=_get_format_cache(config),
+                fixture_scope=config.getoption("--create-fixtures"),
+                parametrize=config.getoption("--create-parametrize"),
+                subclasses=config.getoption("--create-subclasses"),
+                benchmarks_dst=_get_benchmarks_dst(config, dst=dst_path),
+                xdist_group_seconds=config.getoption("--create-xdist-groups"),
+                slow_seconds=config.getoption("--create-slow"),
+                coverage_data=_get_coverage_data(config),
+                coverage_threshold=coverage_threshold
+                if coverage_threshold is not None
+                else DEFAULT_COVERAGE_THRESHOLD,
+                tested_index=tested_index,
+                fingerprints=fingerprints,
+            ),
+            root_sources=root_sources,
+        )
+        if fingerprints_path is not None and fingerprints is not None:
+            fingerprints.write(fingerprints_path)
         items.clear()
 
 
+def pytest_terminal_summary(
+    terminalreporter: pytest.TerminalReporter, config: pytest.Config
+) -> None:
+    """Reports the untested source objects and the path each module took.
+
+    Untested objects are reported when --create-untested is used, and the
+    discovery paths with --create-discovery auto. Imported modules are listed
+    with the dynamic features that required them to be imported. The most
+    imported source modules are reported with --create-import-graph.
+    """
+    untested: Optional[List[str]] = config.stash.get(untested_key, None)
+    if untested is not None:
+        terminalreporter.section("untested objects")
+        for name in untested:
+            terminalreporter.line(name)
+        terminalreporter.line(f"{len(untested)} untested objects")
+    discovery_report: Optional["DiscoveryReport"] = config.stash.get(
+        discovery_key, None
+    )
+    if discovery_report is not None:
+        terminalreporter.section("discovery paths")
+        for name, path in sorted(discovery_report.paths.items()):
+            reasons: List[str] = discovery_report.reasons.get(name, [])
+            terminalreporter.line(
+                f"{name} - {path}" + (f" ({', '.join(reasons)})" if reasons else "")
+            )
+        terminalreporter.line(
+            ", ".join(
+                f"{count} {path}"
+                for path, count in sorted(discovery_report.count_paths().items())
+            )
+        )
+    import_graph: Optional["ImportGraph"] = config.stash.get(import_graph_key, None)
+    if import_graph is not None:
+        terminalreporter.section("import hubs")
+        for name, fan_in, fan_out in import_graph.find_hubs(
+            config.getoption("--create-import-graph")
+        ):
+            terminalreporter.line(f"{name} - fan-in {fan_in}, fan-out {fan_out}")
+        terminalreporter.line(f"{len(import_graph.imports)} modules")
+
+
+def _get_format_cache(config: pytest.Config) -> Optional["FormatCache"]:
+    """Get the format cache if created test files should be formatted."""
+    from pytest_create.formatting import FormatCache
+
+    if not config.getoption("--create-format"):
+        return None
+    cache: Optional[pytest.Cache] = getattr(config, "cache", None)
+    if cache is None:
+        return FormatCache()
+    return FormatCache(directory=cache.mkdir("pytest-create-format"))
+
+
+def _get_index_path(config: pytest.Config) -> Optional[Path]:
+    """Get the symbol index path if the symbol index should be updated."""
+    from pytest_create.symbol_index import DEFAULT_INDEX_PATH
+    from pytest_create.symbol_index import INDEX_DIRECTORY
+    from pytest_create.symbol_index import INDEX_FILE_NAME
+
+    index: Union[str, bool] = config.getoption("--create-index")
+    if index is False:
+        return None
+    if isinstance(index, str):
+        return Path(index).resolve()
+    cache: Optional[pytest.Cache] = getattr(config, "cache", None)
+    if cache is None:
+        return config.rootpath / DEFAULT_INDEX_PATH
+    return cache.mkdir(INDEX_DIRECTORY) / INDEX_FILE_NAME
+
+
+def _get_fingerprints_path(config: pytest.Config) -> Optional[Path]:
+    """Get the fingerprints path if existing test files should be updated."""
+    from pytest_create.fingerprints import FINGERPRINTS_DIRECTORY
+    from pytest_create.fingerprints import FINGERPRINTS_FILE_NAME
+
+    if not config.getoption("--create-update"):
+        return None
+    if config.getoption("--create-parametrize"):
+        raise pytest.UsageError(
+            "--create-update can not be used with --create-parametrize"
+        )
+    cache: Optional[pytest.Cache] = getattr(config, "cache", None)
+    if cache is None:
+        return config.rootpath.joinpath(
+            ".pytest_cache", "d", FINGERPRINTS_DIRECTORY, FINGERPRINTS_FILE_NAME
+        )
+    return cache.mkdir(FINGERPRINTS_DIRECTORY) / FINGERPRINTS_FILE_NAME
+
+
+def _get_stub_paths(config: pytest.Config) -> Optional[List[Path]]:
+    """Get the stub directories if modules should be read from their stubs."""
+    stub_paths: List[Path] = [
+        Path(stub_path).resolve()
+        for stub_path in config.getoption("--create-stub-path")
+    ]
+    if not stub_paths and not config.getoption("--create-stubs"):
+        return None
+    return stub_paths
+
+
+def _get_rules(config: pytest.Config) -> Rules:
+    """Get the include and exclude rules from the ini file and the CLI.
+
+    Globs, regexes and decorators given on the CLI are added to those of the
+    ini file, and kinds given on the CLI replace them.
+    """
+    try:
+        rules: Rules = Rules(
+            include_modules=(
+                *config.getini("create_include"),
+                *config.getoption("--create-include"),
+            ),
+            exclude_modules=(
+                *config.getini("create_exclude"),
+                *config.getoption("--create-exclude"),
+            ),
+            include_names=(
+                *config.getini("create_include_names"),
+                *config.getoption("--create-include-name"),
+            ),
+            exclude_names=(
+                *config.getini("create_exclude_names"),
+                *config.getoption("--create-exclude-name"),
+            ),
+            exclude_decorators=(
+                *config.getini("create_exclude_decorators"),
+                *config.getoption("--create-exclude-decorator"),
+            ),
+            kinds=tuple(
+                config.getoption("--create-kind") or config.getini("create_kinds")
+            ),
+            private=config.getoption("--create-private")
+            or config.getini("create_private"),
+        )
+        for regex in (*rules.include_names, *rules.exclude_names):
+            re.compile(regex)
+    except (ValueError, re.error) as e:
+        raise pytest.UsageError(f"Invalid create rules - {e}") from e
+    return rules
+
+
+def _get_distribution_roots(names: List[str], dst: Path) -> List["SourceRoot"]:
+    """Get the source roots of the installed distributions to create tests for."""
+    from pytest_create.discovery import get_distribution_root
+
+    roots: List["SourceRoot"] = []
+    for name in names:
+        try:
+            roots.append(get_distribution_root(name, dst=dst))
+        except ImportError as e:
+            raise pytest.UsageError(f"Distribution {name} is not installed") from e
+    return roots
+
+
+def _get_coverage_data(config: pytest.Config) -> Optional["CoverageData"]:
+    """Get the coverage data if only uncovered objects should be tested."""
+    import sqlite3
+
+    from pytest_create.coverage_data import CoverageData
+
+    if config.getoption("--create-uncovered-only") is None:
+        return None
+    coverage_file: Optional[str] = config.getoption("--create-coverage-file")
+    path: Path = (
+        Path(coverage_file).resolve()
+        if coverage_file
+        else config.rootpath / ".coverage"
+    )
+    try:
+        return CoverageData.from_file(path)
+    except (FileNotFoundError, sqlite3.Error) as e:
+        raise pytest.UsageError(f"Unable to read coverage data - {e}") from e
+
+
+def _get_benchmarks_dst(config: pytest.Config, dst: Path) -> Optional[Path]:
+    """Get the benchmarks directory path if benchmark stubs should be created."""
+    benchmarks: Union[str, bool] = config.getoption("--create-benchmarks")
+    if benchmarks is False:
+        return None
+    if isinstance(benchmarks, str):
+        return Path(benchmarks).resolve()
+    return dst.parent / "benchmarks"
+
+
 def _get_default_src(config: pytest.Config) -> Path:
     """Get the default source directory path."""
     logger.debug("_get_default_src")
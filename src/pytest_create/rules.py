@@ -0,0 +1,152 @@
+"""A module used for selecting source modules and objects with declarative rules.
+
+Rules are read from the pytest configuration, such as [tool.pytest.ini_options]
+in pyproject.toml, and from the command line. They are compiled once into a
+few regular expressions. Module rules only need a module's name, so they are
+evaluated before the module is imported, and an excluded package is neither
+imported nor walked.
+"""
+import fnmatch
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import FrozenSet
+from typing import Iterable
+from typing import Optional
+from typing import Pattern
+from typing import Tuple
+
+
+KINDS: Tuple[str, ...] = ("function", "class", "method")
+WILDCARDS: Pattern[str] = re.compile(r"[*?\[]")
+
+
+@dataclass(frozen=True)
+class Rules:
+    """The modules and objects to create tests for.
+
+    Module globs match absolute dotted module names, such as pkg.module even
+    when the source root is the pkg directory, and excluding a package excludes
+    every module in it. Name regexes are searched for in qualnames, such as
+    Class.method, and the methods of an included class are selected on their
+    own. Private objects are only kept when private is set, and objects with
+    one of the excluded decorators or a kind that is not listed are left out.
+    """
+
+    include_modules: Tuple[str, ...] = ()
+    exclude_modules: Tuple[str, ...] = ()
+    include_names: Tuple[str, ...] = ()
+    exclude_names: Tuple[str, ...] = ()
+    exclude_decorators: Tuple[str, ...] = ()
+    kinds: Tuple[str, ...] = KINDS
+    private: bool = False
+
+    def __post_init__(self) -> None:
+        """Checks that every kind is one of KINDS."""
+        invalid: Tuple[str, ...] = tuple(
+            kind for kind in self.kinds if kind not in KINDS
+        )
+        if invalid:
+            raise ValueError(f"Kinds must be in {KINDS}, got {invalid}")
+
+
+class CompiledRules:
+    """Rules compiled into the predicates evaluated for each module and object."""
+
+    def __init__(self, rules: Rules) -> None:
+        """Compiles the globs and regexes of the rules.
+
+        Raises re.error when one of the name regexes is invalid.
+        """
+        self.rules: Rules = rules
+        self._include_modules: Optional[Pattern[str]] = _compile_globs(
+            rules.include_modules
+        )
+        self._exclude_modules: Optional[Pattern[str]] = _compile_globs(
+            rules.exclude_modules
+        )
+        self._include_prefixes: Tuple[str, ...] = tuple(
+            WILDCARDS.split(glob, 1)[0] for glob in rules.include_modules
+        )
+        self._include_names: Optional[Pattern[str]] = _compile_regexes(
+            rules.include_names
+        )
+        self._exclude_names: Optional[Pattern[str]] = _compile_regexes(
+            rules.exclude_names
+        )
+        self._exclude_decorators: FrozenSet[str] = frozenset(rules.exclude_decorators)
+        self._kinds: FrozenSet[str] = frozenset(rules.kinds)
+
+    @property
+    def needs_decorators(self) -> bool:
+        """Returns whether objects are selected by their decorators."""
+        return bool(self._exclude_decorators)
+
+    def may_contain(self, module_name: str) -> bool:
+        """Returns whether a module, or any module in it, can be included.
+
+        Modules for which this is False are neither imported nor walked.
+        """
+        if self._is_excluded(module_name):
+            return False
+        if self._include_modules is None:
+            return True
+        return bool(self._include_modules.match(module_name)) or any(
+            prefix.startswith(f"{module_name}.") or f"{module_name}.".startswith(prefix)
+            for prefix in self._include_prefixes
+        )
+
+    def includes_module(self, module_name: str) -> bool:
+        """Returns whether tests are created for a module."""
+        return not self._is_excluded(module_name) and (
+            self._include_modules is None
+            or bool(self._include_modules.match(module_name))
+        )
+
+    def includes_object(
+        self, qualname: str, kind: str, decorators: Iterable[str] = ()
+    ) -> bool:
+        """Returns whether tests are created for a function, class or method."""
+        name: str = qualname.rsplit(".", 1)[-1]
+        return (
+            kind in self._kinds
+            and not (name.startswith("__") and name.endswith("__"))
+            and (self.rules.private or not name.startswith("_"))
+            and (
+                self._include_names is None
+                or self._include_names.search(qualname) is not None
+            )
+            and (
+                self._exclude_names is None
+                or self._exclude_names.search(qualname) is None
+            )
+            and self._exclude_decorators.isdisjoint(decorators)
+        )
+
+    def _is_excluded(self, module_name: str) -> bool:
+        """Returns whether a module or one of its packages is excluded."""
+        if self._exclude_modules is None:
+            return False
+        parts: Tuple[str, ...] = tuple(module_name.split("."))
+        return any(
+            self._exclude_modules.match(".".join(parts[:index]))
+            for index in range(1, len(parts) + 1)
+        )
+
+
+@lru_cache(maxsize=None)
+def compile_rules(rules: Rules) -> CompiledRules:
+    """Returns the compiled rules, compiling each set of rules only once."""
+    return CompiledRules(rules)
+
+
+def _compile_globs(globs: Iterable[str]) -> Optional[Pattern[str]]:
+    """Returns a pattern matching any of the globs, or None without globs."""
+    patterns: Tuple[str, ...] = tuple(fnmatch.translate(glob) for glob in globs)
+    return re.compile("|".join(patterns)) if patterns else None
+
+
+def _compile_regexes(regexes: Iterable[str]) -> Optional[Pattern[str]]:
+    """Returns a pattern searching for any of the regexes, or None without any."""
+    patterns: Tuple[str, ...] = tuple(f"(?:{regex})" for regex in regexes)
+    return re.compile("|".join(patterns)) if patterns else None
@@ -0,0 +1,310 @@
+"""A module used for extracting the signatures of Python callables.
+
+Signatures are built directly from code objects, ``__text_signature__`` or the
+AST, so annotations are never evaluated. Stringified annotations are kept as
+they are.
+"""
+import ast
+import inspect
+from functools import lru_cache
+from types import BuiltinFunctionType
+from types import CodeType
+from types import FunctionType
+from types import MethodType
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Union
+from weakref import WeakKeyDictionary
+
+import astor
+from loguru import logger
+
+
+CO_VARARGS: int = inspect.CO_VARARGS
+CO_VARKEYWORDS: int = inspect.CO_VARKEYWORDS
+
+_CodeSignature = Tuple[
+    Optional[Tuple[Any, ...]],
+    Optional[Dict[str, Any]],
+    Dict[str, Any],
+    inspect.Signature,
+]
+PREFIXED_SIGNATURES_MAXSIZE: int = 1024
+
+_code_signatures: "WeakKeyDictionary[CodeType, _CodeSignature]" = WeakKeyDictionary()
+
+
+class SourceExpression(str):
+    """The source code of an expression, such as a default value from the AST."""
+
+    def __repr__(self) -> str:
+        """Returns the source code unquoted so it renders as written."""
+        return str(self)
+
+
+def get_signature(obj: Callable[..., Any]) -> inspect.Signature:
+    """Returns the signature of a callable without evaluating its annotations.
+
+    Signatures of Python functions are cached by code object, so a function
+    that is re-exported by several modules is only inspected once.
+    """
+    explicit_signature: Any = getattr(obj, "__signature__", None)
+    if isinstance(explicit_signature, inspect.Signature):
+        return explicit_signature
+    if isinstance(obj, MethodType):
+        signature: inspect.Signature = get_signature(obj.__func__)
+        return _without_first_parameter(signature)
+    unwrapped: Any = inspect.unwrap(obj)
+    if isinstance(unwrapped, FunctionType):
+        return signature_from_function(unwrapped)
+    if isinstance(unwrapped, BuiltinFunctionType):
+        text_signature: Optional[str] = getattr(unwrapped, "__text_signature__", None)
+        if text_signature:
+            parsed: Optional[inspect.Signature] = signature_from_text(
+                text_signature,
+                skip_bound_arg=getattr(unwrapped, "__self__", None) is not None,
+            )
+            if parsed is not None:
+                return parsed
+    return _inspect_signature(obj)
+
+
+def signature_from_function(func: FunctionType) -> inspect.Signature:
+    """Returns the signature of a Python function built from its code object."""
+    code: CodeType = func.__code__
+    defaults: Optional[Tuple[Any, ...]] = func.__defaults__
+    kwdefaults: Optional[Dict[str, Any]] = func.__kwdefaults__
+    annotations: Dict[str, Any] = func.__annotations__
+    cached: Optional[_CodeSignature] = _code_signatures.get(code)
+    if (
+        cached is not None
+        and cached[0] is defaults
+        and cached[1] is kwdefaults
+        and cached[2] is annotations
+    ):
+        return cached[3]
+    signature: inspect.Signature = _signature_from_code(
+        code, defaults or (), kwdefaults or {}, annotations
+    )
+    _code_signatures[code] = (defaults, kwdefaults, annotations, signature)
+    return signature
+
+
+def signature_from_code(code: CodeType) -> inspect.Signature:
+    """Returns the signature described by a code object alone.
+
+    Default values and annotations are not stored in code objects, so the
+    signature only has the names and kinds of the parameters.
+    """
+    return _signature_from_code(code, (), {}, {})
+
+
+def signature_from_text(
+    text_signature: str, skip_bound_arg: bool = False
+) -> Optional[inspect.Signature]:
+    """Returns the signature described by a builtin's ``__text_signature__``.
+
+    A leading ``$self`` or ``$module`` parameter is dropped when skip_bound_arg
+    is set, the same as for bound builtins in inspect.
+    """
+    try:
+        node: ast.stmt = ast.parse(
+            f"def _{text_signature.replace('$', '', 1)}: pass"
+        ).body[0]
+    except SyntaxError:
+        logger.debug(f"Unable to parse text signature {text_signature}")
+        return None
+    if not isinstance(node, ast.FunctionDef):  # pragma: no cover
+        return None
+    signature: inspect.Signature = signature_from_ast(node)
+    if skip_bound_arg and text_signature.startswith("($"):
+        return _without_first_parameter(signature)
+    return signature
+
+
+def signature_from_ast(
+    node: Union[ast.FunctionDef, ast.AsyncFunctionDef]
+) -> inspect.Signature:
+    """Returns the signature of a function definition node.
+
+    Annotations are kept as the strings they were written as, and default
+    values are kept as their source code.
+    """
+    arguments: ast.arguments = node.args
+    parameters: List[inspect.Parameter] = []
+    positional: List[ast.arg] = [
+        *getattr(arguments, "posonlyargs", []),
+        *arguments.args,
+    ]
+    positional_only_count: int = len(getattr(arguments, "posonlyargs", []))
+    first_default: int = len(positional) - len(arguments.defaults)
+    for index, arg in enumerate(positional):
+        parameters.append(
+            _parameter_from_arg(
+                arg,
+                inspect.Parameter.POSITIONAL_ONLY
+                if index < positional_only_count
+                else inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                arguments.defaults[index - first_default]
+                if index >= first_default
+                else None,
+            )
+        )
+    if arguments.vararg is not None:
+        parameters.append(
+            _parameter_from_arg(arguments.vararg, inspect.Parameter.VAR_POSITIONAL)
+        )
+    for arg, default in zip(arguments.kwonlyargs, arguments.kw_defaults):
+        parameters.append(
+            _parameter_from_arg(arg, inspect.Parameter.KEYWORD_ONLY, default)
+        )
+    if arguments.kwarg is not None:
+        parameters.append(
+            _parameter_from_arg(arguments.kwarg, inspect.Parameter.VAR_KEYWORD)
+        )
+    return inspect.Signature(
+        parameters,
+        return_annotation=_source(node.returns)
+        if node.returns is not None
+        else inspect.Signature.empty,
+        __validate_parameters__=False,
+    )
+
+
+def with_first_parameter(
+    signature: inspect.Signature, parameter: inspect.Parameter
+) -> inspect.Signature:
+    """Returns the signature with a parameter such as self or cls prepended.
+
+    The most recently prefixed signatures are cached, so methods that share a
+    parameter list also share the resulting signature.
+    """
+    if parameter.name in signature.parameters:
+        return signature
+    try:
+        return _cached_prefix_parameter(signature, parameter)
+    except TypeError:
+        return _prefix_parameter(signature, parameter)
+
+
+def clear_signature_cache() -> None:
+    """Clears the cached signatures."""
+    _code_signatures.clear()
+    _cached_prefix_parameter.cache_clear()
+
+
+def _signature_from_code(
+    code: CodeType,
+    defaults: Tuple[Any, ...],
+    kwdefaults: Dict[str, Any],
+    annotations: Dict[str, Any],
+) -> inspect.Signature:
+    names: Tuple[str, ...] = code.co_varnames
+    positional_count: int = code.co_argcount
+    positional_only_count: int = getattr(code, "co_posonlyargcount", 0)
+    keyword_only_count: int = code.co_kwonlyargcount
+    first_default: int = positional_count - len(defaults)
+    empty: Any = inspect.Parameter.empty
+    parameters: List[inspect.Parameter] = []
+    for index, name in enumerate(names[:positional_count]):
+        parameters.append(
+            inspect.Parameter(
+                name,
+                inspect.Parameter.POSITIONAL_ONLY
+                if index < positional_only_count
+                else inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                default=defaults[index - first_default]
+                if index >= first_default
+                else empty,
+                annotation=annotations.get(name, empty),
+            )
+        )
+    next_index: int = positional_count + keyword_only_count
+    if code.co_flags & CO_VARARGS:
+        name = names[next_index]
+        parameters.append(
+            inspect.Parameter(
+                name,
+                inspect.Parameter.VAR_POSITIONAL,
+                annotation=annotations.get(name, empty),
+            )
+        )
+        next_index += 1
+    for name in names[positional_count : positional_count + keyword_only_count]:
+        parameters.append(
+            inspect.Parameter(
+                name,
+                inspect.Parameter.KEYWORD_ONLY,
+                default=kwdefaults.get(name, empty),
+                annotation=annotations.get(name, empty),
+            )
+        )
+    if code.co_flags & CO_VARKEYWORDS:
+        name = names[next_index]
+        parameters.append(
+            inspect.Parameter(
+                name,
+                inspect.Parameter.VAR_KEYWORD,
+                annotation=annotations.get(name, empty),
+            )
+        )
+    return inspect.Signature(
+        parameters,
+        return_annotation=annotations.get("return", inspect.Signature.empty),
+        __validate_parameters__=False,
+    )
+
+
+def _parameter_from_arg(
+    arg: ast.arg, kind: Any, default: Optional[ast.expr] = None
+) -> inspect.Parameter:
+    return inspect.Parameter(
+        arg.arg,
+        kind,
+        default=_default(default) if default is not None else inspect.Parameter.empty,
+        annotation=_source(arg.annotation)
+        if arg.annotation is not None
+        else inspect.Parameter.empty,
+    )
+
+
+def _default(node: ast.expr) -> Any:
+    try:
+        return ast.literal_eval(node)
+    except ValueError:
+        return SourceExpression(_source(node))
+
+
+def _source(node: ast.AST) -> str:
+    if hasattr(ast, "unparse"):
+        return str(ast.unparse(node))
+    return str(astor.to_source(node)).strip()  # pragma: no cover
+
+
+def _prefix_parameter(
+    signature: inspect.Signature, parameter: inspect.Parameter
+) -> inspect.Signature:
+    return signature.replace(parameters=[parameter, *signature.parameters.values()])
+
+
+@lru_cache(maxsize=PREFIXED_SIGNATURES_MAXSIZE)
+def _cached_prefix_parameter(
+    signature: inspect.Signature, parameter: inspect.Parameter
+) -> inspect.Signature:
+    return _prefix_parameter(signature, parameter)
+
+
+def _without_first_parameter(signature: inspect.Signature) -> inspect.Signature:
+    return signature.replace(parameters=list(signature.parameters.values())[1:])
+
+
+def _inspect_signature(obj: Callable[..., Any]) -> inspect.Signature:
+    try:
+        return inspect.signature(obj)
+    except (TypeError, ValueError):
+        logger.debug(f"No signature found for {obj}")
+        return inspect.Signature()
@@ -0,0 +1,72 @@
+"""A module used for describing the source modules tests are created for.
+
+A source module is listed with the functions and classes to test, the methods
+to test of each class and how long the module took to import.
+"""
+import inspect
+from dataclasses import dataclass
+from dataclasses import field
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Mapping
+from typing import Optional
+
+from pytest_create.rules import CompiledRules
+from pytest_create.rules import Rules
+from pytest_create.rules import compile_rules
+
+
+@dataclass
+class SourceModule:
+    """A source module, the objects it defines and how long it took to import.
+
+    The public methods to test are listed for each class in objects. The package
+    is the dotted name of the package the source root is in, which the paths of
+    the test modules leave out.
+    """
+
+    module: ModuleType
+    objects: List[Any]
+    import_seconds: float = 0.0
+    methods: Dict[type, List[str]] = field(default_factory=dict)
+    package: str = ""
+
+    def __post_init__(self) -> None:
+        """Lists the public methods of classes that have no methods listed."""
+        for obj in self.objects:
+            if inspect.isclass(obj) and obj not in self.methods:
+                self.methods[obj] = _find_public_methods(obj)
+
+
+SourceModules = Dict[Path, SourceModule]
+
+
+def get_source_name(source: SourceModule, obj: Any) -> str:
+    """Returns the qualified name of an object defined by a source module."""
+    return f"{source.module.__name__}.{obj.__qualname__}"
+
+
+def find_methods(
+    cls: type,
+    rule_filter: CompiledRules,
+    decorators: Optional[Mapping[str, List[str]]] = None,
+) -> List[str]:
+    """Returns the names of the methods a class defines that the rules select."""
+    return [
+        name
+        for name, value in vars(cls).items()
+        if (inspect.isfunction(value) or isinstance(value, (staticmethod, classmethod)))
+        and rule_filter.includes_object(
+            f"{cls.__qualname__}.{name}",
+            "method",
+            (decorators or {}).get(f"{cls.__qualname__}.{name}", ()),
+        )
+    ]
+
+
+def _find_public_methods(cls: type) -> List[str]:
+    """Returns the names of the public methods a class defines."""
+    return find_methods(cls, compile_rules(Rules()))
@@ -0,0 +1,79 @@
+"""A module used for creating stand-ins of source objects that are not imported.
+
+Stand-ins are functions and classes that carry the names and signatures of the
+objects they stand in for, so tests can be created for modules that are only
+read, such as stubs and bytecode. Calling a stand-in raises NotImplementedError.
+"""
+import inspect
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+
+
+class StandInModule(ModuleType):
+    """A module holding stand-ins of the public objects it defines.
+
+    The module's __file__ is where its source would be found, so imports of its
+    objects are rendered the same as for an imported module. The discovery path
+    names how the module was read instead of being imported.
+    """
+
+    discovery_path: str = "static"
+
+    def __init__(
+        self,
+        name: str,
+        file: Path,
+        objects: List[Any],
+        path: Optional[List[str]] = None,
+        doc: Optional[str] = None,
+    ) -> None:
+        """Creates a module holding the given stand-ins."""
+        super().__init__(name, doc)
+        self.__file__: str = str(file)
+        self.objects: List[Any] = objects
+        if path is not None:
+            self.__path__: List[str] = path
+        for obj in objects:
+            setattr(self, obj.__name__, obj)
+
+
+def make_function(
+    module_name: str,
+    qualname: str,
+    signature: inspect.Signature,
+    doc: Optional[str] = None,
+) -> Any:
+    """Returns a stand-in of a function with the given signature."""
+
+    def stand_in(*args: Any, **kwargs: Any) -> Any:
+        raise NotImplementedError(f"{qualname} was not imported")
+
+    stand_in.__name__ = qualname.rsplit(".", 1)[-1]
+    stand_in.__qualname__ = qualname
+    stand_in.__module__ = module_name
+    stand_in.__doc__ = doc
+    setattr(stand_in, "__signature__", signature)  # noqa: B010
+    return stand_in
+
+
+def make_class(
+    module_name: str,
+    qualname: str,
+    members: Dict[str, Any],
+    doc: Optional[str] = None,
+) -> type:
+    """Returns a stand-in of a class with the given methods and attributes."""
+    return type(
+        qualname.rsplit(".", 1)[-1],
+        (),
+        {
+            **members,
+            "__module__": module_name,
+            "__qualname__": qualname,
+            "__doc__": doc,
+        },
+    )
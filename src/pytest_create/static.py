@@ -0,0 +1,418 @@
+"""A module used for discovering source objects from source files without imports.
+
+Modules are parsed and classified before they are imported. A module whose
+public surface only depends on the functions and classes written in its source
+is read statically, and only a module that relies on runtime behavior, such as
+a dynamically built __all__, class factories, decorators that may rewrite
+signatures or a module __getattr__, is imported.
+"""
+import ast
+import contextlib
+from importlib.abc import MetaPathFinder
+from importlib.abc import PathEntryFinder
+from importlib.machinery import ModuleSpec
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+from typing import Dict
+from typing import FrozenSet
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+from loguru import logger
+
+from pytest_create.discovery import DiscoveryReport
+from pytest_create.signatures import signature_from_ast
+from pytest_create.stand_ins import StandInModule
+from pytest_create.stand_ins import make_class
+from pytest_create.stand_ins import make_function
+from pytest_create.util import ModuleLoader
+from pytest_create.util import load_from_name
+
+
+SOURCE_SUFFIX: str = ".py"
+METHOD_DECORATORS: Dict[str, Any] = {
+    "staticmethod": staticmethod,
+    "classmethod": classmethod,
+    "property": property,
+}
+STATIC_DECORATORS: FrozenSet[str] = frozenset(
+    {
+        *METHOD_DECORATORS,
+        "abstractmethod",
+        "cache",
+        "cached_property",
+        "contextmanager",
+        "asynccontextmanager",
+        "dataclass",
+        "deleter",
+        "final",
+        "getter",
+        "lru_cache",
+        "overload",
+        "override",
+        "runtime_checkable",
+        "setter",
+        "total_ordering",
+        "unique",
+    }
+)
+STATIC_METACLASSES: FrozenSet[str] = frozenset({"ABCMeta"})
+CLASS_FACTORIES: FrozenSet[str] = frozenset(
+    {
+        "type",
+        "namedtuple",
+        "NamedTuple",
+        "NewType",
+        "TypedDict",
+        "make_dataclass",
+        "Enum",
+        "IntEnum",
+        "Flag",
+        "IntFlag",
+        "StrEnum",
+    }
+)
+MODULE_HOOKS: FrozenSet[str] = frozenset({"__getattr__", "__dir__"})
+NAMESPACE_CALLS: FrozenSet[str] = frozenset({"exec", "globals", "vars"})
+
+_FunctionNode = Union[ast.FunctionDef, ast.AsyncFunctionDef]
+_DefinitionNode = Union[ast.ClassDef, _FunctionNode]
+
+
+class StaticModule(StandInModule):
+    """A module built from its parsed source instead of being imported."""
+
+
+def static_loader(
+    report: Optional[DiscoveryReport] = None, load: Optional[ModuleLoader] = None
+) -> ModuleLoader:
+    """Returns a module loader that only imports modules that need to be imported.
+
+    Python source files are parsed first, and the modules whose public surface
+    depends on runtime behavior are loaded with load_from_name unless another
+    loader is given. The reasons a module was imported are added to the report.
+    """
+
+    def load_static_or_module(
+        name: str, finder: Union[PathEntryFinder, MetaPathFinder]
+    ) -> Optional[ModuleType]:
+        spec: Optional[ModuleSpec] = None
+        with contextlib.suppress(Exception):
+            spec = finder.find_spec(name, None)
+        if spec is not None and spec.origin is not None:
+            static_module: Optional[StaticModule] = load_static_module(
+                name,
+                origin=Path(spec.origin),
+                path=spec.submodule_search_locations,
+                report=report,
+            )
+            if static_module is not None:
+                return static_module
+        return (load or load_from_name)(name, finder)
+
+    return load_static_or_module
+
+
+def load_static_module(
+    name: str,
+    origin: Path,
+    path: Optional[Iterable[str]] = None,
+    report: Optional[DiscoveryReport] = None,
+) -> Optional[StaticModule]:
+    """Returns the module read from its source, or None if it must be imported.
+
+    Modules that are not Python source files, cannot be parsed or have dynamic
+    features are left to be imported, and the reasons are added to the report.
+    """
+    if origin.suffix != SOURCE_SUFFIX:
+        return None
+    try:
+        tree: ast.Module = ast.parse(
+            origin.read_text(encoding="utf-8"), filename=str(origin)
+        )
+    except (OSError, SyntaxError, ValueError) as e:
+        logger.warning(f"Failed to parse {origin} - {e}")
+        return None
+    reasons: List[str] = find_dynamic_features(tree)
+    if reasons:
+        logger.debug(f"Importing {name} - {', '.join(reasons)}")
+        if report is not None:
+            report.add_reasons(name, reasons)
+        return None
+    logger.debug(f"Loaded {name} statically from {origin}")
+    return StaticModule(
+        name,
+        file=origin,
+        objects=build_objects(name, tree.body),
+        path=list(path) if path is not None else None,
+        doc=ast.get_docstring(tree),
+    )
+
+
+def find_dynamic_features(tree: ast.Module) -> List[str]:
+    """Returns why the public surface of a parsed module depends on runtime behavior.
+
+    An empty list means the functions and classes defined in the source are
+    exactly those the module would define when imported.
+    """
+    reasons: List[str] = []
+    definitions: List[_DefinitionNode] = list(_walk_statements(tree.body))
+    for node in _walk_module_statements(tree.body):
+        if isinstance(node, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)):
+            if node.name in MODULE_HOOKS:
+                reasons.append(f"module {node.name}")
+            elif not node.name.startswith("_") and node not in definitions:
+                reasons.append(f"conditional definition of {node.name}")
+        elif isinstance(node, (ast.Assign, ast.AnnAssign, ast.AugAssign, ast.Expr)):
+            reasons.extend(_find_dynamic_assignments(node))
+    for definition in definitions:
+        if not definition.name.startswith("_"):
+            reasons.extend(_find_dynamic_definitions(definition))
+    return list(dict.fromkeys(reasons))
+
+
+def find_decorators(tree: ast.Module) -> Dict[str, List[str]]:
+    """Returns the decorator names of the functions, classes and methods by qualname.
+
+    Decorators are named by the last part of their name, or of the name of the
+    function they call, so @functools.lru_cache(1) is named lru_cache.
+    """
+    decorators: Dict[str, List[str]] = {}
+    for qualname, node in _walk_qualified_statements(tree.body):
+        decorators.setdefault(
+            qualname, [_get_decorator_name(item) for item in node.decorator_list]
+        )
+    return decorators
+
+
+def find_definition_lines(tree: ast.Module) -> Dict[str, int]:
+    """Returns the line of each function, class and method definition by qualname.
+
+    The line is that of the def or class statement, after any decorators.
+    """
+    lines: Dict[str, int] = {}
+    for qualname, node in _walk_qualified_statements(tree.body):
+        lines.setdefault(qualname, node.lineno)
+    return lines
+
+
+def load_decorators(path: Path) -> Dict[str, List[str]]:
+    """Returns the decorator names found in a source or stub file by qualname.
+
+    An empty mapping is returned when the file cannot be read or parsed.
+    """
+    tree: Optional[ast.Module] = _parse_file(path)
+    return find_decorators(tree) if tree is not None else {}
+
+
+def load_definition_lines(path: Path) -> Dict[str, int]:
+    """Returns the definition lines found in a source or stub file by qualname.
+
+    An empty mapping is returned when the file cannot be read or parsed.
+    """
+    tree: Optional[ast.Module] = _parse_file(path)
+    return find_definition_lines(tree) if tree is not None else {}
+
+
+def build_objects(module_name: str, body: Iterable[ast.stmt]) -> List[Any]:
+    """Returns stand-ins of the public functions and classes defined in a body.
+
+    Definitions in if statements are included, and a function defined more than
+    once, such as an overloaded function, keeps the signature of its first
+    definition.
+    """
+    objects: Dict[str, Any] = {}
+    for node in _walk_statements(body):
+        if node.name.startswith("_") or node.name in objects:
+            continue
+        if isinstance(node, ast.ClassDef):
+            objects[node.name] = _build_class(module_name, node)
+        else:
+            objects[node.name] = _build_function(module_name, node.name, node)
+    return list(objects.values())
+
+
+def _build_class(module_name: str, node: ast.ClassDef) -> type:
+    members: Dict[str, Any] = {}
+    for child in _walk_statements(node.body):
+        if isinstance(child, ast.ClassDef) or child.name in members:
+            continue
+        method: Any = _build_function(module_name, f"{node.name}.{child.name}", child)
+        for decorator in child.decorator_list:
+            wrapper: Any = METHOD_DECORATORS.get(_get_decorator_name(decorator))
+            if wrapper is not None:
+                method = wrapper(method)
+                break
+        members[child.name] = method
+    return make_class(module_name, node.name, members, doc=ast.get_docstring(node))
+
+
+def _build_function(module_name: str, qualname: str, node: _FunctionNode) -> Any:
+    return make_function(
+        module_name, qualname, signature_from_ast(node), doc=ast.get_docstring(node)
+    )
+
+
+def _find_dynamic_assignments(
+    node: Union[ast.Assign, ast.AnnAssign, ast.AugAssign, ast.Expr]
+) -> List[str]:
+    """Returns the dynamic features of a module-level assignment or expression.
+
+    Calls that can write to the module namespace are features, and so are
+    setattr() calls on the module object and assignments to sys.modules.
+    """
+    reasons: List[str] = [
+        f"module-level {_get_call_name(call)}()"
+        for call in ast.walk(node)
+        if isinstance(call, ast.Call)
+        and (
+            _get_call_name(call) in NAMESPACE_CALLS
+            or _get_call_name(call) == "setattr"
+            and bool(call.args)
+            and _is_sys_modules_item(call.args[0])
+        )
+    ]
+    if isinstance(node, ast.Expr):
+        if (
+            isinstance(node.value, ast.Call)
+            and isinstance(node.value.func, ast.Attribute)
+            and _is_name(node.value.func.value, "__all__")
+        ):
+            reasons.append("dynamic __all__")
+        return reasons
+    targets: List[ast.expr] = (
+        node.targets if isinstance(node, ast.Assign) else [node.target]
+    )
+    for target in targets:
+        if _is_name(target, "__all__") and (
+            isinstance(node, ast.AugAssign) or not _is_literal_names(node.value)
+        ):
+            reasons.append("dynamic __all__")
+        elif _is_sys_modules_item(target):
+            reasons.append("sys.modules assignment")
+        elif (
+            isinstance(target, ast.Name)
+            and not target.id.startswith("_")
+            and isinstance(node.value, ast.Call)
+            and _get_call_name(node.value) in CLASS_FACTORIES
+        ):
+            reasons.append(f"{target.id} is created by {_get_call_name(node.value)}()")
+    return reasons
+
+
+def _find_dynamic_definitions(node: _DefinitionNode) -> List[str]:
+    """Returns the dynamic features of a public function or class definition.
+
+    The decorators of a class's public methods are checked along with the
+    decorators, metaclass and base classes of the class itself.
+    """
+    reasons: List[str] = [
+        f"{_get_decorator_name(decorator) or 'dynamic'} decorator on {node.name}"
+        for decorator in node.decorator_list
+        if _get_decorator_name(decorator) not in STATIC_DECORATORS
+    ]
+    if not isinstance(node, ast.ClassDef):
+        return reasons
+    for keyword in node.keywords:
+        if keyword.arg == "metaclass" and (
+            _get_decorator_name(keyword.value) not in STATIC_METACLASSES
+        ):
+            reasons.append(f"metaclass of {node.name}")
+    if any(isinstance(base, ast.Call) for base in node.bases):
+        reasons.append(f"base class of {node.name} is created by a call")
+    for child in _walk_statements(node.body):
+        if isinstance(child, ast.ClassDef) or child.name.startswith("_"):
+            continue
+        reasons.extend(
+            f"{_get_decorator_name(decorator) or 'dynamic'} decorator on "
+            f"{node.name}.{child.name}"
+            for decorator in child.decorator_list
+            if _get_decorator_name(decorator) not in STATIC_DECORATORS
+        )
+    return reasons
+
+
+def _walk_statements(body: Iterable[ast.stmt]) -> Iterable[_DefinitionNode]:
+    """Yields the definitions of a body, including those in if statements."""
+    for node in body:
+        if isinstance(node, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)):
+            yield node
+        elif isinstance(node, ast.If):
+            yield from _walk_statements([*node.body, *node.orelse])
+
+
+def _walk_qualified_statements(
+    body: Iterable[ast.stmt],
+) -> Iterable[Tuple[str, _DefinitionNode]]:
+    """Yields the definitions of a body and the methods of its classes by qualname."""
+    for node in _walk_statements(body):
+        yield node.name, node
+        if isinstance(node, ast.ClassDef):
+            for child in _walk_statements(node.body):
+                yield f"{node.name}.{child.name}", child
+
+
+def _parse_file(path: Path) -> Optional[ast.Module]:
+    """Returns the syntax tree of a source or stub file, or None if it is invalid."""
+    try:
+        return ast.parse(path.read_text(encoding="utf-8"), str(path))
+    except (OSError, SyntaxError, ValueError) as e:
+        logger.debug(f"Failed to parse {path} - {e}")
+        return None
+
+
+def _walk_module_statements(body: Iterable[ast.stmt]) -> Iterable[ast.stmt]:
+    """Yields every statement of a body that is not in a function or class body."""
+    for node in body:
+        yield node
+        if isinstance(node, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)):
+            continue
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, ast.stmt):
+                yield from _walk_module_statements([child])
+            elif isinstance(child, ast.ExceptHandler):
+                yield from _walk_module_statements(child.body)
+
+
+def _get_decorator_name(decorator: ast.expr) -> str:
+    """Returns the name of a decorator, or of the function a decorator calls."""
+    if isinstance(decorator, ast.Call):
+        return _get_decorator_name(decorator.func)
+    if isinstance(decorator, ast.Name):
+        return decorator.id
+    if isinstance(decorator, ast.Attribute):
+        return decorator.attr
+    return ""
+
+
+def _get_call_name(call: ast.Call) -> str:
+    return _get_decorator_name(call.func)
+
+
+def _is_name(node: ast.expr, name: str) -> bool:
+    return isinstance(node, ast.Name) and node.id == name
+
+
+def _is_sys_modules_item(node: ast.expr) -> bool:
+    """Returns whether a node is an item of sys.modules, such as the module itself."""
+    return (
+        isinstance(node, ast.Subscript)
+        and isinstance(node.value, ast.Attribute)
+        and node.value.attr == "modules"
+        and _is_name(node.value.value, "sys")
+    )
+
+
+def _is_literal_names(node: Optional[ast.expr]) -> bool:
+    """Returns whether a node is a list or tuple of string literals."""
+    if not isinstance(node, (ast.List, ast.Tuple)):
+        return False
+    try:
+        names: Any = ast.literal_eval(node)
+    except ValueError:
+        return False
+    return all(isinstance(name, str) for name in names)
@@ -0,0 +1,150 @@
+"""A module used for discovering source objects from .pyi stub files.
+
+Stubs are parsed instead of importing the modules they describe, so extension
+modules and packages that are slow to import can be discovered quickly. The
+functions and classes found in a stub are stand-ins that carry the signatures
+written in the stub.
+"""
+import ast
+import contextlib
+from importlib.abc import MetaPathFinder
+from importlib.abc import PathEntryFinder
+from importlib.machinery import ModuleSpec
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Union
+
+from loguru import logger
+
+from pytest_create.stand_ins import StandInModule
+from pytest_create.static import build_objects
+from pytest_create.util import ModuleLoader
+from pytest_create.util import load_from_name
+
+
+STUB_SUFFIX: str = ".pyi"
+STUBS_PACKAGE_SUFFIX: str = "-stubs"
+
+
+class StubModule(StandInModule):
+    """A module built from a .pyi stub file instead of its implementation.
+
+    The module's __file__ is where the stub would be found next to the
+    implementation. The stub that was actually read is kept in stub_file.
+    """
+
+    discovery_path = "stub"
+
+    def __init__(
+        self,
+        name: str,
+        file: Path,
+        stub_file: Path,
+        objects: List[Any],
+        path: Optional[List[str]] = None,
+        doc: Optional[str] = None,
+    ) -> None:
+        """Creates a module holding the public objects defined in a stub."""
+        super().__init__(name, file=file, objects=objects, path=path, doc=doc)
+        self.stub_file: Path = stub_file
+
+
+def stub_loader(
+    stub_paths: Sequence[Path], load: Optional[ModuleLoader] = None
+) -> ModuleLoader:
+    """Returns a module loader that reads stubs, and only imports modules without.
+
+    Stubs next to a module are preferred, followed by stubs in the stub paths.
+    Modules without a stub are loaded with load_from_name unless another loader
+    is given.
+    """
+
+    def load_stub_or_module(
+        name: str, finder: Union[PathEntryFinder, MetaPathFinder]
+    ) -> Optional[ModuleType]:
+        spec: Optional[ModuleSpec] = None
+        with contextlib.suppress(Exception):
+            spec = finder.find_spec(name, None)
+        if spec is not None and spec.origin is not None:
+            stub_module: Optional[StubModule] = load_stub_module(
+                name,
+                origin=Path(spec.origin),
+                path=spec.submodule_search_locations,
+                stub_paths=stub_paths,
+            )
+            if stub_module is not None:
+                return stub_module
+        return (load or load_from_name)(name, finder)
+
+    return load_stub_or_module
+
+
+def load_stub_module(
+    name: str,
+    origin: Path,
+    path: Optional[Iterable[str]] = None,
+    stub_paths: Sequence[Path] = (),
+) -> Optional[StubModule]:
+    """Returns the module described by the stub of a module, if it has one.
+
+    The origin is the file the module would be imported from, and path is its
+    submodule search locations when it is a package.
+    """
+    file: Path = origin.parent / (
+        f"__init__{STUB_SUFFIX}"
+        if path is not None
+        else f"{_get_stem(name)}{STUB_SUFFIX}"
+    )
+    stub_file: Optional[Path] = find_stub_file(
+        name, file, is_package=path is not None, stub_paths=stub_paths
+    )
+    if stub_file is None:
+        return None
+    try:
+        tree: ast.Module = ast.parse(
+            stub_file.read_text(encoding="utf-8"), filename=str(stub_file)
+        )
+    except (OSError, SyntaxError, ValueError) as e:
+        logger.warning(f"Failed to parse stub {stub_file} - {e}")
+        return None
+    logger.debug(f"Loaded {name} from stub {stub_file}")
+    return StubModule(
+        name,
+        file=file,
+        stub_file=stub_file,
+        objects=build_objects(name, tree.body),
+        path=list(path) if path is not None else None,
+        doc=ast.get_docstring(tree),
+    )
+
+
+def find_stub_file(
+    name: str, file: Path, is_package: bool, stub_paths: Sequence[Path] = ()
+) -> Optional[Path]:
+    """Returns the stub of a module next to it, or else in one of the stub paths.
+
+    Stub-only packages named <package>-stubs are searched as well.
+    """
+    if file.is_file():
+        return file
+    top_level, *parts = name.split(".")
+    for stub_path in stub_paths:
+        for package in (top_level, f"{top_level}{STUBS_PACKAGE_SUFFIX}"):
+            base: Path = stub_path.joinpath(package, *parts)
+            candidate: Path = (
+                base / f"__init__{STUB_SUFFIX}"
+                if is_package
+                else base.with_name(f"{base.name}{STUB_SUFFIX}")
+            )
+            if candidate.is_file():
+                return candidate
+    return None
+
+
+def _get_stem(name: str) -> str:
+    return name.rsplit(".", 1)[-1]
@@ -0,0 +1,183 @@
+"""A module used for persisting the discovered source objects in a SQLite index.
+
+Each run replaces the symbols of the modules it discovered, and only writes the
+modules whose symbols changed. The index can then be queried, for example for
+the public functions of a package that have no tests, without importing or
+even reading any source.
+"""
+import sqlite3
+from dataclasses import astuple
+from dataclasses import dataclass
+from pathlib import Path
+from types import TracebackType
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import Tuple
+from typing import Type
+
+from loguru import logger
+
+
+INDEX_DIRECTORY: str = "pytest-create-index"
+INDEX_FILE_NAME: str = "symbols.db"
+DEFAULT_INDEX_PATH: Path = Path(".pytest_cache", "d", INDEX_DIRECTORY, INDEX_FILE_NAME)
+SCHEMA: str = """
+CREATE TABLE IF NOT EXISTS symbol (
+    module TEXT NOT NULL,
+    qualname TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    file TEXT,
+    line INTEGER,
+    signature_hash TEXT NOT NULL,
+    tested INTEGER NOT NULL,
+    PRIMARY KEY (module, qualname)
+);
+CREATE INDEX IF NOT EXISTS symbol_kind ON symbol (kind, tested);
+"""
+COLUMNS: str = "module, qualname, kind, file, line, signature_hash, tested"
+
+
+@dataclass(frozen=True)
+class Symbol:
+    """A function, class or method found in a source module.
+
+    The file is the source or stub the object was read from, and the line is
+    that of its definition in the file when it is known.
+    """
+
+    module: str
+    qualname: str
+    kind: str
+    file: Optional[str] = None
+    line: Optional[int] = None
+    signature_hash: str = ""
+    tested: bool = False
+
+    @property
+    def name(self) -> str:
+        """Returns the qualified name of the symbol."""
+        return f"{self.module}.{self.qualname}"
+
+
+class SymbolIndex:
+    """A SQLite database of the symbols found in every run."""
+
+    def __init__(self, path: Path) -> None:
+        """Opens the index at path, creating the database if it does not exist."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path: Path = path
+        self.connection: sqlite3.Connection = sqlite3.connect(str(path))
+        self.connection.executescript(SCHEMA)
+
+    def update(self, module: str, symbols: Iterable[Symbol]) -> bool:
+        """Replaces the symbols of a module, returning whether they changed."""
+        rows: Set[Tuple[object, ...]] = {
+            _to_row(symbol) for symbol in symbols if symbol.module == module
+        }
+        existing: Set[Tuple[object, ...]] = set(
+            self.connection.execute(
+                f"SELECT {COLUMNS} FROM symbol WHERE module = ?", (module,)
+            )
+        )
+        if rows == existing:
+            return False
+        logger.debug(f"Updating the {len(rows)} symbols of {module}")
+        with self.connection:
+            self.connection.execute("DELETE FROM symbol WHERE module = ?", (module,))
+            self.connection.executemany(
+                f"INSERT INTO symbol ({COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                sorted(rows, key=str),
+            )
+        return True
+
+    def prune(self) -> List[str]:
+        """Removes the symbols of source files that no longer exist.
+
+        Returns the names of the modules that were removed.
+        """
+        removed: List[str] = [
+            module
+            for module, file in self.connection.execute(
+                "SELECT DISTINCT module, file FROM symbol WHERE file IS NOT NULL"
+            )
+            if not Path(file).is_file()
+        ]
+        with self.connection:
+            self.connection.executemany(
+                "DELETE FROM symbol WHERE module = ?",
+                [(module,) for module in removed],
+            )
+        return removed
+
+    def query(
+        self,
+        package: Optional[str] = None,
+        kind: Optional[str] = None,
+        tested: Optional[bool] = None,
+        name: Optional[str] = None,
+    ) -> List[Symbol]:
+        """Returns the symbols that match every given criterion.
+
+        A package matches the module of that name and every module in it, and
+        name is a glob matched against qualnames.
+        """
+        clauses: List[str] = []
+        parameters: List[object] = []
+        if package is not None:
+            clauses.append("(module = ? OR module GLOB ?)")
+            parameters.extend([package, f"{package}.*"])
+        if kind is not None:
+            clauses.append("kind = ?")
+            parameters.append(kind)
+        if tested is not None:
+            clauses.append("tested = ?")
+            parameters.append(int(tested))
+        if name is not None:
+            clauses.append("qualname GLOB ?")
+            parameters.append(name)
+        where: str = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        return [
+            _from_row(row)
+            for row in self.connection.execute(
+                f"SELECT {COLUMNS} FROM symbol{where} ORDER BY module, qualname",
+                parameters,
+            )
+        ]
+
+    def close(self) -> None:
+        """Closes the database connection."""
+        self.connection.close()
+
+    def __enter__(self) -> "SymbolIndex":
+        """Returns the open index."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Closes the index."""
+        self.close()
+
+
+def _to_row(symbol: Symbol) -> Tuple[object, ...]:
+    """Returns the database row of a symbol."""
+    return (*astuple(symbol)[:-1], int(symbol.tested))
+
+
+def _from_row(row: Tuple[object, ...]) -> Symbol:
+    """Returns the symbol of a database row."""
+    module, qualname, kind, file, line, signature_hash, tested = row
+    return Symbol(
+        module=str(module),
+        qualname=str(qualname),
+        kind=str(kind),
+        file=str(file) if file is not None else None,
+        line=int(str(line)) if line is not None else None,
+        signature_hash=str(signature_hash),
+        tested=bool(tested),
+    )
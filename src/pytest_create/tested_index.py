@@ -0,0 +1,139 @@
+"""A module used for indexing the source objects that collected tests already test.
+
+Tests are mapped back to source objects by name, the same way pytest-create
+names the tests it creates. A test_<name> function tests the function <name>,
+and test_<method> in a Test<Class> class tests <Class>.<method>. The names are
+resolved in the namespace of the test module, so a test is indexed under the
+module that actually defines the object it imports. Objects passed as
+parameters of a parametrized test are indexed as well.
+"""
+import inspect
+from dataclasses import dataclass
+from dataclasses import field
+from types import ModuleType
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+
+import pytest
+from loguru import logger
+
+from pytest_create.util import get_qualified_name
+
+
+TEST_PREFIX: str = "test_"
+TEST_CLASS_PREFIX: str = "Test"
+INSTANCE_TEST_NAME: str = "instance"
+
+
+@dataclass
+class TestedIndex:
+    """The nodeids of the collected tests of each source object, by qualified name.
+
+    Qualified names are the module name followed by the object's qualname, such
+    as package.module.Class.method.
+    """
+
+    __test__ = False
+
+    nodeids: Dict[str, List[str]] = field(default_factory=dict)
+
+    @classmethod
+    def from_items(cls, items: Iterable[pytest.Item]) -> "TestedIndex":
+        """Returns the index of the source objects tested by the collected items."""
+        index: TestedIndex = cls()
+        for item in items:
+            index.add_item(item)
+        logger.debug(f"Indexed tests of {len(index.nodeids)} source objects")
+        return index
+
+    def add_item(self, item: pytest.Item) -> None:
+        """Indexes the source objects tested by a collected item."""
+        for name in get_tested_names(item):
+            self.nodeids.setdefault(name, []).append(item.nodeid)
+
+    def is_tested(self, name: str) -> bool:
+        """Returns whether the object with the qualified name has a test."""
+        return name in self.nodeids
+
+    def get_nodeids(self, name: str) -> List[str]:
+        """Returns the nodeids of the tests of the object with the qualified name."""
+        return self.nodeids.get(name, [])
+
+    def find_untested(self, names: Iterable[str]) -> List[str]:
+        """Returns the qualified names that have no test."""
+        return [name for name in names if name not in self.nodeids]
+
+    def __contains__(self, name: object) -> bool:
+        """Returns whether the object with the qualified name has a test."""
+        return name in self.nodeids
+
+    def __len__(self) -> int:
+        """Returns the number of tested source objects."""
+        return len(self.nodeids)
+
+
+def get_tested_names(item: pytest.Item) -> List[str]:
+    """Returns the qualified names of the source objects a collected item tests."""
+    names: List[str] = []
+    module: Optional[ModuleType] = getattr(item, "module", None)
+    namespace: Dict[str, Any] = vars(module) if module is not None else {}
+    test_name: str = getattr(item, "originalname", item.name)
+    target: Optional[str] = (
+        test_name[len(TEST_PREFIX) :] if test_name.startswith(TEST_PREFIX) else None
+    )
+    test_cls: Optional[type] = getattr(item, "cls", None)
+    if test_cls is not None and test_cls.__name__.startswith(TEST_CLASS_PREFIX):
+        tested_cls: Any = namespace.get(test_cls.__name__[len(TEST_CLASS_PREFIX) :])
+        if inspect.isclass(tested_cls):
+            names.extend(_get_class_names(tested_cls, target))
+    elif target is not None:
+        names.extend(_get_object_names(namespace.get(target)))
+    callspec: Any = getattr(item, "callspec", None)
+    if callspec is not None:
+        names.extend(_get_parameter_names(callspec.params))
+    return list(dict.fromkeys(names))
+
+
+def _get_class_names(cls: type, target: Optional[str]) -> List[str]:
+    """Returns the names tested by a test of a Test<Class> class."""
+    cls_name: Optional[str] = get_qualified_name(cls)
+    if cls_name is None:
+        return []
+    if target is None or target == INSTANCE_TEST_NAME:
+        return [cls_name]
+    if target in vars(cls):
+        return [cls_name, f"{cls_name}.{target}"]
+    return [cls_name]
+
+
+def _get_object_names(obj: Any) -> List[str]:
+    """Returns the name of a tested class or function."""
+    if not (inspect.isclass(obj) or inspect.isroutine(obj)):
+        return []
+    name: Optional[str] = get_qualified_name(obj)
+    return [name] if name is not None else []
+
+
+def _get_parameter_names(params: Dict[str, Any]) -> List[str]:
+    """Returns the names of the classes, functions and methods given as parameters.
+
+    A string parameter naming an attribute of a class parameter is taken to be
+    the name of a method under test.
+    """
+    names: List[str] = []
+    classes: List[type] = []
+    for value in params.values():
+        names.extend(_get_object_names(value))
+        if inspect.isclass(value):
+            classes.append(value)
+    for value in params.values():
+        if not isinstance(value, str):
+            continue
+        for cls in classes:
+            cls_name: Optional[str] = get_qualified_name(cls)
+            if cls_name is not None and value in vars(cls):
+                names.append(f"{cls_name}.{value}")
+    return names
@@ -0,0 +1,238 @@
+"""A module used for patching existing test modules in place.
+
+Only the tests of the objects whose fingerprint changed since they were created
+are rendered again, and the fingerprints of the written tests are recorded.
+"""
+import inspect
+from pathlib import Path
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Mapping
+from typing import Optional
+from typing import Sequence
+from typing import Set
+from typing import Tuple
+from typing import Union
+
+from loguru import logger
+
+from pytest_create.builder import TestModuleBuilder
+from pytest_create.builder import get_test_module_path
+from pytest_create.definitions.import_def import ImportBlockDef
+from pytest_create.definitions.import_def import ImportDef
+from pytest_create.definitions.import_def import group_imports
+from pytest_create.definitions.module_def import ModuleDef
+from pytest_create.fingerprints import FingerprintIndex
+from pytest_create.fingerprints import ObjectFingerprint
+from pytest_create.fingerprints import find_imported_names
+from pytest_create.fingerprints import find_test_definitions
+from pytest_create.fingerprints import get_fingerprint
+from pytest_create.fingerprints import hash_definition
+from pytest_create.fingerprints import patch_source
+from pytest_create.formatting import FormatCache
+from pytest_create.formatting import format_sources
+from pytest_create.source_module import SourceModule
+from pytest_create.source_module import SourceModules
+from pytest_create.source_module import get_source_name
+from pytest_create.tested_index import TestedIndex
+
+
+# The text of a test module, the rendered tests and imports to patch it with,
+# and the objects whose tests are rendered.
+_Patch = Tuple[str, Dict[str, str], List[str], List[Any]]
+
+
+def update_test_modules(
+    sources: Sequence[SourceModule],
+    dst: Path,
+    fingerprints: FingerprintIndex,
+    parametrize: bool = False,
+    subclasses: bool = False,
+    tested_index: Optional[TestedIndex] = None,
+    format_cache: Optional[FormatCache] = None,
+) -> List[Path]:
+    """Patch the existing test modules of the sources in place.
+
+    Only the tests of the objects whose fingerprint changed are rendered again,
+    and only tests that still match the stub that was created are replaced.
+    Objects that the test module does not import and that have no test yet get
+    a test appended. Class instances are created inline rather than by
+    fixtures. When a format cache is given, only the rendered tests and imports
+    are formatted, so the rest of each test module is left as it was. Returns
+    the paths of the patched test modules.
+
+    Raises ValueError when parametrize is set, since a parametrized test checks
+    several objects and can not be patched for one of them.
+    """
+    if parametrize:
+        raise ValueError("Parametrized test modules can not be updated")
+    source_modules: SourceModules = {
+        get_test_module_path(source.module.__name__, dst, source.package): source
+        for source in sources
+    }
+    builder: TestModuleBuilder = TestModuleBuilder(
+        source_modules=source_modules,
+        fixture_scope=None,
+        parametrize=parametrize,
+        subclasses=subclasses,
+    )
+    patched: Dict[Path, _Patch] = {}
+    for path, source in source_modules.items():
+        if not path.is_file():
+            continue
+        text: str = path.read_text(encoding="utf-8")
+        try:
+            objects: List[Any] = _find_changed_objects(
+                source, text, fingerprints, tested_index
+            )
+        except SyntaxError as e:
+            logger.warning(f"Failed to update {path} - {e}")
+            continue
+        definitions: Dict[str, str] = {}
+        imports: List[Union[ImportDef, ImportBlockDef]] = []
+        for obj in objects:
+            module_def: ModuleDef = builder.build(path, _select_object(source, obj))
+            definitions[_get_test_name(obj)] = "\n\n\n".join(
+                definition.render() for definition in module_def.definitions
+            )
+            imports.extend(module_def.imports)
+        if definitions:
+            patched[path] = (
+                text,
+                definitions,
+                _render_missing_imports(imports, text),
+                objects,
+            )
+    if format_cache is not None:
+        _format_patches(patched, format_cache)
+    for path, (text, definitions, import_lines, objects) in patched.items():
+        logger.debug(f"Patching the tests of {len(objects)} objects in {path}")
+        path.write_text(patch_source(text, definitions, import_lines), encoding="utf-8")
+        record_fingerprints(path, source_modules[path], fingerprints, objects)
+    return list(patched)
+
+
+def _format_patches(patches: Mapping[Path, _Patch], format_cache: FormatCache) -> None:
+    """Formats the rendered tests and imports of the patches in place."""
+    sources: List[Tuple[Path, str]] = [
+        (path, source)
+        for path, (_, definitions, import_lines, _) in patches.items()
+        for source in (*definitions.values(), *import_lines)
+    ]
+    formatted: Iterator[str] = iter(
+        format_sources(
+            [source for _, source in sources],
+            cache=format_cache,
+            paths=[path for path, _ in sources],
+        )
+    )
+    for _, definitions, import_lines, _ in patches.values():
+        for name in definitions:
+            definitions[name] = next(formatted).rstrip("\n")
+        import_lines[:] = [next(formatted).rstrip("\n") for _ in import_lines]
+
+
+def record_fingerprints(
+    path: Path,
+    source: SourceModule,
+    fingerprints: FingerprintIndex,
+    objects: Optional[Iterable[Any]] = None,
+) -> None:
+    """Record the fingerprints of the objects whose tests were just written.
+
+    The tests of all of a source module's objects are recorded unless objects
+    are given. The stub of a test is recorded along with the fingerprint, so
+    that a test that is later edited by hand can be told apart from it.
+    """
+    tests: Dict[str, Any] = find_test_definitions(path.read_text(encoding="utf-8"))
+    for obj in objects if objects is not None else source.objects:
+        node: Optional[Any] = tests.get(_get_test_name(obj))
+        fingerprints.set(
+            get_source_name(source, obj),
+            ObjectFingerprint(
+                fingerprint=get_fingerprint(obj, source.methods.get(obj, ())),
+                test=_get_test_name(obj),
+                stub=hash_definition(node) if node is not None else None,
+            ),
+        )
+
+
+def _find_changed_objects(
+    source: SourceModule,
+    text: str,
+    fingerprints: FingerprintIndex,
+    tested_index: Optional[TestedIndex] = None,
+) -> List[Any]:
+    """Returns the objects of a source module whose tests should be rendered again.
+
+    A changed object's test is only rendered again when it still matches the
+    recorded stub, and a new object's test when the test module neither tests
+    nor imports the object. The fingerprints of the other changed objects are
+    updated without rendering anything.
+    """
+    tests: Dict[str, Any] = find_test_definitions(text)
+    imported: Set[str] = find_imported_names(text)
+    objects: List[Any] = []
+    for obj in source.objects:
+        name: str = get_source_name(source, obj)
+        fingerprint: str = get_fingerprint(obj, source.methods.get(obj, ()))
+        stored: Optional[ObjectFingerprint] = fingerprints.get(name)
+        if stored is not None and stored.fingerprint == fingerprint:
+            continue
+        node: Optional[Any] = tests.get(_get_test_name(obj))
+        if (
+            node is not None
+            and stored is not None
+            and stored.stub == hash_definition(node)
+        ) or (
+            node is None
+            and obj.__name__ not in imported
+            and (tested_index is None or name not in tested_index)
+        ):
+            objects.append(obj)
+            continue
+        fingerprints.set(
+            name,
+            ObjectFingerprint(
+                fingerprint=fingerprint,
+                test=_get_test_name(obj),
+                stub=stored.stub if stored is not None else None,
+            ),
+        )
+    return objects
+
+
+def _select_object(source: SourceModule, obj: Any) -> SourceModule:
+    """Returns the source module trimmed to a single object."""
+    return SourceModule(
+        source.module,
+        [obj],
+        source.import_seconds,
+        methods={obj: source.methods[obj]} if inspect.isclass(obj) else {},
+        package=source.package,
+    )
+
+
+def _get_test_name(obj: Any) -> str:
+    """Returns the name of the test created for a function or class."""
+    if inspect.isclass(obj):
+        return f"Test{obj.__name__}"
+    return f"test_{obj.__name__}"
+
+
+def _render_missing_imports(
+    imports: Iterable[Union[ImportDef, ImportBlockDef]], text: str
+) -> List[str]:
+    """Returns the import statements of the names a test module does not import."""
+    imported: Set[str] = find_imported_names(text)
+    rendered: List[str] = []
+    for block in group_imports(imports):
+        names: Tuple[str, ...] = tuple(
+            name for name in block.names if name not in imported
+        )
+        if names:
+            rendered.append(ImportBlockDef(module=block.module, names=names).render())
+    return rendered
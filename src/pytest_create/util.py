@@ -6,6 +6,8 @@ import inspect
 import os
 import pathlib
 import pkgutil
+import sys
+import threading
 from importlib.abc import MetaPathFinder
 from importlib.abc import PathEntryFinder
 from importlib.machinery import ModuleSpec
@@ -17,10 +19,13 @@ from types import ModuleType
 from types import TracebackType
 from typing import Any
 from typing import Callable
+from typing import Dict
 from typing import Generator
 from typing import Iterable
 from typing import List
 from typing import Optional
+from typing import Set
+from typing import Tuple
 from typing import Type
 from typing import TypeVar
 from typing import Union
@@ -43,6 +48,9 @@ SourceFileCompatible = TypeVar(
 
 SupportsPath = TypeVar("SupportsPath", str, pathlib.Path)
 
+_import_locks: Dict[str, threading.Lock] = {}
+_import_locks_lock: threading.Lock = threading.Lock()
+
 
 def get_source_code_filter(src: pathlib.Path) -> Callable[[SourceFileCompatible], bool]:
     """Returns a filter for objects defined in a file under the 'src' path."""
@@ -115,6 +123,15 @@ def is_relative_to(path: pathlib.Path, other: pathlib.Path) -> bool:
     return True
 
 
+def get_qualified_name(obj: Any) -> Optional[str]:
+    """Returns the module name and qualname of a class or function."""
+    module: Optional[str] = getattr(obj, "__module__", None)
+    qualname: Optional[str] = getattr(obj, "__qualname__", None)
+    if not isinstance(module, str) or not isinstance(qualname, str):
+        return None
+    return f"{module}.{qualname}"
+
+
 def standardize_paths(paths: Union[Iterable[SupportsPath], SupportsPath]) -> List[str]:
     """Standardizes the input for paths for use in pkgutil methods."""
     paths_list: Optional[Iterable[str]]
@@ -133,37 +150,94 @@ def find_objects(
     """Find all objects in a path.
 
     This function looks for all packages and modules in a path,
-    and then returns all objects within them.
+    and then returns all objects within them. Classes and functions that
+    more than one module binds, such as re-exports, are only returned once.
     """
+    found: Set[str] = set()
     for module in find_modules(paths=standardize_paths(paths), prefix=prefix):
-        yield from find_module_objects(module=module, filter_func=filter_func)
+        for _, obj in find_module_members(module=module, filter_func=filter_func):
+            qualified_name: Optional[str] = get_qualified_name(obj)
+            if qualified_name is None or qualified_name not in found:
+                yield obj
+            if qualified_name is not None:
+                found.add(qualified_name)
+
+
+ModuleLoader = Callable[
+    [str, Union[PathEntryFinder, MetaPathFinder]], Optional[ModuleType]
+]
+ModuleFilter = Callable[[str], bool]
 
 
 def find_modules(
     paths: Union[Iterable[SupportsPath], SupportsPath],
     prefix: str = "",
+    load: Optional[ModuleLoader] = None,
+    module_filter: Optional[ModuleFilter] = None,
 ) -> Generator[ModuleType, None, None]:
-    """Recursively yields all packages and modules under a given path."""
+    """Recursively yields all packages and modules under a given path.
+
+    Modules are loaded with load_from_name unless another loader is given.
+    Modules whose name is rejected by the module filter are neither loaded nor
+    walked.
+    """
     logger.debug(f"Finding objects in {paths}")
     standard_paths: List[str] = standardize_paths(paths)
     for importer, name, ispkg in pkgutil.iter_modules(
         path=standard_paths, prefix=prefix
     ):
-        module: Optional[ModuleType] = load_from_name(name, importer)
+        if module_filter is not None and not module_filter(name):
+            logger.debug(f"Skipping {name}")
+            continue
+        module: Optional[ModuleType] = (load or load_from_name)(name, importer)
         if module is not None:
             yield module
             if ispkg:
                 yield from find_modules(
-                    paths=module.__path__, prefix=module.__name__ + "."
+                    paths=module.__path__,
+                    prefix=module.__name__ + ".",
+                    load=load,
+                    module_filter=module_filter,
                 )
 
 
+def find_named_modules(
+    names: Iterable[str],
+    path: SupportsPath,
+    load: Optional[ModuleLoader] = None,
+    module_filter: Optional[ModuleFilter] = None,
+    prefix: str = "",
+) -> Generator[ModuleType, None, None]:
+    """Yields the named modules found under a given path without walking it.
+
+    Modules are loaded with load_from_name unless another loader is given, and
+    modules whose name is rejected by the module filter are not loaded. Names
+    may start with prefix, the package path is in, which is not part of path.
+    """
+    logger.debug(f"Finding named modules in {path}")
+    for name in names:
+        if module_filter is not None and not module_filter(name):
+            logger.debug(f"Skipping {name}")
+            continue
+        relative_name: str = name[len(prefix) :] if name.startswith(prefix) else name
+        package_path: pathlib.Path = pathlib.Path(path).joinpath(
+            *relative_name.split(".")[:-1]
+        )
+        importer: Any = pkgutil.get_importer(str(package_path))
+        if importer is None:
+            logger.error(f"Failed to find module {name}")
+            continue
+        module: Optional[ModuleType] = (load or load_from_name)(name, importer)
+        if module is not None:
+            yield module
+
+
 def load_from_name(
     name: str, finder: Union[PathEntryFinder, MetaPathFinder]
 ) -> Optional[ModuleType]:
     """Load a module from its name."""
     # logger.debug(f"Loading {name}")
-    with contextlib.suppress(Exception):
+    with contextlib.suppress(Exception, SystemExit):
         spec: Optional[ModuleSpec] = finder.find_spec(name, None)
         if spec is None or spec.loader is None:
             logger.error(f"Failed to load module {name}")
@@ -174,11 +248,85 @@ def load_from_name(
     return None
 
 
-def load_from_file(path: pathlib.Path) -> Optional[ModuleType]:
-    """Loads the module located at the given path."""
+def import_from_name(
+    name: str, finder: Union[PathEntryFinder, MetaPathFinder]
+) -> Optional[ModuleType]:
+    """Import a module from its name, adding it to sys.modules.
+
+    Unlike load_from_name, the module is reused by the modules that import it
+    afterwards, and the module already imported from the same file is returned
+    instead of being executed again. A name that already belongs to a module
+    imported from another file is never replaced, and the module is loaded
+    without being added to sys.modules instead.
+
+    A module that the import system finds by its name is imported with
+    importlib.import_module, which holds the import lock of the module, so
+    threads that import it at the same time wait for it to be initialized.
+    Other modules are only imported by one thread at a time.
+    """
+    with contextlib.suppress(Exception, SystemExit):
+        spec: Optional[ModuleSpec] = finder.find_spec(name, None)
+        if spec is None or spec.loader is None:
+            logger.error(f"Failed to load module {name}")
+            return None
+        with _get_import_lock(name):
+            imported: Optional[ModuleType] = sys.modules.get(name)
+            if imported is not None:
+                if _is_same_file(getattr(imported, "__file__", None), spec.origin):
+                    return imported
+                logger.debug(f"Not replacing {name} imported from another file")
+                return load_from_name(name, finder)
+            if _is_found_by_name(name, spec.origin):
+                return importlib.import_module(name)
+            module: ModuleType = importlib.util.module_from_spec(spec)
+            sys.modules[name] = module
+            try:
+                spec.loader.exec_module(module)
+            except BaseException:
+                sys.modules.pop(name, None)
+                raise
+            package, _, child = name.rpartition(".")
+            if package in sys.modules:
+                setattr(sys.modules[package], child, module)
+            return module
+    return None
+
+
+def _get_import_lock(name: str) -> threading.Lock:
+    """Returns the lock held while import_from_name imports a module."""
+    with _import_locks_lock:
+        return _import_locks.setdefault(name, threading.Lock())
+
+
+def _is_found_by_name(name: str, origin: Optional[str]) -> bool:
+    """Returns whether the import system finds a module in the origin file."""
+    spec: Optional[ModuleSpec] = None
+    with contextlib.suppress(Exception):
+        spec = importlib.util.find_spec(name)
+    return spec is not None and _is_same_file(spec.origin, origin)
+
+
+def _is_same_file(path: Optional[str], other: Optional[str]) -> bool:
+    """Returns whether two module origins are the same file."""
+    if path is None or other is None:
+        return False
+    if path == other:
+        return True
+    with contextlib.suppress(OSError):
+        return pathlib.Path(path).resolve() == pathlib.Path(other).resolve()
+    return False
+
+
+def load_from_file(
+    path: pathlib.Path, name: Optional[str] = None
+) -> Optional[ModuleType]:
+    """Loads the module located at the given path.
+
+    The module is named after its file unless another name is given.
+    """
     # logger.debug(f"Loading {path}")
     spec: Optional[ModuleSpec] = importlib.util.spec_from_file_location(
-        name=path.stem, location=str(path)
+        name=name or path.stem, location=str(path)
     )
     if spec is None or spec.loader is None:
         logger.error(f"Failed to load module {path}")
@@ -192,7 +340,15 @@ def find_module_objects(
     module: ModuleType, filter_func: Optional[Callable[[Any], bool]] = None
 ) -> Generator[Any, None, None]:
     """Find all objects in a module."""
+    for _, obj in find_module_members(module=module, filter_func=filter_func):
+        yield obj
+
+
+def find_module_members(
+    module: ModuleType, filter_func: Optional[Callable[[Any], bool]] = None
+) -> Generator[Tuple[str, Any], None, None]:
+    """Find all objects in a module with the names they are bound to."""
     logger.debug(f"Searching {module.__name__}...")
-    for _, obj in inspect.getmembers(module):
+    for name, obj in inspect.getmembers(module):
         if filter_func is None or filter_func(obj):
-            yield obj
+            yield name, obj
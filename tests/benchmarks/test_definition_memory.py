@@ -0,0 +1,73 @@
+import inspect
+import tracemalloc
+from dataclasses import MISSING
+from dataclasses import Field
+from dataclasses import field
+from dataclasses import fields
+from dataclasses import make_dataclass
+from typing import Any
+from typing import Callable
+from typing import List
+from typing import Tuple
+from typing import Type
+
+import pytest
+
+from pytest_create.definitions.class_def import ClassDef
+from pytest_create.definitions.docstring_def import DocstringDef
+from pytest_create.definitions.function_def import FunctionDef
+from pytest_create.definitions.object_def import ObjectDef
+
+
+COUNT: int = 2000
+
+
+def dict_backed(cls: Type[Any]) -> Type[Any]:
+    """Returns a dataclass with the same fields as cls that stores them in __dict__."""
+    dict_fields: List[Tuple[str, Any, "Field[Any]"]] = []
+    for _field in fields(cls):
+        if _field.default_factory is not MISSING:
+            dict_field: "Field[Any]" = field(default_factory=_field.default_factory)
+        else:
+            dict_field = field(default=_field.default)
+        dict_fields.append((_field.name, _field.type, dict_field))
+    return make_dataclass(f"Dict{cls.__name__}", dict_fields)
+
+
+def bytes_per_definition(factory: Callable[[int], Any]) -> float:
+    tracemalloc.start()
+    try:
+        start: int = tracemalloc.get_traced_memory()[0]
+        definitions: List[Any] = [factory(index) for index in range(COUNT)]
+        used: int = tracemalloc.get_traced_memory()[0] - start
+    finally:
+        tracemalloc.stop()
+    assert len(definitions) == COUNT
+    return used / COUNT
+
+
+@pytest.mark.parametrize(
+    argnames=["cls"],
+    argvalues=[(FunctionDef,), (ClassDef,)],
+    ids=["FunctionDef", "ClassDef"],
+)
+def test_definition_memory_benchmark(
+    cls: Type[ObjectDef], record_property: Callable[[str, object], None]
+) -> None:
+    dict_cls: Type[Any] = dict_backed(cls)
+    before: float = bytes_per_definition(
+        lambda index: dict_cls(name=f"name_{index % 10}", docstring=DocstringDef())
+    )
+    after: float = bytes_per_definition(lambda index: cls(name=f"name_{index % 10}"))
+    record_property(f"{cls.__name__}_bytes_before", before)
+    record_property(f"{cls.__name__}_bytes_after", after)
+    assert after < before
+
+
+def test_definition_memory_has_no_instance_dict() -> None:
+    for definition in (
+        FunctionDef(name="function", signature=inspect.Signature()),
+        ClassDef(name="Class"),
+        DocstringDef(value="Docstring."),
+    ):
+        assert not hasattr(definition, "__dict__")
@@ -0,0 +1,86 @@
+import os
+import time
+from pathlib import Path
+from typing import Callable
+from typing import List
+
+import pytest
+
+from pytest_create.definitions.function_def import FunctionDef
+from pytest_create.definitions.import_def import ImportDef
+from pytest_create.definitions.module_def import ModuleDef
+
+
+MODULES: int = 20
+TESTS_PER_MODULE: int = 100
+OS_FUNCTIONS: List[Callable[..., object]] = [
+    os.chdir,
+    os.getcwd,
+    os.listdir,
+    os.getpid,
+    os.cpu_count,
+]
+
+
+def build_generated_module(index: int) -> ModuleDef:
+    imports: List[ImportDef] = []
+    definitions: List[FunctionDef] = []
+    for test_index in range(TESTS_PER_MODULE):
+        function = OS_FUNCTIONS[test_index % len(OS_FUNCTIONS)]
+        imports.append(ImportDef(module=os, obj=function))
+        definitions.append(
+            FunctionDef(
+                name=f"test_{function.__name__}_{index}_{test_index}",
+                code=f"assert {function.__name__}",
+            )
+        )
+    return ModuleDef(
+        name=f"test_generated_{index}", imports=imports, definitions=definitions
+    )
+
+
+def render_ungrouped(module_def: ModuleDef) -> str:
+    import_lines: str = "\n".join(
+        import_def.render() for import_def in module_def.imports
+    )
+    definitions: str = "\n".join(
+        definition.render() for definition in module_def.definitions
+    )
+    return f"{import_lines}\n{definitions}"
+
+
+def collect(pytester: pytest.Pytester, directory: Path) -> float:
+    start: float = time.perf_counter()
+    result: pytest.RunResult = pytester.runpytest_inprocess(
+        str(directory), "--collect-only", "-q", "-p", "no:cacheprovider"
+    )
+    elapsed: float = time.perf_counter() - start
+    result.assert_outcomes()
+    assert f"{MODULES * TESTS_PER_MODULE} tests collected" in result.stdout.str()
+    return elapsed
+
+
+def test_import_blocks_collection_benchmark(
+    pytester: pytest.Pytester, record_property: Callable[[str, object], None]
+) -> None:
+    ungrouped_dir: Path = pytester.mkdir("ungrouped")
+    grouped_dir: Path = pytester.mkdir("grouped")
+    ungrouped_lines: int = 0
+    grouped_lines: int = 0
+    for index in range(MODULES):
+        module_def: ModuleDef = build_generated_module(index)
+        ungrouped: str = render_ungrouped(module_def)
+        grouped: str = module_def.render()
+        (ungrouped_dir / f"test_ungrouped_{index}.py").write_text(ungrouped)
+        (grouped_dir / f"test_grouped_{index}.py").write_text(grouped)
+        ungrouped_lines += ungrouped.count("import ")
+        grouped_lines += grouped.count("import ")
+    collect(pytester, grouped_dir)
+    ungrouped_time: float = collect(pytester, ungrouped_dir)
+    grouped_time: float = collect(pytester, grouped_dir)
+    record_property("import_lines_ungrouped", ungrouped_lines)
+    record_property("import_lines_grouped", grouped_lines)
+    record_property("collection_seconds_ungrouped", ungrouped_time)
+    record_property("collection_seconds_grouped", grouped_time)
+    assert grouped_lines == MODULES
+    assert ungrouped_lines == MODULES * TESTS_PER_MODULE
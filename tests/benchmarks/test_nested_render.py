@@ -0,0 +1,66 @@
+from typing import Any
+from typing import List
+
+import pytest
+
+from pytest_create.definitions.class_def import ClassDef
+from pytest_create.definitions.function_def import FunctionDef
+from pytest_create.definitions.templates import ENV
+
+
+DEPTH: int = 50
+METHODS_PER_CLASS: int = 5
+
+
+def build_nested_class_def(depth: int) -> ClassDef:
+    class_def: ClassDef = ClassDef(name=f"Level{depth}")
+    for level in range(depth - 1, -1, -1):
+        methods: List[FunctionDef] = [
+            FunctionDef.as_method(
+                name=f"method_{index}", code="value = 1\nreturn value"
+            )
+            for index in range(METHODS_PER_CLASS)
+        ]
+        class_def = ClassDef(
+            name=f"Level{level}",
+            docstring=f"Level {level}.",
+            definitions=[class_def, *methods],
+        )
+    return class_def
+
+
+@pytest.fixture
+def indented_characters(monkeypatch: pytest.MonkeyPatch) -> List[int]:
+    counts: List[int] = []
+    indent = ENV.filters["indent"]
+
+    def counting_indent(s: Any, *args: Any, **kwargs: Any) -> str:
+        counts.append(len(str(s)))
+        return str(indent(s, *args, **kwargs))
+
+    monkeypatch.setitem(ENV.filters, "indent", counting_indent)
+    return counts
+
+
+def test_nested_class_def_render_indents_each_line_once(
+    indented_characters: List[int],
+) -> None:
+    rendered: str = build_nested_class_def(DEPTH).render()
+    assert sum(indented_characters) < len(rendered)
+
+
+def test_nested_class_def_render_final_indentation() -> None:
+    rendered: str = build_nested_class_def(DEPTH).render()
+    for level in range(DEPTH + 1):
+        assert f"\n{' ' * 4 * level}class Level{level}" in rendered
+    assert f"\n{' ' * 4 * (DEPTH + 1)}return value" in rendered
+
+
+def test_nested_class_def_render_scales_linearly(
+    indented_characters: List[int],
+) -> None:
+    build_nested_class_def(DEPTH // 2).render()
+    shallow: int = sum(indented_characters)
+    indented_characters.clear()
+    build_nested_class_def(DEPTH).render()
+    assert sum(indented_characters) < shallow * 3
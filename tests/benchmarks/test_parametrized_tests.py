@@ -0,0 +1,61 @@
+import time
+from pathlib import Path
+from typing import Callable
+from typing import Dict
+from typing import List
+
+import pytest
+
+from pytest_create.create import CreateOptions
+from pytest_create.create import create_tests
+
+
+FUNCTIONS: int = 400
+CLASSES: int = 50
+METHODS_PER_CLASS: int = 8
+
+
+def write_source_module(src: Path) -> None:
+    lines: List[str] = []
+    for index in range(FUNCTIONS):
+        lines.append(f"def function_{index}() -> int:\n    return {index}\n\n")
+    for index in range(CLASSES):
+        lines.append(f"class Class{index}:\n")
+        for method in range(METHODS_PER_CLASS):
+            lines.append(f"    def method_{method}(self) -> None:\n        pass\n\n")
+    src.mkdir()
+    (src / "generated_module.py").write_text("".join(lines))
+
+
+def collect(pytester: pytest.Pytester, directory: Path) -> float:
+    start: float = time.perf_counter()
+    result: pytest.RunResult = pytester.runpytest_inprocess(
+        str(directory), "--collect-only", "-q", "-p", "no:cacheprovider"
+    )
+    elapsed: float = time.perf_counter() - start
+    expected: int = FUNCTIONS + CLASSES * (METHODS_PER_CLASS + 1)
+    assert f"{expected} tests collected" in result.stdout.str()
+    return elapsed
+
+
+def test_parametrized_tests_benchmark(
+    pytester: pytest.Pytester, record_property: Callable[[str, object], None]
+) -> None:
+    src: Path = pytester.path / "src"
+    write_source_module(src)
+    pytester.syspathinsert(src)
+    lines: Dict[bool, int] = {}
+    seconds: Dict[bool, float] = {}
+    for parametrize in (False, True):
+        dst: Path = pytester.mkdir(f"tests_{parametrize}".lower())
+        create_tests(src=src, dst=dst, options=CreateOptions(parametrize=parametrize))
+        lines[parametrize] = len(
+            (dst / "test_generated_module.py").read_text().splitlines()
+        )
+        collect(pytester, dst)
+        seconds[parametrize] = collect(pytester, dst)
+    record_property("generated_lines_per_case", lines[False])
+    record_property("generated_lines_parametrized", lines[True])
+    record_property("collection_seconds_per_case", seconds[False])
+    record_property("collection_seconds_parametrized", seconds[True])
+    assert lines[True] * 2 < lines[False]
@@ -1,6 +1,10 @@
 import importlib.util
+import py_compile
+import sys
 from importlib.machinery import ModuleSpec
 from pathlib import Path
+from typing import Dict
+from typing import Iterator
 
 import pytest
 
@@ -22,3 +26,245 @@ def config(pytester: pytest.Pytester) -> pytest.Config:
     config: pytest.Config = pytester.parseconfig()
     config._rootpath = tests_dir / "unit_tests"
     return config
+
+
+@pytest.fixture
+def site_packages(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    site_packages: Path = tmp_path / "site-packages"
+    package: Path = site_packages / "fake_dist"
+    package.mkdir(parents=True)
+    (package / "__init__.py").write_text("")
+    (package / "core.py").write_text("def run() -> None:\n    pass\n")
+    (package / "test_core.py").write_text("def test_run() -> None:\n    pass\n")
+    (site_packages / "unrelated.py").write_text("def other() -> None:\n    pass\n")
+    dist_info: Path = site_packages / "fake_dist-1.0.dist-info"
+    dist_info.mkdir()
+    (dist_info / "METADATA").write_text(
+        "Metadata-Version: 2.1\nName: fake-dist\nVersion: 1.0\n"
+    )
+    (dist_info / "RECORD").write_text(
+        "fake_dist/__init__.py,,\n"
+        "fake_dist/core.py,,\n"
+        "fake_dist/test_core.py,,\n"
+        "fake_dist/__pycache__/core.cpython-311.pyc,,\n"
+        "fake_dist-1.0.dist-info/METADATA,,\n"
+        "fake_dist-1.0.dist-info/RECORD,,\n"
+        "../../bin/fake-dist,,\n"
+    )
+    monkeypatch.syspath_prepend(str(site_packages))
+    return site_packages
+
+
+HEAVY_STUB: str = '''"""A heavy module."""
+import sys
+from typing import overload
+
+def compute(value: int, *, scale: float = 1.0) -> float:
+    """Computes a value."""
+    ...
+
+@overload
+def convert(value: int) -> str: ...
+@overload
+def convert(value: str) -> int: ...
+
+def _private() -> None: ...
+
+if sys.version_info >= (3, 8):
+    def modern() -> None: ...
+else:
+    def legacy() -> None: ...
+
+class Matrix:
+    """A matrix."""
+
+    def __init__(self, rows: int) -> None: ...
+    def transpose(self) -> Matrix: ...
+    @staticmethod
+    def identity(size: int) -> Matrix: ...
+    @classmethod
+    def zeros(cls, rows: int) -> Matrix: ...
+    @property
+    def shape(self) -> int: ...
+'''
+
+
+@pytest.fixture
+def native_package(tmp_path: Path) -> Path:
+    package: Path = tmp_path / "native_pkg"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    (package / "heavy.py").write_text("raise RuntimeError('heavy was imported')\n")
+    (package / "heavy.pyi").write_text(HEAVY_STUB)
+    (package / "plain.py").write_text("def plain() -> None:\n    pass\n")
+    return tmp_path
+
+
+@pytest.fixture
+def compiled_package(tmp_path: Path) -> Path:
+    root: Path = tmp_path / "compiled"
+    package: Path = root / "compiled_pkg"
+    (package / "sub").mkdir(parents=True)
+    sources: Dict[Path, str] = {
+        package / "__init__.py": "",
+        package
+        / "service.py": (
+            "if __name__:\n"
+            "    raise RuntimeError('service was executed')\n"
+            "\n"
+            "\n"
+            "def run(value, *args, flag, **kwargs):\n"
+            "    return [item for item in args]\n"
+            "\n"
+            "\n"
+            "class Service:\n"
+            "    def __init__(self, name):\n"
+            "        self.name = name\n"
+            "\n"
+            "    def start(self, timeout):\n"
+            "        pass\n"
+            "\n"
+            "    def _stop(self):\n"
+            "        pass\n"
+            "\n"
+            "\n"
+            "def _helper():\n"
+            "    pass\n"
+        ),
+        package / "sub" / "__init__.py": "",
+        package / "sub" / "deep.py": "def dive():\n    pass\n",
+    }
+    for path, source in sources.items():
+        path.write_text(source)
+        py_compile.compile(str(path), doraise=True)
+        path.unlink()
+    legacy: Path = package / "legacy.py"
+    legacy.write_text("def old(value):\n    pass\n")
+    py_compile.compile(str(legacy), cfile=str(package / "legacy.pyc"), doraise=True)
+    legacy.unlink()
+    return root
+
+
+@pytest.fixture
+def hybrid_package(tmp_path: Path) -> Path:
+    package: Path = tmp_path / "hybrid_pkg"
+    package.mkdir()
+    sources: Dict[str, str] = {
+        "__init__.py": "",
+        "plain.py": (
+            '"""A plain module."""\n'
+            "if __name__:\n"
+            "    raise RuntimeError('plain was imported')\n"
+            "\n"
+            "\n"
+            "def scale(value: int, factor: float = 2.0) -> float:\n"
+            '    """Scales a value."""\n'
+            "    return value * factor\n"
+            "\n"
+            "\n"
+            "class Shape:\n"
+            "    @staticmethod\n"
+            "    def unit() -> 'Shape':\n"
+            "        return Shape()\n"
+            "\n"
+            "    def area(self) -> float:\n"
+            "        return 0.0\n"
+        ),
+        "lazy.py": (
+            "def loaded() -> None:\n"
+            "    pass\n"
+            "\n"
+            "\n"
+            "def __getattr__(name):\n"
+            "    raise AttributeError(name)\n"
+        ),
+        "decorated.py": (
+            "import functools\n"
+            "\n"
+            "\n"
+            "def register(func):\n"
+            "    @functools.wraps(func)\n"
+            "    def wrapper(*args, **kwargs):\n"
+            "        return func(*args, **kwargs)\n"
+            "\n"
+            "    return wrapper\n"
+            "\n"
+            "\n"
+            "@register\n"
+            "def handler(event: str) -> None:\n"
+            "    pass\n"
+        ),
+    }
+    for name, source in sources.items():
+        (package / name).write_text(source)
+    return tmp_path
+
+
+@pytest.fixture
+def reexport_package(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    package: Path = tmp_path / "reexport_pkg"
+    package.mkdir()
+    (package / "__init__.py").write_text(
+        "from .impl import *\nfrom .impl import Engine as Motor\n"
+    )
+    (package / "impl.py").write_text(
+        "def start() -> None:\n"
+        "    pass\n"
+        "\n"
+        "\n"
+        "class Engine:\n"
+        "    def run(self) -> None:\n"
+        "        pass\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield tmp_path
+    for name in [name for name in sys.modules if name.startswith("reexport_pkg")]:
+        del sys.modules[name]
+
+
+@pytest.fixture
+def service_package(tmp_path: Path) -> Path:
+    package: Path = tmp_path / "src" / "service_package"
+    (package / "sub_package").mkdir(parents=True)
+    (package / "__init__.py").write_text("")
+    (package / "sub_package" / "__init__.py").write_text("")
+    (package / "service.py").write_text(
+        "class Service:\n"
+        "    def start(self) -> bool:\n"
+        "        return True\n"
+        "\n"
+        "    def _stop(self) -> None:\n"
+        "        pass\n"
+    )
+    (package / "sub_package" / "client.py").write_text(
+        "def connect(service: 'Service') -> bool:\n" "    return service.start()\n"
+    )
+    return package
+
+
+@pytest.fixture
+def shapes_module(tmp_path: Path) -> Path:
+    src: Path = tmp_path / "src"
+    src.mkdir()
+    (src / "shapes.py").write_text(
+        "def area() -> int:\n"
+        "    return 1\n"
+        "\n"
+        "\n"
+        "def perimeter() -> int:\n"
+        "    return 4\n"
+        "\n"
+        "\n"
+        "class Square:\n"
+        "    def scale(self) -> None:\n"
+        "        pass\n"
+        "\n"
+        "    def rotate(self) -> None:\n"
+        "        pass\n"
+        "\n"
+        "\n"
+        "class Circle:\n"
+        "    def scale(self) -> None:\n"
+        "        pass\n"
+    )
+    return src
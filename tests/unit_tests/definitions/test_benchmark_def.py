@@ -0,0 +1,33 @@
+from pytest_create.definitions.benchmark_def import BenchmarkDef
+from pytest_create.definitions.templates import BENCHMARK_TEMPLATE
+
+
+def test_benchmark_def_init() -> None:
+    b: BenchmarkDef = BenchmarkDef(name="test_function_benchmark", target="function")
+    assert b.key == "function"
+    assert (b.warmup, b.repeat, b.number) == (3, 5, 100)
+
+
+def test_benchmark_def_init_with_key() -> None:
+    b: BenchmarkDef = BenchmarkDef(
+        name="test_method_benchmark", target="Example().method", key="Example.method"
+    )
+    assert b.key == "Example.method"
+
+
+def test_benchmark_def_render() -> None:
+    b: BenchmarkDef = BenchmarkDef(
+        name="test_function_benchmark", target="function", warmup=1, number=10
+    )
+    rendered: str = b.render()
+    assert rendered == BENCHMARK_TEMPLATE.render(b._rendered_dict(), indent="")
+    assert "for _ in range(1):" in rendered
+    assert "timeit.repeat(target, repeat=5, number=10)" in rendered
+    assert "seconds: float = min(timings) / 10" in rendered
+
+
+def test_benchmark_def_render_indented() -> None:
+    b: BenchmarkDef = BenchmarkDef(name="test_function_benchmark", target="function")
+    assert b.render(indent="    ").startswith(
+        "    def test_function_benchmark(record_property"
+    )
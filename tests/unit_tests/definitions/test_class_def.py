@@ -1,4 +1,10 @@
+from typing import Any
+from typing import List
+
+import pytest
+
 from pytest_create.definitions.class_def import ClassDef
+from pytest_create.definitions.function_def import FunctionDef
 
 
 def test_class_def_init(class_def: ClassDef) -> None:
@@ -7,3 +13,78 @@ def test_class_def_init(class_def: ClassDef) -> None:
 
 def test_class_def_str(class_def: ClassDef) -> None:
     assert isinstance(str(class_def), str)
+
+
+def test_class_def_render_nested() -> None:
+    class_def: ClassDef = ClassDef(
+        name="Outer",
+        definitions=[
+            ClassDef(
+                name="Inner",
+                definitions=[FunctionDef.as_method(name="method", code="x = 'a'")],
+            )
+        ],
+    )
+    expected = (
+        "class Outer:"
+        "    class Inner:"
+        "        def method(self):"
+        "            x = 'a'"
+    )
+    assert class_def.render().replace("\n", "") == expected
+
+
+def test_class_def_render_string_definitions() -> None:
+    class_def: ClassDef = ClassDef(
+        name="A",
+        definitions=["x = 1\ny = 2", ClassDef(name="B", definitions=["z = 3"])],
+    )
+    rendered: str = class_def.render()
+    assert rendered.strip("\n").startswith("class A:\n    x = 1\n    y = 2\n")
+    assert rendered.rstrip("\n").endswith("\n    class B:\n        z = 3")
+    compile(rendered, "<rendered>", "exec")
+
+
+def test_class_def_render_only_changed_subtree(monkeypatch: pytest.MonkeyPatch) -> None:
+    unchanged: FunctionDef = FunctionDef.as_method(name="unchanged")
+    class_def: ClassDef = ClassDef(name="Outer", definitions=[unchanged])
+    class_def.render()
+    rendered: List[str] = []
+    render = FunctionDef.template.render
+
+    def spy_render(*args: Any, **kwargs: Any) -> str:
+        rendered.append(dict(*args, **kwargs)["name"])
+        return render(*args, **kwargs)
+
+    monkeypatch.setattr(FunctionDef.template, "render", spy_render)
+    class_def.definitions.append(FunctionDef.as_method(name="added"))
+    assert "def added(self):" in class_def.render()
+    assert rendered == ["added"]
+
+
+def test_class_def_render_nested_reuses_unchanged_fragments(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    inner: ClassDef = ClassDef(
+        name="Inner",
+        definitions=[FunctionDef.as_method(name=f"method_{i}") for i in range(3)],
+    )
+    other: ClassDef = ClassDef(
+        name="Other", definitions=[FunctionDef.as_method(name="other")]
+    )
+    class_def: ClassDef = ClassDef(name="Outer", definitions=[inner, other])
+    class_def.render()
+    unchanged: str = other.render(indent="    ")
+    rendered: List[str] = []
+    for template in (FunctionDef.template, ClassDef.template):
+        render = template.render
+
+        def spy_render(*args: Any, render: Any = render, **kwargs: Any) -> str:
+            rendered.append(dict(*args, **kwargs)["name"])
+            return str(render(*args, **kwargs))
+
+        monkeypatch.setattr(template, "render", spy_render)
+    inner.definitions.append(FunctionDef.as_method(name="added"))
+    assert "        def added(self):" in class_def.render()
+    assert rendered == ["added", "Inner", "Outer"]
+    assert other.render(indent="    ") is unchanged
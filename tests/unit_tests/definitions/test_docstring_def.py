@@ -1,5 +1,8 @@
+from dataclasses import FrozenInstanceError
+
 import pytest
 
+from pytest_create.definitions.docstring_def import EMPTY_DOCSTRING
 from pytest_create.definitions.docstring_def import DocstringDef
 
 
@@ -59,3 +62,13 @@ def test_remove_docstring_quotes() -> None:
 def test_is_multi_line(value: str, expected: bool) -> None:
     docstring = DocstringDef(value=value)
     assert docstring.is_multi_line() == expected
+
+
+def test_from_string_with_empty_string() -> None:
+    assert DocstringDef.from_string("") is EMPTY_DOCSTRING
+
+
+def test_docstring_def_is_frozen() -> None:
+    docstring = DocstringDef(value="This is a docstring.")
+    with pytest.raises(FrozenInstanceError):
+        docstring.value = "changed"  # type: ignore[misc]
@@ -95,3 +95,49 @@ def test_function_def_render(example_function_def: FunctionDef) -> None:
     )
 
     assert rendered.strip() == expected.strip()
+
+
+def test_function_def_as_method_reuses_signature() -> None:
+    signature: inspect.Signature = inspect.Signature(
+        parameters=[inspect.Parameter("x", inspect.Parameter.POSITIONAL_OR_KEYWORD)]
+    )
+    first: FunctionDef = FunctionDef.as_method(name="first", signature=signature)
+    second: FunctionDef = FunctionDef.as_method(name="second", signature=signature)
+    assert first.signature is second.signature
+
+
+def test_function_def_as_parametrized() -> None:
+    f: FunctionDef = FunctionDef.as_parametrized(
+        argnames=["cls", "name"],
+        argvalues=['(A, "x")', '(B, "y")'],
+        ids=["A.x", "B.y"],
+        name="test_methods",
+        signature=inspect.Signature(parameters=[SELF_PARAMETER]),
+    )
+    assert f.decorators == [
+        "@pytest.mark.parametrize(\n"
+        '    "cls, name",\n'
+        "    [\n"
+        '        (A, "x"),\n'
+        '        (B, "y"),\n'
+        "    ],\n"
+        "    ids=[\n"
+        '        "A.x",\n'
+        '        "B.y",\n'
+        "    ],\n"
+        ")"
+    ]
+    assert list(f.signature.parameters) == ["self", "cls", "name"]
+
+
+def test_function_def_as_parametrized_render_indented() -> None:
+    f: FunctionDef = FunctionDef.as_parametrized(
+        argnames=["name"], argvalues=['"x"'], name="test_methods"
+    )
+    assert f.render(indent="    ").strip("\n").splitlines()[:5] == [
+        "    @pytest.mark.parametrize(",
+        '        "name",',
+        "        [",
+        '            "x",',
+        "        ],",
+    ]
@@ -1,10 +1,14 @@
 from importlib.machinery import SourceFileLoader
 from pathlib import Path
 from types import ModuleType
+from typing import List
+from typing import Tuple
 
 import pytest
 
+from pytest_create.definitions.import_def import ImportBlockDef
 from pytest_create.definitions.import_def import ImportDef
+from pytest_create.definitions.import_def import group_imports
 from tests.example_package.example_module import example_function
 
 
@@ -44,6 +48,21 @@ def test_import_def_render_object_import_with_object(
     assert import_def.render() == expected
 
 
+def test_import_def_render_object_import_with_module_name(
+    example_module: ModuleType,
+) -> None:
+    import_def: ImportDef = ImportDef(
+        module=example_module, obj=example_function, module_name="example_module"
+    )
+    assert import_def.render() == "from example_module import example_function"
+    assert ImportDef(
+        module=example_module, module_name="pkg.example_module"
+    ).target() == (
+        "pkg",
+        "example_module",
+    )
+
+
 def test_import_def_render_object_import_without_name(
     example_module: ModuleType,
 ) -> None:
@@ -59,3 +78,49 @@ def test_import_def_find_package_root(
     import_def: ImportDef = ImportDef(module=example_module)
     package_root = import_def._find_package_root()
     assert package_root.resolve() == example_package_dir / "example_module.py"
+
+
+def test_import_def_target(example_module: ModuleType) -> None:
+    import_def: ImportDef = ImportDef(module=example_module, obj=example_function)
+    assert import_def.target() == (
+        "tests.example_package.example_module",
+        "example_function",
+    )
+
+
+@pytest.mark.parametrize(
+    argnames=["module", "names", "expected"],
+    argvalues=[
+        ("pkg.mod", ("a",), "from pkg.mod import a"),
+        ("pkg.mod", ("a", "b", "c"), "from pkg.mod import a, b, c"),
+        (
+            "pkg.mod",
+            tuple(f"name_{index}" for index in range(10)),
+            "from pkg.mod import (\n"
+            + "".join(f"    name_{index},\n" for index in range(10))
+            + ")",
+        ),
+        ("", ("os", "sys"), "import os\nimport sys"),
+    ],
+    ids=["single_name", "multiple_names", "long_line", "no_module"],
+)
+def test_import_block_def_render(
+    module: str, names: Tuple[str, ...], expected: str
+) -> None:
+    assert ImportBlockDef(module=module, names=names).render() == expected
+
+
+def test_group_imports(example_module: ModuleType) -> None:
+    import_defs: List[ImportDef] = [
+        ImportDef(module=example_module, obj="example_variable"),
+        ImportDef(module=example_module, obj=example_function),
+        ImportDef(module=example_module),
+        ImportDef(module=example_module, obj="example_function"),
+    ]
+    assert group_imports(import_defs) == [
+        ImportBlockDef(module="tests.example_package", names=("example_module",)),
+        ImportBlockDef(
+            module="tests.example_package.example_module",
+            names=("example_function", "example_variable"),
+        ),
+    ]
@@ -1,3 +1,4 @@
+import io
 import os
 
 import pytest
@@ -34,3 +35,58 @@ def test_module_def_render(module_def: ModuleDef) -> None:
         "    pass"
     )
     assert rendered.replace("\n", "") == expected.replace("\n", "")
+
+
+@pytest.mark.parametrize(
+    argnames=["definitions"],
+    argvalues=[
+        (
+            [
+                ClassDef(
+                    name="TestClass",
+                    docstring="A test class.",
+                    definitions=[
+                        ClassDef(name="TestNestedClass"),
+                        FunctionDef.as_method(name="test_method", code="x = 1"),
+                    ],
+                ),
+                FunctionDef(name="test_function"),
+            ],
+        )
+    ],
+    ids=["nested_class_and_function_definitions"],
+    indirect=True,
+)
+def test_module_def_render_to(module_def: ModuleDef) -> None:
+    fp: io.StringIO = io.StringIO()
+    module_def.render_to(fp)
+    assert fp.getvalue() == module_def.render()
+
+
+@pytest.mark.parametrize(
+    argnames=["imports"],
+    argvalues=[
+        (
+            [
+                ImportDef(module=os, obj=os.chdir),
+                ImportDef(module=os, obj=os.getcwd),
+                ImportDef(module=os, obj=os.chdir),
+            ],
+        )
+    ],
+    ids=["duplicate_os_imports"],
+    indirect=True,
+)
+def test_module_def_render_groups_imports(module_def: ModuleDef) -> None:
+    assert module_def.render().strip() == "from os import chdir, getcwd"
+
+
+def test_module_def_render_statements() -> None:
+    module_def: ModuleDef = ModuleDef(
+        name="test_module",
+        statements=["pytestmark = [pytest.mark.slow]"],
+        definitions=[FunctionDef(name="test_function")],
+    )
+    rendered: str = module_def.render()
+    assert "pytestmark = [pytest.mark.slow]" in rendered
+    assert rendered.index("pytestmark") < rendered.index("def test_function")
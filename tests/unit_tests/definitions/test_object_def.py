@@ -1,9 +1,11 @@
+import sys
 from dataclasses import dataclass
 from typing import ClassVar
 from typing import Union
 
 from jinja2 import Template
 
+from pytest_create.definitions.docstring_def import EMPTY_DOCSTRING
 from pytest_create.definitions.docstring_def import DocstringDef
 from pytest_create.definitions.object_def import ObjectDef
 
@@ -42,3 +44,13 @@ def test_object_def_post_init_no_docstring() -> None:
 def test_object_def_str() -> None:
     obj: MockObjectDef = MockObjectDef(name="mock")
     assert isinstance(str(obj), str)
+
+
+def test_object_def_post_init_shares_empty_docstring() -> None:
+    obj: MockObjectDef = MockObjectDef(name="mock", docstring=None)
+    assert obj.docstring is EMPTY_DOCSTRING
+
+
+def test_object_def_post_init_interns_name() -> None:
+    obj: MockObjectDef = MockObjectDef(name="".join(["mo", "ck"]))
+    assert obj.name is sys.intern("mock")
@@ -1,7 +1,9 @@
+import io
 from dataclasses import dataclass
 from typing import Any
 from typing import ClassVar
 from typing import Dict
+from typing import List
 from typing import MutableMapping
 from typing import MutableSequence
 from typing import Union
@@ -9,6 +11,7 @@ from typing import Union
 import pytest
 from jinja2 import Template
 
+from pytest_create.definitions.render import StreamedFragment
 from pytest_create.definitions.render import SupportsRender
 from pytest_create.definitions.render import TemplateRendered
 
@@ -76,3 +79,61 @@ def test_template_rendered_rendered_dict() -> None:
         MutableSequence[Dict[Any, Any]],
     ] = obj._rendered_dict()
     assert result == {"indent_width": 4, "name": "mock"}
+
+
+def test_template_rendered_render_is_memoized(monkeypatch: pytest.MonkeyPatch) -> None:
+    obj: MockTemplateRendered = MockTemplateRendered(name="mock")
+    first: str = obj.render()
+    monkeypatch.setattr(
+        MockTemplateRendered, "template", Template("{{ name }} re-rendered")
+    )
+    assert obj.render() is first
+
+
+def test_template_rendered_render_after_change() -> None:
+    obj: MockTemplateRendered = MockTemplateRendered(name="mock")
+    obj.render()
+    obj.name = "changed"
+    assert obj.render() == "changed"
+
+
+def test_template_rendered_render_with_different_indent() -> None:
+    obj: MockTemplateRendered = MockTemplateRendered(name="mock")
+    obj.render()
+    assert obj.render(indent="    ") == "mock"
+    assert obj._fragment is not None
+    assert obj._fragment[0][0] == "    "
+
+
+def test_template_rendered_recurse_render_does_not_mutate() -> None:
+    value: List[Any] = [MockSupportsRender()]
+    MockTemplateRendered._recurse_render(value)
+    assert isinstance(value[0], MockSupportsRender)
+
+
+def test_template_rendered_structural_key() -> None:
+    key: Any = TemplateRendered._structural_key({"a": [1, {"b": [2]}], "c": "d"})
+    assert key == (("a", (1, (("b", (2,)),))), ("c", "d"))
+
+
+def test_template_rendered_generate() -> None:
+    obj: MockTemplateRendered = MockTemplateRendered(name="mock")
+    assert "".join(obj.generate()) == "mock"
+
+
+def test_template_rendered_render_to() -> None:
+    obj: MockTemplateRendered = MockTemplateRendered(name="mock")
+    fp: io.StringIO = io.StringIO()
+    obj.render_to(fp)
+    assert fp.getvalue() == "mock"
+
+
+def test_template_rendered_recurse_render_with_stream() -> None:
+    obj: MockTemplateRendered = MockTemplateRendered(name="mock")
+    result: Any = MockTemplateRendered._recurse_render([obj], indent="  ", stream=True)
+    assert result == [StreamedFragment(definition=obj, indent="  ")]
+
+
+def test_streamed_fragment_iter() -> None:
+    obj: MockTemplateRendered = MockTemplateRendered(name="mock")
+    assert list(StreamedFragment(definition=obj)) == ["mock"]
@@ -0,0 +1,55 @@
+from dataclasses import dataclass
+from dataclasses import field
+from typing import List
+
+import pytest
+
+from pytest_create.definitions.slots import slotted
+
+
+@slotted("_cache")
+@dataclass
+class MockBase:
+    name: str
+    values: List[str] = field(default_factory=list)
+
+    def describe(self) -> str:
+        return self.name
+
+
+@slotted()
+@dataclass
+class MockChild(MockBase):
+    extra: int = 0
+
+    def describe(self) -> str:
+        return f"{super().describe()} - {self.extra}"
+
+
+def test_slotted_slots() -> None:
+    assert MockBase.__slots__ == ("name", "values", "_cache")
+    assert MockChild.__slots__ == ("extra",)
+
+
+def test_slotted_has_no_dict() -> None:
+    child: MockChild = MockChild(name="child", extra=1)
+    assert not hasattr(child, "__dict__")
+    with pytest.raises(AttributeError):
+        child.unknown = 1  # type: ignore[attr-defined]
+
+
+def test_slotted_keeps_defaults() -> None:
+    first: MockChild = MockChild(name="first")
+    second: MockChild = MockChild(name="second")
+    assert first.values == [] and first.values is not second.values
+    assert first.extra == 0
+
+
+def test_slotted_rebinds_super() -> None:
+    assert MockChild(name="child", extra=1).describe() == "child - 1"
+
+
+def test_slotted_extra_slots() -> None:
+    base: MockBase = MockBase(name="base")
+    base._cache = "cached"  # type: ignore[attr-defined]
+    assert base._cache == "cached"  # type: ignore[attr-defined]
@@ -0,0 +1,56 @@
+from pathlib import Path
+from typing import Generator
+
+import pytest
+from jinja2 import Environment
+from jinja2 import FileSystemBytecodeCache
+from jinja2 import Template
+
+import pytest_create.definitions.templates as templates
+from pytest_create.definitions.function_def import FunctionDef
+from pytest_create.definitions.templates import LazyTemplate
+from pytest_create.definitions.templates import get_environment
+from pytest_create.definitions.templates import get_template
+from pytest_create.definitions.templates import set_template_dirs
+
+
+@pytest.fixture
+def user_template_dir(tmp_path: Path) -> Generator[Path, None, None]:
+    (tmp_path / "function.jinja2").write_text("{{ indent }}def user_{{ name }}(): ...")
+    set_template_dirs([tmp_path])
+    yield tmp_path
+    set_template_dirs([])
+
+
+def test_get_environment() -> None:
+    env: Environment = get_environment()
+    assert env is get_environment()
+    assert isinstance(env.bytecode_cache, FileSystemBytecodeCache)
+    assert not env.autoescape
+
+
+def test_get_template() -> None:
+    assert isinstance(get_template("function.jinja2"), Template)
+
+
+def test_lazy_template() -> None:
+    assert FunctionDef.template is get_template("function.jinja2")
+    assert isinstance(LazyTemplate("class.jinja2").__get__(None), Template)
+
+
+def test_module_getattr() -> None:
+    assert templates.ENV is get_environment()
+    assert templates.MODULE_TEMPLATE is get_template("module.jinja2")
+
+
+def test_module_getattr_with_unknown_name() -> None:
+    with pytest.raises(AttributeError):
+        templates.UNKNOWN_TEMPLATE  # noqa: B018
+
+
+def test_set_template_dirs(user_template_dir: Path) -> None:
+    assert get_environment() is not templates._get_environment(())
+    assert FunctionDef(name="function").render() == "def user_function(): ..."
+    assert "class Class" in get_template("class.jinja2").render(
+        name="Class", indent_width=4
+    )
@@ -0,0 +1,421 @@
+import json
+import sys
+from pathlib import Path
+from typing import Dict
+from typing import Iterator
+from typing import Optional
+
+import pytest
+
+from pytest_create.builder import build_benchmark_modules
+from pytest_create.builder import build_test_modules
+from pytest_create.builder import write_modules
+from pytest_create.constants import FIXTURE_SCOPES
+from pytest_create.create import CreateOptions
+from pytest_create.create import create_tests
+from pytest_create.create import find_source_objects
+from pytest_create.definitions.function_def import FunctionDef
+from pytest_create.definitions.module_def import ModuleDef
+from pytest_create.formatting import FormatCache
+
+
+def test_write_modules(tmp_path: Path) -> None:
+    path: Path = tmp_path / "tests" / "test_module.py"
+    module_def: ModuleDef = ModuleDef(
+        name="test_module", definitions=[FunctionDef(name="test_function")]
+    )
+    write_modules({path: module_def})
+    assert path.read_text() == module_def.render()
+
+
+def test_write_modules_with_format_cache(tmp_path: Path) -> None:
+    path: Path = tmp_path / "tests" / "test_module.py"
+    module_def: ModuleDef = ModuleDef(
+        name="test_module", definitions=[FunctionDef(name="test_function")]
+    )
+    write_modules({path: module_def}, format_cache=FormatCache())
+    assert path.read_text() == "def test_function():\n    pass\n"
+
+
+class TestBuildTestModules:
+    def test_build_test_modules(
+        self, example_package_dir: Path, tmp_path: Path
+    ) -> None:
+        modules: Dict[Path, ModuleDef] = build_test_modules(
+            find_source_objects(example_package_dir), dst=tmp_path
+        )
+        assert set(modules) == {
+            tmp_path / "test_example_module.py",
+            tmp_path / "example_sub_package" / "test_example_sub_module.py",
+        }
+        source: str = modules[tmp_path / "test_example_module.py"].render()
+        assert (
+            "from tests.example_package.example_module import "
+            "ExampleClassA, example_function"
+        ) in source
+        assert "class TestExampleClassA:" in source
+        assert "assert callable(ExampleClassA().example_method)" in source
+        assert "def test_example_function() -> None:" in source
+        assert "pytest.fixture" not in source
+
+    def test_build_test_modules_skips_existing(
+        self, example_package_dir: Path, tmp_path: Path
+    ) -> None:
+        (tmp_path / "test_example_module.py").write_text("")
+        modules: Dict[Path, ModuleDef] = build_test_modules(
+            find_source_objects(example_package_dir), dst=tmp_path
+        )
+        assert tmp_path / "test_example_module.py" not in modules
+
+    def test_build_test_modules_with_source_file(
+        self, example_package_dir: Path, tmp_path: Path
+    ) -> None:
+        modules: Dict[Path, ModuleDef] = build_test_modules(
+            find_source_objects(example_package_dir / "example_module.py"), dst=tmp_path
+        )
+        assert list(modules) == [tmp_path / "test_example_module.py"]
+
+    @pytest.mark.parametrize("fixture_scope", FIXTURE_SCOPES)
+    def test_build_test_modules_with_fixtures(
+        self, example_package_dir: Path, tmp_path: Path, fixture_scope: str
+    ) -> None:
+        modules: Dict[Path, ModuleDef] = build_test_modules(
+            find_source_objects(example_package_dir),
+            dst=tmp_path,
+            fixture_scope=fixture_scope,
+        )
+        source: str = modules[tmp_path / "test_example_module.py"].render()
+        assert f'@pytest.fixture(scope="{fixture_scope}")' in source
+        assert "def example_class_a() -> ExampleClassA:" in source
+        assert (
+            "def test_example_method(self, example_class_a: ExampleClassA) -> None:"
+            in source
+        )
+        assert "assert callable(example_class_a.example_method)" in source
+        assert tmp_path / "conftest.py" not in modules
+
+    def test_build_test_modules_with_invalid_fixture_scope(
+        self, example_package_dir: Path, tmp_path: Path
+    ) -> None:
+        with pytest.raises(ValueError):
+            build_test_modules(
+                find_source_objects(example_package_dir),
+                dst=tmp_path,
+                fixture_scope="function",
+            )
+
+    def test_build_test_modules_hoists_shared_fixtures(
+        self, service_package: Path, tmp_path: Path
+    ) -> None:
+        dst: Path = tmp_path / "tests"
+        modules: Dict[Path, ModuleDef] = build_test_modules(
+            find_source_objects(service_package), dst=dst, fixture_scope="session"
+        )
+        assert set(modules) == {
+            dst / "conftest.py",
+            dst / "test_service.py",
+            dst / "sub_package" / "test_client.py",
+        }
+        conftest: str = modules[dst / "conftest.py"].render()
+        assert "import pytest" in conftest
+        assert "from service_package.service import Service" in conftest
+        assert "def service() -> Service:" in conftest
+        client: str = modules[dst / "sub_package" / "test_client.py"].render()
+        assert "def test_connect(service: Service) -> None:" in client
+        assert "pytest.fixture" not in client
+        assert "def test__stop" not in modules[dst / "test_service.py"].render()
+
+    def test_build_test_modules_with_existing_conftest(
+        self, service_package: Path, tmp_path: Path
+    ) -> None:
+        dst: Path = tmp_path / "tests"
+        dst.mkdir()
+        (dst / "conftest.py").write_text("")
+        modules: Dict[Path, ModuleDef] = build_test_modules(
+            find_source_objects(service_package), dst=dst, fixture_scope="module"
+        )
+        assert dst / "conftest.py" not in modules
+        for module_def in modules.values():
+            assert "def service() -> Service:" in module_def.render()
+
+
+class TestBuildParametrizedTestModules:
+    def test_build_test_modules_with_parametrize(
+        self, shapes_module: Path, tmp_path: Path
+    ) -> None:
+        dst: Path = tmp_path / "tests"
+        modules: Dict[Path, ModuleDef] = build_test_modules(
+            find_source_objects(shapes_module), dst=dst, parametrize=True
+        )
+        source: str = modules[dst / "test_shapes.py"].render()
+        assert source.count("@pytest.mark.parametrize(") == 3
+        assert "import pytest" in source
+        assert "def test_functions(function) -> None:" in source
+        assert "def test_classes(cls) -> None:" in source
+        assert "def test_methods(cls, name) -> None:" in source
+        assert '(Square, "rotate"),' in source
+        assert "class Test" not in source
+
+    def test_build_test_modules_with_parametrize_and_fixtures(
+        self, shapes_module: Path, tmp_path: Path
+    ) -> None:
+        dst: Path = tmp_path / "tests"
+        modules: Dict[Path, ModuleDef] = build_test_modules(
+            find_source_objects(shapes_module),
+            dst=dst,
+            fixture_scope="module",
+            parametrize=True,
+        )
+        source: str = modules[dst / "test_shapes.py"].render()
+        assert (
+            "    def test_methods(self, square: Square, name) -> None:\n"
+            '        """Tests the methods of Square."""\n'
+            "        assert callable(getattr(square, name))"
+        ) in source
+        assert "    def test_scale(self, circle: Circle) -> None:" in source
+
+    @pytest.mark.parametrize("fixture_scope", [None, *FIXTURE_SCOPES])
+    def test_create_tests_with_parametrize_runs(
+        self,
+        shapes_module: Path,
+        pytester: pytest.Pytester,
+        fixture_scope: Optional[str],
+    ) -> None:
+        dst: Path = pytester.mkdir("tests")
+        create_tests(
+            src=shapes_module,
+            dst=dst,
+            options=CreateOptions(fixture_scope=fixture_scope, parametrize=True),
+        )
+        pytester.syspathinsert(shapes_module)
+        result: pytest.RunResult = pytester.runpytest_inprocess(
+            str(dst), "-p", "no:cacheprovider"
+        )
+        result.assert_outcomes(passed=7)
+
+
+@pytest.fixture
+def vehicles_package(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    package: Path = tmp_path / "src" / "vehicles"
+    package.mkdir(parents=True)
+    (package / "__init__.py").write_text("")
+    (package / "base.py").write_text(
+        "class Vehicle:\n"
+        "    def drive(self) -> None:\n"
+        "        pass\n"
+        "\n"
+        "    def honk(self) -> None:\n"
+        "        pass\n"
+    )
+    (package / "cars.py").write_text(
+        "from vehicles.base import Vehicle\n"
+        "\n"
+        "\n"
+        "class Car(Vehicle):\n"
+        "    def honk(self) -> None:\n"
+        "        pass\n"
+        "\n"
+        "\n"
+        "class SportsCar(Car):\n"
+        "    pass\n"
+        "\n"
+        "\n"
+        "class Truck(Vehicle):\n"
+        "    def load(self) -> None:\n"
+        "        pass\n"
+    )
+    monkeypatch.syspath_prepend(str(package.parent))
+    yield package.parent
+    for name in [name for name in sys.modules if name.startswith("vehicles")]:
+        del sys.modules[name]
+
+
+class TestBuildSubclassTestModules:
+    def test_build_test_modules_with_subclasses(
+        self, vehicles_package: Path, tmp_path: Path
+    ) -> None:
+        dst: Path = tmp_path / "tests"
+        modules: Dict[Path, ModuleDef] = build_test_modules(
+            find_source_objects(vehicles_package), dst=dst, subclasses=True
+        )
+        base: str = modules[dst / "vehicles" / "test_base.py"].render()
+        assert "from vehicles.cars import Car, SportsCar, Truck" in base
+        assert "import pytest" in base
+        assert (
+            "    @pytest.mark.parametrize(\n"
+            '        "cls",\n'
+            "        [\n"
+            "            Vehicle,\n"
+            "            Car,\n"
+            "            SportsCar,\n"
+            "            Truck,\n"
+            "        ],"
+        ) in base
+        assert "    def test_drive(self, cls) -> None:" in base
+        assert "        assert callable(cls().drive)" in base
+        assert "            Truck,\n        ],\n        ids=" in base
+        cars: str = modules[dst / "vehicles" / "test_cars.py"].render()
+        assert "    def test_honk(self, cls) -> None:" in cars
+        assert "    def test_load(self) -> None:" in cars
+        assert "def test_drive" not in cars
+
+    def test_build_test_modules_with_subclasses_in_package_src(
+        self, vehicles_package: Path, tmp_path: Path
+    ) -> None:
+        dst: Path = tmp_path / "tests"
+        modules: Dict[Path, ModuleDef] = build_test_modules(
+            find_source_objects(vehicles_package / "vehicles"),
+            dst=dst,
+            subclasses=True,
+        )
+        base: str = modules[dst / "test_base.py"].render()
+        assert "from vehicles.cars import Car, SportsCar, Truck" in base
+        assert "    def test_drive(self, cls) -> None:" in base
+        assert "def test_drive" not in modules[dst / "test_cars.py"].render()
+
+    def test_build_test_modules_without_subclasses(
+        self, vehicles_package: Path, tmp_path: Path
+    ) -> None:
+        dst: Path = tmp_path / "tests"
+        modules: Dict[Path, ModuleDef] = build_test_modules(
+            find_source_objects(vehicles_package), dst=dst
+        )
+        base: str = modules[dst / "vehicles" / "test_base.py"].render()
+        assert "vehicles.cars" not in base
+        assert "    def test_drive(self) -> None:" in base
+
+    def test_build_test_modules_with_subclasses_and_parametrize(
+        self, vehicles_package: Path, tmp_path: Path
+    ) -> None:
+        dst: Path = tmp_path / "tests"
+        modules: Dict[Path, ModuleDef] = build_test_modules(
+            find_source_objects(vehicles_package),
+            dst=dst,
+            parametrize=True,
+            subclasses=True,
+        )
+        base: str = modules[dst / "vehicles" / "test_base.py"].render()
+        assert "class TestVehicle:" in base
+        assert "    def test_honk(self, cls) -> None:" in base
+        cars: str = modules[dst / "vehicles" / "test_cars.py"].render()
+        assert "class TestCar:" in cars
+        assert "def test_classes(cls) -> None:" in cars
+
+    @pytest.mark.parametrize("fixture_scope", [None, *FIXTURE_SCOPES])
+    def test_create_tests_with_subclasses_runs(
+        self,
+        vehicles_package: Path,
+        pytester: pytest.Pytester,
+        fixture_scope: Optional[str],
+    ) -> None:
+        dst: Path = pytester.mkdir("tests")
+        create_tests(
+            src=vehicles_package,
+            dst=dst,
+            options=CreateOptions(fixture_scope=fixture_scope, subclasses=True),
+        )
+        result: pytest.RunResult = pytester.runpytest_inprocess(
+            str(dst), "-p", "no:cacheprovider", "--import-mode=importlib"
+        )
+        result.assert_outcomes(passed=13)
+
+
+class TestBuildBenchmarkModules:
+    def test_build_benchmark_modules(
+        self, example_package_dir: Path, tmp_path: Path
+    ) -> None:
+        modules: Dict[Path, ModuleDef] = build_benchmark_modules(
+            find_source_objects(example_package_dir), dst=tmp_path
+        )
+        source: str = modules[tmp_path / "test_example_module.py"].render()
+        assert "import timeit" in source
+        assert "def test_example_function_benchmark(" in source
+        assert "target: Callable[[], object] = example_function" in source
+        assert "def test_example_class_a_example_method_benchmark(" in source
+        assert "= ExampleClassA().example_method" in source
+        assert 'baseline["ExampleClassA.example_method"]' in source
+
+    def test_build_benchmark_modules_with_required_arguments(
+        self, tmp_path: Path
+    ) -> None:
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "orders.py").write_text(
+            "def total(items: list) -> int:\n"
+            "    return 0\n"
+            "\n"
+            "\n"
+            "def count(*items: object, limit: int = 1) -> int:\n"
+            "    return 0\n"
+            "\n"
+            "\n"
+            "class Order:\n"
+            "    def pay(self, amount: int) -> None:\n"
+            "        pass\n"
+            "\n"
+            "    def cancel(self, reason: str = '') -> None:\n"
+            "        pass\n"
+            "\n"
+            "    @staticmethod\n"
+            "    def create() -> None:\n"
+            "        pass\n"
+            "\n"
+            "\n"
+            "class Invoice:\n"
+            "    def __init__(self, order: Order) -> None:\n"
+            "        pass\n"
+            "\n"
+            "    def send(self) -> None:\n"
+            "        pass\n"
+        )
+        modules: Dict[Path, ModuleDef] = build_benchmark_modules(
+            find_source_objects(tmp_path / "src"), dst=tmp_path / "benchmarks"
+        )
+        source: str = modules[tmp_path / "benchmarks" / "test_orders.py"].render()
+        assert "def test_count_benchmark(" in source
+        assert "def test_order_cancel_benchmark(" in source
+        assert "def test_order_create_benchmark(" in source
+        assert "total" not in source
+        assert "_pay_" not in source
+        assert "Invoice" not in source
+
+    def test_build_benchmark_modules_skips_existing(
+        self, example_package_dir: Path, tmp_path: Path
+    ) -> None:
+        (tmp_path / "test_example_module.py").write_text("")
+        modules: Dict[Path, ModuleDef] = build_benchmark_modules(
+            find_source_objects(example_package_dir), dst=tmp_path
+        )
+        assert list(modules) == [
+            tmp_path / "example_sub_package" / "test_example_sub_module.py"
+        ]
+
+    def test_create_tests_with_benchmarks_runs(
+        self, shapes_module: Path, pytester: pytest.Pytester
+    ) -> None:
+        benchmarks_dst: Path = pytester.path / "benchmarks"
+        create_tests(
+            src=shapes_module,
+            dst=pytester.mkdir("tests"),
+            options=CreateOptions(benchmarks_dst=benchmarks_dst),
+        )
+        pytester.syspathinsert(shapes_module)
+        first: pytest.RunResult = pytester.runpytest_inprocess(
+            str(benchmarks_dst), "-p", "no:cacheprovider"
+        )
+        first.assert_outcomes(skipped=5)
+        baseline: Dict[str, float] = json.loads(
+            (benchmarks_dst / "test_shapes.json").read_text()
+        )
+        assert set(baseline) == {
+            "area",
+            "perimeter",
+            "Square.scale",
+            "Square.rotate",
+            "Circle.scale",
+        }
+        baseline = {key: 1.0 for key in baseline}
+        (benchmarks_dst / "test_shapes.json").write_text(json.dumps(baseline))
+        second: pytest.RunResult = pytester.runpytest_inprocess(
+            str(benchmarks_dst), "-p", "no:cacheprovider"
+        )
+        second.assert_outcomes(passed=5)
@@ -0,0 +1,153 @@
+import sys
+from pathlib import Path
+from types import CodeType
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+
+import pytest
+
+from pytest_create.bytecode import BytecodeModule
+from pytest_create.bytecode import find_bytecode_modules
+from pytest_create.bytecode import find_init_bytecode
+from pytest_create.bytecode import get_bytecode_path
+from pytest_create.bytecode import get_source_path
+from pytest_create.bytecode import load_bytecode_module
+from pytest_create.bytecode import read_bytecode
+from pytest_create.definitions.import_def import ImportDef
+from pytest_create.signatures import get_signature
+
+
+CACHE_TAG: Optional[str] = sys.implementation.cache_tag
+
+
+@pytest.fixture
+def service_bytecode(compiled_package: Path) -> Path:
+    return (
+        compiled_package / "compiled_pkg" / "__pycache__" / f"service.{CACHE_TAG}.pyc"
+    )
+
+
+@pytest.fixture
+def service_module(service_bytecode: Path) -> BytecodeModule:
+    module: Optional[BytecodeModule] = load_bytecode_module(
+        "compiled_pkg.service", service_bytecode
+    )
+    assert module is not None
+    return module
+
+
+class TestReadBytecode:
+    def test_read_bytecode(self, service_bytecode: Path) -> None:
+        code: Optional[CodeType] = read_bytecode(service_bytecode)
+        assert code is not None
+        assert code.co_name == "<module>"
+
+    def test_read_bytecode_of_another_python(self, tmp_path: Path) -> None:
+        bytecode_file: Path = tmp_path / "other.pyc"
+        bytecode_file.write_bytes(b"\x00\x00\r\n" + bytes(12))
+        assert read_bytecode(bytecode_file) is None
+
+    def test_read_bytecode_with_empty_file(self, tmp_path: Path) -> None:
+        bytecode_file: Path = tmp_path / "empty.pyc"
+        bytecode_file.write_bytes(b"")
+        assert read_bytecode(bytecode_file) is None
+
+    def test_read_bytecode_without_file(self, tmp_path: Path) -> None:
+        assert read_bytecode(tmp_path / "missing.pyc") is None
+
+
+class TestLoadBytecodeModule:
+    def test_load_bytecode_module(
+        self, compiled_package: Path, service_module: BytecodeModule
+    ) -> None:
+        assert service_module.__file__ == str(
+            compiled_package / "compiled_pkg" / "service.py"
+        )
+        assert [obj.__name__ for obj in service_module.objects] == ["run", "Service"]
+
+    def test_load_bytecode_module_function(
+        self, service_module: BytecodeModule
+    ) -> None:
+        run: Any = getattr(service_module, "run")
+        assert run.__module__ == "compiled_pkg.service"
+        assert str(get_signature(run)) == "(value, *args, flag, **kwargs)"
+
+    def test_load_bytecode_module_class(self, service_module: BytecodeModule) -> None:
+        service: Any = getattr(service_module, "Service")
+        assert service.__module__ == "compiled_pkg.service"
+        assert {"__init__", "start", "_stop"} <= set(vars(service))
+        assert service.start.__qualname__ == "Service.start"
+        assert str(get_signature(service.start)) == "(self, timeout)"
+
+    def test_load_bytecode_module_import(self, service_module: BytecodeModule) -> None:
+        import_def: ImportDef = ImportDef(
+            module=service_module,
+            obj=getattr(service_module, "run"),
+            module_name=service_module.__name__,
+        )
+        assert import_def.render() == "from compiled_pkg.service import run"
+
+
+class TestFindBytecodeModules:
+    def test_find_bytecode_modules(self, compiled_package: Path) -> None:
+        modules: Dict[str, BytecodeModule] = {
+            module.__name__: module
+            for module in find_bytecode_modules(compiled_package)
+        }
+        assert list(modules) == [
+            "compiled_pkg",
+            "compiled_pkg.legacy",
+            "compiled_pkg.service",
+            "compiled_pkg.sub",
+            "compiled_pkg.sub.deep",
+        ]
+        assert modules["compiled_pkg"].__path__ == [
+            str(compiled_package / "compiled_pkg")
+        ]
+        assert modules["compiled_pkg.legacy"].bytecode_file == (
+            compiled_package / "compiled_pkg" / "legacy.pyc"
+        )
+
+    def test_find_bytecode_modules_with_module_filter(
+        self, compiled_package: Path
+    ) -> None:
+        modules: List[BytecodeModule] = list(
+            find_bytecode_modules(
+                compiled_package,
+                module_filter=lambda name: name != "compiled_pkg.sub",
+            )
+        )
+        assert [module.__name__ for module in modules] == [
+            "compiled_pkg",
+            "compiled_pkg.legacy",
+            "compiled_pkg.service",
+        ]
+
+    def test_find_bytecode_modules_without_bytecode(self, tmp_path: Path) -> None:
+        (tmp_path / "plain.py").write_text("")
+        modules: List[BytecodeModule] = list(find_bytecode_modules(tmp_path))
+        assert modules == []
+
+
+def test_find_init_bytecode(compiled_package: Path) -> None:
+    assert find_init_bytecode(compiled_package / "compiled_pkg") == (
+        compiled_package / "compiled_pkg" / "__pycache__" / f"__init__.{CACHE_TAG}.pyc"
+    )
+    assert find_init_bytecode(compiled_package) is None
+
+
+def test_get_source_path(tmp_path: Path) -> None:
+    assert get_source_path(tmp_path / "__pycache__" / f"module.{CACHE_TAG}.pyc") == (
+        tmp_path / "module.py"
+    )
+    assert get_source_path(tmp_path / "module.pyc") == tmp_path / "module.py"
+    assert get_source_path(tmp_path / "module.py") == tmp_path / "module.py"
+
+
+def test_get_bytecode_path(tmp_path: Path) -> None:
+    assert get_bytecode_path(tmp_path / "module.py") == (
+        tmp_path / "__pycache__" / f"module.{CACHE_TAG}.pyc"
+    )
+    assert get_bytecode_path(tmp_path / "module.pyc") == tmp_path / "module.pyc"
@@ -0,0 +1,115 @@
+import sqlite3
+from pathlib import Path
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import Tuple
+
+import pytest
+
+from pytest_create.coverage_data import CoverageData
+from pytest_create.coverage_data import get_code_lines
+from pytest_create.coverage_data import numbits_to_lines
+
+
+def lines_to_numbits(lines: Set[int]) -> bytes:
+    numbits: bytearray = bytearray(max(lines) // 8 + 1)
+    for line in lines:
+        numbits[line // 8] |= 1 << (line % 8)
+    return bytes(numbits)
+
+
+def write_coverage_file(
+    path: Path,
+    lines: Optional[Dict[Path, Set[int]]] = None,
+    arcs: Optional[Dict[Path, List[Tuple[int, int]]]] = None,
+) -> Path:
+    connection: sqlite3.Connection = sqlite3.connect(path)
+    connection.executescript(
+        "CREATE TABLE file (id INTEGER PRIMARY KEY, path TEXT);"
+        "CREATE TABLE line_bits (file_id INTEGER, context_id INTEGER, numbits BLOB);"
+        "CREATE TABLE arc (file_id INTEGER, context_id INTEGER, fromno INTEGER, "
+        "tono INTEGER);"
+    )
+    files: List[Path] = [*(lines or {}), *(arcs or {})]
+    for file_id, file_path in enumerate(files, start=1):
+        connection.execute("INSERT INTO file VALUES (?, ?)", (file_id, str(file_path)))
+        if file_path in (lines or {}):
+            connection.execute(
+                "INSERT INTO line_bits VALUES (?, 1, ?)",
+                (file_id, lines_to_numbits((lines or {})[file_path])),
+            )
+        for from_line, to_line in (arcs or {}).get(file_path, []):
+            connection.execute(
+                "INSERT INTO arc VALUES (?, 1, ?, ?)", (file_id, from_line, to_line)
+            )
+    connection.commit()
+    connection.close()
+    return path
+
+
+def partly_covered(flag: bool) -> int:
+    if flag:
+        return 1
+    return 0
+
+
+def test_numbits_to_lines() -> None:
+    assert numbits_to_lines(b"") == set()
+    assert numbits_to_lines(bytes([0b00000110, 0, 0b10000000])) == {1, 2, 23}
+    assert numbits_to_lines(lines_to_numbits({3, 17, 200})) == {3, 17, 200}
+
+
+def test_get_code_lines() -> None:
+    first: int = partly_covered.__code__.co_firstlineno
+    assert get_code_lines(partly_covered.__code__) >= {first + 1, first + 2, first + 3}
+
+
+def test_get_code_lines_with_nested_code() -> None:
+    def outer() -> int:
+        def inner() -> int:
+            return 1
+
+        return inner()
+
+    first: int = outer.__code__.co_firstlineno
+    assert get_code_lines(outer.__code__) >= {first + 1, first + 2, first + 4}
+
+
+class TestCoverageData:
+    def test_from_file_with_lines(self, tmp_path: Path) -> None:
+        path: Path = write_coverage_file(
+            tmp_path / ".coverage", lines={tmp_path / "module.py": {1, 2, 5}}
+        )
+        assert CoverageData.from_file(path).lines == {tmp_path / "module.py": {1, 2, 5}}
+
+    def test_from_file_with_arcs(self, tmp_path: Path) -> None:
+        path: Path = write_coverage_file(
+            tmp_path / ".coverage",
+            arcs={tmp_path / "module.py": [(-1, 1), (1, 2), (2, -1)]},
+        )
+        assert CoverageData.from_file(path).lines == {tmp_path / "module.py": {1, 2}}
+
+    def test_from_file_without_file(self, tmp_path: Path) -> None:
+        with pytest.raises(FileNotFoundError):
+            CoverageData.from_file(tmp_path / ".coverage")
+        assert not (tmp_path / ".coverage").exists()
+
+    def test_get_coverage(self) -> None:
+        first: int = partly_covered.__code__.co_firstlineno
+        coverage_data: CoverageData = CoverageData(
+            lines={Path(__file__).resolve(): {first, first + 1, first + 3}}
+        )
+        coverage: Optional[float] = coverage_data.get_coverage(partly_covered)
+        assert coverage is not None
+        assert 0 < coverage < 1
+
+    def test_get_coverage_without_lines(self) -> None:
+        assert CoverageData().get_coverage(partly_covered) == 0
+
+    def test_get_coverage_of_staticmethod(self) -> None:
+        assert CoverageData().get_coverage(staticmethod(partly_covered)) == 0
+
+    def test_get_coverage_without_code(self) -> None:
+        assert CoverageData().get_coverage(len) is None
@@ -1,2 +1,884 @@
+import json
+import sys
+from pathlib import Path
+from typing import Dict
+from typing import Iterator
+from typing import List
+
+import pytest
+
+import pytest_create.definitions.templates as templates
+from pytest_create.builder import build_test_modules
+from pytest_create.coverage_data import CoverageData
+from pytest_create.create import CreateOptions
+from pytest_create.create import create_tests
+from pytest_create.create import create_tests_for_roots
+from pytest_create.create import find_root_source_objects
+from pytest_create.create import find_source_objects
+from pytest_create.create import find_untested
+from pytest_create.create import get_source_names
+from pytest_create.create import get_source_symbols
+from pytest_create.create import index_symbols
+from pytest_create.create import select_uncovered
+from pytest_create.create import select_untested
+from pytest_create.definitions.module_def import ModuleDef
+from pytest_create.discovery import DiscoveryReport
+from pytest_create.discovery import ImportManager
+from pytest_create.discovery import SourceRoot
+from pytest_create.discovery import get_distribution_root
+from pytest_create.fingerprints import FingerprintIndex
+from pytest_create.import_graph import ImportGraph
+from pytest_create.object_index import ObjectIndex
+from pytest_create.rules import Rules
+from pytest_create.signatures import get_signature
+from pytest_create.source_module import SourceModule
+from pytest_create.symbol_index import Symbol
+from pytest_create.symbol_index import SymbolIndex
+from pytest_create.tested_index import TestedIndex
+
+
 def test_create_tests() -> None:
     assert True
+
+
+def test_create_tests_with_template_dirs(tmp_path: Path) -> None:
+    create_tests(
+        src=tmp_path, dst=tmp_path, options=CreateOptions(template_dirs=[tmp_path])
+    )
+    assert templates._template_dirs == (tmp_path.resolve(),)
+    create_tests(src=tmp_path, dst=tmp_path)
+    assert templates._template_dirs == ()
+
+
+def test_create_tests_with_fixtures(service_package: Path, tmp_path: Path) -> None:
+    dst: Path = tmp_path / "tests"
+    create_tests(
+        src=service_package, dst=dst, options=CreateOptions(fixture_scope="module")
+    )
+    assert (dst / "conftest.py").is_file()
+    assert (dst / "sub_package" / "__init__.py").is_file()
+    assert not (dst / "__init__.py").exists()
+
+
+@pytest.fixture
+def slow_import_package(tmp_path: Path) -> Path:
+    src: Path = tmp_path / "src"
+    src.mkdir()
+    (src / "heavy.py").write_text(
+        "import time\n"
+        "\n"
+        "time.sleep(0.2)\n"
+        "\n"
+        "\n"
+        "def compute() -> int:\n"
+        "    return 1\n"
+    )
+    (src / "light.py").write_text("def compute_light() -> int:\n    return 1\n")
+    return src
+
+
+class TestImportCostMarkers:
+    def test_find_source_objects_records_import_seconds(
+        self, slow_import_package: Path
+    ) -> None:
+        sources: Dict[str, SourceModule] = {
+            source.module.__name__: source
+            for source in find_source_objects(slow_import_package)
+        }
+        assert sources["heavy"].import_seconds >= 0.2
+        assert sources["light"].import_seconds < 0.2
+
+    def test_find_source_objects_records_only_loader_seconds(
+        self, slow_import_package: Path
+    ) -> None:
+        (slow_import_package / "broken.py").write_text(
+            "import time\n\ntime.sleep(0.2)\nraise ImportError\n"
+        )
+        (slow_import_package / "fast.py").write_text(
+            "def helper() -> None:\n    pass\n"
+        )
+        sources: Dict[str, SourceModule] = {
+            source.module.__name__: source
+            for source in find_source_objects(slow_import_package)
+        }
+        assert "broken" not in sources
+        assert sources["fast"].import_seconds < 0.2
+
+    def test_find_source_objects_with_source_file_records_import_seconds(
+        self, slow_import_package: Path
+    ) -> None:
+        sources: List[SourceModule] = find_source_objects(
+            slow_import_package / "heavy.py"
+        )
+        assert sources[0].import_seconds >= 0.2
+
+    def test_build_test_modules_with_xdist_groups_and_slow(
+        self, slow_import_package: Path, tmp_path: Path
+    ) -> None:
+        dst: Path = tmp_path / "tests"
+        modules: Dict[Path, ModuleDef] = build_test_modules(
+            find_source_objects(slow_import_package),
+            dst=dst,
+            xdist_group_seconds=0.1,
+            slow_seconds=0.15,
+        )
+        heavy: str = modules[dst / "test_heavy.py"].render()
+        assert "import pytest" in heavy
+        assert (
+            'pytestmark = [pytest.mark.xdist_group(name="heavy"), pytest.mark.slow]'
+            in heavy
+        )
+        assert "pytestmark" not in modules[dst / "test_light.py"].render()
+
+    def test_build_test_modules_with_xdist_groups_only(
+        self, slow_import_package: Path, tmp_path: Path
+    ) -> None:
+        dst: Path = tmp_path / "tests"
+        modules: Dict[Path, ModuleDef] = build_test_modules(
+            find_source_objects(slow_import_package), dst=dst, xdist_group_seconds=0.1
+        )
+        heavy: str = modules[dst / "test_heavy.py"].render()
+        assert 'pytestmark = [pytest.mark.xdist_group(name="heavy")]' in heavy
+
+    def test_create_tests_with_markers_runs(
+        self, slow_import_package: Path, pytester: pytest.Pytester
+    ) -> None:
+        dst: Path = pytester.mkdir("tests")
+        create_tests(
+            src=slow_import_package, dst=dst, options=CreateOptions(slow_seconds=0.1)
+        )
+        pytester.syspathinsert(slow_import_package)
+        pytester.makeini("[pytest]\nmarkers =\n    slow: slow tests\n")
+        result: pytest.RunResult = pytester.runpytest_inprocess(
+            str(dst), "-p", "no:cacheprovider", "-m", "not slow"
+        )
+        result.assert_outcomes(passed=1, deselected=1)
+
+
+class TestCreateTestsForRoots:
+    @pytest.fixture
+    def roots(self, tmp_path: Path) -> List[SourceRoot]:
+        roots: List[SourceRoot] = []
+        for service in ("api", "billing", "search"):
+            src: Path = tmp_path / service / "src"
+            src.mkdir(parents=True)
+            (src / f"{service}.py").write_text("def handle() -> None:\n    pass\n")
+            roots.append(SourceRoot(src=src, dst=tmp_path / service / "tests"))
+        return roots
+
+    def test_find_root_source_objects(self, roots: List[SourceRoot]) -> None:
+        manager: ImportManager = ImportManager()
+        sources: List[List[SourceModule]] = find_root_source_objects(
+            roots, import_manager=manager
+        )
+        assert [
+            [source.module.__name__ for source in root_sources]
+            for root_sources in sources
+        ] == [["api"], ["billing"], ["search"]]
+        assert len(manager.path_index) == 3
+
+    def test_find_root_source_objects_with_overlapping_roots(
+        self, roots: List[SourceRoot]
+    ) -> None:
+        sources: List[List[SourceModule]] = find_root_source_objects(
+            [roots[0], roots[0]]
+        )
+        assert sources[0][0].module is sources[1][0].module
+
+    def test_create_tests_for_roots(
+        self, roots: List[SourceRoot], tmp_path: Path
+    ) -> None:
+        create_tests_for_roots(
+            roots, options=CreateOptions(benchmarks_dst=tmp_path / "benchmarks")
+        )
+        for root in roots:
+            assert (root.dst / f"test_{root.src.parent.name}.py").is_file()
+            assert (
+                tmp_path / "benchmarks" / f"test_{root.src.parent.name}.py"
+            ).is_file()
+
+    def test_create_tests_for_roots_with_benchmark_collision(
+        self, roots: List[SourceRoot], tmp_path: Path
+    ) -> None:
+        (roots[1].src / "api.py").write_text("def handle() -> None:\n    pass\n")
+        with pytest.raises(ValueError, match="api and api"):
+            create_tests_for_roots(
+                roots[:2],
+                options=CreateOptions(
+                    benchmarks_dst=tmp_path / "benchmarks", max_workers=1
+                ),
+            )
+        assert not roots[0].dst.exists()
+
+    def test_create_tests_for_roots_with_overlapping_roots(
+        self, roots: List[SourceRoot], tmp_path: Path
+    ) -> None:
+        create_tests_for_roots(
+            [roots[0], roots[0]],
+            options=CreateOptions(benchmarks_dst=tmp_path / "benchmarks"),
+        )
+        assert (tmp_path / "benchmarks" / "test_api.py").is_file()
+
+    def test_create_tests_for_roots_with_root_sources(
+        self, roots: List[SourceRoot]
+    ) -> None:
+        create_tests_for_roots(
+            roots, root_sources=[find_source_objects(roots[0].src), []]
+        )
+        assert (roots[0].dst / f"test_{roots[0].src.parent.name}.py").is_file()
+        assert not roots[1].dst.exists()
+
+
+class TestSelectUncovered:
+    @pytest.fixture
+    def coverage_data(self, shapes_module: Path) -> CoverageData:
+        # area, Square.scale and Square.rotate are covered
+        return CoverageData(
+            lines={(shapes_module / "shapes.py").resolve(): {2, 10, 11, 13, 14}}
+        )
+
+    def test_select_uncovered(
+        self, shapes_module: Path, coverage_data: CoverageData
+    ) -> None:
+        sources: List[SourceModule] = select_uncovered(
+            find_source_objects(shapes_module), coverage_data
+        )
+        assert [obj.__name__ for obj in sources[0].objects] == ["Circle", "perimeter"]
+        assert [(cls.__name__, names) for cls, names in sources[0].methods.items()] == [
+            ("Circle", ["scale"]),
+            ("Square", []),
+        ]
+
+    def test_select_uncovered_with_everything_covered(
+        self, shapes_module: Path, coverage_data: CoverageData
+    ) -> None:
+        sources: List[SourceModule] = select_uncovered(
+            find_source_objects(shapes_module), coverage_data, threshold=0
+        )
+        assert sources == []
+
+    def test_create_tests_with_coverage_data(
+        self, shapes_module: Path, coverage_data: CoverageData, tmp_path: Path
+    ) -> None:
+        dst: Path = tmp_path / "tests"
+        create_tests(
+            src=shapes_module,
+            dst=dst,
+            options=CreateOptions(coverage_data=coverage_data),
+        )
+        source: str = (dst / "test_shapes.py").read_text()
+        assert "def test_perimeter" in source
+        assert "def test_area" not in source
+        assert "class TestCircle" in source
+        assert "Square" not in source
+
+    def test_create_tests_with_coverage_data_and_fingerprints(
+        self, shapes_module: Path, coverage_data: CoverageData, tmp_path: Path
+    ) -> None:
+        dst: Path = tmp_path / "tests"
+        fingerprints: FingerprintIndex = FingerprintIndex()
+        for _ in range(2):
+            create_tests(
+                src=shapes_module,
+                dst=dst,
+                options=CreateOptions(
+                    coverage_data=coverage_data, fingerprints=fingerprints
+                ),
+            )
+        source: str = (dst / "test_shapes.py").read_text()
+        assert "def test_perimeter" in source
+        assert "def test_area" not in source
+        assert "Square" not in source
+
+
+class TestSelectUntested:
+    @pytest.fixture
+    def tested_index(self) -> TestedIndex:
+        return TestedIndex(
+            nodeids={
+                "shapes.area": ["test_shapes.py::test_area"],
+                "shapes.Square": ["test_shapes.py::TestSquare::test_scale"],
+                "shapes.Square.scale": ["test_shapes.py::TestSquare::test_scale"],
+                "shapes.Square.rotate": ["test_shapes.py::TestSquare::test_rotate"],
+                "shapes.Circle": ["test_shapes.py::TestCircle::test_instance"],
+            }
+        )
+
+    def test_select_untested(
+        self, shapes_module: Path, tested_index: TestedIndex
+    ) -> None:
+        sources: List[SourceModule] = select_untested(
+            find_source_objects(shapes_module), tested_index
+        )
+        assert [obj.__name__ for obj in sources[0].objects] == ["Circle", "perimeter"]
+        assert sources[0].methods[sources[0].objects[0]] == ["scale"]
+
+    def test_select_untested_with_everything_tested(self, shapes_module: Path) -> None:
+        sources: List[SourceModule] = find_source_objects(shapes_module)
+        tested_index: TestedIndex = TestedIndex(
+            nodeids={name: ["test"] for name in get_source_names(sources[0])}
+        )
+        assert select_untested(sources, tested_index) == []
+
+    def test_find_untested(
+        self, shapes_module: Path, tested_index: TestedIndex
+    ) -> None:
+        assert find_untested(find_source_objects(shapes_module), tested_index) == [
+            "shapes.Circle.scale",
+            "shapes.perimeter",
+        ]
+
+    def test_create_tests_with_tested_index(
+        self, shapes_module: Path, tested_index: TestedIndex, tmp_path: Path
+    ) -> None:
+        dst: Path = tmp_path / "tests"
+        create_tests(
+            src=shapes_module, dst=dst, options=CreateOptions(tested_index=tested_index)
+        )
+        source: str = (dst / "test_shapes.py").read_text()
+        assert "def test_perimeter" in source
+        assert "def test_area" not in source
+        assert "class TestCircle" in source
+        assert "Square" not in source
+
+
+class TestFindSourceObjectsWithModules:
+    def test_find_source_objects_with_modules(self, site_packages: Path) -> None:
+        sources: List[SourceModule] = find_source_objects(
+            site_packages,
+            modules=["fake_dist", "fake_dist.core", "fake_dist.test_core"],
+        )
+        assert [source.module.__name__ for source in sources] == ["fake_dist.core"]
+
+    def test_create_tests_for_distribution_root(
+        self, site_packages: Path, tmp_path: Path
+    ) -> None:
+        dst: Path = tmp_path / "tests"
+        create_tests_for_roots([get_distribution_root("fake-dist", dst=dst)])
+        assert (dst / "fake_dist" / "test_core.py").is_file()
+        assert not (dst / "test_unrelated.py").exists()
+
+
+class TestFindSourceObjectsWithReexports:
+    def test_find_source_objects_with_reexports(self, reexport_package: Path) -> None:
+        object_index: ObjectIndex = ObjectIndex()
+        sources: List[SourceModule] = find_source_objects(
+            reexport_package, object_index=object_index
+        )
+        assert {
+            source.module.__name__: [obj.__name__ for obj in source.objects]
+            for source in sources
+        } == {"reexport_pkg.impl": ["Engine", "start"]}
+        assert sorted(object_index.objects) == [
+            "reexport_pkg.impl.Engine",
+            "reexport_pkg.impl.start",
+        ]
+        assert object_index.get_aliases("reexport_pkg.impl.Engine") == [
+            "reexport_pkg.Engine",
+            "reexport_pkg.Motor",
+        ]
+        assert object_index.get_aliases("reexport_pkg.impl.start") == [
+            "reexport_pkg.start"
+        ]
+
+    def test_find_root_source_objects_with_overlapping_roots(
+        self, reexport_package: Path, tmp_path: Path
+    ) -> None:
+        roots: List[SourceRoot] = [
+            SourceRoot(src=reexport_package, dst=tmp_path / "a"),
+            SourceRoot(src=reexport_package, dst=tmp_path / "b"),
+        ]
+        assert [
+            [source.module.__name__ for source in sources]
+            for sources in find_root_source_objects(roots)
+        ] == [["reexport_pkg.impl"], ["reexport_pkg.impl"]]
+
+    def test_create_tests_with_object_index(
+        self, reexport_package: Path, tmp_path: Path
+    ) -> None:
+        object_index: ObjectIndex = ObjectIndex()
+        create_tests(
+            src=reexport_package,
+            dst=tmp_path / "tests",
+            options=CreateOptions(object_index=object_index),
+        )
+        assert object_index.get_aliases("reexport_pkg.impl.start") == [
+            "reexport_pkg.start"
+        ]
+
+
+class TestFindSourceObjectsWithStubs:
+    def test_find_source_objects_with_stubs(self, native_package: Path) -> None:
+        sources: List[SourceModule] = find_source_objects(native_package, stub_paths=[])
+        assert {
+            source.module.__name__: [obj.__name__ for obj in source.objects]
+            for source in sources
+        } == {
+            "native_pkg.heavy": ["compute", "convert", "modern", "legacy", "Matrix"],
+            "native_pkg.plain": ["plain"],
+        }
+        assert sources[0].methods[sources[0].objects[-1]] == [
+            "transpose",
+            "identity",
+            "zeros",
+        ]
+
+    def test_find_source_objects_without_stubs(self, native_package: Path) -> None:
+        sources: List[SourceModule] = find_source_objects(native_package)
+        assert [source.module.__name__ for source in sources] == ["native_pkg.plain"]
+
+    def test_find_source_objects_with_stub_file(self, native_package: Path) -> None:
+        sources: List[SourceModule] = find_source_objects(
+            native_package / "native_pkg" / "heavy.py", stub_paths=[]
+        )
+        assert [source.module.__name__ for source in sources] == ["native_pkg.heavy"]
+
+    def test_create_tests_with_stubs(
+        self, native_package: Path, tmp_path: Path
+    ) -> None:
+        dst: Path = tmp_path / "tests"
+        create_tests(src=native_package, dst=dst, options=CreateOptions(stub_paths=[]))
+        source: str = (dst / "native_pkg" / "test_heavy.py").read_text()
+        assert "from native_pkg.heavy import Matrix, compute" in source
+        assert "def test_compute() -> None:" in source
+        assert "class TestMatrix:" in source
+        assert "def test_transpose(self) -> None:" in source
+
+
+class TestFindSourceObjectsWithBytecode:
+    def test_find_source_objects_with_bytecode(self, compiled_package: Path) -> None:
+        sources: List[SourceModule] = find_source_objects(
+            compiled_package, bytecode=True
+        )
+        assert {
+            source.module.__name__: [obj.__name__ for obj in source.objects]
+            for source in sources
+        } == {
+            "compiled_pkg.legacy": ["old"],
+            "compiled_pkg.service": ["run", "Service"],
+            "compiled_pkg.sub.deep": ["dive"],
+        }
+        assert sources[1].methods[sources[1].objects[1]] == ["start"]
+
+    def test_find_source_objects_with_bytecode_file(
+        self, compiled_package: Path
+    ) -> None:
+        sources: List[SourceModule] = find_source_objects(
+            compiled_package / "compiled_pkg" / "legacy.pyc", bytecode=True
+        )
+        assert [source.module.__name__ for source in sources] == ["compiled_pkg.legacy"]
+
+    def test_find_source_objects_with_bytecode_and_stubs(
+        self, compiled_package: Path
+    ) -> None:
+        (compiled_package / "compiled_pkg" / "legacy.pyi").write_text(
+            "def old(value: int) -> None: ...\n"
+        )
+        sources: List[SourceModule] = find_source_objects(
+            compiled_package, stub_paths=[], bytecode=True
+        )
+        assert str(get_signature(sources[0].objects[0])) == ("(value: 'int') -> 'None'")
+
+    def test_create_tests_with_bytecode(
+        self, compiled_package: Path, tmp_path: Path
+    ) -> None:
+        dst: Path = tmp_path / "tests"
+        create_tests(
+            src=compiled_package, dst=dst, options=CreateOptions(bytecode=True)
+        )
+        source: str = (dst / "compiled_pkg" / "test_service.py").read_text()
+        assert "from compiled_pkg.service import Service, run" in source
+        assert "def test_run() -> None:" in source
+        assert "def test_start(self) -> None:" in source
+
+
+class TestFindSourceObjectsWithAutoDiscovery:
+    def test_find_source_objects_with_auto_discovery(
+        self, hybrid_package: Path
+    ) -> None:
+        report: DiscoveryReport = DiscoveryReport()
+        sources: List[SourceModule] = find_source_objects(
+            hybrid_package, discovery="auto", discovery_report=report
+        )
+        assert {
+            source.module.__name__: [obj.__name__ for obj in source.objects]
+            for source in sources
+        } == {
+            "hybrid_pkg.decorated": ["handler", "register"],
+            "hybrid_pkg.lazy": ["loaded"],
+            "hybrid_pkg.plain": ["scale", "Shape"],
+        }
+        assert report.paths == {
+            "hybrid_pkg": "static",
+            "hybrid_pkg.decorated": "import",
+            "hybrid_pkg.lazy": "import",
+            "hybrid_pkg.plain": "static",
+        }
+        assert report.reasons == {
+            "hybrid_pkg.decorated": ["register decorator on handler"],
+            "hybrid_pkg.lazy": ["module __getattr__"],
+        }
+
+    def test_find_source_objects_with_auto_discovery_and_stubs(
+        self, native_package: Path
+    ) -> None:
+        report: DiscoveryReport = DiscoveryReport()
+        find_source_objects(
+            native_package,
+            stub_paths=[],
+            discovery="auto",
+            discovery_report=report,
+        )
+        assert report.paths == {
+            "native_pkg": "static",
+            "native_pkg.heavy": "stub",
+            "native_pkg.plain": "static",
+        }
+
+    def test_find_source_objects_with_auto_discovery_file(
+        self, hybrid_package: Path
+    ) -> None:
+        report: DiscoveryReport = DiscoveryReport()
+        sources: List[SourceModule] = find_source_objects(
+            hybrid_package / "hybrid_pkg" / "plain.py",
+            discovery="auto",
+            discovery_report=report,
+        )
+        assert [source.module.__name__ for source in sources] == ["hybrid_pkg.plain"]
+        assert report.paths == {"hybrid_pkg.plain": "static"}
+
+    def test_find_source_objects_with_import_discovery(self, tmp_path: Path) -> None:
+        (tmp_path / "simple.py").write_text("def simple() -> None:\n    pass\n")
+        report: DiscoveryReport = DiscoveryReport()
+        find_source_objects(tmp_path / "simple.py", discovery_report=report)
+        assert report.paths == {"simple": "import"}
+        assert report.reasons == {}
+
+    def test_find_source_objects_with_invalid_discovery(self, tmp_path: Path) -> None:
+        with pytest.raises(ValueError):
+            find_source_objects(tmp_path, discovery="static")
+
+    def test_create_tests_with_auto_discovery(
+        self, hybrid_package: Path, tmp_path: Path
+    ) -> None:
+        dst: Path = tmp_path / "tests"
+        create_tests(
+            src=hybrid_package, dst=dst, options=CreateOptions(discovery="auto")
+        )
+        source: str = (dst / "hybrid_pkg" / "test_plain.py").read_text()
+        assert "from hybrid_pkg.plain import Shape, scale" in source
+        assert "def test_unit(self) -> None:" in source
+        assert (dst / "hybrid_pkg" / "test_lazy.py").is_file()
+
+
+class TestFindSourceObjectsWithRules:
+    def test_find_source_objects_with_excluded_module(
+        self, hybrid_package: Path
+    ) -> None:
+        report: DiscoveryReport = DiscoveryReport()
+        sources: List[SourceModule] = find_source_objects(
+            hybrid_package,
+            discovery_report=report,
+            rules=Rules(exclude_modules=("hybrid_pkg.plain",)),
+        )
+        assert [source.module.__name__ for source in sources] == [
+            "hybrid_pkg.decorated",
+            "hybrid_pkg.lazy",
+        ]
+        assert "hybrid_pkg.plain" not in report.paths
+
+    @pytest.mark.parametrize("discovery", ["import", "auto"])
+    def test_find_source_objects_with_excluded_module_in_package_src(
+        self, hybrid_package: Path, discovery: str
+    ) -> None:
+        report: DiscoveryReport = DiscoveryReport()
+        sources: List[SourceModule] = find_source_objects(
+            hybrid_package / "hybrid_pkg",
+            discovery=discovery,
+            discovery_report=report,
+            rules=Rules(exclude_modules=("hybrid_pkg.plain",)),
+        )
+        assert [source.module.__name__ for source in sources] == [
+            "hybrid_pkg.decorated",
+            "hybrid_pkg.lazy",
+        ]
+        assert "hybrid_pkg.plain" not in report.paths
+
+    def test_find_source_objects_with_excluded_package(
+        self, hybrid_package: Path
+    ) -> None:
+        report: DiscoveryReport = DiscoveryReport()
+        sources: List[SourceModule] = find_source_objects(
+            hybrid_package,
+            discovery_report=report,
+            rules=Rules(exclude_modules=("hybrid_*",)),
+        )
+        assert sources == []
+        assert report.paths == {}
+
+    def test_find_source_objects_with_included_module(
+        self, hybrid_package: Path
+    ) -> None:
+        report: DiscoveryReport = DiscoveryReport()
+        sources: List[SourceModule] = find_source_objects(
+            hybrid_package,
+            discovery="auto",
+            discovery_report=report,
+            rules=Rules(include_modules=("hybrid_pkg.pl*",)),
+        )
+        assert [source.module.__name__ for source in sources] == ["hybrid_pkg.plain"]
+        assert report.paths == {"hybrid_pkg.plain": "static"}
+
+    @pytest.mark.parametrize("discovery", ["import", "auto"])
+    def test_find_source_objects_with_object_rules(
+        self, hybrid_package: Path, discovery: str
+    ) -> None:
+        sources: List[SourceModule] = find_source_objects(
+            hybrid_package / "hybrid_pkg" / "decorated.py",
+            discovery=discovery,
+            rules=Rules(exclude_decorators=("register",)),
+        )
+        assert [obj.__name__ for obj in sources[0].objects] == ["register"]
+
+    def test_find_source_objects_with_method_rules(self, hybrid_package: Path) -> None:
+        sources: List[SourceModule] = find_source_objects(
+            hybrid_package,
+            discovery="auto",
+            rules=Rules(
+                include_modules=("hybrid_pkg.plain",),
+                kinds=("class", "method"),
+                exclude_decorators=("staticmethod",),
+            ),
+        )
+        assert [obj.__name__ for obj in sources[0].objects] == ["Shape"]
+        assert list(sources[0].methods.values()) == [["area"]]
+
+    def test_find_source_objects_with_private_rules(self, tmp_path: Path) -> None:
+        (tmp_path / "private.py").write_text(
+            "def _helper() -> None:\n"
+            "    pass\n"
+            "\n"
+            "\n"
+            "def __getattr__(name):\n"
+            "    raise AttributeError(name)\n"
+        )
+        assert find_source_objects(tmp_path / "private.py") == []
+        sources: List[SourceModule] = find_source_objects(
+            tmp_path / "private.py", rules=Rules(private=True)
+        )
+        assert [obj.__name__ for obj in sources[0].objects] == ["_helper"]
+
+    def test_create_tests_with_rules(
+        self, service_package: Path, tmp_path: Path
+    ) -> None:
+        dst: Path = tmp_path / "tests"
+        create_tests(
+            src=service_package,
+            dst=dst,
+            options=CreateOptions(rules=Rules(include_names=("^connect$",))),
+        )
+        assert [
+            path.relative_to(dst).as_posix() for path in sorted(dst.rglob("test_*.py"))
+        ] == ["sub_package/test_client.py"]
+
+
+class TestSymbols:
+    def test_get_source_symbols(self, hybrid_package: Path) -> None:
+        sources: List[SourceModule] = find_source_objects(
+            hybrid_package / "hybrid_pkg" / "plain.py", discovery="auto"
+        )
+        tested_index: TestedIndex = TestedIndex(
+            nodeids={
+                "hybrid_pkg.plain.Shape.area": ["test_plain.py::TestShape::test_area"]
+            }
+        )
+        symbols: List[Symbol] = get_source_symbols(sources[0], tested_index)
+        assert [
+            (symbol.qualname, symbol.kind, symbol.line, symbol.tested)
+            for symbol in symbols
+        ] == [
+            ("scale", "function", 6, False),
+            ("Shape", "class", 11, False),
+            ("Shape.unit", "method", 13, False),
+            ("Shape.area", "method", 16, True),
+        ]
+        assert {symbol.file for symbol in symbols} == {
+            str(hybrid_package / "hybrid_pkg" / "plain.py")
+        }
+        assert len({symbol.signature_hash for symbol in symbols}) == 4
+
+    def test_index_symbols(self, hybrid_package: Path, tmp_path: Path) -> None:
+        sources: List[SourceModule] = find_source_objects(
+            hybrid_package, discovery="auto"
+        )
+        with SymbolIndex(tmp_path / "symbols.db") as symbol_index:
+            assert index_symbols(sources, symbol_index) == [
+                "hybrid_pkg.decorated",
+                "hybrid_pkg.lazy",
+                "hybrid_pkg.plain",
+            ]
+            assert index_symbols(sources, symbol_index) == []
+            assert [
+                symbol.name
+                for symbol in symbol_index.query(package="hybrid_pkg", kind="function")
+            ] == [
+                "hybrid_pkg.decorated.handler",
+                "hybrid_pkg.decorated.register",
+                "hybrid_pkg.lazy.loaded",
+                "hybrid_pkg.plain.scale",
+            ]
+
+
+@pytest.fixture
+def counted_package(tmp_path: Path) -> Iterator[Path]:
+    """A package that is not on sys.path and logs each module it executes."""
+    package: Path = tmp_path / "counted_pkg"
+    package.mkdir()
+    log: str = (
+        "import pathlib\n"
+        "\n"
+        "with (pathlib.Path(__file__).parents[1] / 'log').open('a') as f:\n"
+        "    f.write(__name__ + '\\n')\n"
+    )
+    (package / "__init__.py").write_text(log)
+    (package / "base.py").write_text(log + "\n\ndef base() -> None:\n    pass\n")
+    (package / "alpha.py").write_text(
+        "from counted_pkg import base\n"
+        + log
+        + "\n\ndef alpha() -> None:\n    base.base()\n"
+    )
+    (package / "beta.py").write_text(
+        "from .base import base\n" + log + "\n\ndef beta() -> None:\n    base()\n"
+    )
+    yield tmp_path
+    for name in [name for name in sys.modules if name.startswith("counted_pkg")]:
+        del sys.modules[name]
+
+
+class TestFindSourceObjectsWithImportGraph:
+    def test_find_source_objects_with_import_graph(self, counted_package: Path) -> None:
+        import_graph: ImportGraph = ImportGraph()
+        sources: List[SourceModule] = find_source_objects(
+            counted_package, import_graph=import_graph
+        )
+        assert [source.module.__name__ for source in sources] == [
+            "counted_pkg.base",
+            "counted_pkg.alpha",
+            "counted_pkg.beta",
+        ]
+        assert (counted_package / "log").read_text().split() == [
+            "counted_pkg",
+            "counted_pkg.base",
+            "counted_pkg.alpha",
+            "counted_pkg.beta",
+        ]
+        assert import_graph.find_hubs(limit=1) == [("counted_pkg.base", 2, 0)]
+
+    def test_find_source_objects_without_import_graph(
+        self, counted_package: Path
+    ) -> None:
+        assert [
+            source.module.__name__ for source in find_source_objects(counted_package)
+        ] == ["counted_pkg.base"]
+
+    def test_find_root_source_objects_with_import_graph(
+        self, counted_package: Path, tmp_path: Path
+    ) -> None:
+        import_graph: ImportGraph = ImportGraph()
+        find_root_source_objects(
+            [SourceRoot(src=counted_package, dst=tmp_path / "tests")],
+            import_manager=ImportManager(),
+            import_graph=import_graph,
+        )
+        assert sorted(import_graph.imports) == [
+            "counted_pkg",
+            "counted_pkg.alpha",
+            "counted_pkg.base",
+            "counted_pkg.beta",
+        ]
+        assert (counted_package / "log").read_text().count("counted_pkg.base") == 1
+
+    def test_find_root_source_objects_with_shared_dependency(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        log: str = (
+            "import pathlib\n"
+            "import time\n"
+            "\n"
+            "with (pathlib.Path(__file__).parents[1] / 'log').open('a') as f:\n"
+            "    f.write(__name__ + '\\n')\n"
+            "time.sleep(0.2)\n"
+        )
+        for name in ("shared_dep", "app_a", "app_b"):
+            (tmp_path / name).mkdir()
+        (tmp_path / "shared_dep" / "__init__.py").write_text(log)
+        (tmp_path / "shared_dep" / "core.py").write_text(
+            log + "\n\ndef core() -> None:\n    pass\n"
+        )
+        for name in ("app_a", "app_b"):
+            (tmp_path / name / "__init__.py").write_text("")
+            (tmp_path / name / "app.py").write_text(
+                "from shared_dep.core import core\n"
+                "\n"
+                "\n"
+                "def run() -> None:\n"
+                "    core()\n"
+            )
+        monkeypatch.syspath_prepend(str(tmp_path))
+        try:
+            sources: List[List[SourceModule]] = find_root_source_objects(
+                [
+                    SourceRoot(src=tmp_path / name, dst=tmp_path / "tests" / name)
+                    for name in ("shared_dep", "app_a", "app_b")
+                ],
+                import_graph=ImportGraph(),
+                max_workers=3,
+            )
+            assert [
+                [obj.__name__ for source in root_sources for obj in source.objects]
+                for root_sources in sources
+            ] == [["core"], ["run"], ["run"]]
+            assert (tmp_path / "log").read_text().split().count("shared_dep.core") == 1
+        finally:
+            for name in [
+                name
+                for name in sys.modules
+                if name.split(".")[0] in ("shared_dep", "app_a", "app_b")
+            ]:
+                del sys.modules[name]
+
+    def test_find_source_objects_with_import_graph_in_package(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        package: Path = tmp_path / "src" / "shadow_pkg"
+        package.mkdir(parents=True)
+        (package / "__init__.py").write_text("")
+        (package / "json.py").write_text(
+            "def dumps(obj: object) -> str:\n    return 'shadowed'\n"
+        )
+        (package / "api.py").write_text(
+            "from shadow_pkg import json\n"
+            "\n"
+            "\n"
+            "def render() -> str:\n"
+            "    return json.dumps([1])\n"
+        )
+        monkeypatch.syspath_prepend(str(tmp_path / "src"))
+        import_graph: ImportGraph = ImportGraph()
+        try:
+            sources: List[SourceModule] = find_source_objects(
+                package, import_graph=import_graph
+            )
+            assert [source.module.__name__ for source in sources] == [
+                "shadow_pkg.json",
+                "shadow_pkg.api",
+            ]
+            assert import_graph.imports == {
+                "shadow_pkg.api": ["shadow_pkg.json"],
+                "shadow_pkg.json": [],
+            }
+            assert json.dumps([1]) == "[1]"
+            assert sources[1].objects[0]() == "shadowed"
+        finally:
+            for name in [name for name in sys.modules if name.startswith("shadow_pkg")]:
+                del sys.modules[name]
@@ -0,0 +1,200 @@
+import os
+import pkgutil
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from importlib.abc import PathEntryFinder
+from pathlib import Path
+from types import ModuleType
+from typing import List
+from typing import Optional
+
+import pytest
+
+from pytest_create.discovery import DiscoveryReport
+from pytest_create.discovery import ImportManager
+from pytest_create.discovery import SourceRoot
+from pytest_create.discovery import expand_roots
+from pytest_create.discovery import find_package_name
+from pytest_create.discovery import get_distribution_modules
+from pytest_create.discovery import get_distribution_root
+from pytest_create.discovery import metadata
+
+
+@pytest.fixture
+def services(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    for service in ("api", "billing"):
+        src: Path = tmp_path / "services" / service / "src"
+        src.mkdir(parents=True)
+        (src / f"{service}.py").write_text("def handle() -> None:\n    pass\n")
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+class TestDiscoveryReport:
+    def test_discovery_report(self) -> None:
+        report: DiscoveryReport = DiscoveryReport()
+        report.record("pkg.plain", "static")
+        report.record("pkg.lazy", "import")
+        report.record("pkg.fast", "stub")
+        report.record("pkg.core", "static")
+        report.add_reasons("pkg.lazy", ["module __getattr__"])
+        assert report.get_modules("static") == ["pkg.core", "pkg.plain"]
+        assert report.get_modules("bytecode") == []
+        assert report.count_paths() == {"static": 2, "import": 1, "stub": 1}
+        assert report.reasons == {"pkg.lazy": ["module __getattr__"]}
+
+
+class TestImportManager:
+    def test_load_from_name(self, example_package_dir: Path) -> None:
+        finder: Optional[PathEntryFinder] = pkgutil.get_importer(
+            str(example_package_dir)
+        )
+        assert finder is not None
+        manager: ImportManager = ImportManager()
+        module: Optional[ModuleType] = manager.load_from_name("example_module", finder)
+        assert module is not None
+        assert manager.load_from_name("example_module", finder) is module
+        assert manager.path_index == {example_package_dir / "example_module.py": module}
+
+    def test_load_from_file_through_symlink(
+        self, example_package_dir: Path, tmp_path: Path
+    ) -> None:
+        finder: Optional[PathEntryFinder] = pkgutil.get_importer(
+            str(example_package_dir)
+        )
+        assert finder is not None
+        (tmp_path / "link").symlink_to(example_package_dir, target_is_directory=True)
+        manager: ImportManager = ImportManager()
+        module: Optional[ModuleType] = manager.load_from_name("example_module", finder)
+        assert module is not None
+        assert manager.load_from_file(tmp_path / "link" / "example_module.py") is module
+        assert manager.load_from_file(
+            tmp_path / "link" / "example_module.py", name="other_module"
+        ) not in (None, module)
+
+    def test_load_from_name_with_missing_module(self, tmp_path: Path) -> None:
+        finder: Optional[PathEntryFinder] = pkgutil.get_importer(str(tmp_path))
+        assert finder is not None
+        manager: ImportManager = ImportManager()
+        assert manager.load_from_name("missing_module", finder) is None
+        assert manager.path_index == {}
+
+    def test_import_from_name(self, tmp_path: Path) -> None:
+        (tmp_path / "managed_module.py").write_text("")
+        finder: Optional[PathEntryFinder] = pkgutil.get_importer(str(tmp_path))
+        assert finder is not None
+        manager: ImportManager = ImportManager()
+        try:
+            module: Optional[ModuleType] = manager.import_from_name(
+                "managed_module", finder
+            )
+            assert module is not None
+            assert sys.modules["managed_module"] is module
+            assert manager.import_from_name("managed_module", finder) is module
+            assert manager.path_index == {tmp_path / "managed_module.py": module}
+        finally:
+            sys.modules.pop("managed_module", None)
+
+    def test_load_from_file(self, example_package_dir: Path) -> None:
+        manager: ImportManager = ImportManager()
+        path: Path = example_package_dir / "example_module.py"
+        module: Optional[ModuleType] = manager.load_from_file(path)
+        assert module is not None
+        assert manager.load_from_file(path) is module
+
+    def test_load_from_file_concurrently(self, tmp_path: Path) -> None:
+        (tmp_path / "counted.py").write_text(
+            "import os\n"
+            "\n"
+            "with open(os.path.join(os.path.dirname(__file__), 'count'), 'a') as f:\n"
+            "    f.write('.')\n"
+        )
+        manager: ImportManager = ImportManager()
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            modules: List[Optional[ModuleType]] = list(
+                executor.map(manager.load_from_file, [tmp_path / "counted.py"] * 16)
+            )
+        assert len({id(module) for module in modules}) == 1
+        assert (tmp_path / "count").read_text() == "."
+
+
+def test_find_package_name(tmp_path: Path) -> None:
+    (tmp_path / "src" / "shapes" / "solids").mkdir(parents=True)
+    (tmp_path / "src" / "shapes" / "__init__.py").write_text("")
+    (tmp_path / "src" / "shapes" / "solids" / "__init__.py").write_text("")
+    assert find_package_name(tmp_path / "src" / "shapes" / "solids") == (
+        "shapes.solids"
+    )
+    assert find_package_name(tmp_path / "src") == ""
+
+
+class TestExpandRoots:
+    def test_expand_roots_with_path(self, services: Path) -> None:
+        roots: List[SourceRoot] = expand_roots(
+            ["services/api/src"], dst=services / "tests"
+        )
+        assert roots == [
+            SourceRoot(
+                src=services / "services" / "api" / "src", dst=services / "tests"
+            )
+        ]
+
+    def test_expand_roots_with_glob(self, services: Path) -> None:
+        roots: List[SourceRoot] = expand_roots(
+            ["services/*/src"], dst=services / "tests"
+        )
+        assert roots == [
+            SourceRoot(
+                src=services / "services" / service / "src",
+                dst=services / "tests" / service,
+            )
+            for service in ("api", "billing")
+        ]
+
+    def test_expand_roots_with_glob_and_dst(self, services: Path) -> None:
+        roots: List[SourceRoot] = expand_roots(
+            [f"services{os.sep}*{os.sep}src=services/*/tests/unit_tests"],
+            dst=services / "tests",
+        )
+        assert [root.dst for root in roots] == [
+            services / "services" / service / "tests" / "unit_tests"
+            for service in ("api", "billing")
+        ]
+
+    def test_expand_roots_without_matches(self, services: Path) -> None:
+        assert expand_roots(["packages/*/src"], dst=services / "tests") == []
+
+
+class TestGetDistributionRoot:
+    def test_get_distribution_root(self, site_packages: Path, tmp_path: Path) -> None:
+        root: SourceRoot = get_distribution_root("fake-dist", dst=tmp_path / "tests")
+        assert root == SourceRoot(
+            src=site_packages.resolve(),
+            dst=tmp_path / "tests",
+            modules=("fake_dist", "fake_dist.core", "fake_dist.test_core"),
+        )
+
+    def test_get_distribution_root_without_distribution(self, tmp_path: Path) -> None:
+        with pytest.raises(metadata.PackageNotFoundError):
+            get_distribution_root("missing-fake-dist", dst=tmp_path)
+
+    def test_get_distribution_modules_without_record(self, site_packages: Path) -> None:
+        (site_packages / "fake_dist-1.0.dist-info" / "RECORD").unlink()
+        assert get_distribution_modules(metadata.distribution("fake-dist")) == []
+
+    def test_get_distribution_modules_with_extensions_and_stubs(
+        self, site_packages: Path
+    ) -> None:
+        record: Path = site_packages / "fake_dist-1.0.dist-info" / "RECORD"
+        record.write_text(
+            record.read_text()
+            + "fake_dist/_speedups.cpython-311-x86_64-linux-gnu.so,,\n"
+            + "fake_dist/_speedups.pyi,,\n"
+            + "fake_dist/core.pyi,,\n"
+        )
+        assert get_distribution_modules(metadata.distribution("fake-dist")) == [
+            "fake_dist",
+            "fake_dist._speedups",
+            "fake_dist.core",
+            "fake_dist.test_core",
+        ]
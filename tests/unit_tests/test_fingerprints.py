@@ -0,0 +1,168 @@
+import ast
+from pathlib import Path
+from typing import Any
+from typing import Dict
+
+import pytest
+
+from pytest_create.fingerprints import FingerprintIndex
+from pytest_create.fingerprints import ObjectFingerprint
+from pytest_create.fingerprints import find_imported_names
+from pytest_create.fingerprints import find_test_definitions
+from pytest_create.fingerprints import get_fingerprint
+from pytest_create.fingerprints import hash_definition
+from pytest_create.fingerprints import patch_source
+
+
+def define(source: str) -> Dict[str, Any]:
+    namespace: Dict[str, Any] = {}
+    exec(source, namespace)  # noqa: S102
+    return namespace
+
+
+class TestFingerprintIndex:
+    def test_write(self, tmp_path: Path) -> None:
+        index: FingerprintIndex = FingerprintIndex()
+        index.set("shop.cart.total", ObjectFingerprint("a", "test_total", "b"))
+        index.write(tmp_path / "fingerprints" / "fingerprints.json")
+        assert FingerprintIndex.from_file(
+            tmp_path / "fingerprints" / "fingerprints.json"
+        ).get("shop.cart.total") == ObjectFingerprint("a", "test_total", "b")
+
+    @pytest.mark.parametrize("text", [None, "{", '{"shop.cart.total": {"a": 1}}'])
+    def test_from_file_without_fingerprints(self, tmp_path: Path, text: str) -> None:
+        if text is not None:
+            (tmp_path / "fingerprints.json").write_text(text)
+        assert FingerprintIndex.from_file(tmp_path / "fingerprints.json").objects == {}
+
+
+class TestGetFingerprint:
+    def test_get_fingerprint_ignores_body(self) -> None:
+        assert get_fingerprint(
+            define("def total(items: list) -> int:\n    return 0\n")["total"]
+        ) == get_fingerprint(
+            define("def total(items: list) -> int:\n    return len(items)\n")["total"]
+        )
+
+    @pytest.mark.parametrize(
+        "changed",
+        [
+            "def total(items: tuple) -> int:\n    return 0\n",
+            "def total(items: list) -> int:\n    '''Totals the items.'''\n",
+        ],
+    )
+    def test_get_fingerprint_with_changes(self, changed: str) -> None:
+        assert get_fingerprint(
+            define("def total(items: list) -> int:\n    return 0\n")["total"]
+        ) != get_fingerprint(define(changed)["total"])
+
+    def test_get_fingerprint_of_class(self) -> None:
+        cart: type = define(
+            "class Cart:\n    def add(self, item: int) -> None:\n        pass\n"
+        )["Cart"]
+        changed: type = define(
+            "class Cart:\n    def add(self, item: str) -> None:\n        pass\n"
+        )["Cart"]
+        assert get_fingerprint(cart) == get_fingerprint(changed)
+        assert get_fingerprint(cart, ["add"]) != get_fingerprint(changed, ["add"])
+
+
+def test_hash_definition() -> None:
+    assert hash_definition(ast.parse("def test_a() -> None:\n    pass\n")) == (
+        hash_definition(ast.parse("def test_a()->None:\n\n    pass  # stub\n"))
+    )
+    assert hash_definition(ast.parse("def test_a() -> None:\n    pass\n")) != (
+        hash_definition(ast.parse("def test_a() -> None:\n    assert True\n"))
+    )
+
+
+def test_find_test_definitions() -> None:
+    assert list(
+        find_test_definitions(
+            "import pytest\n\n\nclass TestCart:\n    pass\n\n\n"
+            "async def test_total():\n    pass\n"
+        )
+    ) == ["TestCart", "test_total"]
+
+
+def test_find_imported_names() -> None:
+    assert find_imported_names(
+        "import os.path\nimport pytest as pt\nfrom shop.cart import Cart, total\n"
+    ) == {"os", "pt", "Cart", "total"}
+
+
+class TestPatchSource:
+    source: str = (
+        "import pytest\n"
+        "from shop.cart import total\n"
+        "\n"
+        "\n"
+        "@pytest.mark.slow\n"
+        "def test_total() -> None:\n"
+        "    assert callable(total)\n"
+        "\n"
+        "\n"
+        "# The checkout tests.\n"
+        "def test_checkout() -> None:\n"
+        "    pass\n"
+    )
+
+    def test_patch_source_replaces_definition(self) -> None:
+        assert patch_source(
+            self.source,
+            {"test_total": "def test_total() -> None:\n    assert total([]) == 0\n"},
+        ) == (
+            "import pytest\n"
+            "from shop.cart import total\n"
+            "\n"
+            "\n"
+            "def test_total() -> None:\n"
+            "    assert total([]) == 0\n"
+            "\n"
+            "\n"
+            "# The checkout tests.\n"
+            "def test_checkout() -> None:\n"
+            "    pass\n"
+        )
+
+    def test_patch_source_appends_definition(self) -> None:
+        assert patch_source(
+            self.source,
+            {"test_clear": "def test_clear() -> None:\n    assert callable(clear)\n"},
+            imports=["from shop.cart import clear"],
+        ) == (
+            "import pytest\n"
+            "from shop.cart import total\n"
+            "from shop.cart import clear\n"
+            "\n"
+            "\n"
+            "@pytest.mark.slow\n"
+            "def test_total() -> None:\n"
+            "    assert callable(total)\n"
+            "\n"
+            "\n"
+            "# The checkout tests.\n"
+            "def test_checkout() -> None:\n"
+            "    pass\n"
+            "\n"
+            "\n"
+            "def test_clear() -> None:\n"
+            "    assert callable(clear)\n"
+        )
+
+    def test_patch_source_with_docstring_and_no_imports(self) -> None:
+        source: str = patch_source(
+            '"""Tests for the cart module."""\n\n\ndef test_total() -> None:\n'
+            "    pass\n",
+            {"test_clear": "def test_clear() -> None:\n    assert callable(clear)\n"},
+            imports=["from shop.cart import clear"],
+        )
+        assert source.startswith(
+            '"""Tests for the cart module."""\nfrom shop.cart import clear\n'
+        )
+        assert ast.get_docstring(ast.parse(source)) == "Tests for the cart module."
+
+    def test_patch_source_replaces_last_definition(self) -> None:
+        assert patch_source(
+            self.source, {"test_checkout": "def test_checkout() -> None:\n    ...\n"}
+        ).endswith("# The checkout tests.\ndef test_checkout() -> None:\n    ...\n")
@@ -0,0 +1,114 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import List
+
+import pytest
+
+import pytest_create.formatting
+from pytest_create.formatting import FormatCache
+from pytest_create.formatting import format_source
+from pytest_create.formatting import format_sources
+from pytest_create.formatting import get_format_settings
+from pytest_create.formatting import get_version
+
+
+UNFORMATTED: str = "import sys\nimport os\ndef f( x ):\n  return x\n"
+FORMATTED: str = "import os\nimport sys\n\n\ndef f(x):\n    return x\n"
+
+
+@pytest.fixture
+def configured_project(tmp_path: Path) -> Path:
+    """A project whose pyproject.toml configures isort and black."""
+    (tmp_path / "pyproject.toml").write_text(
+        "[tool.isort]\n"
+        "force_single_line = true\n"
+        "\n"
+        "[tool.black]\n"
+        "skip-string-normalization = true\n"
+    )
+    return tmp_path
+
+
+class TestFormatCache:
+    def test_format_cache_key(self) -> None:
+        cache: FormatCache = FormatCache()
+        assert cache.key("a") == cache.key("a")
+        assert cache.key("a") != cache.key("b")
+        assert cache.key("a") != FormatCache(line_length=79).key("a")
+
+    def test_format_cache_key_with_settings(self, configured_project: Path) -> None:
+        cache: FormatCache = FormatCache()
+        assert cache.key("a", get_format_settings(configured_project)) != cache.key(
+            "a", get_format_settings(None)
+        )
+
+    def test_format_cache_get_missing(self, tmp_path: Path) -> None:
+        assert FormatCache(directory=tmp_path).get("missing") is None
+
+    def test_format_cache_set_and_get(self, tmp_path: Path) -> None:
+        FormatCache(directory=tmp_path).set("key", "formatted")
+        cache: FormatCache = FormatCache(directory=tmp_path)
+        assert cache.get("key") == "formatted"
+        assert cache.formatted == {"key": "formatted"}
+
+
+def test_get_version() -> None:
+    assert get_version("black") is not None
+    assert get_version("not-an-installed-distribution") is None
+
+
+def test_import_does_not_import_formatters() -> None:
+    result: subprocess.CompletedProcess = subprocess.run(  # noqa: S603
+        [
+            sys.executable,
+            "-c",
+            "import sys, pytest_create.formatting; "
+            "print('black' in sys.modules, 'isort' in sys.modules)",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+    )
+    assert result.stdout.split() == ["False", "False"]
+
+
+def test_format_source() -> None:
+    assert format_source(UNFORMATTED) == FORMATTED
+
+
+class TestFormatSources:
+    def test_format_sources(self) -> None:
+        assert format_sources([UNFORMATTED, FORMATTED]) == [FORMATTED, FORMATTED]
+
+    def test_format_sources_with_process_pool(self) -> None:
+        sources: List[str] = [UNFORMATTED, UNFORMATTED.replace("f(", "g(")]
+        formatted: List[str] = format_sources(sources, batch_size=1, max_workers=2)
+        assert formatted == [FORMATTED, FORMATTED.replace("f(", "g(")]
+
+    def test_format_sources_uses_cache(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        cache: FormatCache = FormatCache()
+        format_sources([UNFORMATTED], cache=cache)
+        monkeypatch.setattr(
+            pytest_create.formatting, "format_source", pytest.fail, raising=True
+        )
+        assert format_sources([UNFORMATTED, UNFORMATTED], cache=cache) == [
+            FORMATTED,
+            FORMATTED,
+        ]
+
+    def test_format_sources_with_invalid_source(self) -> None:
+        cache: FormatCache = FormatCache()
+        assert format_sources(["def f(:\n"], cache=cache) == ["def f(:\n"]
+        assert cache.formatted == {}
+
+    def test_format_sources_with_project_settings(
+        self, configured_project: Path
+    ) -> None:
+        source: str = "from os import (path, sep)\nx = 'x'\n"
+        assert format_sources([source]) == ['from os import path, sep\n\nx = "x"\n']
+        assert format_sources(
+            [source], paths=[configured_project / "tests" / "test_x.py"]
+        ) == ["from os import path\nfrom os import sep\n\nx = 'x'\n"]
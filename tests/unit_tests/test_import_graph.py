@@ -0,0 +1,95 @@
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from pytest_create.import_graph import ImportGraph
+
+
+@pytest.fixture
+def shop_src(tmp_path: Path) -> Path:
+    """A source root whose modules import each other."""
+    (tmp_path / "shop").mkdir()
+    (tmp_path / "shop" / "__init__.py").write_text("from shop import money\n")
+    (tmp_path / "shop" / "money.py").write_text("import decimal\n")
+    (tmp_path / "shop" / "cart.py").write_text(
+        "from . import money\nfrom .orders.order import Order\n"
+    )
+    (tmp_path / "shop" / "orders").mkdir()
+    (tmp_path / "shop" / "orders" / "__init__.py").write_text("")
+    (tmp_path / "shop" / "orders" / "order.py").write_text(
+        "import shop.money\n\n\ndef pay():\n    from shop import cart\n"
+    )
+    (tmp_path / "tools.py").write_text(
+        "try:\n    from shop.cart import checkout\nexcept ImportError:\n    pass\n"
+    )
+    return tmp_path
+
+
+class TestImportGraph:
+    def test_from_path(self, shop_src: Path) -> None:
+        assert ImportGraph.from_path(shop_src).imports == {
+            "shop": ["shop.money"],
+            "shop.cart": ["shop", "shop.money", "shop.orders.order"],
+            "shop.money": [],
+            "shop.orders": [],
+            "shop.orders.order": ["shop.money"],
+            "tools": ["shop.cart"],
+        }
+
+    def test_from_path_with_module_filter(self, shop_src: Path) -> None:
+        assert sorted(
+            ImportGraph.from_path(
+                shop_src, module_filter=lambda name: not name.startswith("shop.orders")
+            ).imports
+        ) == ["shop", "shop.cart", "shop.money", "tools"]
+
+    def test_from_path_with_invalid_source(self, tmp_path: Path) -> None:
+        (tmp_path / "broken.py").write_text("import (\n")
+        assert ImportGraph.from_path(tmp_path).imports == {"broken": []}
+
+    def test_topological_order(self, shop_src: Path) -> None:
+        order: List[str] = ImportGraph.from_path(shop_src).topological_order()
+        assert sorted(order) == sorted(ImportGraph.from_path(shop_src).imports)
+        for module, dependency in [
+            ("shop.cart", "shop"),
+            ("shop.cart", "shop.orders.order"),
+            ("shop.orders.order", "shop.orders"),
+            ("tools", "shop.cart"),
+        ]:
+            assert order.index(dependency) < order.index(module)
+
+    def test_topological_order_puts_packages_first(self, shop_src: Path) -> None:
+        order: List[str] = ImportGraph.from_path(shop_src).topological_order()
+        assert order.index("shop") < order.index("shop.money")
+        assert order.index("shop.orders") < order.index("shop.orders.order")
+
+    def test_topological_order_with_cycle(self) -> None:
+        assert ImportGraph(
+            imports={"a": ["b"], "b": ["c"], "c": ["a"]}
+        ).topological_order() == ["c", "b", "a"]
+
+    def test_fan_in_and_fan_out(self, shop_src: Path) -> None:
+        graph: ImportGraph = ImportGraph.from_path(shop_src)
+        assert (graph.fan_in("shop.money"), graph.fan_out("shop.money")) == (3, 0)
+        assert (graph.fan_in("tools"), graph.fan_out("tools")) == (0, 1)
+        assert graph.fan_out("missing") == 0
+
+    def test_count_fan_ins(self, shop_src: Path) -> None:
+        graph: ImportGraph = ImportGraph.from_path(shop_src)
+        fan_ins = graph.count_fan_ins()
+        assert {name: fan_ins[name] for name in graph.imports} == {
+            name: graph.fan_in(name) for name in graph.imports
+        }
+
+    def test_find_hubs(self, shop_src: Path) -> None:
+        assert ImportGraph.from_path(shop_src).find_hubs(limit=3) == [
+            ("shop.money", 3, 0),
+            ("shop.cart", 1, 3),
+            ("shop", 1, 1),
+        ]
+
+    def test_update(self) -> None:
+        graph: ImportGraph = ImportGraph(imports={"a": []})
+        graph.update(ImportGraph(imports={"b": ["a"]}))
+        assert graph.imports == {"a": [], "b": ["a"]}
@@ -1,16 +1,22 @@
 """Test cases for the __main__ module."""
+from pathlib import Path
+from typing import Iterator
 
 import pytest
 from click.testing import CliRunner
 from click.testing import Result
 
 from pytest_create.__main__ import main
+from pytest_create.symbol_index import Symbol
+from pytest_create.symbol_index import SymbolIndex
 
 
 @pytest.fixture
-def runner() -> CliRunner:
-    """Fixture for invoking command-line interfaces."""
-    return CliRunner()
+def runner(tmp_path: Path) -> Iterator[CliRunner]:
+    """Fixture for invoking command-line interfaces in an empty directory."""
+    cli_runner: CliRunner = CliRunner()
+    with cli_runner.isolated_filesystem(temp_dir=tmp_path):
+        yield cli_runner
 
 
 def test_main_with_defaults(runner: CliRunner) -> None:
@@ -46,3 +52,41 @@ def test_main_with_custom_src_and_dir(runner: CliRunner) -> None:
 def test_main_with_fake_src_and_dst(runner: CliRunner) -> None:
     result: Result = runner.invoke(main, args=["foo", "foo"])
     assert result.exit_code == 0
+
+
+def test_main_with_create(runner: CliRunner) -> None:
+    result: Result = runner.invoke(main, args=["create", "."])
+    assert result.exit_code == 0
+
+
+def test_main_index_query(runner: CliRunner, tmp_path: Path) -> None:
+    with SymbolIndex(tmp_path / "symbols.db") as symbol_index:
+        symbol_index.update(
+            "shop.cart",
+            [
+                Symbol("shop.cart", "total", "function", "cart.py", 1),
+                Symbol("shop.cart", "Cart", "class", "cart.py", 5, tested=True),
+            ],
+        )
+    result: Result = runner.invoke(
+        main,
+        args=["index", "query", f"--db={tmp_path / 'symbols.db'}", "--untested"],
+    )
+    assert result.exit_code == 0
+    assert result.output == "shop.cart.total function cart.py:1\n"
+
+
+def test_main_index_query_without_index(runner: CliRunner) -> None:
+    result: Result = runner.invoke(main, args=["index", "query"])
+    assert result.exit_code == 1
+    assert "No symbol index found" in result.output
+
+
+def test_main_graph(runner: CliRunner) -> None:
+    Path("shop").mkdir()
+    Path("shop", "__init__.py").write_text("from . import money\n")
+    Path("shop", "money.py").write_text("")
+    Path("shop", "cart.py").write_text("from shop.money import Money\n")
+    result: Result = runner.invoke(main, args=["graph", "--limit=2"])
+    assert result.exit_code == 0
+    assert result.output == "shop.money 2 0\nshop 0 1\n"
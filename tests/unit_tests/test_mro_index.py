@@ -0,0 +1,61 @@
+from typing import List
+
+from pytest_create.mro_index import MroIndex
+from pytest_create.mro_index import get_owner
+
+
+class Vehicle:
+    def drive(self) -> None:
+        pass
+
+    def honk(self) -> None:
+        pass
+
+
+class Car(Vehicle):
+    def honk(self) -> None:
+        pass
+
+
+class SportsCar(Car):
+    pass
+
+
+class Truck(Vehicle):
+    pass
+
+
+CLASSES: List[type] = [Vehicle, Car, SportsCar, Truck]
+
+
+def test_get_owner() -> None:
+    assert get_owner(SportsCar, "drive") is Vehicle
+    assert get_owner(SportsCar, "honk") is Car
+    assert get_owner(Truck, "load") is None
+
+
+class TestMroIndex:
+    def test_from_classes(self) -> None:
+        index: MroIndex = MroIndex.from_classes(CLASSES)
+        assert index.get_subclasses(Vehicle) == [Car, SportsCar, Truck]
+        assert index.get_subclasses(Car) == [SportsCar]
+        assert index.get_subclasses(Truck) == []
+
+    def test_from_classes_without_bases(self) -> None:
+        index: MroIndex = MroIndex.from_classes([SportsCar, Truck])
+        assert index.subclasses == {}
+
+    def test_get_inheritors(self) -> None:
+        index: MroIndex = MroIndex.from_classes(CLASSES)
+        assert index.get_inheritors(Vehicle, "drive") == [Car, SportsCar, Truck]
+        assert index.get_inheritors(Vehicle, "honk") == [Truck]
+        assert index.get_inheritors(Car, "honk") == [SportsCar]
+
+    def test_get_inheritors_of_copies(self) -> None:
+        copy: type = type(
+            "Vehicle",
+            (),
+            {"__module__": Vehicle.__module__, "drive": Vehicle.drive},
+        )
+        index: MroIndex = MroIndex.from_classes([copy, Truck])
+        assert index.get_inheritors(copy, "drive") == [Truck]
@@ -0,0 +1,52 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+from pytest_create.object_index import ObjectIndex
+from pytest_create.tested_index import TestedIndex
+
+
+class TestObjectIndex:
+    def test_add_definition(self) -> None:
+        index: ObjectIndex = ObjectIndex()
+        assert index.add("pytest_create.tested_index", "TestedIndex", TestedIndex)
+        assert index.objects == {"pytest_create.tested_index.TestedIndex": TestedIndex}
+        assert "pytest_create.tested_index.TestedIndex" in index
+        assert len(index) == 1
+
+    def test_add_alias(self) -> None:
+        index: ObjectIndex = ObjectIndex()
+        assert not index.add("pytest_create", "TestedIndex", TestedIndex)
+        assert not index.add("pytest_create.plugin", "Index", TestedIndex)
+        assert not index.add("pytest_create", "TestedIndex", TestedIndex)
+        assert index.add("pytest_create.tested_index", "TestedIndex", TestedIndex)
+        assert index.get_aliases("pytest_create.tested_index.TestedIndex") == [
+            "pytest_create.TestedIndex",
+            "pytest_create.plugin.Index",
+        ]
+        assert len(index) == 1
+
+    def test_add_alias_only(self) -> None:
+        index: ObjectIndex = ObjectIndex()
+        index.add("pytest_create", "TestedIndex", TestedIndex)
+        assert "pytest_create.tested_index.TestedIndex" in index
+        assert len(index) == 0
+
+    def test_add_without_qualified_name(self) -> None:
+        index: ObjectIndex = ObjectIndex()
+        assert not index.add("pytest_create", "VERSION", "1.0")
+        assert len(index) == 0
+        assert index.aliases == {}
+
+    def test_add_from_threads(self) -> None:
+        index: ObjectIndex = ObjectIndex()
+        module_names: List[str] = [f"module_{number}" for number in range(50)]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(
+                executor.map(
+                    lambda module_name: index.add(module_name, "Index", TestedIndex),
+                    module_names,
+                )
+            )
+        assert sorted(index.get_aliases("pytest_create.tested_index.TestedIndex")) == (
+            sorted(f"{module_name}.Index" for module_name in module_names)
+        )
@@ -1,12 +1,58 @@
+import os
+import subprocess
+import sys
 from pathlib import Path
+from typing import List
 from typing import Optional
 
 import pytest
 
+from pytest_create.coverage_data import CoverageData
+from pytest_create.fingerprints import FINGERPRINTS_DIRECTORY
+from pytest_create.fingerprints import FINGERPRINTS_FILE_NAME
+from pytest_create.formatting import FormatCache
+from pytest_create.plugin import _get_benchmarks_dst
+from pytest_create.plugin import _get_coverage_data
 from pytest_create.plugin import _get_default_dst
 from pytest_create.plugin import _get_default_src
+from pytest_create.plugin import _get_fingerprints_path
+from pytest_create.plugin import _get_format_cache
+from pytest_create.plugin import _get_index_path
+from pytest_create.plugin import _get_rules
+from pytest_create.plugin import _get_stub_paths
 from pytest_create.plugin import _get_tests_dir
 from pytest_create.plugin import is_in_tests_dir
+from pytest_create.rules import Rules
+from pytest_create.symbol_index import DEFAULT_INDEX_PATH
+from pytest_create.symbol_index import SymbolIndex
+from tests.unit_tests.test_coverage_data import write_coverage_file
+
+
+def test_import_does_not_import_create() -> None:
+    result: subprocess.CompletedProcess = subprocess.run(  # noqa: S603
+        [
+            sys.executable,
+            "-c",
+            "import sys, pytest_create.plugin; "
+            "print('pytest_create.create' in sys.modules, "
+            "'pytest_create.discovery' in sys.modules)",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+    )
+    assert result.stdout.split() == ["False", "False"]
+
+
+def test_slow_marker(pytester: pytest.Pytester) -> None:
+    pytester.makepyfile(
+        "import pytest\n\n\n@pytest.mark.slow\ndef test_slow() -> None:\n    pass\n"
+    )
+    result: pytest.RunResult = pytester.runpytest_inprocess(
+        "-p", "pytest_create.plugin", "-p", "no:cacheprovider", "--strict-markers"
+    )
+    result.assert_outcomes(passed=1)
 
 
 class TestGetDefaultSrc:
@@ -55,6 +101,528 @@ class TestGetDefaultDst:
         assert default_dst == config.rootpath
 
 
+class TestGetFormatCache:
+    def test__get_format_cache_without_option(self, pytester: pytest.Pytester) -> None:
+        config: pytest.Config = pytester.parseconfigure("-p", "pytest_create.plugin")
+        assert _get_format_cache(config=config) is None
+
+    def test__get_format_cache_with_option(self, pytester: pytest.Pytester) -> None:
+        config: pytest.Config = pytester.parseconfigure(
+            "-p", "pytest_create.plugin", "--create-format"
+        )
+        format_cache: Optional[FormatCache] = _get_format_cache(config=config)
+        assert format_cache is not None
+        assert format_cache.directory is not None
+        assert format_cache.directory.name == "pytest-create-format"
+
+    def test__get_format_cache_without_cacheprovider(
+        self, pytester: pytest.Pytester
+    ) -> None:
+        config: pytest.Config = pytester.parseconfigure(
+            "-p", "pytest_create.plugin", "-p", "no:cacheprovider", "--create-format"
+        )
+        format_cache: Optional[FormatCache] = _get_format_cache(config=config)
+        assert format_cache is not None
+        assert format_cache.directory is None
+
+
+class TestCreateFixtures:
+    def test_create_fixtures(
+        self, pytester: pytest.Pytester, example_package_dir: Path
+    ) -> None:
+        dst: Path = pytester.mkdir("created_tests")
+        pytester.runpytest_inprocess(
+            "-p",
+            "pytest_create.plugin",
+            f"--create={example_package_dir}",
+            "--create-fixtures=session",
+            str(dst),
+        )
+        source: str = (dst / "test_example_module.py").read_text()
+        assert '@pytest.fixture(scope="session")' in source
+
+    def test_create_root(self, pytester: pytest.Pytester, tmp_path: Path) -> None:
+        for service in ("api", "billing"):
+            src: Path = tmp_path / "services" / service / "src"
+            src.mkdir(parents=True)
+            (src / f"{service}.py").write_text("def handle() -> None:\n    pass\n")
+        pytester.runpytest_inprocess(
+            "-p",
+            "pytest_create.plugin",
+            f"--create-root={tmp_path}/services/*/src={tmp_path}/services/*/tests",
+            str(pytester.path),
+        )
+        assert (tmp_path / "services" / "api" / "tests" / "test_api.py").is_file()
+        assert (
+            tmp_path / "services" / "billing" / "tests" / "test_billing.py"
+        ).is_file()
+        assert not list(pytester.path.glob("test_*.py"))
+
+    def test_create_dist(self, pytester: pytest.Pytester, site_packages: Path) -> None:
+        dst: Path = pytester.mkdir("created_tests")
+        pytester.runpytest_inprocess(
+            "-p", "pytest_create.plugin", "--create-dist=fake-dist", str(dst)
+        )
+        assert (dst / "fake_dist" / "test_core.py").is_file()
+        assert not (dst / "test_unrelated.py").exists()
+
+    def test_create_dist_without_distribution(self, pytester: pytest.Pytester) -> None:
+        result: pytest.RunResult = pytester.runpytest_inprocess(
+            "-p", "pytest_create.plugin", "--create-dist=missing-fake-dist"
+        )
+        result.stderr.fnmatch_lines(["*missing-fake-dist is not installed*"])
+
+    def test_create_stubs(
+        self, pytester: pytest.Pytester, native_package: Path
+    ) -> None:
+        dst: Path = pytester.mkdir("created_tests")
+        pytester.runpytest_inprocess(
+            "-p",
+            "pytest_create.plugin",
+            f"--create={native_package}",
+            "--create-stubs",
+            str(dst),
+        )
+        assert (dst / "native_pkg" / "test_heavy.py").is_file()
+        assert (dst / "native_pkg" / "test_plain.py").is_file()
+
+    def test_create_bytecode(
+        self, pytester: pytest.Pytester, compiled_package: Path
+    ) -> None:
+        dst: Path = pytester.mkdir("created_tests")
+        pytester.runpytest_inprocess(
+            "-p",
+            "pytest_create.plugin",
+            f"--create={compiled_package}",
+            "--create-bytecode",
+            str(dst),
+        )
+        assert (dst / "compiled_pkg" / "test_service.py").is_file()
+        assert (dst / "compiled_pkg" / "sub" / "test_deep.py").is_file()
+
+    def test_create_discovery_auto(
+        self, pytester: pytest.Pytester, hybrid_package: Path
+    ) -> None:
+        dst: Path = pytester.mkdir("created_tests")
+        result: pytest.RunResult = pytester.runpytest_inprocess(
+            "-p",
+            "pytest_create.plugin",
+            f"--create={hybrid_package}",
+            "--create-discovery=auto",
+            str(dst),
+        )
+        result.stdout.fnmatch_lines(
+            [
+                "*discovery paths*",
+                "hybrid_pkg.lazy - import (module __getattr__)",
+                "hybrid_pkg.plain - static",
+                "2 import, 2 static",
+            ]
+        )
+        assert (dst / "hybrid_pkg" / "test_plain.py").is_file()
+
+    def test_create_discovery_import(
+        self, pytester: pytest.Pytester, hybrid_package: Path
+    ) -> None:
+        (hybrid_package / "hybrid_pkg" / "plain.py").unlink()
+        result: pytest.RunResult = pytester.runpytest_inprocess(
+            "-p", "pytest_create.plugin", f"--create={hybrid_package}"
+        )
+        assert "discovery paths" not in result.stdout.str()
+
+    def test_create_import_graph(
+        self, pytester: pytest.Pytester, reexport_package: Path
+    ) -> None:
+        dst: Path = pytester.mkdir("created_tests")
+        result: pytest.RunResult = pytester.runpytest_inprocess(
+            "-p",
+            "pytest_create.plugin",
+            f"--create={reexport_package}",
+            "--create-import-graph=1",
+            str(dst),
+        )
+        result.stdout.fnmatch_lines(
+            [
+                "*import hubs*",
+                "reexport_pkg.impl - fan-in 1, fan-out 0",
+                "2 modules",
+            ]
+        )
+        assert "reexport_pkg - fan-in" not in result.stdout.str()
+        assert (dst / "reexport_pkg" / "test_impl.py").is_file()
+
+    def test_create_subclasses(self, pytester: pytest.Pytester) -> None:
+        src: Path = pytester.mkdir("src")
+        (src / "vehicles.py").write_text(
+            "class Vehicle:\n"
+            "    def drive(self) -> None:\n"
+            "        pass\n"
+            "\n"
+            "\n"
+            "class Truck(Vehicle):\n"
+            "    pass\n"
+        )
+        dst: Path = pytester.mkdir("created_tests")
+        pytester.runpytest_inprocess(
+            "-p",
+            "pytest_create.plugin",
+            f"--create={src}",
+            "--create-subclasses",
+            str(dst),
+        )
+        source: str = (dst / "test_vehicles.py").read_text()
+        assert "def test_drive(self, cls) -> None:" in source
+        assert "            Truck,\n" in source
+
+    def test_create_with_rules(self, pytester: pytest.Pytester) -> None:
+        src: Path = pytester.mkdir("src")
+        (src / "shop").mkdir()
+        (src / "shop" / "__init__.py").write_text("")
+        (src / "shop" / "cart.py").write_text(
+            "def total() -> int:\n"
+            "    return 0\n"
+            "\n"
+            "\n"
+            "def _round() -> int:\n"
+            "    return 0\n"
+        )
+        (src / "shop" / "legacy").mkdir()
+        (src / "shop" / "legacy" / "__init__.py").write_text(
+            "raise RuntimeError('legacy was imported')\n"
+        )
+        pytester.makeini("[pytest]\ncreate_exclude =\n    shop.legacy\n")
+        dst: Path = pytester.mkdir("created_tests")
+        pytester.runpytest_inprocess(
+            "-p",
+            "pytest_create.plugin",
+            f"--create={src}",
+            "--create-private",
+            str(dst),
+        )
+        source: str = (dst / "shop" / "test_cart.py").read_text()
+        assert "def test_total() -> None:" in source
+        assert "def test__round() -> None:" in source
+        assert not (dst / "shop" / "legacy").exists()
+
+    def test_create_update(self, pytester: pytest.Pytester) -> None:
+        src: Path = pytester.mkdir("src")
+        (src / "pricing.py").write_text("def price() -> int:\n    return 1\n")
+        dst: Path = pytester.mkdir("created_tests")
+        args: List[str] = [
+            "-p",
+            "pytest_create.plugin",
+            "-p",
+            "cacheprovider",
+            f"--create={src}",
+            "--create-update",
+            str(dst),
+        ]
+        pytester.runpytest_inprocess(*args)
+        (src / "pricing.py").write_text(
+            "def price() -> int:\n"
+            "    return 1\n"
+            "\n"
+            "\n"
+            "def discount() -> int:\n"
+            "    return 0\n"
+        )
+        pytester.runpytest_inprocess(*args)
+        source: str = (dst / "test_pricing.py").read_text()
+        assert "def test_price() -> None:" in source
+        assert "def test_discount() -> None:" in source
+
+    def test_create_fixtures_with_invalid_scope(
+        self, pytester: pytest.Pytester
+    ) -> None:
+        with pytest.raises(pytest.UsageError):
+            pytester.parseconfigure(
+                "-p", "pytest_create.plugin", "--create-fixtures=function"
+            )
+
+
+class TestTestedIndex:
+    @pytest.fixture
+    def geometry_src(self, pytester: pytest.Pytester) -> Path:
+        src: Path = pytester.mkdir("src")
+        (src / "geometry.py").write_text(
+            "def area() -> int:\n"
+            "    return 1\n"
+            "\n"
+            "\n"
+            "def volume() -> int:\n"
+            "    return 1\n"
+        )
+        pytester.syspathinsert(src)
+        tests: Path = pytester.mkdir("tests")
+        (tests / "test_area.py").write_text(
+            "from geometry import area\n\n\ndef test_area() -> None:\n    pass\n"
+        )
+        return src
+
+    def test_create_skips_tested_objects(
+        self, pytester: pytest.Pytester, geometry_src: Path
+    ) -> None:
+        pytester.runpytest_inprocess(
+            "-p",
+            "pytest_create.plugin",
+            f"--create={geometry_src}",
+            str(pytester.path / "tests"),
+        )
+        source: str = (pytester.path / "tests" / "test_geometry.py").read_text()
+        assert "def test_volume" in source
+        assert "def test_area" not in source
+
+    def test_create_untested(
+        self, pytester: pytest.Pytester, geometry_src: Path
+    ) -> None:
+        result: pytest.RunResult = pytester.runpytest_inprocess(
+            "-p",
+            "pytest_create.plugin",
+            f"--create={geometry_src}",
+            "--create-untested",
+            str(pytester.path / "tests"),
+        )
+        result.stdout.fnmatch_lines(
+            ["*untested objects*", "geometry.volume", "1 untested objects"]
+        )
+        assert "geometry.area" not in result.stdout.str()
+
+    def test_create_untested_without_create(
+        self, pytester: pytest.Pytester, geometry_src: Path
+    ) -> None:
+        result: pytest.RunResult = pytester.runpytest_inprocess(
+            "-p",
+            "pytest_create.plugin",
+            "--create-untested",
+            str(pytester.path / "tests"),
+        )
+        result.assert_outcomes(passed=1)
+        assert not (pytester.path / "tests" / "test_geometry.py").exists()
+
+    def test_create_index(
+        self, pytester: pytest.Pytester, geometry_src: Path, tmp_path: Path
+    ) -> None:
+        pytester.runpytest_inprocess(
+            "-p",
+            "pytest_create.plugin",
+            f"--create={geometry_src}",
+            f"--create-index={tmp_path / 'symbols.db'}",
+            str(pytester.path / "tests"),
+        )
+        with SymbolIndex(tmp_path / "symbols.db") as symbol_index:
+            assert [
+                (symbol.name, symbol.line, symbol.tested)
+                for symbol in symbol_index.query(package="geometry")
+            ] == [("geometry.area", 1, True), ("geometry.volume", 5, False)]
+
+    def test_create_untested_and_index_with_package_src(
+        self, pytester: pytest.Pytester, tmp_path: Path
+    ) -> None:
+        package: Path = pytester.mkdir("src") / "geo_pkg"
+        package.mkdir()
+        (package / "__init__.py").write_text("")
+        (package / "geometry.py").write_text(
+            "def area() -> int:\n"
+            "    return 1\n"
+            "\n"
+            "\n"
+            "def volume() -> int:\n"
+            "    return 1\n"
+        )
+        pytester.syspathinsert(package.parent)
+        tests: Path = pytester.mkdir("tests")
+        (tests / "test_area.py").write_text(
+            "from geo_pkg.geometry import area\n\n\ndef test_area() -> None:\n"
+            "    pass\n"
+        )
+        result: pytest.RunResult = pytester.runpytest_inprocess(
+            "-p",
+            "pytest_create.plugin",
+            f"--create={package}",
+            "--create-untested",
+            f"--create-index={tmp_path / 'symbols.db'}",
+            str(tests),
+        )
+        result.stdout.fnmatch_lines(
+            ["*untested objects*", "geo_pkg.geometry.volume", "1 untested objects"]
+        )
+        assert "def test_area" not in (tests / "test_geometry.py").read_text()
+        with SymbolIndex(tmp_path / "symbols.db") as symbol_index:
+            assert [
+                (symbol.name, symbol.tested)
+                for symbol in symbol_index.query(package="geo_pkg")
+            ] == [("geo_pkg.geometry.area", True), ("geo_pkg.geometry.volume", False)]
+
+
+class TestGetBenchmarksDst:
+    def test__get_benchmarks_dst_without_option(
+        self, pytester: pytest.Pytester, tmp_path: Path
+    ) -> None:
+        config: pytest.Config = pytester.parseconfigure("-p", "pytest_create.plugin")
+        assert _get_benchmarks_dst(config=config, dst=tmp_path / "tests") is None
+
+    def test__get_benchmarks_dst_with_option(
+        self, pytester: pytest.Pytester, tmp_path: Path
+    ) -> None:
+        config: pytest.Config = pytester.parseconfigure(
+            "-p", "pytest_create.plugin", "--create-benchmarks"
+        )
+        benchmarks_dst: Optional[Path] = _get_benchmarks_dst(
+            config=config, dst=tmp_path / "tests" / "unit_tests"
+        )
+        assert benchmarks_dst == tmp_path / "tests" / "benchmarks"
+
+    def test__get_benchmarks_dst_with_directory(
+        self, pytester: pytest.Pytester, tmp_path: Path
+    ) -> None:
+        config: pytest.Config = pytester.parseconfigure(
+            "-p", "pytest_create.plugin", f"--create-benchmarks={tmp_path / 'perf'}"
+        )
+        benchmarks_dst: Optional[Path] = _get_benchmarks_dst(
+            config=config, dst=tmp_path / "tests"
+        )
+        assert benchmarks_dst == tmp_path / "perf"
+
+
+class TestGetCoverageData:
+    def test__get_coverage_data_without_option(self, pytester: pytest.Pytester) -> None:
+        config: pytest.Config = pytester.parseconfigure("-p", "pytest_create.plugin")
+        assert _get_coverage_data(config=config) is None
+
+    def test__get_coverage_data_with_coverage_file(
+        self, pytester: pytest.Pytester
+    ) -> None:
+        coverage_file: Path = write_coverage_file(
+            pytester.path / "coverage.db", lines={pytester.path / "module.py": {1}}
+        )
+        config: pytest.Config = pytester.parseconfigure(
+            "-p",
+            "pytest_create.plugin",
+            "--create-uncovered-only",
+            f"--create-coverage-file={coverage_file}",
+        )
+        coverage_data: Optional[CoverageData] = _get_coverage_data(config=config)
+        assert coverage_data is not None
+        assert coverage_data.lines == {(pytester.path / "module.py").resolve(): {1}}
+
+    def test__get_coverage_data_without_coverage_file(
+        self, pytester: pytest.Pytester
+    ) -> None:
+        config: pytest.Config = pytester.parseconfigure(
+            "-p", "pytest_create.plugin", "--create-uncovered-only=0.8"
+        )
+        with pytest.raises(pytest.UsageError):
+            _get_coverage_data(config=config)
+
+
+class TestGetIndexPath:
+    def test__get_index_path_without_option(self, pytester: pytest.Pytester) -> None:
+        config: pytest.Config = pytester.parseconfigure("-p", "pytest_create.plugin")
+        assert _get_index_path(config=config) is None
+
+    def test__get_index_path_with_option(self, pytester: pytest.Pytester) -> None:
+        config: pytest.Config = pytester.parseconfigure(
+            "-p", "pytest_create.plugin", "--create-index"
+        )
+        assert _get_index_path(config=config) == pytester.path / DEFAULT_INDEX_PATH
+
+    def test__get_index_path_with_path(
+        self, pytester: pytest.Pytester, tmp_path: Path
+    ) -> None:
+        config: pytest.Config = pytester.parseconfigure(
+            "-p", "pytest_create.plugin", f"--create-index={tmp_path / 'symbols.db'}"
+        )
+        assert _get_index_path(config=config) == (tmp_path / "symbols.db").resolve()
+
+
+class TestGetFingerprintsPath:
+    def test__get_fingerprints_path_without_option(
+        self, pytester: pytest.Pytester
+    ) -> None:
+        config: pytest.Config = pytester.parseconfigure("-p", "pytest_create.plugin")
+        assert _get_fingerprints_path(config=config) is None
+
+    def test__get_fingerprints_path_with_option(
+        self, pytester: pytest.Pytester
+    ) -> None:
+        config: pytest.Config = pytester.parseconfigure(
+            "-p", "pytest_create.plugin", "--create-update"
+        )
+        path: Optional[Path] = _get_fingerprints_path(config=config)
+        assert path is not None
+        assert path.parts[-2:] == (FINGERPRINTS_DIRECTORY, FINGERPRINTS_FILE_NAME)
+
+    def test__get_fingerprints_path_with_parametrize(
+        self, pytester: pytest.Pytester
+    ) -> None:
+        config: pytest.Config = pytester.parseconfigure(
+            "-p", "pytest_create.plugin", "--create-update", "--create-parametrize"
+        )
+        with pytest.raises(pytest.UsageError):
+            _get_fingerprints_path(config=config)
+
+
+class TestGetStubPaths:
+    def test__get_stub_paths_without_option(self, pytester: pytest.Pytester) -> None:
+        config: pytest.Config = pytester.parseconfigure("-p", "pytest_create.plugin")
+        assert _get_stub_paths(config=config) is None
+
+    def test__get_stub_paths_with_stubs(self, pytester: pytest.Pytester) -> None:
+        config: pytest.Config = pytester.parseconfigure(
+            "-p", "pytest_create.plugin", "--create-stubs"
+        )
+        assert _get_stub_paths(config=config) == []
+
+    def test__get_stub_paths_with_stub_path(
+        self, pytester: pytest.Pytester, tmp_path: Path
+    ) -> None:
+        config: pytest.Config = pytester.parseconfigure(
+            "-p", "pytest_create.plugin", f"--create-stub-path={tmp_path}"
+        )
+        assert _get_stub_paths(config=config) == [tmp_path.resolve()]
+
+
+class TestGetRules:
+    def test__get_rules_without_options(self, pytester: pytest.Pytester) -> None:
+        config: pytest.Config = pytester.parseconfigure("-p", "pytest_create.plugin")
+        assert _get_rules(config=config) == Rules()
+
+    def test__get_rules_with_ini_and_options(self, pytester: pytest.Pytester) -> None:
+        pytester.makeini(
+            "[pytest]\n"
+            "create_exclude =\n"
+            "    shop.legacy\n"
+            "create_exclude_decorators = property\n"
+            "create_kinds =\n"
+            "    function\n"
+            "    class\n"
+        )
+        config: pytest.Config = pytester.parseconfigure(
+            "-p",
+            "pytest_create.plugin",
+            "--create-exclude=shop.vendor",
+            "--create-include-name=^Cart",
+            "--create-kind=method",
+        )
+        assert _get_rules(config=config) == Rules(
+            exclude_modules=("shop.legacy", "shop.vendor"),
+            include_names=("^Cart",),
+            exclude_decorators=("property",),
+            kinds=("method",),
+        )
+
+    @pytest.mark.parametrize(
+        "ini", ["create_kinds = module\n", "create_exclude_names = Cart(\n"]
+    )
+    def test__get_rules_with_invalid_rules(
+        self, pytester: pytest.Pytester, ini: str
+    ) -> None:
+        pytester.makeini(f"[pytest]\n{ini}")
+        config: pytest.Config = pytester.parseconfigure("-p", "pytest_create.plugin")
+        with pytest.raises(pytest.UsageError):
+            _get_rules(config=config)
+
+
 class TestGetTestsDir:
     def test__get_tests_dir_with_rootpath_in_tests(self, config: pytest.Config) -> None:
         tests_dir: Optional[Path] = _get_tests_dir(config=config)
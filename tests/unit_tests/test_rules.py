@@ -0,0 +1,107 @@
+import re
+from typing import Tuple
+
+import pytest
+
+from pytest_create.rules import CompiledRules
+from pytest_create.rules import Rules
+from pytest_create.rules import compile_rules
+
+
+class TestRules:
+    def test_rules_with_invalid_kinds(self) -> None:
+        with pytest.raises(ValueError):
+            Rules(kinds=("function", "module"))
+
+
+class TestCompiledRules:
+    @pytest.mark.parametrize(
+        "rules, module_name, expected",
+        [
+            (Rules(), "shop.cart", True),
+            (Rules(exclude_modules=("shop.legacy",)), "shop.legacy", False),
+            (Rules(exclude_modules=("shop.legacy",)), "shop.legacy.orders", False),
+            (Rules(exclude_modules=("shop.legacy",)), "shop.legacyish", True),
+            (Rules(exclude_modules=("*.vendor",)), "shop.vendor.lib", False),
+            (Rules(include_modules=("shop.api.*",)), "shop", True),
+            (Rules(include_modules=("shop.api.*",)), "shop.api", True),
+            (Rules(include_modules=("shop.api.*",)), "shop.api.orders", True),
+            (Rules(include_modules=("shop.api.*",)), "shop.admin", False),
+            (Rules(include_modules=("shop.api.*",)), "other", False),
+            (Rules(include_modules=("*.api",)), "shop.admin", True),
+        ],
+    )
+    def test_may_contain(self, rules: Rules, module_name: str, expected: bool) -> None:
+        assert CompiledRules(rules).may_contain(module_name) is expected
+
+    @pytest.mark.parametrize(
+        "rules, module_name, expected",
+        [
+            (Rules(), "shop.cart", True),
+            (Rules(include_modules=("shop.api.*",)), "shop", False),
+            (Rules(include_modules=("shop.api.*",)), "shop.api.orders", True),
+            (
+                Rules(include_modules=("shop.*",), exclude_modules=("shop.legacy",)),
+                "shop.legacy.orders",
+                False,
+            ),
+        ],
+    )
+    def test_includes_module(
+        self, rules: Rules, module_name: str, expected: bool
+    ) -> None:
+        assert CompiledRules(rules).includes_module(module_name) is expected
+
+    @pytest.mark.parametrize(
+        "rules, qualname, kind, decorators, expected",
+        [
+            (Rules(), "Cart.total", "method", (), True),
+            (Rules(), "_helper", "function", (), False),
+            (Rules(private=True), "_helper", "function", (), True),
+            (Rules(private=True), "Cart.__init__", "method", (), False),
+            (Rules(kinds=("class",)), "checkout", "function", (), False),
+            (Rules(include_names=(r"^Cart\b",)), "Cart.total", "method", (), True),
+            (Rules(include_names=(r"^Cart\b",)), "CartItem", "class", (), False),
+            (Rules(exclude_names=(r"\.total$",)), "Cart.total", "method", (), False),
+            (
+                Rules(exclude_decorators=("property",)),
+                "Cart.size",
+                "method",
+                ("property",),
+                False,
+            ),
+            (
+                Rules(exclude_decorators=("property",)),
+                "Cart.clear",
+                "method",
+                ("lru_cache",),
+                True,
+            ),
+        ],
+    )
+    def test_includes_object(
+        self,
+        rules: Rules,
+        qualname: str,
+        kind: str,
+        decorators: Tuple[str, ...],
+        expected: bool,
+    ) -> None:
+        assert (
+            CompiledRules(rules).includes_object(qualname, kind, decorators) is expected
+        )
+
+    def test_needs_decorators(self) -> None:
+        assert not CompiledRules(Rules()).needs_decorators
+        assert CompiledRules(Rules(exclude_decorators=("property",))).needs_decorators
+
+    def test_compiled_rules_with_invalid_regex(self) -> None:
+        with pytest.raises(re.error):
+            CompiledRules(Rules(include_names=("Cart(",)))
+
+
+def test_compile_rules() -> None:
+    rules: Rules = Rules(exclude_modules=("shop.legacy",))
+    assert compile_rules(rules) is compile_rules(
+        Rules(exclude_modules=("shop.legacy",))
+    )
@@ -0,0 +1,194 @@
+import ast
+import functools
+import gc
+import inspect
+import sys
+import weakref
+from typing import Any
+from typing import Dict
+from typing import List
+
+import pytest
+
+from pytest_create.definitions.function_def import SELF_PARAMETER
+from pytest_create.signatures import PREFIXED_SIGNATURES_MAXSIZE
+from pytest_create.signatures import SourceExpression
+from pytest_create.signatures import _cached_prefix_parameter
+from pytest_create.signatures import clear_signature_cache
+from pytest_create.signatures import get_signature
+from pytest_create.signatures import signature_from_ast
+from pytest_create.signatures import signature_from_code
+from pytest_create.signatures import signature_from_function
+from pytest_create.signatures import signature_from_text
+from pytest_create.signatures import with_first_parameter
+
+
+requires_positional_only = pytest.mark.skipif(
+    sys.version_info < (3, 8), reason="Positional-only parameters require 3.8"
+)
+
+
+def example_function(
+    a: int, b: "str" = "b", *args: Any, c: List[int], d: int = 1, **kwargs: Any
+) -> "bool":
+    return True
+
+
+@functools.wraps(example_function)
+def example_wrapper(*args: Any, **kwargs: Any) -> Any:
+    return example_function(*args, **kwargs)
+
+
+class ExampleClass:
+    def example_method(self, x: "int") -> None:
+        return None
+
+
+@pytest.fixture(autouse=True)
+def clear_cache() -> None:
+    clear_signature_cache()
+
+
+@pytest.mark.parametrize(
+    argnames=["obj"],
+    argvalues=[
+        (example_function,),
+        (example_wrapper,),
+        (ExampleClass.example_method,),
+        (ExampleClass().example_method,),
+        (len,),
+        ("".join,),
+        (dict.get,),
+        (functools.partial(example_function, 1),),
+        (ExampleClass,),
+    ],
+    ids=[
+        "function",
+        "wrapped",
+        "method",
+        "bound_method",
+        "builtin",
+        "bound_builtin",
+        "method_descriptor",
+        "partial",
+        "class",
+    ],
+)
+def test_get_signature_matches_inspect(obj: Any) -> None:
+    assert str(get_signature(obj)) == str(inspect.signature(obj))
+
+
+def test_get_signature_keeps_string_annotations() -> None:
+    signature: inspect.Signature = get_signature(example_function)
+    assert signature.parameters["b"].annotation == "str"
+    assert signature.return_annotation == "bool"
+
+
+def test_get_signature_with_explicit_signature() -> None:
+    def func() -> None:
+        return None
+
+    explicit: inspect.Signature = inspect.Signature()
+    func.__signature__ = explicit  # type: ignore[attr-defined]
+    assert get_signature(func) is explicit
+
+
+def test_get_signature_without_signature() -> None:
+    assert get_signature(int) == inspect.Signature()
+
+
+def test_signature_from_function_is_cached_by_code() -> None:
+    first: inspect.Signature = signature_from_function(example_function)
+    assert signature_from_function(example_function) is first
+
+
+def test_signature_from_function_with_changed_defaults() -> None:
+    def func(x: int = 1) -> int:
+        return x
+
+    first: inspect.Signature = signature_from_function(func)
+    func.__defaults__ = (2,)
+    second: inspect.Signature = signature_from_function(func)
+    assert second is not first
+    assert second.parameters["x"].default == 2
+
+
+def test_signature_from_function_does_not_keep_code_alive() -> None:
+    namespace: Dict[str, Any] = {}
+    exec("def func(x: int = 1) -> int:\n    return x\n", namespace)
+    signature_from_function(namespace["func"])
+    code: "weakref.ref[Any]" = weakref.ref(namespace.pop("func").__code__)
+    gc.collect()
+    assert code() is None
+
+
+@requires_positional_only
+@pytest.mark.parametrize(
+    argnames=["text_signature", "skip_bound_arg", "expected"],
+    argvalues=[
+        ("($self, key, default=None, /)", False, "(self, key, default=None, /)"),
+        ("($self, key, default=None, /)", True, "(key, default=None, /)"),
+        ("(obj, /)", True, "(obj, /)"),
+    ],
+    ids=["unbound", "bound", "no_bound_arg"],
+)
+def test_signature_from_text(
+    text_signature: str, skip_bound_arg: bool, expected: str
+) -> None:
+    signature = signature_from_text(text_signature, skip_bound_arg=skip_bound_arg)
+    assert str(signature) == expected
+
+
+def test_signature_from_text_with_invalid_text() -> None:
+    assert signature_from_text("(<unrepresentable>)") is None
+
+
+@requires_positional_only
+def test_signature_from_ast() -> None:
+    node: ast.stmt = ast.parse(
+        "async def f(a: int, b: List[str] = [1], /, *c, d=DEFAULT, **e) -> Dict: ..."
+    ).body[0]
+    assert isinstance(node, ast.AsyncFunctionDef)
+    signature: inspect.Signature = signature_from_ast(node)
+    assert str(signature) == (
+        "(a: 'int', b: 'List[str]' = [1], /, *c, d=DEFAULT, **e) -> 'Dict'"
+    )
+    assert isinstance(signature.parameters["d"].default, SourceExpression)
+
+
+def test_signature_from_code() -> None:
+    assert str(signature_from_code(example_function.__code__)) == (
+        "(a, b, *args, c, d, **kwargs)"
+    )
+
+
+class TestWithFirstParameter:
+    def test_with_first_parameter(self) -> None:
+        signature: inspect.Signature = get_signature(example_function)
+        prefixed: inspect.Signature = with_first_parameter(signature, SELF_PARAMETER)
+        assert list(prefixed.parameters)[0] == "self"
+        assert with_first_parameter(signature, SELF_PARAMETER) is prefixed
+
+    def test_with_first_parameter_already_present(self) -> None:
+        signature: inspect.Signature = get_signature(ExampleClass.example_method)
+        assert with_first_parameter(signature, SELF_PARAMETER) is signature
+
+    def test_with_first_parameter_unhashable(self) -> None:
+        def func(x: List[int] = []) -> None:  # noqa: B006
+            return None
+
+        prefixed: inspect.Signature = with_first_parameter(
+            get_signature(func), SELF_PARAMETER
+        )
+        assert list(prefixed.parameters) == ["self", "x"]
+
+    def test_with_first_parameter_cache_is_bounded(self) -> None:
+        for index in range(PREFIXED_SIGNATURES_MAXSIZE + 1):
+            with_first_parameter(
+                inspect.Signature(
+                    [inspect.Parameter(f"x{index}", inspect.Parameter.KEYWORD_ONLY)]
+                ),
+                SELF_PARAMETER,
+            )
+        info = _cached_prefix_parameter.cache_info()
+        assert info.currsize == PREFIXED_SIGNATURES_MAXSIZE
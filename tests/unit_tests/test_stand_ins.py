@@ -0,0 +1,51 @@
+import inspect
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from pytest_create.signatures import get_signature
+from pytest_create.stand_ins import StandInModule
+from pytest_create.stand_ins import make_class
+from pytest_create.stand_ins import make_function
+
+
+SIGNATURE: inspect.Signature = inspect.Signature(
+    [inspect.Parameter("value", inspect.Parameter.POSITIONAL_OR_KEYWORD)]
+)
+
+
+def test_make_function() -> None:
+    function: Any = make_function("package.module", "Example.run", SIGNATURE, "Runs.")
+    assert function.__name__ == "run"
+    assert function.__qualname__ == "Example.run"
+    assert function.__module__ == "package.module"
+    assert function.__doc__ == "Runs."
+    assert get_signature(function) is SIGNATURE
+    with pytest.raises(NotImplementedError):
+        function(1)
+
+
+def test_make_class() -> None:
+    run: Any = make_function("package.module", "Example.run", SIGNATURE)
+    cls: type = make_class("package.module", "Example", {"run": run}, "An example.")
+    assert cls.__name__ == "Example"
+    assert cls.__module__ == "package.module"
+    assert cls.__doc__ == "An example."
+    assert vars(cls)["run"] is run
+
+
+def test_stand_in_module(tmp_path: Path) -> None:
+    function: Any = make_function("package.module", "run", SIGNATURE)
+    module: StandInModule = StandInModule(
+        "package.module",
+        file=tmp_path / "module.py",
+        objects=[function],
+        path=[str(tmp_path)],
+        doc="A module.",
+    )
+    assert module.__file__ == str(tmp_path / "module.py")
+    assert module.__path__ == [str(tmp_path)]
+    assert module.__doc__ == "A module."
+    assert module.objects == [function]
+    assert getattr(module, "run") is function
@@ -0,0 +1,249 @@
+import ast
+import pkgutil
+from importlib.abc import PathEntryFinder
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+
+import pytest
+
+from pytest_create.discovery import DiscoveryReport
+from pytest_create.signatures import get_signature
+from pytest_create.static import StaticModule
+from pytest_create.static import find_decorators
+from pytest_create.static import find_definition_lines
+from pytest_create.static import find_dynamic_features
+from pytest_create.static import load_decorators
+from pytest_create.static import load_definition_lines
+from pytest_create.static import load_static_module
+from pytest_create.static import static_loader
+
+
+def get_finder(path: Path) -> PathEntryFinder:
+    finder: Optional[PathEntryFinder] = pkgutil.get_importer(str(path))
+    assert finder is not None
+    return finder
+
+
+class TestLoadStaticModule:
+    def test_load_static_module(self, hybrid_package: Path) -> None:
+        module: Optional[StaticModule] = load_static_module(
+            "hybrid_pkg.plain", origin=hybrid_package / "hybrid_pkg" / "plain.py"
+        )
+        assert module is not None
+        assert module.discovery_path == "static"
+        assert module.__doc__ == "A plain module."
+        assert module.__file__ == str(hybrid_package / "hybrid_pkg" / "plain.py")
+        assert [obj.__name__ for obj in module.objects] == ["scale", "Shape"]
+        assert module.scale.__doc__ == "Scales a value."
+        assert str(get_signature(module.scale)) == (
+            "(value: 'int', factor: 'float' = 2.0) -> 'float'"
+        )
+        assert isinstance(vars(module.Shape)["unit"], staticmethod)
+
+    @pytest.mark.parametrize(
+        "name, reasons",
+        [
+            ("lazy", ["module __getattr__"]),
+            ("decorated", ["register decorator on handler"]),
+        ],
+    )
+    def test_load_static_module_with_dynamic_features(
+        self, hybrid_package: Path, name: str, reasons: List[str]
+    ) -> None:
+        report: DiscoveryReport = DiscoveryReport()
+        assert (
+            load_static_module(
+                f"hybrid_pkg.{name}",
+                origin=hybrid_package / "hybrid_pkg" / f"{name}.py",
+                report=report,
+            )
+            is None
+        )
+        assert report.reasons == {f"hybrid_pkg.{name}": reasons}
+
+    def test_load_static_module_without_source(self, tmp_path: Path) -> None:
+        (tmp_path / "native.so").write_bytes(b"")
+        assert load_static_module("native", origin=tmp_path / "native.so") is None
+
+    def test_load_static_module_with_invalid_source(self, tmp_path: Path) -> None:
+        (tmp_path / "broken.py").write_text("def broken(:\n")
+        assert load_static_module("broken", origin=tmp_path / "broken.py") is None
+
+
+class TestFindDynamicFeatures:
+    @pytest.mark.parametrize(
+        "source",
+        [
+            "__all__ = ['run', 'Job']\n",
+            "__all__: list = ('run',)\n",
+            "import abc\n\nclass Job(abc.ABC, metaclass=abc.ABCMeta):\n    pass\n",
+            "from dataclasses import dataclass\n\n@dataclass\nclass Job:\n    pass\n",
+            "class Job:\n    @property\n    def name(self) -> str:\n        return ''\n",
+            "class Job:\n    @custom\n    def _private(self) -> None:\n        pass\n",
+            "import sys\n\nif sys.platform == 'win32':\n    def run() -> None:\n"
+            "        pass\n",
+            "try:\n    from fast import _run\nexcept ImportError:\n    def _run():\n"
+            "        pass\n",
+            "DEFAULTS = dict(retries=3)\nlogger = get_logger()\n",
+            "if __name__ == '__main__':\n    main()\n",
+            "setattr(job, 'name', 'run')\n",
+            "import logging\n\nLogger = logging.getLogger(__name__)\n",
+            "Config = load()\nDefault = Settings()\n",
+        ],
+    )
+    def test_find_dynamic_features_of_static_source(self, source: str) -> None:
+        assert find_dynamic_features(ast.parse(source)) == []
+
+    @pytest.mark.parametrize(
+        "source, reasons",
+        [
+            ("__all__ = [name for name in dir()]\n", ["dynamic __all__"]),
+            ("__all__ = ['run']\n__all__ += other.__all__\n", ["dynamic __all__"]),
+            ("__all__ = []\n__all__.append('run')\n", ["dynamic __all__"]),
+            ("def __getattr__(name):\n    pass\n", ["module __getattr__"]),
+            ("def __dir__():\n    return []\n", ["module __dir__"]),
+            (
+                "from collections import namedtuple\n\n"
+                "Point = namedtuple('Point', 'x y')\n",
+                ["Point is created by namedtuple()"],
+            ),
+            (
+                "from enum import Enum\n\nColor = Enum('Color', 'RED GREEN')\n",
+                ["Color is created by Enum()"],
+            ),
+            ("job = type('Job', (), {})\n", ["job is created by type()"]),
+            ("globals()['run'] = lambda: None\n", ["module-level globals()"]),
+            ("exec('def run(): pass')\n", ["module-level exec()"]),
+            ("vars()['run'] = lambda: None\n", ["module-level vars()"]),
+            (
+                "import sys\n\nfor name in ('run', 'stop'):\n"
+                "    setattr(sys.modules[__name__], name, lambda: None)\n",
+                ["module-level setattr()"],
+            ),
+            (
+                "import sys\n\nsys.modules[__name__] = Lazy(__name__)\n",
+                ["sys.modules assignment"],
+            ),
+            (
+                "@app.route('/')\ndef index() -> str:\n    return ''\n",
+                ["route decorator on index"],
+            ),
+            (
+                "class Job:\n    @retry(3)\n    def run(self) -> None:\n        pass\n",
+                ["retry decorator on Job.run"],
+            ),
+            ("class Job(metaclass=Registry):\n    pass\n", ["metaclass of Job"]),
+            (
+                "class Job(with_base(object)):\n    pass\n",
+                ["base class of Job is created by a call"],
+            ),
+            (
+                "try:\n    from fast import run\nexcept ImportError:\n"
+                "    def run():\n        pass\n",
+                ["conditional definition of run"],
+            ),
+        ],
+    )
+    def test_find_dynamic_features(self, source: str, reasons: List[str]) -> None:
+        assert find_dynamic_features(ast.parse(source)) == reasons
+
+
+class TestFindDecorators:
+    def test_find_decorators(self) -> None:
+        source: str = (
+            "import functools\n"
+            "\n"
+            "\n"
+            "@functools.lru_cache(1)\n"
+            "def load() -> None:\n"
+            "    pass\n"
+            "\n"
+            "\n"
+            "@dataclass\n"
+            "class Job:\n"
+            "    @property\n"
+            "    def name(self) -> str:\n"
+            "        return ''\n"
+            "\n"
+            "    def run(self) -> None:\n"
+            "        pass\n"
+        )
+        assert find_decorators(ast.parse(source)) == {
+            "load": ["lru_cache"],
+            "Job": ["dataclass"],
+            "Job.name": ["property"],
+            "Job.run": [],
+        }
+
+    def test_load_decorators(self, hybrid_package: Path) -> None:
+        decorators: Dict[str, List[str]] = load_decorators(
+            hybrid_package / "hybrid_pkg" / "decorated.py"
+        )
+        assert decorators["handler"] == ["register"]
+
+    def test_load_decorators_with_invalid_source(self, tmp_path: Path) -> None:
+        (tmp_path / "broken.py").write_text("def broken(:\n")
+        assert load_decorators(tmp_path / "broken.py") == {}
+        assert load_decorators(tmp_path / "missing.py") == {}
+
+
+class TestFindDefinitionLines:
+    def test_find_definition_lines(self) -> None:
+        source: str = (
+            "@dataclass\n"
+            "class Job:\n"
+            "    @property\n"
+            "    def name(self) -> str:\n"
+            "        return ''\n"
+            "\n"
+            "\n"
+            "def run() -> None:\n"
+            "    pass\n"
+        )
+        assert find_definition_lines(ast.parse(source)) == {
+            "Job": 2,
+            "Job.name": 4,
+            "run": 8,
+        }
+
+    def test_load_definition_lines(self, hybrid_package: Path) -> None:
+        assert load_definition_lines(hybrid_package / "hybrid_pkg" / "plain.py") == {
+            "scale": 6,
+            "Shape": 11,
+            "Shape.unit": 13,
+            "Shape.area": 16,
+        }
+        assert load_definition_lines(hybrid_package / "missing.py") == {}
+
+
+class TestStaticLoader:
+    def test_static_loader(self, hybrid_package: Path) -> None:
+        module: Optional[ModuleType] = static_loader()(
+            "hybrid_pkg.plain", get_finder(hybrid_package / "hybrid_pkg")
+        )
+        assert isinstance(module, StaticModule)
+
+    def test_static_loader_with_dynamic_module(self, hybrid_package: Path) -> None:
+        loaded: List[str] = []
+        report: DiscoveryReport = DiscoveryReport()
+
+        def load(name: str, finder: Any) -> Optional[ModuleType]:
+            loaded.append(name)
+            return None
+
+        static_loader(report, load=load)(
+            "hybrid_pkg.lazy", get_finder(hybrid_package / "hybrid_pkg")
+        )
+        assert loaded == ["hybrid_pkg.lazy"]
+        assert report.reasons == {"hybrid_pkg.lazy": ["module __getattr__"]}
+
+    def test_static_loader_with_package(self, hybrid_package: Path) -> None:
+        module: Optional[ModuleType] = static_loader()(
+            "hybrid_pkg", get_finder(hybrid_package)
+        )
+        assert isinstance(module, StaticModule)
+        assert module.__path__ == [str(hybrid_package / "hybrid_pkg")]
@@ -0,0 +1,156 @@
+import inspect
+import pkgutil
+from importlib.abc import PathEntryFinder
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+from typing import List
+from typing import Optional
+
+import pytest
+
+from pytest_create.signatures import get_signature
+from pytest_create.stubs import StubModule
+from pytest_create.stubs import find_stub_file
+from pytest_create.stubs import load_stub_module
+from pytest_create.stubs import stub_loader
+
+
+@pytest.fixture
+def heavy_module(native_package: Path) -> StubModule:
+    stub_module: Optional[StubModule] = load_stub_module(
+        "native_pkg.heavy", origin=native_package / "native_pkg" / "heavy.py"
+    )
+    assert stub_module is not None
+    return stub_module
+
+
+def get_finder(path: Path) -> PathEntryFinder:
+    finder: Optional[PathEntryFinder] = pkgutil.get_importer(str(path))
+    assert finder is not None
+    return finder
+
+
+class TestLoadStubModule:
+    def test_load_stub_module(
+        self, native_package: Path, heavy_module: StubModule
+    ) -> None:
+        assert heavy_module.__name__ == "native_pkg.heavy"
+        assert heavy_module.__doc__ == "A heavy module."
+        assert heavy_module.__file__ == str(native_package / "native_pkg" / "heavy.pyi")
+        assert heavy_module.stub_file == native_package / "native_pkg" / "heavy.pyi"
+        assert [obj.__name__ for obj in heavy_module.objects] == [
+            "compute",
+            "convert",
+            "modern",
+            "legacy",
+            "Matrix",
+        ]
+
+    def test_load_stub_module_without_stub(self, native_package: Path) -> None:
+        assert (
+            load_stub_module(
+                "native_pkg.plain", origin=native_package / "native_pkg" / "plain.py"
+            )
+            is None
+        )
+
+    def test_load_stub_module_with_invalid_stub(self, tmp_path: Path) -> None:
+        (tmp_path / "broken.pyi").write_text("def broken(:\n")
+        assert load_stub_module("broken", origin=tmp_path / "broken.py") is None
+
+    def test_stub_function(self, heavy_module: StubModule) -> None:
+        compute: Any = heavy_module.compute
+        assert compute.__module__ == "native_pkg.heavy"
+        assert compute.__qualname__ == "compute"
+        assert compute.__doc__ == "Computes a value."
+        assert str(get_signature(compute)) == (
+            "(value: 'int', *, scale: 'float' = 1.0) -> 'float'"
+        )
+        with pytest.raises(NotImplementedError):
+            compute(1)
+
+    def test_stub_function_with_overloads(self, heavy_module: StubModule) -> None:
+        assert str(get_signature(heavy_module.convert)) == "(value: 'int') -> 'str'"
+
+    def test_stub_class(self, heavy_module: StubModule) -> None:
+        matrix: Any = heavy_module.Matrix
+        assert inspect.isclass(matrix)
+        assert matrix.__module__ == "native_pkg.heavy"
+        assert matrix.__doc__ == "A matrix."
+        assert matrix.transpose.__qualname__ == "Matrix.transpose"
+        assert isinstance(vars(matrix)["identity"], staticmethod)
+        assert isinstance(vars(matrix)["zeros"], classmethod)
+        assert isinstance(vars(matrix)["shape"], property)
+        assert str(get_signature(matrix.identity)) == "(size: 'int') -> 'Matrix'"
+
+
+class TestFindStubFile:
+    def test_find_stub_file_next_to_module(self, native_package: Path) -> None:
+        stub_file: Path = native_package / "native_pkg" / "heavy.pyi"
+        assert find_stub_file("native_pkg.heavy", stub_file, is_package=False) == (
+            stub_file
+        )
+
+    @pytest.mark.parametrize("package", ["native_pkg", "native_pkg-stubs"])
+    def test_find_stub_file_in_stub_path(self, tmp_path: Path, package: str) -> None:
+        stubs: Path = tmp_path / "stubs"
+        (stubs / package / "sub").mkdir(parents=True)
+        (stubs / package / "sub" / "__init__.pyi").write_text("")
+        (stubs / package / "sub" / "fast.pyi").write_text("")
+        assert (
+            find_stub_file(
+                "native_pkg.sub.fast",
+                tmp_path / "fast.pyi",
+                is_package=False,
+                stub_paths=[stubs],
+            )
+            == stubs / package / "sub" / "fast.pyi"
+        )
+        assert (
+            find_stub_file(
+                "native_pkg.sub",
+                tmp_path / "__init__.pyi",
+                is_package=True,
+                stub_paths=[stubs],
+            )
+            == stubs / package / "sub" / "__init__.pyi"
+        )
+
+    def test_find_stub_file_without_stub(self, tmp_path: Path) -> None:
+        assert (
+            find_stub_file(
+                "missing", tmp_path / "missing.pyi", is_package=False, stub_paths=[]
+            )
+            is None
+        )
+
+
+class TestStubLoader:
+    def test_stub_loader(self, native_package: Path) -> None:
+        module: Optional[ModuleType] = stub_loader([])(
+            "native_pkg.heavy", get_finder(native_package / "native_pkg")
+        )
+        assert isinstance(module, StubModule)
+
+    def test_stub_loader_without_stub(self, native_package: Path) -> None:
+        loaded: List[str] = []
+
+        def load(name: str, finder: Any) -> Optional[ModuleType]:
+            loaded.append(name)
+            return None
+
+        stub_loader([], load=load)(
+            "native_pkg.plain", get_finder(native_package / "native_pkg")
+        )
+        assert loaded == ["native_pkg.plain"]
+
+    def test_stub_loader_with_package(self, native_package: Path) -> None:
+        (native_package / "native_pkg" / "__init__.pyi").write_text(
+            "def version() -> str: ...\n"
+        )
+        module: Optional[ModuleType] = stub_loader([])(
+            "native_pkg", get_finder(native_package)
+        )
+        assert isinstance(module, StubModule)
+        assert module.__path__ == [str(native_package / "native_pkg")]
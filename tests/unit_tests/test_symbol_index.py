@@ -0,0 +1,100 @@
+from pathlib import Path
+from typing import Iterator
+from typing import List
+
+import pytest
+
+from pytest_create.symbol_index import Symbol
+from pytest_create.symbol_index import SymbolIndex
+
+
+@pytest.fixture
+def symbol_index(tmp_path: Path) -> Iterator[SymbolIndex]:
+    with SymbolIndex(tmp_path / "index" / "symbols.db") as index:
+        yield index
+
+
+@pytest.fixture
+def shop_symbols(tmp_path: Path) -> List[Symbol]:
+    (tmp_path / "cart.py").write_text("")
+    return [
+        Symbol("shop.cart", "total", "function", str(tmp_path / "cart.py"), 1, "a"),
+        Symbol("shop.cart", "Cart", "class", str(tmp_path / "cart.py"), 5, "b"),
+        Symbol(
+            "shop.cart", "Cart.clear", "method", str(tmp_path / "cart.py"), 6, "c", True
+        ),
+    ]
+
+
+class TestSymbolIndex:
+    def test_update(
+        self, symbol_index: SymbolIndex, shop_symbols: List[Symbol]
+    ) -> None:
+        assert symbol_index.update("shop.cart", shop_symbols)
+        assert symbol_index.query() == sorted(
+            shop_symbols, key=lambda symbol: symbol.qualname
+        )
+
+    def test_update_without_changes(
+        self, symbol_index: SymbolIndex, shop_symbols: List[Symbol]
+    ) -> None:
+        symbol_index.update("shop.cart", shop_symbols)
+        assert not symbol_index.update("shop.cart", reversed(shop_symbols))
+
+    def test_update_replaces_module(
+        self, symbol_index: SymbolIndex, shop_symbols: List[Symbol]
+    ) -> None:
+        symbol_index.update("shop.cart", shop_symbols)
+        assert symbol_index.update("shop.cart", shop_symbols[:1])
+        assert symbol_index.query() == shop_symbols[:1]
+
+    def test_update_persists(self, tmp_path: Path, shop_symbols: List[Symbol]) -> None:
+        with SymbolIndex(tmp_path / "symbols.db") as index:
+            index.update("shop.cart", shop_symbols)
+        with SymbolIndex(tmp_path / "symbols.db") as index:
+            assert len(index.query()) == 3
+
+    @pytest.mark.parametrize(
+        "package, kind, tested, name, expected",
+        [
+            ("shop", None, None, None, ["Cart", "Cart.clear", "total", "checkout"]),
+            ("shop.cart", "function", None, None, ["total"]),
+            ("sho", None, None, None, []),
+            (None, "function", False, None, ["total", "checkout"]),
+            (None, None, True, None, ["Cart.clear"]),
+            (None, None, None, "Cart.*", ["Cart.clear"]),
+        ],
+    )
+    def test_query(
+        self,
+        symbol_index: SymbolIndex,
+        shop_symbols: List[Symbol],
+        package: str,
+        kind: str,
+        tested: bool,
+        name: str,
+        expected: List[str],
+    ) -> None:
+        symbol_index.update("shop.cart", shop_symbols)
+        symbol_index.update("shop.pay", [Symbol("shop.pay", "checkout", "function")])
+        assert [
+            symbol.qualname
+            for symbol in symbol_index.query(
+                package=package, kind=kind, tested=tested, name=name
+            )
+        ] == expected
+
+    def test_prune(
+        self, symbol_index: SymbolIndex, shop_symbols: List[Symbol], tmp_path: Path
+    ) -> None:
+        symbol_index.update("shop.cart", shop_symbols)
+        symbol_index.update(
+            "shop.gone",
+            [Symbol("shop.gone", "run", "function", str(tmp_path / "gone.py"))],
+        )
+        assert symbol_index.prune() == ["shop.gone"]
+        assert {symbol.module for symbol in symbol_index.query()} == {"shop.cart"}
+
+
+def test_symbol_name() -> None:
+    assert Symbol("shop.cart", "Cart.clear", "method").name == "shop.cart.Cart.clear"
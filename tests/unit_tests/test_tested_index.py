@@ -0,0 +1,116 @@
+from typing import List
+
+import pytest
+
+from pytest_create.tested_index import TestedIndex
+from pytest_create.tested_index import get_tested_names
+
+
+@pytest.fixture
+def geometry_module(pytester: pytest.Pytester) -> None:
+    pytester.makepyfile(
+        geometry=(
+            "def area() -> int:\n"
+            "    return 1\n"
+            "\n"
+            "\n"
+            "class Square:\n"
+            "    def scale(self) -> None:\n"
+            "        pass\n"
+            "\n"
+            "    def rotate(self) -> None:\n"
+            "        pass\n"
+        )
+    )
+    pytester.syspathinsert()
+
+
+@pytest.mark.usefixtures("geometry_module")
+class TestGetTestedNames:
+    def test_get_tested_names_of_function_test(self, pytester: pytest.Pytester) -> None:
+        items: List[pytest.Item] = pytester.getitems(
+            "from geometry import area\n\ndef test_area():\n    pass\n"
+        )
+        assert get_tested_names(items[0]) == ["geometry.area"]
+
+    def test_get_tested_names_of_class_tests(self, pytester: pytest.Pytester) -> None:
+        items: List[pytest.Item] = pytester.getitems(
+            "from geometry import Square\n"
+            "\n"
+            "class TestSquare:\n"
+            "    def test_instance(self):\n"
+            "        pass\n"
+            "\n"
+            "    def test_scale(self):\n"
+            "        pass\n"
+            "\n"
+            "    def test_other(self):\n"
+            "        pass\n",
+        )
+        assert [get_tested_names(item) for item in items] == [
+            ["geometry.Square"],
+            ["geometry.Square", "geometry.Square.scale"],
+            ["geometry.Square"],
+        ]
+
+    def test_get_tested_names_of_parametrized_tests(
+        self, pytester: pytest.Pytester
+    ) -> None:
+        items: List[pytest.Item] = pytester.getitems(
+            "import pytest\n"
+            "from geometry import Square, area\n"
+            "\n"
+            "@pytest.mark.parametrize('function', [area])\n"
+            "def test_functions(function):\n"
+            "    pass\n"
+            "\n"
+            "@pytest.mark.parametrize('cls, name', [(Square, 'rotate')])\n"
+            "def test_methods(cls, name):\n"
+            "    pass\n",
+        )
+        assert [get_tested_names(item) for item in items] == [
+            ["geometry.area"],
+            ["geometry.Square", "geometry.Square.rotate"],
+        ]
+
+    def test_get_tested_names_without_source_object(
+        self, pytester: pytest.Pytester
+    ) -> None:
+        items: List[pytest.Item] = pytester.getitems("def test_volume():\n    pass\n")
+        assert get_tested_names(items[0]) == []
+
+
+@pytest.mark.usefixtures("geometry_module")
+class TestTestedIndex:
+    @pytest.fixture
+    def tested_index(self, pytester: pytest.Pytester) -> TestedIndex:
+        return TestedIndex.from_items(
+            pytester.getitems(
+                "from geometry import Square, area\n"
+                "\n"
+                "def test_area():\n"
+                "    pass\n"
+                "\n"
+                "class TestSquare:\n"
+                "    def test_scale(self):\n"
+                "        pass\n",
+            )
+        )
+
+    def test_from_items(self, tested_index: TestedIndex) -> None:
+        assert len(tested_index) == 3
+        assert "geometry.area" in tested_index
+        assert tested_index.is_tested("geometry.Square.scale")
+        assert not tested_index.is_tested("geometry.Square.rotate")
+
+    def test_get_nodeids(self, tested_index: TestedIndex) -> None:
+        assert [
+            nodeid.split("::", 1)[1]
+            for nodeid in tested_index.get_nodeids("geometry.Square")
+        ] == ["TestSquare::test_scale"]
+        assert tested_index.get_nodeids("geometry.Square.rotate") == []
+
+    def test_find_untested(self, tested_index: TestedIndex) -> None:
+        assert tested_index.find_untested(
+            ["geometry.area", "geometry.Square", "geometry.Square.rotate"]
+        ) == ["geometry.Square.rotate"]
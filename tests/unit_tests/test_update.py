@@ -0,0 +1,149 @@
+from pathlib import Path
+
+import pytest
+
+from pytest_create.create import CreateOptions
+from pytest_create.create import create_tests
+from pytest_create.create import find_source_objects
+from pytest_create.fingerprints import FingerprintIndex
+from pytest_create.formatting import FormatCache
+from pytest_create.update import update_test_modules
+
+
+class TestUpdateTestModules:
+    @pytest.fixture
+    def cart_package(self, tmp_path: Path) -> Path:
+        package: Path = tmp_path / "src" / "cart_pkg"
+        package.mkdir(parents=True)
+        (package / "__init__.py").write_text("")
+        (package / "cart.py").write_text(
+            "def total(items: list) -> int:\n"
+            "    return 0\n"
+            "\n"
+            "\n"
+            "def clear() -> None:\n"
+            "    pass\n"
+        )
+        return package
+
+    def test_create_tests_with_fingerprints(
+        self, cart_package: Path, tmp_path: Path
+    ) -> None:
+        fingerprints: FingerprintIndex = FingerprintIndex()
+        create_tests(
+            src=cart_package,
+            dst=tmp_path / "tests",
+            options=CreateOptions(fingerprints=fingerprints),
+        )
+        assert sorted(fingerprints.objects) == [
+            "cart_pkg.cart.clear",
+            "cart_pkg.cart.total",
+        ]
+        assert all(
+            fingerprint.stub is not None
+            for fingerprint in fingerprints.objects.values()
+        )
+
+    def test_update_test_modules(self, cart_package: Path, tmp_path: Path) -> None:
+        dst: Path = tmp_path / "tests"
+        fingerprints: FingerprintIndex = FingerprintIndex()
+        create_tests(
+            src=cart_package, dst=dst, options=CreateOptions(fingerprints=fingerprints)
+        )
+        test_file: Path = dst / "test_cart.py"
+        test_file.write_text(
+            test_file.read_text().replace(
+                "assert callable(clear)", "assert clear() is None"
+            )
+        )
+        (cart_package / "cart.py").write_text(
+            "def total(items: tuple) -> int:\n"
+            "    return 0\n"
+            "\n"
+            "\n"
+            "def clear(force: bool = False) -> None:\n"
+            "    pass\n"
+            "\n"
+            "\n"
+            "def checkout() -> None:\n"
+            "    pass\n"
+        )
+        test_file.write_text(
+            test_file.read_text().replace(
+                "assert callable(total)", "assert callable(total)  # stub"
+            )
+        )
+        assert update_test_modules(
+            find_source_objects(cart_package), dst=dst, fingerprints=fingerprints
+        ) == [test_file]
+        source: str = test_file.read_text()
+        assert "assert clear() is None" in source
+        assert "assert callable(total)\n" in source
+        assert "from cart_pkg.cart import checkout" in source
+        assert source.endswith("    assert callable(checkout)\n")
+        assert (
+            update_test_modules(
+                find_source_objects(cart_package), dst=dst, fingerprints=fingerprints
+            )
+            == []
+        )
+
+    def test_update_test_modules_with_format_cache(
+        self, cart_package: Path, tmp_path: Path
+    ) -> None:
+        dst: Path = tmp_path / "tests"
+        fingerprints: FingerprintIndex = FingerprintIndex()
+        create_tests(
+            src=cart_package, dst=dst, options=CreateOptions(fingerprints=fingerprints)
+        )
+        test_file: Path = dst / "test_cart.py"
+        test_file.write_text(test_file.read_text() + "\n\nCARTS = [ 'a','b' ]\n")
+        (cart_package / "cart.py").write_text(
+            "def total(items: tuple) -> int:\n"
+            "    return 0\n"
+            "\n"
+            "\n"
+            "def clear() -> None:\n"
+            "    pass\n"
+        )
+        update_test_modules(
+            find_source_objects(cart_package),
+            dst=dst,
+            fingerprints=fingerprints,
+            format_cache=FormatCache(directory=tmp_path / "cache"),
+        )
+        source: str = test_file.read_text()
+        assert "CARTS = [ 'a','b' ]" in source
+        assert (
+            '    """Tests the total function."""\n    assert callable(total)' in source
+        )
+
+    def test_update_test_modules_with_parametrize(
+        self, cart_package: Path, tmp_path: Path
+    ) -> None:
+        with pytest.raises(ValueError):
+            update_test_modules(
+                find_source_objects(cart_package),
+                dst=tmp_path / "tests",
+                fingerprints=FingerprintIndex(),
+                parametrize=True,
+            )
+
+    def test_update_test_modules_without_fingerprints(
+        self, cart_package: Path, tmp_path: Path
+    ) -> None:
+        dst: Path = tmp_path / "tests"
+        create_tests(src=cart_package, dst=dst)
+        source: str = (dst / "test_cart.py").read_text()
+        fingerprints: FingerprintIndex = FingerprintIndex()
+        assert (
+            update_test_modules(
+                find_source_objects(cart_package), dst=dst, fingerprints=fingerprints
+            )
+            == []
+        )
+        assert (dst / "test_cart.py").read_text() == source
+        assert sorted(fingerprints.objects) == [
+            "cart_pkg.cart.clear",
+            "cart_pkg.cart.total",
+        ]
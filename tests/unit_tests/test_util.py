@@ -2,12 +2,14 @@ import builtins
 import importlib.util
 import inspect
 import pkgutil
+import sys
 from importlib.abc import PathEntryFinder
 from importlib.machinery import ModuleSpec
 from pathlib import Path
 from types import ModuleType
 from typing import Any
 from typing import Callable
+from typing import Iterator
 from typing import List
 from typing import Optional
 
@@ -17,10 +19,14 @@ from _pytest.monkeypatch import MonkeyPatch
 import pytest_create.util
 import tests.example_package.example_module
 from pytest_create.util import SourceFileCompatible
+from pytest_create.util import find_module_members
 from pytest_create.util import find_module_objects
 from pytest_create.util import find_modules
+from pytest_create.util import find_named_modules
 from pytest_create.util import find_objects
+from pytest_create.util import get_qualified_name
 from pytest_create.util import get_source_code_filter
+from pytest_create.util import import_from_name
 from pytest_create.util import is_object_defined_under_path
 from pytest_create.util import is_src_object
 from pytest_create.util import load_from_file
@@ -139,6 +145,16 @@ class TestIsObjectDefinedUnderPath:
         )
 
 
+def test_get_qualified_name() -> None:
+    assert get_qualified_name(ExampleClassA) == (
+        "tests.example_package.example_module.ExampleClassA"
+    )
+    assert get_qualified_name(example_function) == (
+        "tests.example_package.example_module.example_function"
+    )
+    assert get_qualified_name(1) is None
+
+
 class TestStandardizePaths:
     def test_standardize_paths_with_str(self, example_package_dir: Path) -> None:
         assert standardize_paths(str(example_package_dir)) == [str(example_package_dir)]
@@ -213,6 +229,15 @@ class TestFindObjects:
         objects: List[Any] = list(find_objects(example_package_dir))
         assert not objects
 
+    def test_find_objects_with_reexports(self, reexport_package: Path) -> None:
+        objects: List[Any] = list(
+            find_objects(
+                reexport_package,
+                filter_func=get_source_code_filter(reexport_package),
+            )
+        )
+        assert sorted(get_names(objects)) == ["Engine", "start"]
+
     def test_find_objects_invalid_path(self) -> None:
         """Tests the find_objects function with an invalid path."""
         path = Path("non_existent_path")
@@ -233,6 +258,72 @@ class TestFindModules:
         modules: List[ModuleType] = list(find_modules(tmp_path))
         assert modules == []
 
+    def test_find_modules_with_load(self, example_package_dir: Path) -> None:
+        loaded: List[str] = []
+
+        def load(name: str, finder: Any) -> Optional[ModuleType]:
+            loaded.append(name)
+            return load_from_name(name, finder)
+
+        modules: List[ModuleType] = list(find_modules(example_package_dir, load=load))
+        assert loaded == get_names(modules)
+
+    def test_find_modules_with_module_filter(self, tmp_path: Path) -> None:
+        (tmp_path / "kept.py").write_text("")
+        (tmp_path / "excluded").mkdir()
+        (tmp_path / "excluded" / "__init__.py").write_text(
+            "raise RuntimeError('excluded was imported')\n"
+        )
+        (tmp_path / "excluded" / "inner.py").write_text("")
+        modules: List[ModuleType] = list(
+            find_modules(tmp_path, module_filter=lambda name: name != "excluded")
+        )
+        assert get_names(modules) == ["kept"]
+
+
+class TestFindNamedModules:
+    def test_find_named_modules(self, example_package_dir: Path) -> None:
+        modules: List[ModuleType] = list(
+            find_named_modules(
+                ["example_sub_package.example_sub_module", "example_module"],
+                example_package_dir,
+            )
+        )
+        assert get_names(modules) == [
+            "example_sub_package.example_sub_module",
+            "example_module",
+        ]
+
+    def test_find_named_modules_with_missing_module(
+        self, example_package_dir: Path
+    ) -> None:
+        modules: List[ModuleType] = list(
+            find_named_modules(["missing_package.missing"], example_package_dir)
+        )
+        assert modules == []
+
+    def test_find_named_modules_with_load(self, example_package_dir: Path) -> None:
+        loaded: List[str] = []
+
+        def load(name: str, finder: Any) -> Optional[ModuleType]:
+            loaded.append(name)
+            return load_from_name(name, finder)
+
+        list(find_named_modules(["example_module"], example_package_dir, load=load))
+        assert loaded == ["example_module"]
+
+    def test_find_named_modules_with_module_filter(
+        self, example_package_dir: Path
+    ) -> None:
+        modules: List[ModuleType] = list(
+            find_named_modules(
+                ["example_sub_package.example_sub_module", "example_module"],
+                example_package_dir,
+                module_filter=lambda name: name.startswith("example_sub_package"),
+            )
+        )
+        assert get_names(modules) == ["example_sub_package.example_sub_module"]
+
 
 class TestLoadFromName:
     def test_load_from_name(self, example_package_dir: Path) -> None:
@@ -271,6 +362,76 @@ class TestLoadFromName:
         module: Optional[ModuleType] = load_from_name("non_existent_module", finder)
         assert module is None
 
+    def test_load_from_name_with_system_exit(self, tmp_path: Path) -> None:
+        """Tests the load_from_name function with a module that exits."""
+        (tmp_path / "exiting_module.py").write_text("raise SystemExit(1)\n")
+        finder: Optional[PathEntryFinder] = pkgutil.get_importer(str(tmp_path))
+        assert finder is not None
+        module: Optional[ModuleType] = load_from_name("exiting_module", finder)
+        assert module is None
+
+
+class TestImportFromName:
+    @pytest.fixture
+    def finder(self, tmp_path: Path) -> Iterator[PathEntryFinder]:
+        (tmp_path / "imported_pkg").mkdir()
+        (tmp_path / "imported_pkg" / "__init__.py").write_text("")
+        (tmp_path / "imported_pkg" / "money.py").write_text("VALUE = 1\n")
+        (tmp_path / "imported_pkg" / "cart.py").write_text(
+            "from imported_pkg.money import VALUE\n"
+        )
+        (tmp_path / "imported_pkg" / "broken.py").write_text("raise ValueError\n")
+        finder: Optional[PathEntryFinder] = pkgutil.get_importer(str(tmp_path))
+        assert finder is not None
+        yield finder
+        for name in [name for name in sys.modules if name.startswith("imported_pkg")]:
+            del sys.modules[name]
+
+    def test_import_from_name(self, finder: PathEntryFinder, tmp_path: Path) -> None:
+        package: Optional[ModuleType] = import_from_name("imported_pkg", finder)
+        assert package is not None
+        assert sys.modules["imported_pkg"] is package
+        package_finder: Optional[PathEntryFinder] = pkgutil.get_importer(
+            str(tmp_path / "imported_pkg")
+        )
+        assert package_finder is not None
+        money: Optional[ModuleType] = import_from_name(
+            "imported_pkg.money", package_finder
+        )
+        assert money is not None
+        assert package.money is money
+        cart: Optional[ModuleType] = import_from_name(
+            "imported_pkg.cart", package_finder
+        )
+        assert cart is not None
+        assert cart.VALUE == 1
+        assert import_from_name("imported_pkg.money", package_finder) is money
+
+    def test_import_from_name_with_error(
+        self, finder: PathEntryFinder, tmp_path: Path
+    ) -> None:
+        package_finder: Optional[PathEntryFinder] = pkgutil.get_importer(
+            str(tmp_path / "imported_pkg")
+        )
+        assert package_finder is not None
+        assert import_from_name("imported_pkg.broken", package_finder) is None
+        assert "imported_pkg.broken" not in sys.modules
+
+    def test_import_from_name_with_name_of_another_module(self, tmp_path: Path) -> None:
+        (tmp_path / "json.py").write_text("VALUE = 1\n")
+        finder: Optional[PathEntryFinder] = pkgutil.get_importer(str(tmp_path))
+        assert finder is not None
+        standard_json: ModuleType = sys.modules["json"]
+        module: Optional[ModuleType] = import_from_name("json", finder)
+        assert module is not None
+        assert module.VALUE == 1
+        assert sys.modules["json"] is standard_json
+
+    def test_import_from_name_with_spec_not_found(
+        self, finder: PathEntryFinder
+    ) -> None:
+        assert import_from_name("missing_module", finder) is None
+
 
 class TestLoadFromFile:
     def test_load_from_file_with_module(self, example_package_dir: Path) -> None:
@@ -301,3 +462,12 @@ def test_find_module_objects(example_module_spec: ModuleSpec) -> None:
     assert example_function.__name__ in get_names(objects)
     assert example_variable in objects
     assert ExampleClassA.__name__ in get_names(objects)
+
+
+def test_find_module_members(example_module_spec: ModuleSpec) -> None:
+    module: ModuleType = importlib.util.module_from_spec(example_module_spec)
+    assert example_module_spec.loader is not None
+    example_module_spec.loader.exec_module(module)
+    members: List[Any] = list(find_module_members(module, filter_func=callable))
+    assert ("example_function", module.example_function) in members
+    assert ("ExampleClassA", module.ExampleClassA) in members